@@ -22,11 +22,13 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("Cache", "CacheView", "MutableCache")
+__all__: typing.Sequence[str] = ("Cache", "CacheBackend", "CacheView", "MutableCache")
 
 import abc
 import typing
 
+from hikari import undefined
+
 if typing.TYPE_CHECKING:
     from hikari import channels
     from hikari import emojis
@@ -39,6 +41,7 @@
     from hikari import users
     from hikari import voices
     from hikari.api import config
+    from hikari.internal import data_binding
 
 _KeyT = typing.TypeVar("_KeyT", bound=typing.Hashable)
 _ValueT = typing.TypeVar("_ValueT")
@@ -565,6 +568,46 @@ def get_messages_view(self) -> CacheView[snowflakes.Snowflake, messages.Message]
             A view of message objects found in the cache.
         """
 
+    @abc.abstractmethod
+    def get_messages_view_for_channel(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+        *,
+        before: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        after: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        limit: undefined.UndefinedOr[int] = undefined.UNDEFINED,
+    ) -> CacheView[snowflakes.Snowflake, messages.Message]:
+        """Get a view of the message objects cached for a specific channel.
+
+        Messages are indexed per channel and ordered by their ID, so this
+        does not need to scan the whole message cache.
+
+        !!! note
+            Messages which are only being kept alive because another cached
+            message references them will not be included in this view.
+
+        Parameters
+        ----------
+        channel
+            Object or ID of the channel to get the cached messages for.
+        before
+            If provided, only messages sent before this message, ID or
+            datetime will be included.
+        after
+            If provided, only messages sent after this message, ID or
+            datetime will be included.
+        limit
+            If provided, the maximum number of messages to include. When
+            more messages match, the most recent ones are kept.
+
+        Returns
+        -------
+        CacheView[hikari.snowflakes.Snowflake, hikari.messages.Message]
+            A view of message IDs to objects of the messages found in the
+            cache for the specified channel, ordered from oldest to newest.
+        """
+
     @abc.abstractmethod
     def get_presence(
         self,
@@ -1050,6 +1093,42 @@ def update_guild(
             be added (else [`None`][]).
         """
 
+    def get_guild_version(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> bytes | None:  # noqa: ARG002 - Unused arguments
+        """Get the version recorded for a guild's cached channels, emojis and roles.
+
+        This is used to reconcile the cache against an incoming `GUILD_CREATE`
+        without deserializing any of these entities if they haven't changed.
+
+        By default, no versions are recorded and this always returns
+        [`None`][], so the entities are always deserialized again.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild to get the version for.
+
+        Returns
+        -------
+        typing.Optional[bytes]
+            The version recorded for the guild. This will be [`None`][] if
+            no version was recorded or if any of the guild's channels, emojis
+            or roles were modified since it was recorded.
+        """
+        return None
+
+    def set_guild_version(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], version: bytes, /) -> None:
+        """Record the version of a guild's cached channels, emojis and roles.
+
+        By default, this does nothing.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild to set the version for.
+        version
+            The version to record.
+        """
+
     @abc.abstractmethod
     def clear_guild_channels(self) -> CacheView[snowflakes.Snowflake, channels.PermissibleGuildChannel]:
         """Remove all guild channels from the cache.
@@ -1431,6 +1510,27 @@ def set_member(self, member: guilds.Member, /) -> None:
             The object of the member to add to the cache.
         """
 
+    @abc.abstractmethod
+    def set_members_from_payloads(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        payloads: typing.Iterable[data_binding.JSONObject],
+        /,
+    ) -> None:
+        """Add members to the cache directly from their raw gateway payloads.
+
+        This is used when nothing listens for the event the members were
+        received in, so that the event doesn't have to be built only for the
+        members to be taken out of it and stored.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild the members belong to.
+        payloads
+            The raw member payloads.
+        """
+
     @abc.abstractmethod
     def update_member(self, member: guilds.Member, /) -> tuple[guilds.Member | None, guilds.Member | None]:
         """Update a member in the cache.
@@ -1761,3 +1861,85 @@ def update_message(
             and the new cached message object if it could be cached (else
             [`None`][]).
         """
+
+
+class CacheBackend(abc.ABC):
+    """Interface describing a key-value store which a [`MutableCache`][] can share its entities through.
+
+    This allows multiple processes, such as ones each running a subset of a
+    bot's shards, to read entities cached by each other. Entities are stored
+    under string keys in a compact serialized form.
+
+    As lookups are synchronous, implementations should be backed by a local
+    store which can be accessed with low latency.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def get(self, key: str, /) -> bytes | None:
+        """Get a value from the store.
+
+        Parameters
+        ----------
+        key
+            The key to get the value for.
+
+        Returns
+        -------
+        typing.Optional[bytes]
+            The value if found, else [`None`][].
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes, /) -> None:
+        """Set a value in the store, replacing any existing value.
+
+        Parameters
+        ----------
+        key
+            The key to set the value for.
+        value
+            The value to set.
+        """
+
+    @abc.abstractmethod
+    def delete(self, keys: typing.Iterable[str], /) -> None:
+        """Remove values from the store.
+
+        Keys which aren't in the store will be ignored.
+
+        Parameters
+        ----------
+        keys
+            The keys to remove the values for.
+        """
+
+    def write(self, changes: typing.Mapping[str, bytes | None], /) -> None:
+        """Set and remove multiple values in the store at once.
+
+        By default, this calls [`hikari.api.cache.CacheBackend.set`][] and
+        [`hikari.api.cache.CacheBackend.delete`][]. Implementations should
+        override it to apply all the changes in a single batch.
+
+        !!! note
+            This may be called from another thread than the other methods.
+
+        Parameters
+        ----------
+        changes
+            Mapping of keys to the values to set, or to [`None`][] to remove
+            their values.
+        """
+        for key, value in changes.items():
+            if value is not None:
+                self.set(key, value)
+
+        self.delete([key for key, value in changes.items() if value is None])
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Close the store.
+
+        This will not clear its contents.
+        """
@@ -992,6 +992,27 @@ def deserialize_stopped_event(self) -> lifetime_events.StoppedEvent:
             The built starting event object.
         """
 
+    @abc.abstractmethod
+    def deserialize_event_loop_blocked_event(
+        self, *, duration: float, task_name: str | None, stack: typing.Sequence[str]
+    ) -> lifetime_events.EventLoopBlockedEvent:
+        """Build an event loop blocked event object.
+
+        Parameters
+        ----------
+        duration
+            How long the event loop was blocked for, in seconds.
+        task_name
+            Name of the task which was running while the event loop was blocked.
+        stack
+            Formatted stack of the event loop thread, sampled while it was blocked.
+
+        Returns
+        -------
+        hikari.events.lifetime_events.EventLoopBlockedEvent
+            The built event loop blocked event object.
+        """
+
     ##################
     # MESSAGE EVENTS #
     ##################
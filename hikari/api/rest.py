@@ -42,6 +42,7 @@
     from hikari import commands
     from hikari import embeds as embeds_
     from hikari import emojis
+    from hikari import errors
     from hikari import files
     from hikari import guilds
     from hikari import invites
@@ -2503,6 +2504,119 @@ async def execute_webhook(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    def execute_webhooks(
+        self,
+        # MyPy might not say this but SnowflakeishOr[ExecutableWebhook] isn't valid as ExecutableWebhook isn't Unique
+        targets: typing.Iterable[tuple[webhooks.ExecutableWebhook | snowflakes.Snowflakeish, str]],
+        content: undefined.UndefinedOr[typing.Any] = undefined.UNDEFINED,
+        *,
+        username: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        avatar_url: undefined.UndefinedType | str | files.URL = undefined.UNDEFINED,
+        attachment: undefined.UndefinedOr[files.Resourceish] = undefined.UNDEFINED,
+        attachments: undefined.UndefinedOr[typing.Sequence[files.Resourceish]] = undefined.UNDEFINED,
+        component: undefined.UndefinedOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
+        components: undefined.UndefinedOr[typing.Sequence[special_endpoints.ComponentBuilder]] = undefined.UNDEFINED,
+        embed: undefined.UndefinedOr[embeds_.Embed] = undefined.UNDEFINED,
+        embeds: undefined.UndefinedOr[typing.Sequence[embeds_.Embed]] = undefined.UNDEFINED,
+        poll: undefined.UndefinedOr[special_endpoints.PollBuilder] = undefined.UNDEFINED,
+        tts: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        mentions_everyone: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        user_mentions: undefined.UndefinedOr[
+            snowflakes.SnowflakeishSequence[users_.PartialUser] | bool
+        ] = undefined.UNDEFINED,
+        role_mentions: undefined.UndefinedOr[
+            snowflakes.SnowflakeishSequence[guilds.PartialRole] | bool
+        ] = undefined.UNDEFINED,
+        flags: undefined.UndefinedType | int | messages_.MessageFlag = undefined.UNDEFINED,
+        max_concurrency: int = 50,
+    ) -> typing.AsyncIterator[
+        tuple[webhooks.ExecutableWebhook | snowflakes.Snowflakeish, messages_.Message | errors.HTTPError]
+    ]:
+        """Execute many webhooks with the same message.
+
+        The message is built and its attachments are read once, then sent to
+        every webhook concurrently. Executions of the same webhook still wait
+        on each other's rate limits.
+
+        Examples
+        --------
+        ```py
+        async for webhook, result in rest.execute_webhooks(targets, "Hello!"):
+            if isinstance(result, hikari.HTTPError):
+                print(f"Failed to execute {webhook}: {result}")
+        ```
+
+        Parameters
+        ----------
+        targets
+            Pairs of the webhooks to execute and their tokens. The webhooks
+            may be the objects or the IDs of existing webhooks.
+        content
+            If provided, the message contents.
+        username
+            If provided, the username to override the webhooks' usernames
+            with for this message.
+        avatar_url
+            If provided, the url of an image to override the webhooks'
+            avatars with for this message.
+        attachment
+            If provided, the message attachment.
+        attachments
+            If provided, the message attachments.
+        component
+            If provided, builder object of the component to include in this message.
+        components
+            If provided, a sequence of the component builder objects to include
+            in this message.
+        embed
+            If provided, the message embed.
+        embeds
+            If provided, the message embeds.
+        poll
+            If provided, the message poll.
+        tts
+            If provided, whether the message will be read out by a screen
+            reader using Discord's TTS (text-to-speech) system.
+        mentions_everyone
+            If provided, whether the message should parse @everyone/@here
+            mentions.
+        user_mentions
+            If provided, the users to mention or whether to detect them.
+        role_mentions
+            If provided, the roles to mention or whether to detect them.
+        flags
+            The flags to set for this message.
+        max_concurrency
+            The maximum number of webhooks to execute at once.
+
+        See [`hikari.api.rest.RESTClient.execute_webhook`][] for more
+        information on each of the message's fields.
+
+        Returns
+        -------
+        typing.AsyncIterator[typing.Tuple[typing.Union[hikari.webhooks.ExecutableWebhook, hikari.snowflakes.Snowflakeish], typing.Union[hikari.messages.Message, hikari.errors.HTTPError]]]
+            An async iterator of each webhook along with the message created
+            through it, or the error raised when executing it, in the order
+            they finish. Stopping iterating cancels the remaining executions.
+
+            The errors cover anything which only concerns one webhook: error
+            responses from Discord, [`hikari.errors.RateLimitTooLongError`][],
+            and connection or timeout errors which persisted through the
+            retries (as a [`hikari.errors.HTTPError`][] with the original error
+            as its cause).
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` is less than 1 or if the message is invalid
+            as described in [`hikari.api.rest.RESTClient.execute_webhook`][].
+        hikari.errors.ComponentStateConflictError
+            If the REST client is closed while executing the webhooks. This,
+            and any other error not listed above, stops the iteration and
+            cancels the remaining executions.
+        """  # noqa: E501 - Line too long
+
     @abc.abstractmethod
     async def fetch_webhook_message(
         self,
@@ -7956,6 +8070,77 @@ async def set_application_commands(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def sync_application_commands(
+        self,
+        application: snowflakes.SnowflakeishOr[guilds.PartialApplication],
+        commands: typing.Sequence[special_endpoints.CommandBuilder],
+        guild: undefined.UndefinedOr[snowflakes.SnowflakeishOr[guilds.PartialGuild]] = undefined.UNDEFINED,
+        *,
+        hashes: typing.MutableMapping[str, str] | None = None,
+    ) -> typing.Sequence[commands.PartialCommand] | None:
+        """Sync the commands for an application, only changing what differs.
+
+        Unlike [`hikari.api.rest.RESTClient.set_application_commands`][], this
+        fetches the existing commands and compares them to the provided ones,
+        ignoring fields assigned by Discord, then only creates the new
+        commands, edits the changed ones and deletes the removed ones.
+        Commands are matched by their type and name, so edited commands keep
+        their IDs and permissions.
+
+        The creations, edits and deletions are made concurrently. If any of
+        them fails, the ones still in progress are cancelled and the error is
+        raised, leaving the commands partially synced; syncing again will
+        finish the job.
+
+        !!! warning
+            Any existing commands not included in the provided commands array
+            will be deleted.
+
+        Parameters
+        ----------
+        application
+            Object or ID of the application to sync the commands of.
+        commands
+            A sequence of up to 100 initialised command builder objects of the
+            commands to sync for the application.
+        guild
+            Object or ID of the specific guild to sync the commands of.
+            If left as [`hikari.undefined.UNDEFINED`][] then this will sync the
+            global commands rather than guild specific commands.
+        hashes
+            If provided, a mapping to keep hashes of the last synced commands
+            in. When the provided commands hash the same as the last ones
+            synced to this application and guild, nothing will be fetched or
+            changed.
+
+            This can be a [`shelve.Shelf`][] to keep the hashes across restarts.
+            As this only knows about changes made through it, it should be
+            cleared if the commands are changed any other way.
+
+        Returns
+        -------
+        typing.Optional[typing.Sequence[hikari.commands.PartialCommand]]
+            A sequence of the synced command objects or [`None`][] if they
+            were skipped as their hash matched.
+
+        Raises
+        ------
+        hikari.errors.ForbiddenError
+            If you cannot access the provided application's commands.
+        hikari.errors.NotFoundError
+            If the provided application isn't found.
+        hikari.errors.BadRequestError
+            If any of the fields that are passed have an invalid value.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     @abc.abstractmethod
     async def edit_application_command(
         self,
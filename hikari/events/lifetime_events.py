@@ -26,7 +26,13 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("StartedEvent", "StartingEvent", "StoppedEvent", "StoppingEvent")
+__all__: typing.Sequence[str] = (
+    "EventLoopBlockedEvent",
+    "StartedEvent",
+    "StartingEvent",
+    "StoppedEvent",
+    "StoppingEvent",
+)
 
 import typing
 
@@ -126,3 +132,41 @@ class StoppedEvent(base_events.Event):
 
     app: traits.RESTAware = attrs.field(metadata={attrs_extensions.SKIP_DEEP_COPY: True})
     # <<inherited docstring from Event>>.
+
+
+@attrs_extensions.with_copy
+@attrs.define(kw_only=True, weakref_slot=False)
+class EventLoopBlockedEvent(base_events.Event):
+    """Event that is triggered when the event loop was blocked for too long.
+
+    This is only fired if the watchdog was enabled through the `watchdog_threshold`
+    argument of [`hikari.impl.gateway_bot.GatewayBot`][], once the event loop
+    has recovered.
+
+    A blocked event loop delays heartbeats, which can lead Discord to consider
+    the shards dead and reconnect them. The most common cause is a listener
+    doing blocking work (such as synchronous IO or heavy computation) instead of
+    awaiting or offloading it to an executor.
+    """
+
+    app: traits.RESTAware = attrs.field(metadata={attrs_extensions.SKIP_DEEP_COPY: True})
+    # <<inherited docstring from Event>>.
+
+    duration: float = attrs.field(repr=True)
+    """How long the event loop was blocked for, in seconds."""
+
+    task_name: str | None = attrs.field(repr=True)
+    """Name of the task which was running while the event loop was blocked.
+
+    For listeners, this is `"handler '<listener name>' for '<event name>'"`.
+
+    This will be [`None`][] if the event loop wasn't running a task or if it
+    could not be sampled while it was blocked.
+    """
+
+    stack: typing.Sequence[str] = attrs.field(repr=False)
+    """Formatted stack of the event loop thread, sampled while it was blocked.
+
+    The outermost frame is first. This will be empty if the event loop could
+    not be sampled while it was blocked.
+    """
@@ -418,6 +418,10 @@ class GuildIncidents:
     """
 
 
+# Parsing these on first access speeds up deserializing the thousands of members sent on startup.
+@attrs_extensions.with_lazy_fields(
+    str, time.iso8601_datetime_string_to_datetime, "joined_at", "premium_since", "raw_communication_disabled_until"
+)
 @attrs_extensions.with_copy
 @attrs.define(eq=False, kw_only=True, weakref_slot=False)
 class Member(users.User):
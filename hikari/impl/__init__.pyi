@@ -1,6 +1,7 @@
 # DO NOT MANUALLY EDIT THIS FILE!
 # This file was automatically generated by `nox -s generate-stubs`
 
+from hikari.impl.autocomplete_cache import *
 from hikari.impl.buckets import *
 from hikari.impl.cache import *
 from hikari.impl.config import *
@@ -9,10 +10,16 @@ from hikari.impl.event_factory import *
 from hikari.impl.event_manager import *
 from hikari.impl.event_manager_base import *
 from hikari.impl.gateway_bot import *
+from hikari.impl.instrumentation import *
+from hikari.impl.interaction_router import *
 from hikari.impl.interaction_server import *
+from hikari.impl.member_chunker import *
 from hikari.impl.rate_limits import *
 from hikari.impl.rest import *
 from hikari.impl.rest_bot import *
 from hikari.impl.shard import *
+from hikari.impl.shared_cache import *
 from hikari.impl.special_endpoints import *
+from hikari.impl.typed_decoding import *
 from hikari.impl.voice import *
+from hikari.impl.watchdog import *
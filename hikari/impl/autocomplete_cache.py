@@ -0,0 +1,260 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Cache of the choices returned for autocomplete interactions."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("AutocompleteCache",)
+
+import functools
+import typing
+
+from hikari import commands
+from hikari.api import special_endpoints
+from hikari.internal import collections
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari import snowflakes
+    from hikari.interactions import command_interactions
+
+    _AutocompleteListenerT = typing.Callable[
+        [command_interactions.AutocompleteInteraction],
+        typing.Awaitable[typing.Optional[special_endpoints.InteractionAutocompleteBuilder]],
+    ]
+    _CachedAutocompleteListenerT = typing.Callable[
+        [command_interactions.AutocompleteInteraction],
+        typing.Coroutine[typing.Any, typing.Any, typing.Optional[special_endpoints.InteractionAutocompleteBuilder]],
+    ]
+    _KeyT = tuple[str, str, str, typing.Optional[snowflakes.Snowflake]]
+
+_MAX_CHOICES: typing.Final[int] = 25
+"""The most choices Discord accepts in an autocomplete response."""
+_SUB_COMMAND_TYPES: typing.Final[frozenset[int]] = frozenset(
+    (commands.OptionType.SUB_COMMAND, commands.OptionType.SUB_COMMAND_GROUP)
+)
+
+
+class AutocompleteCache:
+    """Cache of the choices returned for autocomplete interactions.
+
+    Autocompletes are sent on every keystroke, often with the same input by
+    many users in a short time. This keeps the choices returned for each input
+    for a while, keyed by the command path, the name of the focused option,
+    the value typed into it and, optionally, the guild the interaction was
+    triggered in.
+
+    This should only be used for autocompletes whose choices only depend on
+    the value of the focused option (and guild, if `per_guild` is set).
+
+    Parameters
+    ----------
+    ttl
+        How long choices are kept for, in seconds.
+    max_entries
+        The most entries to keep. The least recently used entries are
+        removed first once this is exceeded.
+    per_guild
+        Whether choices should be kept separately for each guild.
+    match
+        A predicate which is passed a choice and the value typed into the
+        focused option and returns whether the choice matches the value.
+
+        If this is set, then the choices for a value which extends a cached
+        value are filtered from the cached choices with this, as long as
+        the cached choices weren't cut short by Discord's limit of 25
+        choices. This should match the filtering the listener does.
+
+    Raises
+    ------
+    ValueError
+        If `ttl` or `max_entries` isn't positive.
+
+    Examples
+    --------
+    ```py
+    cache = hikari.impl.AutocompleteCache(
+        match=lambda choice, value: choice.name.startswith(value)
+    )
+
+
+    @cache.wrap
+    async def on_colour_autocomplete(interaction: hikari.AutocompleteInteraction):
+        colours = await fetch_colours(interaction.options[0].value)
+        return interaction.build_response(
+            [hikari.impl.AutocompleteChoiceBuilder(c, c) for c in colours]
+        )
+
+
+    bot.router.set_autocomplete("colour", on_colour_autocomplete)
+    ```
+    """
+
+    __slots__: typing.Sequence[str] = ("_entries", "_match", "_per_guild", "_ttl")
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 30.0,
+        max_entries: int = 1024,
+        per_guild: bool = False,
+        match: typing.Callable[[special_endpoints.AutocompleteChoiceBuilder, str], bool] | None = None,
+    ) -> None:
+        if ttl <= 0:
+            msg = "ttl must be greater than 0"
+            raise ValueError(msg)
+
+        if max_entries <= 0:
+            msg = "max_entries must be greater than 0"
+            raise ValueError(msg)
+
+        self._entries: collections.LimitedCapacityCacheMap[
+            _KeyT, tuple[float, typing.Sequence[special_endpoints.AutocompleteChoiceBuilder]]
+        ] = collections.LimitedCapacityCacheMap(limit=max_entries)
+        self._match = match
+        self._per_guild = per_guild
+        self._ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _make_key(self, interaction: command_interactions.AutocompleteInteraction, /) -> _KeyT | None:
+        path = interaction.command_name
+        options = interaction.options
+        while options and options[0].type in _SUB_COMMAND_TYPES:
+            path = f"{path} {options[0].name}"
+            options = options[0].options
+
+        for option in options or ():
+            if option.is_focused:
+                guild_id = interaction.guild_id if self._per_guild else None
+                return (path, option.name, str(option.value), guild_id)
+
+        return None
+
+    def _get_entry(
+        self, key: _KeyT, /
+    ) -> tuple[float, typing.Sequence[special_endpoints.AutocompleteChoiceBuilder]] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        del self._entries[key]
+        if entry[0] < time.perf_counter():
+            return None
+
+        # Reinserting moves the entry to the end, so the least recently used entries are removed first
+        self._entries[key] = entry
+        return entry
+
+    def get(
+        self, interaction: command_interactions.AutocompleteInteraction, /
+    ) -> typing.Sequence[special_endpoints.AutocompleteChoiceBuilder] | None:
+        """Get the cached choices for an autocomplete interaction.
+
+        Parameters
+        ----------
+        interaction
+            The autocomplete interaction to get the choices for.
+
+        Returns
+        -------
+        typing.Optional[typing.Sequence[hikari.api.special_endpoints.AutocompleteChoiceBuilder]]
+            The cached choices, or [`None`][] if there are none.
+        """
+        key = self._make_key(interaction)
+        if key is None:
+            return None
+
+        if (entry := self._get_entry(key)) is not None:
+            return entry[1]
+
+        if self._match is None:
+            return None
+
+        path, name, value, guild_id = key
+        for end in range(len(value) - 1, -1, -1):
+            superset = self._get_entry((path, name, value[:end], guild_id))
+            # Choices which were cut short may be missing some of the ones which match the longer value
+            if superset is not None and len(superset[1]) < _MAX_CHOICES:
+                expires_at, superset_choices = superset
+                choices = tuple(choice for choice in superset_choices if self._match(choice, value))
+                # These can't outlive the choices they were filtered from
+                self._entries[key] = (expires_at, choices)
+                return choices
+
+        return None
+
+    def put(
+        self,
+        interaction: command_interactions.AutocompleteInteraction,
+        choices: typing.Sequence[special_endpoints.AutocompleteChoiceBuilder],
+        /,
+    ) -> None:
+        """Cache the choices for an autocomplete interaction.
+
+        Parameters
+        ----------
+        interaction
+            The autocomplete interaction the choices are for.
+        choices
+            The choices to cache.
+        """
+        if (key := self._make_key(interaction)) is not None:
+            self._entries[key] = (time.perf_counter() + self._ttl, tuple(choices))
+
+    def clear(self) -> None:
+        """Remove all the cached choices."""
+        self._entries.clear()
+
+    def wrap(self, listener: _AutocompleteListenerT, /) -> _CachedAutocompleteListenerT:
+        """Wrap an autocomplete listener to cache the choices it returns.
+
+        The returned listener responds with the cached choices when there
+        are any, without calling the wrapped listener.
+
+        Parameters
+        ----------
+        listener
+            The autocomplete listener to wrap. The choices of the
+            [`hikari.api.special_endpoints.InteractionAutocompleteBuilder`][]
+            it returns are cached.
+
+        Returns
+        -------
+        typing.Callable[[hikari.interactions.command_interactions.AutocompleteInteraction], typing.Coroutine[typing.Any, typing.Any, typing.Optional[hikari.api.special_endpoints.InteractionAutocompleteBuilder]]]
+            The wrapped listener.
+        """  # noqa: E501 - Line too long
+
+        @functools.wraps(listener)
+        async def wrapper(
+            interaction: command_interactions.AutocompleteInteraction, /
+        ) -> special_endpoints.InteractionAutocompleteBuilder | None:
+            if (choices := self.get(interaction)) is not None:
+                return interaction.build_response(choices)
+
+            response = await listener(interaction)
+            if isinstance(response, special_endpoints.InteractionAutocompleteBuilder):
+                self.put(interaction, response.choices)
+
+            return response
+
+        return wrapper
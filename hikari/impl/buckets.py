@@ -390,6 +390,19 @@ def release(self) -> None:
         if self._in_transit > 0:
             self._in_transit -= 1
 
+    @typing_extensions.override
+    def get_time_until_increase(self, now: float) -> float:
+        if not self.is_rate_limited(now):
+            return 0.0
+
+        if self.move_at > now:
+            return self.move_at - now
+
+        # The window wasn't moved along as we are out of sync (see move_window). Wait until it
+        # is moved regardless, rather than spinning in the throttler until then, which would
+        # block the event loop from receiving the response that would get us back in sync.
+        return self.move_at + self.period - now
+
     @typing_extensions.override
     def move_window(self, now: float) -> None:
         # If we are out of sync, we shouldn't slide the window along, as we will be off due to
@@ -25,9 +25,11 @@
 __all__: typing.Sequence[str] = ("CacheImpl",)
 
 import copy
+import datetime
 import logging
 import typing
 
+from hikari import _about as about
 from hikari import channels as channels_
 from hikari import emojis
 from hikari import messages
@@ -48,8 +50,22 @@
     from hikari import users
     from hikari import voices
     from hikari.impl import config as config_impl
+    from hikari.internal import data_binding
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cache")
+_SNAPSHOT_VERSION: typing.Final[int] = 1
+
+
+def _to_searchable_snowflake(
+    value: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]], /
+) -> snowflakes.Snowflake | None:
+    if value is undefined.UNDEFINED:
+        return None
+
+    if isinstance(value, datetime.datetime):
+        return snowflakes.Snowflake.from_datetime(value)
+
+    return snowflakes.Snowflake(value)
 
 
 # TODO: do we want to hide entities that are marked as "deleted" and being kept alive by references?
@@ -66,12 +82,14 @@ class CacheImpl(cache.MutableCache):
 
     __slots__: typing.Sequence[str] = (
         "_app",
+        "_channel_message_ids",
         "_dm_channel_entries",
         "_emoji_entries",
         "_guild_channel_entries",
         "_guild_entries",
         "_guild_thread_entries",
         "_intents",
+        "_intern_pools",
         "_invite_entries",
         "_me",
         "_message_entries",
@@ -103,6 +121,7 @@ class CacheImpl(cache.MutableCache):
     _referenced_messages: collections.ExtendedMutableMapping[
         snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MessageData]
     ]
+    _channel_message_ids: collections.ExtendedMutableMapping[snowflakes.Snowflake, collections.SnowflakeSet]
 
     def __init__(self, app: traits.RESTAware, settings: config_impl.CacheSettings) -> None:
         self._app = app
@@ -124,6 +143,8 @@ def _create_cache(self) -> None:
         self._invite_entries = collections.FreezableDict()
         self._role_entries = collections.FreezableDict()
         self._sticker_entries = collections.FreezableDict()
+        # Pools used to share equal strings and snowflakes between the cached entities.
+        self._intern_pools = cache_utility.InternPools()
         # This is a purely internal cache used for handling the caching and de-duplicating of the unknown custom emojis
         # found attached to cached presence activities.
         self._unknown_custom_emoji_entries = collections.FreezableDict()
@@ -132,6 +153,8 @@ def _create_cache(self) -> None:
             limit=self._settings.max_messages, on_expire=self._on_message_expire
         )
         self._referenced_messages = collections.FreezableDict()
+        # Index of channel IDs to the sorted IDs of the messages in _message_entries which belong to them.
+        self._channel_message_ids = collections.FreezableDict()
 
     def _is_cache_enabled_for(self, required_flag: config_api.CacheComponents) -> bool:
         return (self._settings.components & required_flag) == required_flag
@@ -147,6 +170,141 @@ def clear(self) -> None:
 
         self._create_cache()
 
+    def dump_snapshot(self) -> bytes:
+        """Dump a snapshot of the cached guilds, channels, roles, emojis, members and users.
+
+        This can later be passed to [`hikari.impl.cache.CacheImpl.load_snapshot`][]
+        to warm up the cache after a restart, for example by writing it to disk
+        in a [`hikari.events.lifetime_events.StoppedEvent`][] listener and
+        loading it in a [`hikari.events.lifetime_events.StartingEvent`][] listener.
+
+        Alongside the entities, the version of each guild's channels, emojis and
+        roles is kept so that an incoming `GUILD_CREATE` for a restored guild only
+        has to deserialize these if they changed while the snapshot was taken.
+
+        !!! note
+            Snapshots are only compatible with the same version of hikari.
+
+        Returns
+        -------
+        bytes
+            The compressed snapshot.
+        """
+        guild_records: dict[snowflakes.Snowflake, cache_utility.GuildRecord] = {}
+        for guild_id, record in self._guild_entries.items():
+            members = (
+                {user_id: member for user_id, member in record.members.items() if not member.object.has_been_deleted}
+                if record.members
+                else None
+            )
+            guild_records[guild_id] = cache_utility.GuildRecord(
+                is_available=record.is_available,
+                guild=record.guild,
+                channels=record.channels,
+                channel_order=record.channel_order,
+                emojis=record.emojis,
+                members=collections.FreezableDict(members) if members else None,
+                roles=record.roles,
+                version=record.version,
+            )
+
+        snapshot = (
+            _SNAPSHOT_VERSION,
+            about.__version__,
+            self._settings.components,
+            self._me,
+            guild_records,
+            self._guild_channel_entries.freeze(),
+            self._emoji_entries.freeze(),
+            self._role_entries.freeze(),
+        )
+        return cache_utility.dump_snapshot(snapshot, app=self._app)
+
+    def load_snapshot(self, snapshot: bytes, /) -> None:  # noqa: PLR0912 - Too many branches
+        """Replace the contents of the cache with a snapshot.
+
+        Components of the snapshot which aren't enabled in this cache's settings
+        will be ignored.
+
+        !!! warning
+            Only load snapshots from a trusted source, such as those dumped by
+            your own application.
+
+        Parameters
+        ----------
+        snapshot
+            The snapshot created by [`hikari.impl.cache.CacheImpl.dump_snapshot`][].
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is malformed or was created by a different
+            version of hikari.
+        """
+        data = cache_utility.load_snapshot(snapshot, app=self._app)
+        if not isinstance(data, tuple) or data[:2] != (_SNAPSHOT_VERSION, about.__version__):
+            msg = "Cache snapshot was created by an incompatible version of hikari"
+            raise ValueError(msg)
+
+        _, _, components, me, guild_records, channels, emojis, roles = data
+        # Versions are only valid if the same entities are being cached for each guild.
+        keep_versions = components == self._settings.components
+        user_cells: list[cache_utility.RefCell[users.User]] = []
+
+        self._create_cache()
+
+        if self._is_cache_enabled_for(config_api.CacheComponents.ME):
+            self._me = me
+
+        for guild_id, record in guild_records.items():
+            if not keep_versions:
+                record.version = None
+
+            if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+                record.guild = None
+                record.is_available = None
+
+            if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+                record.channels = None
+                record.channel_order = None
+
+            if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+                record.emojis = None
+
+            if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+                record.roles = None
+
+            if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+                record.members = None
+
+            elif record.members:
+                for member in record.members.values():
+                    # Nothing else which may reference members is part of the snapshot.
+                    member.ref_count = 0
+                    user_cells.append(member.object.user)
+
+            if not record.empty():
+                self._guild_entries[guild_id] = record
+
+        if self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            self._guild_channel_entries = collections.FreezableDict(channels)
+
+        if self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            self._emoji_entries = collections.FreezableDict(emojis)
+            user_cells.extend(emoji.user for emoji in emojis.values() if emoji.user)
+
+        if self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            self._role_entries = collections.FreezableDict(roles)
+
+        # User cells are shared between the entities which reference them, so their reference counts
+        # have to be rebuilt from only the references which were part of the snapshot.
+        for cell in user_cells:
+            cell.ref_count = 0
+
+        for cell in user_cells:
+            cell.ref_count += 1
+            self._user_entries[cell.object.id] = cell
+
     @typing_extensions.override
     def clear_dm_channel_ids(self) -> cache.CacheView[snowflakes.Snowflake, snowflakes.Snowflake]:
         if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
@@ -208,6 +366,7 @@ def clear_emojis(self) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCust
 
         for guild_id, guild_record in self._guild_entries.freeze().items():
             guild_record.emojis = None
+            guild_record.version = None
             self._remove_guild_record_if_empty(guild_id, guild_record)
 
         return cache_utility.CacheMappingView(cached_emojis, builder=self._build_emoji)
@@ -226,6 +385,7 @@ def clear_emojis_for_guild(
 
         cached_emojis = {emoji_id: self._emoji_entries.pop(emoji_id) for emoji_id in guild_record.emojis}
         guild_record.emojis = None
+        guild_record.version = None
         self._remove_guild_record_if_empty(guild_id, guild_record)
 
         for emoji_data in cached_emojis.values():
@@ -250,6 +410,7 @@ def delete_emoji(self, emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji], /)
         guild_record = self._guild_entries.get(emoji_data.guild_id)
         if guild_record and guild_record.emojis:
             guild_record.emojis.remove(emoji_id)
+            guild_record.version = None
 
             if not guild_record.emojis:
                 guild_record.emojis = None
@@ -301,9 +462,10 @@ def set_emoji(self, emoji: emojis.KnownCustomEmoji, /) -> None:
             if emoji.id not in self._emoji_entries:
                 self._increment_ref_count(user)
 
-        emoji_data = cache_utility.KnownCustomEmojiData.build_from_entity(emoji, user=user)
+        emoji_data = cache_utility.KnownCustomEmojiData.build_from_entity(emoji, user=user, pools=self._intern_pools)
         self._emoji_entries[emoji.id] = emoji_data
         guild_record = self._get_or_create_guild_record(emoji.guild_id)
+        guild_record.version = None
 
         if guild_record.emojis is None:  # TODO: add test cases when it is not None?
             guild_record.emojis = collections.SnowflakeSet()
@@ -432,7 +594,7 @@ def set_sticker(self, sticker: stickers.GuildSticker, /) -> None:
             if sticker.id not in self._sticker_entries:
                 self._increment_ref_count(user)
 
-        sticker_data = cache_utility.GuildStickerData.build_from_entity(sticker, user=user)
+        sticker_data = cache_utility.GuildStickerData.build_from_entity(sticker, user=user, pools=self._intern_pools)
         self._sticker_entries[sticker.id] = sticker_data
         guild_record = self._get_or_create_guild_record(sticker.guild_id)
 
@@ -595,6 +757,17 @@ def update_guild(
         self.set_guild(guild)
         return cached_guild, self.get_guild(guild.id)
 
+    @typing_extensions.override
+    def get_guild_version(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> bytes | None:
+        guild_record = self._guild_entries.get(snowflakes.Snowflake(guild))
+        return guild_record.version if guild_record else None
+
+    @typing_extensions.override
+    def set_guild_version(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], version: bytes, /) -> None:
+        guild_record = self._guild_entries.get(snowflakes.Snowflake(guild))
+        if guild_record:
+            guild_record.version = version
+
     @typing_extensions.override
     def clear_threads(self) -> cache.CacheView[snowflakes.Snowflake, channels_.GuildThreadChannel]:
         if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_THREADS):
@@ -757,6 +930,8 @@ def clear_guild_channels(self) -> cache.CacheView[snowflakes.Snowflake, channels
         for guild_id, guild_record in self._guild_entries.freeze().items():
             if guild_record.channels:
                 guild_record.channels = None
+                guild_record.channel_order = None
+                guild_record.version = None
                 self._remove_guild_record_if_empty(guild_id, guild_record)
 
         return cache_utility.CacheMappingView(cached_channels)
@@ -775,6 +950,8 @@ def clear_guild_channels_for_guild(
 
         cached_channels = {sf: self._guild_channel_entries.pop(sf) for sf in guild_record.channels}
         guild_record.channels = None
+        guild_record.channel_order = None
+        guild_record.version = None
         self._remove_guild_record_if_empty(guild_id, guild_record)
         return cache_utility.CacheMappingView(cached_channels)
 
@@ -794,8 +971,13 @@ def delete_guild_channel(
         guild_record = self._guild_entries.get(channel.guild_id)
         if guild_record and guild_record.channels:
             guild_record.channels.remove(channel_id)
+            guild_record.version = None
+            if guild_record.channel_order:
+                guild_record.channel_order.remove(channel_id)
+
             if not guild_record.channels:
                 guild_record.channels = None
+                guild_record.channel_order = None
                 self._remove_guild_record_if_empty(channel.guild_id, guild_record)
 
         return channel
@@ -828,26 +1010,17 @@ def get_guild_channels_view_for_guild(
             return cache_utility.EmptyCacheView()
 
         guild_record = self._guild_entries.get(snowflakes.Snowflake(guild))
-        if not guild_record or not guild_record.channels:
+        if not guild_record or not guild_record.channel_order:
             return cache_utility.EmptyCacheView()
 
-        cached_channels = {sf: self._guild_channel_entries[sf] for sf in guild_record.channels}
-
-        def sorter(args: tuple[snowflakes.Snowflake, channels_.PermissibleGuildChannel]) -> tuple[int, int, int]:
-            channel = args[1]
-            if isinstance(channel, channels_.GuildCategory):
-                return channel.position, -1, 0
-
-            parent_position = -1 if channel.parent_id is None else cached_channels[channel.parent_id].position
-
-            if not isinstance(channel, channels_.GuildVoiceChannel):
-                return parent_position, 0, channel.position
+        # The order is kept up to date as channels are set and deleted, so the ordered mapping only
+        # has to be rebuilt after the guild's channels changed.
+        channel_order = guild_record.channel_order
+        if channel_order.sorted_channels is None:
+            channel_order.sorted_channels = {sf: self._guild_channel_entries[sf] for sf in channel_order}
 
-            return parent_position, 1, channel.position
-
-        cached_channels = dict(sorted(cached_channels.items(), key=sorter))
         return cache_utility.CacheMappingView(
-            cached_channels,
+            channel_order.sorted_channels,
             builder=cache_utility.copy_guild_channel,  # type: ignore[type-var]
         )
 
@@ -858,11 +1031,16 @@ def set_guild_channel(self, channel: channels_.PermissibleGuildChannel, /) -> No
 
         self._guild_channel_entries[channel.id] = cache_utility.copy_guild_channel(channel)
         guild_record = self._get_or_create_guild_record(channel.guild_id)
+        guild_record.version = None
 
         if guild_record.channels is None:
             guild_record.channels = collections.SnowflakeSet()
 
+        if guild_record.channel_order is None:
+            guild_record.channel_order = cache_utility.GuildChannelOrder()
+
         guild_record.channels.add(channel.id)
+        guild_record.channel_order.add(channel)
 
     @typing_extensions.override
     def update_guild_channel(
@@ -1252,31 +1430,63 @@ def set_member(self, member: guilds.Member, /) -> None:
 
         self._set_member(member, is_reference=False)
 
+    @typing_extensions.override
+    def set_members_from_payloads(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        payloads: typing.Iterable[data_binding.JSONObject],
+        /,
+    ) -> None:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return
+
+        guild_id = snowflakes.Snowflake(guild)
+        guild_record = self._get_or_create_guild_record(guild_id)
+        entity_factory = self._app.entity_factory
+
+        for payload in payloads:
+            user = entity_factory.deserialize_user(payload["user"])
+            member = entity_factory.deserialize_member(payload, user=user, guild_id=guild_id)
+            member_data = cache_utility.MemberData.build_from_entity(
+                member, user=self._set_user(user), pools=self._intern_pools
+            )
+            self._set_member_data(guild_record, user.id, member_data, is_reference=False)
+
     def _set_member(
         self, member: guilds.Member, /, *, is_reference: bool = True
     ) -> cache_utility.RefCell[cache_utility.MemberData]:
         guild_record = self._get_or_create_guild_record(member.guild_id)
         user = self._set_user(member.user)
-        member_data = cache_utility.MemberData.build_from_entity(member, user=user)
+        member_data = cache_utility.MemberData.build_from_entity(member, user=user, pools=self._intern_pools)
+        return self._set_member_data(guild_record, member.user.id, member_data, is_reference=is_reference)
 
+    def _set_member_data(
+        self,
+        guild_record: cache_utility.GuildRecord,
+        user_id: snowflakes.Snowflake,
+        member_data: cache_utility.MemberData,
+        /,
+        *,
+        is_reference: bool,
+    ) -> cache_utility.RefCell[cache_utility.MemberData]:
         if guild_record.members is None:  # TODO: test when this is not None
             guild_record.members = collections.FreezableDict()
 
-        if member.user.id not in guild_record.members:
+        if user_id not in guild_record.members:
             self._increment_ref_count(member_data.user)
 
         try:
             member_data.has_been_deleted = False
             if is_reference:
-                member_data.has_been_deleted = guild_record.members[member.id].object.has_been_deleted
+                member_data.has_been_deleted = guild_record.members[user_id].object.has_been_deleted
 
-            guild_record.members[member.id].object = member_data
+            guild_record.members[user_id].object = member_data
 
         except KeyError:
             member_data.has_been_deleted = is_reference
-            guild_record.members[member.id] = cache_utility.RefCell(member_data)
+            guild_record.members[user_id] = cache_utility.RefCell(member_data)
 
-        return guild_record.members[member.id]
+        return guild_record.members[user_id]
 
     @typing_extensions.override
     def update_member(self, member: guilds.Member, /) -> tuple[guilds.Member | None, guilds.Member | None]:
@@ -1414,7 +1624,7 @@ def set_presence(self, presence: presences.MemberPresence, /) -> None:
         if not self._is_cache_enabled_for(config_api.CacheComponents.PRESENCES):
             return
 
-        presence_data = cache_utility.MemberPresenceData.build_from_entity(presence)
+        presence_data = cache_utility.MemberPresenceData.build_from_entity(presence, pools=self._intern_pools)
         for activity, activity_data in zip(presence.activities, presence_data.activities):
             emoji = activity.emoji
             if not isinstance(emoji, emojis.CustomEmoji):
@@ -1459,6 +1669,7 @@ def clear_roles(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
         for guild_id, guild_record in self._guild_entries.freeze().items():
             if guild_record.roles:  # TODO: test coverage for when not this
                 guild_record.roles = None
+                guild_record.version = None
                 self._remove_guild_record_if_empty(guild_id, guild_record)
 
         return cache_utility.CacheMappingView(roles)
@@ -1479,6 +1690,7 @@ def clear_roles_for_guild(
             {role_id: self._role_entries.pop(role_id) for role_id in guild_record.roles}
         )
         guild_record.roles = None
+        guild_record.version = None
         self._remove_guild_record_if_empty(guild_id, guild_record)
         return view
 
@@ -1495,6 +1707,7 @@ def delete_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) ->
         guild_record = self._guild_entries.get(role.guild_id)
         if guild_record and guild_record.roles:
             guild_record.roles.remove(role_id)
+            guild_record.version = None
 
             if not guild_record.roles:
                 guild_record.roles = None
@@ -1537,6 +1750,7 @@ def set_role(self, role: guilds.Role, /) -> None:
 
         self._role_entries[role.id] = role
         guild_record = self._get_or_create_guild_record(role.guild_id)
+        guild_record.version = None
 
         if guild_record.roles is None:  # TODO: test when this is not None
             guild_record.roles = collections.SnowflakeSet()
@@ -1581,11 +1795,13 @@ def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
         return cache_utility.CacheMappingView(cached_users, builder=unwrapper)  # type: ignore[type-var]
 
     def _set_user(self, user: users.User, /) -> cache_utility.RefCell[users.User]:
+        # Always copy, as the entity factory may share user objects with the events it builds.
+        user = copy.copy(user)
         try:
-            self._user_entries[user.id].object = copy.copy(user)
+            self._user_entries[user.id].object = user
             cell = self._user_entries[user.id]
         except KeyError:
-            cell = cache_utility.RefCell(copy.copy(user))
+            cell = cache_utility.RefCell(user)
             self._user_entries[user.id] = cell
 
         return cell
@@ -1773,7 +1989,9 @@ def set_voice_state(self, voice_state: voices.VoiceState, /) -> None:
         else:
             member = None
 
-        voice_state_data = cache_utility.VoiceStateData.build_from_entity(voice_state, member=member)
+        voice_state_data = cache_utility.VoiceStateData.build_from_entity(
+            voice_state, member=member, pools=self._intern_pools
+        )
 
         guild_record.voice_states[voice_state.user_id] = voice_state_data
 
@@ -1828,7 +2046,30 @@ def _garbage_collect_message(
 
         return message
 
+    def _index_channel_message(self, channel_id: snowflakes.Snowflake, message_id: snowflakes.Snowflake) -> None:
+        message_ids = self._channel_message_ids.get(channel_id)
+        if message_ids is None:
+            message_ids = self._channel_message_ids[channel_id] = collections.SnowflakeSet()
+
+        message_ids.add(message_id)
+
+        while len(message_ids) > self._settings.max_messages_per_channel:
+            expired_message = self._message_entries.pop(message_ids.pop_oldest(), None)
+            if expired_message:
+                self._on_message_expire(expired_message)
+
+    def _unindex_channel_message(self, message: cache_utility.MessageData, /) -> None:
+        message_ids = self._channel_message_ids.get(message.channel_id)
+        if message_ids is None:
+            return
+
+        message_ids.discard(message.id)
+        if not message_ids:
+            del self._channel_message_ids[message.channel_id]
+
     def _on_message_expire(self, message: cache_utility.RefCell[cache_utility.MessageData], /) -> None:
+        self._unindex_channel_message(message.object)
+
         if not self._garbage_collect_message(message):
             self._referenced_messages[message.object.id] = message
 
@@ -1840,6 +2081,7 @@ def clear_messages(self) -> cache.CacheView[snowflakes.Snowflake, messages.Messa
         # As the only entry which references messages is other messages, this is enough for now.
         cached_messages = self._message_entries.freeze()
         self._message_entries.clear()
+        self._channel_message_ids.clear()
         cached_messages.update(self._referenced_messages)
         self._referenced_messages.clear()
 
@@ -1859,6 +2101,8 @@ def delete_message(self, message: snowflakes.SnowflakeishOr[messages.PartialMess
         if not message_data:
             return None
 
+        self._unindex_channel_message(message_data.object)
+
         if not self._garbage_collect_message(message_data):
             self._referenced_messages[message_id] = message_data
             return None
@@ -1883,6 +2127,31 @@ def get_messages_view(self) -> cache.CacheView[snowflakes.Snowflake, messages.Me
         cached_messages.update(self._referenced_messages)
         return cache_utility.CacheMappingView(cached_messages, builder=self._build_message)  # type: ignore[type-var]
 
+    @typing_extensions.override
+    def get_messages_view_for_channel(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.PartialChannel],
+        /,
+        *,
+        before: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        after: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        limit: undefined.UndefinedOr[int] = undefined.UNDEFINED,
+    ) -> cache.CacheView[snowflakes.Snowflake, messages.Message]:
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MESSAGES):
+            return cache_utility.EmptyCacheView()
+
+        message_ids = self._channel_message_ids.get(snowflakes.Snowflake(channel))
+        if not message_ids:
+            return cache_utility.EmptyCacheView()
+
+        message_ids_in_range = message_ids.get_range(
+            after=_to_searchable_snowflake(after),
+            before=_to_searchable_snowflake(before),
+            limit=None if limit is undefined.UNDEFINED else limit,
+        )
+        cached_messages = {message_id: self._message_entries[message_id] for message_id in message_ids_in_range}
+        return cache_utility.CacheMappingView(cached_messages, builder=self._build_message)  # type: ignore[type-var]
+
     # We rather keep everything we can here inline.
     def _set_message(  # noqa: PLR0912
         self, message: messages.Message, /, *, is_reference: bool = True
@@ -1945,6 +2214,7 @@ def set_message(self, message: messages.Message, /) -> None:
             return
 
         self._set_message(message, is_reference=False)
+        self._index_channel_message(message.channel_id, message.id)
 
     @typing_extensions.override
     def update_message(
@@ -328,6 +328,19 @@ class CacheSettings(config.CacheSettings):
     Defaults to `300`.
     """
 
+    max_messages_per_channel: int = attrs.field(default=100)
+    """The maximum number of messages to store in the cache for each channel.
+
+    Once a channel reaches this limit, its oldest messages will be removed
+    as new ones are added, meaning a single busy channel cannot evict the
+    messages of every other channel. The global limit set by
+    [`hikari.impl.config.CacheSettings.max_messages`][] still applies.
+
+    This will have no effect if the messages cache is not enabled.
+
+    Defaults to `100`.
+    """
+
     max_dm_channel_ids: int = attrs.field(default=50)
     """The maximum number of channel IDs to store in the cache at once.
 
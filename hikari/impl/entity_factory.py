@@ -66,17 +66,32 @@
 from hikari.interactions import component_interactions
 from hikari.interactions import modal_interactions
 from hikari.internal import attrs_extensions
+from hikari.internal import collections
 from hikari.internal import data_binding
+from hikari.internal import fast_deserializers
 from hikari.internal import time
 from hikari.internal import typing_extensions
+from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
+    from hikari.internal import gateway_records
+
     ValueT = typing.TypeVar("ValueT")
+    ParamsT = typing.ParamSpec("ParamsT")
     EntityT = typing.TypeVar("EntityT")
     UndefinedSnowflakeMapping = undefined.UndefinedOr[typing.Mapping[snowflakes.Snowflake, EntityT]]
 
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.entity_factory")
+# Errors the generated deserializers raise on payloads they can't handle, which the regular ones deal with instead.
+_FAST_PATH_ERRORS: typing.Final[tuple[type[Exception], ...]] = (KeyError, TypeError, ValueError)
+# The generated deserializers replace these methods and call each other directly, so they would bypass overrides.
+_GENERATED_DESERIALIZERS: typing.Final[tuple[str, ...]] = (
+    "deserialize_embed",
+    "deserialize_member",
+    "deserialize_message",
+    "deserialize_user",
+)
 
 _interaction_option_type_mapping: dict[int, typing.Callable[[typing.Any], typing.Any]] = {
     commands.OptionType.USER: snowflakes.Snowflake,
@@ -92,6 +107,11 @@ def _with_int_cast(cast: typing.Callable[[int], ValueT]) -> typing.Callable[[typ
     return lambda value: cast(int(value))
 
 
+def _defer(function: typing.Callable[ParamsT, ValueT], /, *args: ParamsT.args, **kwargs: ParamsT.kwargs) -> ValueT:
+    """Defer a call until the lazy model field it's passed to is first accessed."""
+    return typing.cast("ValueT", attrs_extensions.DeferredCall(function, *args, **kwargs))
+
+
 def _deserialize_seconds_timedelta(seconds: str | int) -> datetime.timedelta:
     return datetime.timedelta(seconds=int(seconds))
 
@@ -114,6 +134,13 @@ def _deserialize_max_age(seconds: int) -> datetime.timedelta | None:
     return datetime.timedelta(seconds=seconds) if seconds > 0 else None
 
 
+def _get_record_deserializers() -> gateway_records.RecordDeserializers:
+    # This is kept inline as msgspec is an optional dependency, and records can only be received if it is installed.
+    from hikari.internal import gateway_records  # noqa: PLC0415
+
+    return gateway_records.get_record_deserializers()
+
+
 @attrs_extensions.with_copy
 @attrs.define(kw_only=True, repr=False, weakref_slot=False)
 class _GuildChannelFields:
@@ -458,6 +485,26 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
     """Standard implementation for a serializer/deserializer.
 
     This will convert objects to/from JSON compatible representations.
+
+    Parameters
+    ----------
+    app
+        The application this factory builds entities for.
+    fast_paths
+        Whether to deserialize messages, members, users and embeds with the
+        generated deserializers from [`hikari.internal.fast_deserializers`][].
+        These are faster, and the regular deserializers are used as a fallback
+        for any payload which they fail to handle.
+
+        The generated deserializers are not used if any of these methods are
+        overridden by a subclass, as they would bypass the override.
+    user_identity_map_size
+        How many users to remember so that [`hikari.impl.entity_factory.EntityFactoryImpl.deserialize_user`][]
+        can return the same object for a user until their payload changes. If
+        `0`, a new object is built for each payload.
+
+        Enabling this cuts down on allocations when the same users are seen
+        over and over again, but the shared user objects must not be modified.
     """
 
     __slots__: typing.Sequence[str] = (
@@ -470,6 +517,8 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         "_command_mapping",
         "_container_component_mapping",
         "_dm_channel_type_mapping",
+        "_fast_deserializers",
+        "_generated_records",
         "_guild_channel_type_mapping",
         "_interaction_metadata_mapping",
         "_interaction_type_mapping",
@@ -479,11 +528,24 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         "_section_component_mapping",
         "_thread_channel_type_mapping",
         "_top_level_components_mapping",
+        "_user_identity_map",
         "_webhook_type_mapping",
     )
 
-    def __init__(self, app: traits.RESTAware) -> None:
+    def __init__(self, app: traits.RESTAware, *, fast_paths: bool = False, user_identity_map_size: int = 0) -> None:
         self._app = app
+        overridden = any(
+            getattr(type(self), name) is not getattr(EntityFactoryImpl, name) for name in _GENERATED_DESERIALIZERS
+        )
+        self._fast_deserializers = (
+            fast_deserializers.get_fast_deserializers() if fast_paths and not overridden else None
+        )
+        # Records implement the mapping interface, so the regular deserializers can handle them too.
+        self._generated_records = not overridden
+        # User ID -> (payload items, user)
+        self._user_identity_map: (
+            collections.LimitedCapacityCacheMap[str, tuple[tuple[tuple[str, typing.Any], ...], user_models.User]] | None
+        ) = collections.LimitedCapacityCacheMap(limit=user_identity_map_size) if user_identity_map_size > 0 else None
         self._audit_log_entry_converters: dict[str, typing.Callable[[typing.Any], typing.Any]] = {
             audit_log_models.AuditLogChangeKey.OWNER_ID: snowflakes.Snowflake,
             audit_log_models.AuditLogChangeKey.AFK_CHANNEL_ID: snowflakes.Snowflake,
@@ -1784,6 +1846,12 @@ def deserialize_channel(
 
     @typing_extensions.override
     def deserialize_embed(self, payload: data_binding.JSONObject) -> embed_models.Embed:
+        if self._fast_deserializers is not None:
+            try:
+                return self._fast_deserializers.embed(self, payload)
+            except _FAST_PATH_ERRORS:
+                _LOGGER.log(ux.TRACE, "falling back to the regular embed deserializer", exc_info=True)
+
         # Keep these separate to aid debugging later.
         title = payload.get("title")
         description = payload.get("description")
@@ -2144,6 +2212,15 @@ def deserialize_member(
         user: undefined.UndefinedOr[user_models.User] = undefined.UNDEFINED,
         guild_id: undefined.UndefinedOr[snowflakes.Snowflake] = undefined.UNDEFINED,
     ) -> guild_models.Member:
+        if self._generated_records and isinstance(payload, data_binding.JSONRecord):
+            return _get_record_deserializers().member(self, payload, user, guild_id)
+
+        if self._fast_deserializers is not None:
+            try:
+                return self._fast_deserializers.member(self, payload, user, guild_id)
+            except _FAST_PATH_ERRORS:
+                _LOGGER.log(ux.TRACE, "falling back to the regular member deserializer", exc_info=True)
+
         if user is undefined.UNDEFINED:
             user = self.deserialize_user(payload["user"])
 
@@ -2155,36 +2232,24 @@ def deserialize_member(
         if guild_id not in role_ids:
             role_ids.append(guild_id)
 
-        raw_joined_at = payload["joined_at"]
-        joined_at = time.iso8601_datetime_string_to_datetime(raw_joined_at) if raw_joined_at is not None else None
-
-        raw_premium_since = payload.get("premium_since")
-        premium_since = (
-            time.iso8601_datetime_string_to_datetime(raw_premium_since) if raw_premium_since is not None else None
-        )
-
         guild_flags = guild_models.GuildMemberFlags(payload.get("flags") or guild_models.GuildMemberFlags.NONE)
-
-        communication_disabled_until: datetime.datetime | None = None
-        if raw_communication_disabled_until := payload.get("communication_disabled_until"):
-            communication_disabled_until = time.iso8601_datetime_string_to_datetime(raw_communication_disabled_until)
-
         avatar_decoration = self._deserialize_avatar_decoration(payload.get("avatar_decoration_data"))
 
         return guild_models.Member(
             user=user,
             guild_id=guild_id,
             role_ids=role_ids,
-            joined_at=joined_at,
+            # The timestamps are parsed on first access, see Member.
+            joined_at=payload["joined_at"],
             nickname=payload.get("nick"),
             guild_avatar_decoration=avatar_decoration,
             guild_avatar_hash=payload.get("avatar"),
             guild_banner_hash=payload.get("banner"),
-            premium_since=premium_since,
+            premium_since=payload.get("premium_since"),
             is_deaf=payload.get("deaf", undefined.UNDEFINED),
             is_mute=payload.get("mute", undefined.UNDEFINED),
             is_pending=payload.get("pending", undefined.UNDEFINED),
-            raw_communication_disabled_until=communication_disabled_until,
+            raw_communication_disabled_until=payload.get("communication_disabled_until") or None,
             guild_flags=guild_flags,
         )
 
@@ -3085,9 +3150,9 @@ def deserialize_autocomplete_interaction(
         member: base_interactions.InteractionMember | None
         if member_payload := payload.get("member"):
             assert guild_id is not None
-            member = self._deserialize_interaction_member(member_payload, guild_id=guild_id)
             # See https://github.com/discord/discord-api-docs/pull/2568
-            user = member.user
+            user = self.deserialize_user(member_payload["user"])
+            member = _defer(self._deserialize_interaction_member, member_payload, guild_id=guild_id, user=user)
 
         else:
             member = None
@@ -3106,7 +3171,7 @@ def deserialize_autocomplete_interaction(
             id=snowflakes.Snowflake(payload["id"]),
             type=base_interactions.InteractionType(payload["type"]),
             guild_id=guild_id,
-            channel=self._deserialize_interaction_channel(payload["channel"]),
+            channel=_defer(self._deserialize_interaction_channel, payload["channel"]),
             member=member,
             user=user,
             token=payload["token"],
@@ -3284,9 +3349,9 @@ def deserialize_component_interaction(
         member: base_interactions.InteractionMember | None
         if member_payload := payload.get("member"):
             assert guild_id is not None
-            member = self._deserialize_interaction_member(member_payload, guild_id=guild_id)
             # See https://github.com/discord/discord-api-docs/pull/2568
-            user = member.user
+            user = self.deserialize_user(member_payload["user"])
+            member = _defer(self._deserialize_interaction_member, member_payload, guild_id=guild_id, user=user)
 
         else:
             member = None
@@ -3294,7 +3359,7 @@ def deserialize_component_interaction(
 
         resolved: base_interactions.ResolvedOptionData | None = None
         if resolved_payload := data_payload.get("resolved"):
-            resolved = self._deserialize_resolved_option_data(resolved_payload, guild_id=guild_id)
+            resolved = _defer(self._deserialize_resolved_option_data, resolved_payload, guild_id=guild_id)
 
         authorizing_integration_owners = {
             application_models.ApplicationIntegrationType(int(integration_type)): snowflakes.Snowflake(
@@ -3309,7 +3374,7 @@ def deserialize_component_interaction(
             id=snowflakes.Snowflake(payload["id"]),
             type=base_interactions.InteractionType(payload["type"]),
             guild_id=guild_id,
-            channel=self._deserialize_interaction_channel(payload["channel"]),
+            channel=_defer(self._deserialize_interaction_channel, payload["channel"]),
             member=member,
             user=user,
             token=payload["token"],
@@ -3318,7 +3383,7 @@ def deserialize_component_interaction(
             version=payload["version"],
             custom_id=data_payload["custom_id"],
             component_type=component_models.ComponentType(data_payload["component_type"]),
-            message=self.deserialize_message(payload["message"]),
+            message=_defer(self.deserialize_message, payload["message"]),
             locale=locales.Locale(payload["locale"]),
             guild_locale=locales.Locale(payload["guild_locale"]) if "guild_locale" in payload else None,
             app_permissions=permission_models.Permissions(payload["app_permissions"]),
@@ -4030,6 +4095,15 @@ def deserialize_partial_message(  # noqa: C901, PLR0912, PLR0915
 
     @typing_extensions.override
     def deserialize_message(self, payload: data_binding.JSONObject) -> message_models.Message:  # noqa: PLR0912, PLR0915
+        if self._generated_records and isinstance(payload, data_binding.JSONRecord):
+            return _get_record_deserializers().message(self, payload)
+
+        if self._fast_deserializers is not None:
+            try:
+                return self._fast_deserializers.message(self, payload)
+            except _FAST_PATH_ERRORS:
+                _LOGGER.log(ux.TRACE, "falling back to the regular message deserializer", exc_info=True)
+
         author = self.deserialize_user(payload["author"])
 
         guild_id: snowflakes.Snowflake | None = None
@@ -4040,10 +4114,6 @@ def deserialize_message(self, payload: data_binding.JSONObject) -> message_model
             if member_pl := payload.get("member"):
                 member = self.deserialize_member(member_pl, user=author, guild_id=guild_id)
 
-        edited_timestamp: datetime.datetime | None = None
-        if (raw_edited_timestamp := payload["edited_timestamp"]) is not None:
-            edited_timestamp = time.iso8601_datetime_string_to_datetime(raw_edited_timestamp)
-
         attachments = [self._deserialize_message_attachment(attachment) for attachment in payload["attachments"]]
 
         embeds = [self.deserialize_embed(embed) for embed in payload["embeds"]]
@@ -4110,8 +4180,9 @@ def deserialize_message(self, payload: data_binding.JSONObject) -> message_model
             author=author,
             member=member,
             content=payload["content"] or None,
-            timestamp=time.iso8601_datetime_string_to_datetime(payload["timestamp"]),
-            edited_timestamp=edited_timestamp,
+            # The timestamps are parsed on first access, see Message.
+            timestamp=payload["timestamp"],
+            edited_timestamp=payload["edited_timestamp"],
             is_tts=payload["tts"],
             attachments=attachments,
             embeds=embeds,
@@ -4154,11 +4225,10 @@ def deserialize_member_presence(
             timestamps: presence_models.ActivityTimestamps | None = None
             if "timestamps" in activity_payload:
                 timestamps_payload = activity_payload["timestamps"]
-                start = (
-                    time.unix_epoch_to_datetime(timestamps_payload["start"]) if "start" in timestamps_payload else None
+                # The timestamps are parsed on first access, see ActivityTimestamps.
+                timestamps = presence_models.ActivityTimestamps(
+                    start=timestamps_payload.get("start"), end=timestamps_payload.get("end")
                 )
-                end = time.unix_epoch_to_datetime(timestamps_payload["end"]) if "end" in timestamps_payload else None
-                timestamps = presence_models.ActivityTimestamps(start=start, end=end)
 
             application_id = (
                 snowflakes.Snowflake(activity_payload["application_id"])
@@ -4213,7 +4283,8 @@ def deserialize_member_presence(
                 # RichActivity's generated init already declares a converter for the "type" field
                 type=activity_payload["type"],
                 url=activity_payload.get("url"),
-                created_at=time.unix_epoch_to_datetime(activity_payload["created_at"]),
+                # This is parsed on first access, see RichActivity.
+                created_at=activity_payload["created_at"],
                 timestamps=timestamps,
                 application_id=application_id,
                 details=activity_payload.get("details"),
@@ -4493,6 +4564,38 @@ def _set_user_attributes(self, payload: data_binding.JSONObject) -> _UserFields:
 
     @typing_extensions.override
     def deserialize_user(self, payload: data_binding.JSONObject) -> user_models.User:
+        if self._user_identity_map is not None:
+            return self._get_or_build_user(payload, EntityFactoryImpl._build_user)
+
+        return self._build_user(payload)
+
+    def _get_or_build_user(
+        self,
+        payload: data_binding.JSONObject,
+        build: typing.Callable[[EntityFactoryImpl, data_binding.JSONObject], user_models.User],
+        /,
+    ) -> user_models.User:
+        assert self._user_identity_map is not None
+        # Comparing the payload items is cheaper than building a user and only hits when nothing changed.
+        items = tuple(payload.items())
+        user_id = payload["id"]
+        if (entry := self._user_identity_map.get(user_id)) is not None and entry[0] == items:
+            return entry[1]
+
+        user = build(self, payload)
+        self._user_identity_map[user_id] = (items, user)
+        return user
+
+    def _build_user(self, payload: data_binding.JSONObject) -> user_models.User:
+        if self._generated_records and isinstance(payload, data_binding.JSONRecord):
+            return _get_record_deserializers().user(self, payload)
+
+        if self._fast_deserializers is not None:
+            try:
+                return self._fast_deserializers.user(self, payload)
+            except _FAST_PATH_ERRORS:
+                _LOGGER.log(ux.TRACE, "falling back to the regular user deserializer", exc_info=True)
+
         user_fields = self._set_user_attributes(payload)
         flags = (
             user_models.UserFlag(payload["public_flags"]) if "public_flags" in payload else user_models.UserFlag.NONE
@@ -695,6 +695,12 @@ def deserialize_stopping_event(self) -> lifetime_events.StoppingEvent:
     def deserialize_stopped_event(self) -> lifetime_events.StoppedEvent:
         return lifetime_events.StoppedEvent(app=self._app)
 
+    @typing_extensions.override
+    def deserialize_event_loop_blocked_event(
+        self, *, duration: float, task_name: str | None, stack: typing.Sequence[str]
+    ) -> lifetime_events.EventLoopBlockedEvent:
+        return lifetime_events.EventLoopBlockedEvent(app=self._app, duration=duration, task_name=task_name, stack=stack)
+
     ##################
     # MESSAGE EVENTS #
     ##################
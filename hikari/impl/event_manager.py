@@ -53,6 +53,7 @@
 from hikari.events import user_events
 from hikari.events import voice_events
 from hikari.impl import event_manager_base
+from hikari.internal import cache as cache_utility
 from hikari.internal import time
 from hikari.internal import ux
 
@@ -64,6 +65,7 @@
     from hikari.api import entity_factory as entity_factory_
     from hikari.api import event_factory as event_factory_
     from hikari.api import shard as gateway_shard
+    from hikari.impl import instrumentation as instrumentation_
     from hikari.internal import data_binding
 
 
@@ -111,6 +113,7 @@ def __init__(
         *,
         auto_chunk_members: bool = True,
         cache: cache_.MutableCache | None = None,
+        instrumentation: instrumentation_.PipelineInstrumentation | None = None,
     ) -> None:
         self._cache = cache
         self._auto_chunk_members = auto_chunk_members
@@ -118,11 +121,28 @@ def __init__(
         self._guild_member_request_tasks: set[asyncio.Task[None]] = set()
 
         components = cache.settings.components if cache else config.CacheComponents.NONE
-        super().__init__(event_factory=event_factory, intents=intents, cache_components=components)
+        super().__init__(
+            event_factory=event_factory, intents=intents, cache_components=components, instrumentation=instrumentation
+        )
 
     def _cache_enabled_for(self, components: config.CacheComponents, /) -> bool:
         return self._cache is not None and (self._cache.settings.components & components) == components
 
+    def _check_guild_version(
+        self, guild_id: snowflakes.Snowflake, payload: data_binding.JSONObject
+    ) -> tuple[bytes | None, bool]:
+        # If a guild's channels, emojis and roles are unchanged since they were last cached (e.g. when restored from
+        # a snapshot), then we can skip deserializing and re-caching them.
+        if not self._cache or not (
+            self._cache_enabled_for(config.CacheComponents.GUILD_CHANNELS)
+            or self._cache_enabled_for(config.CacheComponents.EMOJIS)
+            or self._cache_enabled_for(config.CacheComponents.ROLES)
+        ):
+            return None, False
+
+        version = cache_utility.compute_guild_version(payload)
+        return version, self._cache.get_guild_version(guild_id) == version
+
     @event_manager_base.filtered(shard_events.ShardReadyEvent, config.CacheComponents.ME)
     def on_ready(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway-events#ready for more info."""
@@ -291,30 +311,49 @@ def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too complex, too
             event = None
 
         if event:
+            guild_id = event.guild.id
+            version, is_unchanged = self._check_guild_version(guild_id, payload)
             # We also filter here to prevent iterating over them and calling a function that won't do anything
-            channels = event.channels if self._cache_enabled_for(config.CacheComponents.GUILD_CHANNELS) else None
-            emojis = event.emojis if self._cache_enabled_for(config.CacheComponents.EMOJIS) else None
+            channels = (
+                event.channels
+                if not is_unchanged and self._cache_enabled_for(config.CacheComponents.GUILD_CHANNELS)
+                else None
+            )
+            emojis = (
+                event.emojis if not is_unchanged and self._cache_enabled_for(config.CacheComponents.EMOJIS) else None
+            )
             stickers = event.stickers if self._cache_enabled_for(config.CacheComponents.GUILD_STICKERS) else None
             guild = event.guild if self._cache_enabled_for(config.CacheComponents.GUILDS) else None
-            guild_id = event.guild.id
             members = event.members if self._cache_enabled_for(config.CacheComponents.MEMBERS) else None
+            member_payloads = None
             presences = event.presences if self._cache_enabled_for(config.CacheComponents.PRESENCES) else None
-            roles = event.roles if self._cache_enabled_for(config.CacheComponents.ROLES) else None
+            roles = event.roles if not is_unchanged and self._cache_enabled_for(config.CacheComponents.ROLES) else None
             voice_states = event.voice_states if self._cache_enabled_for(config.CacheComponents.VOICE_STATES) else None
             threads = event.threads if self._cache_enabled_for(config.CacheComponents.GUILD_THREADS) else None
 
         elif self._cache:
             _LOGGER.log(ux.TRACE, "Skipping on_guild_create dispatch due to lack of any registered listeners")
             gd = self._entity_factory.deserialize_gateway_guild(payload, user_id=shard.get_user_id())
+            guild_id = gd.id
+            version, is_unchanged = self._check_guild_version(guild_id, payload)
 
-            channels = gd.channels() if self._cache_enabled_for(config.CacheComponents.GUILD_CHANNELS) else None
-            emojis = gd.emojis() if self._cache_enabled_for(config.CacheComponents.EMOJIS) else None
+            channels = (
+                gd.channels()
+                if not is_unchanged and self._cache_enabled_for(config.CacheComponents.GUILD_CHANNELS)
+                else None
+            )
+            emojis = (
+                gd.emojis() if not is_unchanged and self._cache_enabled_for(config.CacheComponents.EMOJIS) else None
+            )
             stickers = gd.stickers() if self._cache_enabled_for(config.CacheComponents.GUILD_STICKERS) else None
             guild = gd.guild() if self._cache_enabled_for(config.CacheComponents.GUILDS) else None
-            guild_id = gd.id
-            members = gd.members() if self._cache_enabled_for(config.CacheComponents.MEMBERS) else None
+            # Members are the bulk of a large guild, so they are cached straight from the payload
+            members = None
+            member_payloads = (
+                payload.get("members") if self._cache_enabled_for(config.CacheComponents.MEMBERS) else None
+            )
             presences = gd.presences() if self._cache_enabled_for(config.CacheComponents.PRESENCES) else None
-            roles = gd.roles() if self._cache_enabled_for(config.CacheComponents.ROLES) else None
+            roles = gd.roles() if not is_unchanged and self._cache_enabled_for(config.CacheComponents.ROLES) else None
             voice_states = gd.voice_states() if self._cache_enabled_for(config.CacheComponents.VOICE_STATES) else None
             threads = gd.threads() if self._cache_enabled_for(config.CacheComponents.GUILD_THREADS) else None
 
@@ -328,7 +367,9 @@ def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too complex, too
             stickers = None
             guild = None
             guild_id = snowflakes.Snowflake(payload["id"])
+            version = None
             members = None
+            member_payloads = None
             presences = None
             roles = None
             voice_states = None
@@ -368,6 +409,14 @@ def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too complex, too
                     my_member = members[shard.get_user_id()]
                     self._cache.set_member(my_member)
 
+            if member_payloads:
+                self._cache.clear_members_for_guild(guild_id)
+                if self._cache.settings.only_my_member:
+                    user_id = shard.get_user_id()
+                    member_payloads = [p for p in member_payloads if p["user"]["id"] == str(user_id)]
+
+                self._cache.set_members_from_payloads(guild_id, member_payloads)
+
             if presences:
                 self._cache.clear_presences_for_guild(guild_id)
                 for presence in presences.values():
@@ -383,6 +432,9 @@ def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too complex, too
                 for thread in threads.values():
                     self._cache.set_thread(thread)
 
+            if version is not None:
+                self._cache.set_guild_version(guild_id, version)
+
         # We only want to chunk if we are allowed and need to:
         #   Allowed?
         #       All the following must be true:
@@ -627,6 +679,20 @@ def on_guild_member_update(self, shard: gateway_shard.GatewayShard, payload: dat
     @event_manager_base.filtered(shard_events.MemberChunkEvent, config.CacheComponents.MEMBERS)
     def on_guild_members_chunk(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway-events#guild-members-chunk for more info."""
+        if self._cache and not self._enabled_for_event(shard_events.MemberChunkEvent):
+            _LOGGER.log(ux.TRACE, "Skipping on_guild_members_chunk dispatch due to lack of any registered listeners")
+            guild_id = snowflakes.Snowflake(payload["guild_id"])
+            self._cache.set_members_from_payloads(guild_id, payload["members"])
+
+            if (presence_payloads := payload.get("presences")) and self._cache_enabled_for(
+                config.CacheComponents.PRESENCES
+            ):
+                for presence_payload in presence_payloads:
+                    presence = self._entity_factory.deserialize_member_presence(presence_payload, guild_id=guild_id)
+                    self._cache.set_presence(presence)
+
+            return
+
         event = self._event_factory.deserialize_guild_member_chunk_event(shard, payload)
 
         if self._cache:
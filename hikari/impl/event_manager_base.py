@@ -41,6 +41,7 @@
 from hikari.api import event_manager as event_manager_
 from hikari.events import base_events
 from hikari.events import shard_events
+from hikari.impl import instrumentation as instrumentation_
 from hikari.internal import fast_protocol
 from hikari.internal import typing_extensions
 from hikari.internal import ux
@@ -311,12 +312,17 @@ class EventManagerBase(event_manager_.EventManager):
 
     Specific event handlers should be in functions named `on_xxx` where `xxx`
     is the raw event name being dispatched in lower-case.
+
+    If `instrumentation` is provided, the time taken by the consumers, by
+    [`hikari.impl.event_manager_base.EventManagerBase.dispatch`][] and by each
+    listener is recorded in it.
     """
 
     __slots__: typing.Sequence[str] = (
         "_consumers",
         "_dispatched_tasks",
         "_event_factory",
+        "_instrumentation",
         "_intents",
         "_listeners",
         "_waiters",
@@ -328,9 +334,11 @@ def __init__(
         intents: intents_.Intents,
         *,
         cache_components: config.CacheComponents = config.CacheComponents.NONE,
+        instrumentation: instrumentation_.PipelineInstrumentation | None = None,
     ) -> None:
         self._consumers: dict[str, _Consumer] = {}
         self._event_factory = event_factory
+        self._instrumentation = instrumentation
         self._intents = intents
         self._listeners: _ListenerMapT[base_events.Event] = {}
         self._waiters: _WaiterMapT[base_events.Event] = {}
@@ -416,6 +424,9 @@ def consume_raw_event(
             )
             return
 
+        instrumentation = self._instrumentation
+        start = instrumentation.clock() if instrumentation is not None else 0.0
+
         try:
             consumer.callback(shard, payload)
         except errors.UnrecognisedEntityError:
@@ -430,6 +441,9 @@ def consume_raw_event(
                 }
             )
 
+        if instrumentation is not None:
+            instrumentation.record(instrumentation_.CONSUME_STAGE, event_name, instrumentation.clock() - start)
+
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
     # For the sake of UX, I will check this at runtime instead and let the
@@ -556,6 +570,8 @@ def dispatch(
     def dispatch(  # noqa: PLR0912 - Too many branches
         self, event: base_events.Event, *, return_tasks: bool = False
     ) -> asyncio.Future[typing.Any] | None:
+        instrumentation = self._instrumentation
+        start = instrumentation.clock() if instrumentation is not None else 0.0
         tasks: list[asyncio.Task[None]] = []
 
         for cls in event.dispatches():
@@ -593,6 +609,11 @@ def dispatch(  # noqa: PLR0912 - Too many branches
                 del self._waiters[cls]
                 self._increment_waiter_group_count(cls, -1)
 
+        if instrumentation is not None:
+            instrumentation.record(
+                instrumentation_.DISPATCH_STAGE, type(event).__name__, instrumentation.clock() - start
+            )
+
         if return_tasks:
             return asyncio.gather(*tasks)
 
@@ -641,6 +662,9 @@ async def wait_for(
     async def _invoke_callback(
         self, callback: event_manager_.CallbackT[base_events.EventT], event: base_events.EventT
     ) -> None:
+        instrumentation = self._instrumentation
+        start = instrumentation.clock() if instrumentation is not None else 0.0
+
         try:
             await callback(event)
         except Exception as ex:
@@ -658,3 +682,8 @@ async def _invoke_callback(
                 log = _LOGGER.debug if self.get_listeners(type(exception_event), polymorphic=True) else _LOGGER.error
                 log("an exception occurred handling an event (%s)", type(event).__name__, exc_info=trio)
                 self.dispatch(exception_event)
+
+        if instrumentation is not None:
+            instrumentation.record(
+                instrumentation_.LISTENER_STAGE, type(event).__name__, instrumentation.clock() - start
+            )
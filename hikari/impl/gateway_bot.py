@@ -45,9 +45,12 @@
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
+from hikari.impl import instrumentation as instrumentation_
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
+from hikari.impl import shared_cache as shared_cache_impl
 from hikari.impl import voice as voice_impl
+from hikari.impl import watchdog as watchdog_impl
 from hikari.internal import aio
 from hikari.internal import data_binding
 from hikari.internal import signals
@@ -159,6 +162,12 @@ class GatewayBot(traits.GatewayBotAware):
         This will take precedence over `allow_color` if both are specified.
     cache_settings
         Optional cache settings. If unspecified, will use the defaults.
+    cache_backend
+        If provided, the cache will share guilds, guild channels, roles,
+        emojis and members with other processes through this backend, using
+        [`hikari.impl.shared_cache.SharedCacheImpl`][].
+
+        The backend will be closed when the bot is closed.
     http_settings
         Optional custom HTTP configuration settings to use. Allows you to
         customise functionality such as whether SSL-verification is enabled,
@@ -245,11 +254,32 @@ class GatewayBot(traits.GatewayBotAware):
         The JSON encoder this application should use.
     loads
         The JSON decoder this application should use.
+
+        [`hikari.impl.typed_decoding.TypedGatewayDecoder`][] can be used to
+        decode hot dispatches into typed records instead.
     rest_url
         Defaults to the Discord REST API URL if [`None`][]. Can be
         overridden if you are attempting to point to an unofficial endpoint, or
         if you are attempting to mock/stub the Discord API for any reason.
         Generally you do not want to change this.
+    enable_instrumentation
+        Whether to record how long each stage of the gateway event pipeline
+        takes for each event.
+
+        The recorded timings can be polled through
+        [`hikari.impl.gateway_bot.GatewayBot.instrumentation`][]. This adds a
+        small overhead to every event, so it is disabled by default.
+    watchdog_threshold
+        If provided, how long the event loop must be blocked for, in seconds,
+        for the watchdog to report it.
+
+        Blocking periods are logged and dispatched as
+        [`hikari.events.lifetime_events.EventLoopBlockedEvent`][], along with
+        the name of the task (such as the listener) which blocked the event
+        loop and a sample of its stack. The watchdog can be accessed through
+        [`hikari.impl.gateway_bot.GatewayBot.watchdog`][].
+
+        Defaults to [`None`][], which disables the watchdog.
 
     Examples
     --------
@@ -306,6 +336,7 @@ class GatewayBot(traits.GatewayBotAware):
         "_event_manager",
         "_executor",
         "_http_settings",
+        "_instrumentation",
         "_intents",
         "_loads",
         "_proxy_settings",
@@ -314,10 +345,11 @@ class GatewayBot(traits.GatewayBotAware):
         "_token",
         "_token_id",
         "_voice",
+        "_watchdog",
         "shards",
     )
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - Too many arguments
         self,
         token: str,
         *,
@@ -327,6 +359,7 @@ def __init__(
         executor: concurrent.futures.Executor | None = None,
         force_color: bool = False,
         cache_settings: config_impl.CacheSettings | None = None,
+        cache_backend: cache_.CacheBackend | None = None,
         http_settings: config_impl.HTTPSettings | None = None,
         dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         loads: data_binding.JSONDecoder = data_binding.default_json_loads,
@@ -338,6 +371,8 @@ def __init__(
         max_retries: int = 3,
         proxy_settings: config_impl.ProxySettings | None = None,
         rest_url: str | None = None,
+        enable_instrumentation: bool = False,
+        watchdog_threshold: float | None = None,
     ) -> None:
         # Beautification and logging
         ux.init_logging(logs, allow_color=allow_color, force_color=force_color)
@@ -349,6 +384,7 @@ def __init__(
         self._closing_event: asyncio.Event | None = None
         self._executor = executor
         self._http_settings = http_settings if http_settings is not None else config_impl.HTTPSettings()
+        self._instrumentation = instrumentation_.PipelineInstrumentation() if enable_instrumentation else None
         self._intents = intents
         self._capabilities = capabilities
         self._proxy_settings = proxy_settings if proxy_settings is not None else config_impl.ProxySettings()
@@ -359,7 +395,11 @@ def __init__(
 
         # Caching
         cache_settings = cache_settings if cache_settings is not None else config_impl.CacheSettings()
-        self._cache = cache_impl.CacheImpl(self, cache_settings)
+        self._cache: cache_impl.CacheImpl
+        if cache_backend is not None:
+            self._cache = shared_cache_impl.SharedCacheImpl(self, cache_settings, cache_backend)
+        else:
+            self._cache = cache_impl.CacheImpl(self, cache_settings)
 
         # Entity creation
         self._entity_factory = entity_factory_impl.EntityFactoryImpl(self)
@@ -374,11 +414,18 @@ def __init__(
             self._intents,
             auto_chunk_members=auto_chunk_members,
             cache=self._cache,
+            instrumentation=self._instrumentation,
         )
 
         # Voice subsystem
         self._voice = voice_impl.VoiceComponentImpl(self)
 
+        # Event loop watchdog
+        self._watchdog: watchdog_impl.LoopWatchdog | None = None
+        if watchdog_threshold is not None:
+            self._watchdog = watchdog_impl.LoopWatchdog(threshold=watchdog_threshold)
+            self._watchdog.subscribe(self._on_loop_blocked)
+
         # RESTful API.
         self._rest = rest_impl.RESTClientImpl(
             cache=self._cache,
@@ -445,6 +492,25 @@ def heartbeat_latency(self) -> float:
     def http_settings(self) -> config_impl.HTTPSettings:
         return self._http_settings
 
+    @property
+    def watchdog(self) -> watchdog_impl.LoopWatchdog | None:
+        """Watchdog which reports blocking of the event loop, if enabled.
+
+        This will be [`None`][] unless `watchdog_threshold` was set when
+        creating the bot.
+        """
+        return self._watchdog
+
+    @property
+    def instrumentation(self) -> instrumentation_.PipelineInstrumentation | None:
+        """Timings of the gateway event pipeline, if enabled.
+
+        This will be [`None`][] unless `enable_instrumentation` was set when
+        creating the bot. Statistics can be polled with
+        [`hikari.impl.instrumentation.PipelineInstrumentation.get_statistics`][].
+        """
+        return self._instrumentation
+
     @property
     @typing_extensions.override
     def intents(self) -> intents_.Intents:
@@ -518,14 +584,27 @@ async def close(self) -> None:
         self._cache.clear()
         self._shards.clear()
 
+        if isinstance(self._cache, shared_cache_impl.SharedCacheImpl):
+            self._cache.close()
+
         await self._event_manager.dispatch(self._event_factory.deserialize_stopped_event(), return_tasks=True)
 
+        if self._watchdog is not None and self._watchdog.is_alive:
+            await self._watchdog.close()
+
         self._closed_event.set()
         self._closed_event = None
         self._closing_event = None
 
         _LOGGER.info("bot shut down successfully")
 
+    def _on_loop_blocked(self, report: watchdog_impl.BlockedLoopReport, /) -> None:
+        self._event_manager.dispatch(
+            self._event_factory.deserialize_event_loop_blocked_event(
+                duration=report.duration, task_name=report.task_name, stack=report.stack
+            )
+        )
+
     @typing.overload
     def dispatch(self, event: base_events.Event, *, return_tasks: typing.Literal[False] = False) -> None: ...
 
@@ -998,6 +1077,9 @@ async def start(
         self._closed_event = asyncio.Event()
         self._closing_event = asyncio.Event()
 
+        if self._watchdog is not None:
+            self._watchdog.start()
+
         if check_for_updates:
             asyncio.create_task(  # noqa: RUF006 - We want this to be a dangling asyncio task
                 ux.check_for_updates(self._http_settings, self._proxy_settings), name="check for package updates"
@@ -1381,6 +1463,7 @@ async def _start_one_shard(
             shard_count=shard_count,
             token=self._token,
             url=url,
+            instrumentation=self._instrumentation,
         )
         try:
             start = time.time()
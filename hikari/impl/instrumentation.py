@@ -0,0 +1,171 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Opt-in timing instrumentation for the gateway event pipeline."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "CONSUME_STAGE",
+    "DISPATCH_STAGE",
+    "HISTOGRAM_BOUNDS",
+    "LISTENER_STAGE",
+    "LOADS_STAGE",
+    "RECEIVE_STAGE",
+    "WAIT_STAGE",
+    "PipelineInstrumentation",
+    "StageStatistics",
+)
+
+import bisect
+import typing
+
+import attrs
+
+from hikari.internal import time
+
+WAIT_STAGE: typing.Final[str] = "wait"
+"""Stage covering the idle wait for a gateway payload to arrive."""
+
+RECEIVE_STAGE: typing.Final[str] = "receive"
+"""Stage covering the reception (and decompression) of a gateway payload, once it arrived."""
+
+LOADS_STAGE: typing.Final[str] = "loads"
+"""Stage covering the JSON decoding of a gateway payload."""
+
+CONSUME_STAGE: typing.Final[str] = "consume"
+"""Stage covering the raw event consumer of a dispatch (deserialization and cache updates)."""
+
+DISPATCH_STAGE: typing.Final[str] = "dispatch"
+"""Stage covering the scheduling of the listeners and waiters of an event."""
+
+LISTENER_STAGE: typing.Final[str] = "listener"
+"""Stage covering the runtime of a single listener for an event."""
+
+HISTOGRAM_BOUNDS: typing.Final[tuple[float, ...]] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1, 1.0)
+"""Upper bounds (in seconds) of the histogram buckets of [`hikari.impl.instrumentation.StageStatistics`][].
+
+Durations above the last bound are counted in an extra, final bucket.
+"""
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class StageStatistics:
+    """Statistics recorded for an event in a pipeline stage."""
+
+    count: int = attrs.field(default=0)
+    """The number of recorded durations."""
+
+    total: float = attrs.field(default=0.0)
+    """The sum of the recorded durations, in seconds."""
+
+    max: float = attrs.field(default=0.0)
+    """The longest recorded duration, in seconds."""
+
+    buckets: list[int] = attrs.field(factory=lambda: [0] * (len(HISTOGRAM_BOUNDS) + 1))
+    """Histogram of the recorded durations.
+
+    Each element counts the durations which are lower or equal to the
+    bound at the same index in [`HISTOGRAM_BOUNDS`][hikari.impl.instrumentation.HISTOGRAM_BOUNDS],
+    with the last one counting the durations above every bound.
+    """
+
+    @property
+    def mean(self) -> float:
+        """The mean recorded duration, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, duration: float, /) -> None:
+        """Record a duration.
+
+        Parameters
+        ----------
+        duration
+            The duration to record, in seconds.
+        """
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS, duration)] += 1
+
+
+class PipelineInstrumentation:
+    """Per-event timings of each stage of the gateway event pipeline.
+
+    When passed to [`hikari.impl.shard.GatewayShardImpl`][] and
+    [`hikari.impl.event_manager_base.EventManagerBase`][], they record how
+    long each stage took for each event. This is usually enabled through
+    the `enable_instrumentation` argument of [`hikari.impl.gateway_bot.GatewayBot`][]
+    and polled through [`hikari.impl.gateway_bot.GatewayBot.instrumentation`][].
+
+    When no instrumentation is passed, the pipeline only pays for a
+    [`None`][] check in each stage.
+
+    Parameters
+    ----------
+    clock
+        The clock to time stages with. Defaults to [`hikari.internal.time.perf_counter`][].
+    """
+
+    __slots__: typing.Sequence[str] = ("_stages", "clock")
+
+    clock: typing.Callable[[], float]
+    """The clock used to time stages."""
+
+    def __init__(self, *, clock: typing.Callable[[], float] = time.perf_counter) -> None:
+        self._stages: dict[str, dict[str, StageStatistics]] = {}
+        self.clock = clock
+
+    def record(self, stage: str, name: str, duration: float, /) -> None:
+        """Record how long a stage took for an event.
+
+        Parameters
+        ----------
+        stage
+            The stage which was timed.
+        name
+            The name of the event, either its gateway dispatch name or its
+            event class name.
+        duration
+            How long the stage took, in seconds.
+        """
+        try:
+            statistics = self._stages[stage][name]
+        except KeyError:
+            statistics = self._stages.setdefault(stage, {}).setdefault(name, StageStatistics())
+
+        statistics.add(duration)
+
+    def get_statistics(self) -> dict[str, dict[str, StageStatistics]]:
+        """Get a snapshot of the recorded statistics.
+
+        Returns
+        -------
+        dict[str, dict[str, StageStatistics]]
+            Mapping of stage names to mappings of event names to copies of their statistics.
+        """
+        return {
+            stage: {name: attrs.evolve(stats, buckets=stats.buckets.copy()) for name, stats in events.items()}
+            for stage, events in self._stages.items()
+        }
+
+    def reset(self) -> None:
+        """Drop all the recorded statistics."""
+        self._stages.clear()
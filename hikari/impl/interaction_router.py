@@ -0,0 +1,444 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Router which dispatches interactions to listeners by command name or custom ID."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("InteractionRouter",)
+
+import inspect
+import logging
+import typing
+
+from hikari import commands
+from hikari.interactions import base_interactions
+from hikari.interactions import command_interactions
+from hikari.interactions import component_interactions
+from hikari.interactions import modal_interactions
+
+if typing.TYPE_CHECKING:
+    from hikari.api import interaction_server
+    from hikari.api import special_endpoints
+    from hikari.events import interaction_events
+    from hikari.internal import data_binding
+
+    _MessageResponseBuilderT = typing.Union[
+        special_endpoints.InteractionDeferredBuilder, special_endpoints.InteractionMessageBuilder
+    ]
+    _ModalOrMessageResponseBuilderT = typing.Union[_MessageResponseBuilderT, special_endpoints.InteractionModalBuilder]
+    _AnyListenerT = interaction_server.ListenerT[typing.Any, special_endpoints.InteractionResponseBuilder]
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.interaction_router")
+
+_SUB_COMMAND_TYPES: typing.Final[frozenset[int]] = frozenset(
+    (commands.OptionType.SUB_COMMAND, commands.OptionType.SUB_COMMAND_GROUP)
+)
+
+
+def _normalize_path(path: str, /) -> str:
+    names = path.split()
+    if not names or len(names) > 3:
+        msg = f"Invalid command path {path!r}, expected a command name followed by up to 2 subcommand names"
+        raise ValueError(msg)
+
+    return " ".join(names)
+
+
+def _command_paths(name: str, options: typing.Sequence[typing.Any] | None, /) -> list[str]:
+    # Payload options are dicts and entity options are objects, so both are taken through the same getter.
+    get = dict.get if options and isinstance(options[0], dict) else getattr
+    paths = [name]
+
+    while options and get(options[0], "type", None) in _SUB_COMMAND_TYPES:
+        paths.append(f"{paths[-1]} {get(options[0], 'name', None)}")
+        options = get(options[0], "options", None)
+
+    # Most specific first
+    paths.reverse()
+    return paths
+
+
+class _PrefixRoutes:
+    __slots__: typing.Sequence[str] = ("_lengths", "_routes")
+
+    def __init__(self) -> None:
+        self._lengths: list[int] = []
+        self._routes: dict[str, _AnyListenerT] = {}
+
+    def __contains__(self, prefix: str) -> bool:
+        return prefix in self._routes
+
+    def get(self, custom_id: str, /) -> _AnyListenerT | None:
+        # There are only ever as many lookups as there are distinct prefix lengths, longest first.
+        for length in self._lengths:
+            if (listener := self._routes.get(custom_id[:length])) is not None:
+                return listener
+
+        return None
+
+    def set(self, prefix: str, listener: _AnyListenerT, /) -> None:
+        self._routes[prefix] = listener
+        self._lengths = sorted({len(prefix) for prefix in self._routes}, reverse=True)
+
+    def pop(self, prefix: str, /) -> None:
+        if self._routes.pop(prefix, None) is not None:
+            self._lengths = sorted({len(prefix) for prefix in self._routes}, reverse=True)
+
+
+class InteractionRouter:
+    """Router which dispatches interactions to listeners by command name or custom ID.
+
+    Commands and autocompletes are routed by their command path, which is the
+    name of the command followed by the names of the subcommand group and
+    subcommand that were invoked (if any), separated by spaces. The most
+    specific path which has a listener is picked, so a listener for `"settings"`
+    receives every subcommand of `settings` which doesn't have its own.
+
+    Components and modals are routed by the longest prefix of their
+    `custom_id` which has a listener.
+
+    Routes are resolved through dictionary lookups, without going through the
+    listeners in turn. The interaction server of a
+    [`hikari.impl.rest_bot.RESTBot`][] has its own router (see
+    [`hikari.impl.interaction_server.InteractionServer.router`][]), which it
+    resolves routes with before deserializing interactions, ahead of the
+    listeners set for each interaction type. Interactions which neither have a
+    route nor a listener are then responded to without being deserialized.
+
+    A router can also route interactions received over the gateway by
+    subscribing [`hikari.impl.interaction_router.InteractionRouter.on_interaction_create`][]
+    to [`hikari.events.interaction_events.InteractionCreateEvent`][]. As
+    the gateway can't respond to interactions, any response returned by the
+    listeners is ignored and they should respond through the interaction
+    instead.
+
+    Examples
+    --------
+    With a [`hikari.impl.rest_bot.RESTBot`][], listeners return their
+    response:
+
+    ```py
+    bot = hikari.RESTBot(...)
+
+
+    async def on_settings_notifications(interaction: hikari.CommandInteraction):
+        return interaction.build_response().set_content("Notifications updated!")
+
+
+    bot.router.set_command("settings notifications", on_settings_notifications)
+    ```
+
+    Over the gateway, listeners respond through the interaction instead:
+
+    ```py
+    router = hikari.impl.InteractionRouter()
+
+
+    async def on_settings_notifications(interaction: hikari.CommandInteraction):
+        await interaction.create_initial_response(
+            hikari.ResponseType.MESSAGE_CREATE, "Notifications updated!"
+        )
+
+
+    router.set_command("settings notifications", on_settings_notifications)
+
+    bot = hikari.GatewayBot(...)
+    bot.subscribe(hikari.InteractionCreateEvent, router.on_interaction_create)
+    ```
+    """
+
+    __slots__: typing.Sequence[str] = ("_autocompletes", "_commands", "_components", "_modals")
+
+    def __init__(self) -> None:
+        self._autocompletes: dict[str, _AnyListenerT] = {}
+        self._commands: dict[tuple[int, str], _AnyListenerT] = {}
+        self._components = _PrefixRoutes()
+        self._modals = _PrefixRoutes()
+
+    def set_command(
+        self,
+        path: str,
+        listener: interaction_server.ListenerT[command_interactions.CommandInteraction, _ModalOrMessageResponseBuilderT]
+        | None,
+        /,
+        *,
+        command_type: commands.CommandType | int = commands.CommandType.SLASH,
+        replace: bool = False,
+    ) -> None:
+        """Set the listener for a command.
+
+        Parameters
+        ----------
+        path
+            The name of the command, followed by the names of its subcommand
+            group and subcommand (if any), separated by spaces.
+        listener
+            The listener to route the command to. If [`None`][], then the
+            route is removed.
+        command_type
+            The type of the command.
+        replace
+            Whether to replace the listener already routed to this command.
+
+        Raises
+        ------
+        ValueError
+            If `path` is not a valid command path.
+        TypeError
+            If a listener is already routed to this command and `replace` is
+            [`False`][].
+        """
+        key = (int(command_type), _normalize_path(path))
+        if listener is None:
+            self._commands.pop(key, None)
+            return
+
+        if not replace and key in self._commands:
+            msg = f"Listener already set for command {key[1]!r}"
+            raise TypeError(msg)
+
+        self._commands[key] = listener
+
+    def set_autocomplete(
+        self,
+        path: str,
+        listener: interaction_server.ListenerT[
+            command_interactions.AutocompleteInteraction, special_endpoints.InteractionAutocompleteBuilder
+        ]
+        | None,
+        /,
+        *,
+        replace: bool = False,
+    ) -> None:
+        """Set the listener for the autocompletes of a slash command.
+
+        Parameters
+        ----------
+        path
+            The name of the command, followed by the names of its subcommand
+            group and subcommand (if any), separated by spaces.
+        listener
+            The listener to route the autocompletes to. If [`None`][], then
+            the route is removed.
+        replace
+            Whether to replace the listener already routed to this command.
+
+        Raises
+        ------
+        ValueError
+            If `path` is not a valid command path.
+        TypeError
+            If a listener is already routed to this command and `replace` is
+            [`False`][].
+        """
+        path = _normalize_path(path)
+        if listener is None:
+            self._autocompletes.pop(path, None)
+            return
+
+        if not replace and path in self._autocompletes:
+            msg = f"Listener already set for the autocompletes of {path!r}"
+            raise TypeError(msg)
+
+        self._autocompletes[path] = listener
+
+    def set_component(
+        self,
+        prefix: str,
+        listener: interaction_server.ListenerT[
+            component_interactions.ComponentInteraction, _ModalOrMessageResponseBuilderT
+        ]
+        | None,
+        /,
+        *,
+        replace: bool = False,
+    ) -> None:
+        """Set the listener for components with a custom ID prefix.
+
+        Parameters
+        ----------
+        prefix
+            The prefix of the custom IDs to route.
+        listener
+            The listener to route the components to. If [`None`][], then the
+            route is removed.
+        replace
+            Whether to replace the listener already routed to this prefix.
+
+        Raises
+        ------
+        TypeError
+            If a listener is already routed to this prefix and `replace` is
+            [`False`][].
+        """
+        self._set_prefix(self._components, prefix, listener, replace=replace)
+
+    def set_modal(
+        self,
+        prefix: str,
+        listener: interaction_server.ListenerT[modal_interactions.ModalInteraction, _MessageResponseBuilderT] | None,
+        /,
+        *,
+        replace: bool = False,
+    ) -> None:
+        """Set the listener for modals with a custom ID prefix.
+
+        Parameters
+        ----------
+        prefix
+            The prefix of the custom IDs to route.
+        listener
+            The listener to route the modals to. If [`None`][], then the
+            route is removed.
+        replace
+            Whether to replace the listener already routed to this prefix.
+
+        Raises
+        ------
+        TypeError
+            If a listener is already routed to this prefix and `replace` is
+            [`False`][].
+        """
+        self._set_prefix(self._modals, prefix, listener, replace=replace)
+
+    @staticmethod
+    def _set_prefix(routes: _PrefixRoutes, prefix: str, listener: _AnyListenerT | None, /, *, replace: bool) -> None:
+        if listener is None:
+            routes.pop(prefix)
+            return
+
+        if not replace and prefix in routes:
+            msg = f"Listener already set for custom ID prefix {prefix!r}"
+            raise TypeError(msg)
+
+        routes.set(prefix, listener)
+
+    def _resolve_command(self, command_type: int, paths: typing.Sequence[str], /) -> _AnyListenerT | None:
+        for path in paths:
+            if (listener := self._commands.get((command_type, path))) is not None:
+                return listener
+
+        return None
+
+    def _resolve_autocomplete(self, paths: typing.Sequence[str], /) -> _AnyListenerT | None:
+        for path in paths:
+            if (listener := self._autocompletes.get(path)) is not None:
+                return listener
+
+        return None
+
+    def resolve(self, interaction: base_interactions.PartialInteraction, /) -> _AnyListenerT | None:
+        """Resolve the listener routed to an interaction.
+
+        Parameters
+        ----------
+        interaction
+            The interaction to resolve the listener for.
+
+        Returns
+        -------
+        typing.Optional[hikari.api.interaction_server.ListenerT]
+            The listener routed to the interaction, or [`None`][] if it
+            has no route.
+        """
+        if isinstance(interaction, command_interactions.CommandInteraction):
+            return self._resolve_command(
+                interaction.command_type, _command_paths(interaction.command_name, interaction.options)
+            )
+
+        if isinstance(interaction, command_interactions.AutocompleteInteraction):
+            return self._resolve_autocomplete(_command_paths(interaction.command_name, interaction.options))
+
+        if isinstance(interaction, component_interactions.ComponentInteraction):
+            return self._components.get(interaction.custom_id)
+
+        if isinstance(interaction, modal_interactions.ModalInteraction):
+            return self._modals.get(interaction.custom_id)
+
+        return None
+
+    def resolve_payload(self, payload: data_binding.JSONObject, /) -> _AnyListenerT | None:
+        """Resolve the listener routed to a raw interaction payload.
+
+        This lets an interaction be routed before it is deserialized.
+
+        Parameters
+        ----------
+        payload
+            The raw interaction payload.
+
+        Returns
+        -------
+        typing.Optional[hikari.api.interaction_server.ListenerT]
+            The listener routed to the interaction, or [`None`][] if it
+            has no route or the payload is malformed.
+        """
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            return None
+
+        try:
+            interaction_type = payload["type"]
+            if interaction_type == base_interactions.InteractionType.APPLICATION_COMMAND:
+                return self._resolve_command(data["type"], _command_paths(data["name"], data.get("options")))
+
+            if interaction_type == base_interactions.InteractionType.AUTOCOMPLETE:
+                return self._resolve_autocomplete(_command_paths(data["name"], data.get("options")))
+
+            if interaction_type == base_interactions.InteractionType.MESSAGE_COMPONENT:
+                return self._components.get(data["custom_id"])
+
+            if interaction_type == base_interactions.InteractionType.MODAL_SUBMIT:
+                return self._modals.get(data["custom_id"])
+
+        except (KeyError, TypeError):
+            pass
+
+        return None
+
+    async def on_interaction_create(self, event: interaction_events.InteractionCreateEvent, /) -> None:
+        """Route an interaction received over the gateway.
+
+        This is meant to be subscribed to
+        [`hikari.events.interaction_events.InteractionCreateEvent`][].
+
+        Parameters
+        ----------
+        event
+            The event to route the interaction of.
+        """
+        listener = self.resolve(event.interaction)
+        if listener is None:
+            return
+
+        call = listener(event.interaction)
+        if inspect.isasyncgen(call):
+            results = [result async for result in call]
+        else:
+            results = [await typing.cast("typing.Awaitable[special_endpoints.InteractionResponseBuilder | None]", call)]
+
+        if any(result is not None for result in results):
+            _LOGGER.warning(
+                "Ignoring response returned by %r for interaction %s, interactions received over the gateway must be "
+                "responded to through REST",
+                listener,
+                event.interaction.id,
+            )
@@ -22,9 +22,11 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("InteractionServer",)
+__all__: typing.Sequence[str] = ("InteractionDeferralStatistics", "InteractionServer")
 
 import asyncio
+import contextlib
+import functools
 import inspect
 import logging
 import typing
@@ -32,12 +34,22 @@
 import aiohttp
 import aiohttp.web
 import aiohttp.web_runner
+import attrs
 
 from hikari import applications
 from hikari import errors
+from hikari import messages
+from hikari import undefined
 from hikari.api import interaction_server
 from hikari.api import special_endpoints
+from hikari.impl import interaction_router
+from hikari.impl import special_endpoints as special_endpoints_impl
+from hikari.interactions import base_interactions
+from hikari.interactions import command_interactions
+from hikari.interactions import component_interactions
+from hikari.interactions import modal_interactions
 from hikari.internal import data_binding
+from hikari.internal import time
 
 if not typing.TYPE_CHECKING:
     # This is insanely hacky, but it is needed for ruff to not complain until it gets type inference
@@ -57,10 +69,6 @@
     from hikari import files as files_
     from hikari.api import entity_factory as entity_factory_api
     from hikari.api import rest as rest_api
-    from hikari.interactions import base_interactions
-    from hikari.interactions import command_interactions
-    from hikari.interactions import component_interactions
-    from hikari.interactions import modal_interactions
 
     _InteractionT_co = typing.TypeVar("_InteractionT_co", bound=base_interactions.PartialInteraction, covariant=True)
     _MessageResponseBuilderT = typing.Union[
@@ -73,6 +81,17 @@
 # Internal interaction and interaction response types.
 _PING_INTERACTION_TYPE: typing.Final[int] = 1
 _PONG_RESPONSE_TYPE: typing.Final[int] = 1
+# Discord only waits this long for the initial response to an interaction.
+_RESPONSE_DEADLINE: typing.Final[float] = 3.0
+# The number of signature batches which may be verified in an executor at once.
+_MAX_VERIFICATION_BATCHES: typing.Final[int] = 4
+_MAX_VERIFICATION_BATCH_SIZE: typing.Final[int] = 32
+_LISTENER_TYPES: typing.Final[typing.Mapping[int, type[base_interactions.PartialInteraction]]] = {
+    base_interactions.InteractionType.APPLICATION_COMMAND: command_interactions.CommandInteraction,
+    base_interactions.InteractionType.MESSAGE_COMPONENT: component_interactions.ComponentInteraction,
+    base_interactions.InteractionType.AUTOCOMPLETE: command_interactions.AutocompleteInteraction,
+    base_interactions.InteractionType.MODAL_SUBMIT: modal_interactions.ModalInteraction,
+}
 
 # HTTP status codes.
 _OK_STATUS: typing.Final[int] = 200
@@ -190,11 +209,160 @@ async def _consume_generator_listener(generator: typing.AsyncGenerator[typing.An
         )
 
 
+def _verify_signatures(
+    signatures: typing.Sequence[tuple[signing.VerifyKey, bytes, bytes]], errors_: tuple[type[Exception], ...], /
+) -> list[Exception | None]:
+    results: list[Exception | None] = []
+    for public_key, message, signature in signatures:
+        try:
+            public_key.verify(message, signature)
+
+        except errors_ as exc:  # noqa: PERF203 - Usage of try-except inside a loop
+            results.append(exc)
+
+        else:
+            results.append(None)
+
+    return results
+
+
+class _SignatureVerifier:
+    """Verifies request signatures, in batches on an executor if one is provided.
+
+    A batch is sent to the executor as soon as a signature is queued, unless
+    enough batches are already being verified. Under load, signatures queue up
+    while those batches are verified and are then sent together, which shares
+    the cost of moving to and from the executor between them.
+    """
+
+    __slots__: typing.Sequence[str] = ("_batches", "_errors", "_executor", "_max_batch_size", "_queue")
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor | None,
+        errors_: tuple[type[Exception], ...],
+        /,
+        *,
+        max_batch_size: int = _MAX_VERIFICATION_BATCH_SIZE,
+    ) -> None:
+        self._batches = 0
+        self._errors = errors_
+        self._executor = executor
+        self._max_batch_size = max_batch_size
+        self._queue: list[tuple[signing.VerifyKey, bytes, bytes, asyncio.Future[None]]] = []
+
+    async def start(self, public_key: signing.VerifyKey) -> None:
+        if self._executor is not None:
+            # This starts the executor's workers, so that the first requests don't wait on them.
+            with contextlib.suppress(*self._errors):
+                await self.verify(public_key, b"", bytes(64))
+
+    async def verify(self, public_key: signing.VerifyKey, message: bytes, signature: bytes) -> None:
+        """Verify a signature, raising one of the verification errors if it's invalid."""
+        if self._executor is None:
+            public_key.verify(message, signature)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queue.append((public_key, message, signature, future))
+        self._flush()
+        await future
+
+    def _flush(self) -> None:
+        while self._queue and self._batches < _MAX_VERIFICATION_BATCHES:
+            batch = self._queue[: self._max_batch_size]
+            del self._queue[: self._max_batch_size]
+            futures = [future for *_, future in batch]
+            signatures = [(public_key, message, signature) for public_key, message, signature, _ in batch]
+
+            try:
+                verification = asyncio.get_running_loop().run_in_executor(
+                    self._executor, _verify_signatures, signatures, self._errors
+                )
+
+            except RuntimeError as exc:
+                # The executor was shut down
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+
+                continue
+
+            self._batches += 1
+            verification.add_done_callback(functools.partial(self._on_batch_done, futures))
+
+    def _on_batch_done(
+        self, futures: list[asyncio.Future[None]], batch: asyncio.Future[list[Exception | None]]
+    ) -> None:
+        self._batches -= 1
+        if batch.cancelled():
+            for future in futures:
+                future.cancel()
+
+        elif (exc := batch.exception()) is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+
+        else:
+            for future, error in zip(futures, batch.result()):
+                if future.done():
+                    continue
+
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+        self._flush()
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class InteractionDeferralStatistics:
+    """Statistics of the interactions automatically deferred by an interaction server."""
+
+    dispatched: int = attrs.field(default=0)
+    """The number of interactions dispatched which could be deferred."""
+
+    deferred: int = attrs.field(default=0)
+    """The number of interactions deferred because their listener missed the deadline."""
+
+    failed: int = attrs.field(default=0)
+    """The number of deferred interactions which could not be responded to afterwards."""
+
+    @property
+    def deferral_rate(self) -> float:
+        """The ratio of deferred to dispatched interactions, or `0.0` if none were dispatched yet."""
+        return self.deferred / self.dispatched if self.dispatched else 0.0
+
+
 class InteractionServer(interaction_server.InteractionServer):
     """Standard implementation of [`hikari.api.interaction_server.InteractionServer`][].
 
     Parameters
     ----------
+    auto_defer_after
+        If set, the number of seconds after an interaction is received by which
+        its listener must have returned a response, after which the interaction
+        is automatically deferred.
+
+        Once deferred, the response returned by the listener is sent by editing
+        the initial response, or as a followup message for components which
+        respond with a new message. Autocomplete interactions can't be deferred.
+
+        This must be between 0 and 3 seconds, as Discord only waits 3 seconds
+        for the initial response. See
+        [`hikari.impl.interaction_server.InteractionServer.deferral_statistics`][]
+        for how often this is triggered.
+    auto_defer_flags
+        The message flags to automatically defer command and modal interactions
+        with. This decides whether the response is ephemeral, as that can't be
+        changed once the interaction has been deferred.
+
+        If a listener which missed the deadline then responds with an ephemeral
+        message while the deferral wasn't ephemeral, the response is not sent
+        and the error is passed to the event loop's exception handler. This
+        is so that it isn't posted publicly.
     entity_factory
         The entity factory instance this server should use.
     dumps
@@ -207,11 +375,21 @@ class InteractionServer(interaction_server.InteractionServer):
         out using `rest_client`.
     rest_client
         The client this should use for making REST requests.
+    verification_executor
+        If provided, the executor to verify request signatures on rather than
+        on the event loop. Signatures received while others are being verified
+        are verified together, so this keeps the event loop responsive under
+        load at the cost of a little latency per request.
+
+        The executor is warmed up as the server starts.
     """
 
     __slots__: typing.Sequence[str] = (
         "_application_fetch_lock",
+        "_auto_defer_after",
+        "_auto_defer_flags",
         "_close_event",
+        "_deferral_statistics",
         "_dumps",
         "_entity_factory",
         "_executor",
@@ -221,19 +399,24 @@ class InteractionServer(interaction_server.InteractionServer):
         "_nacl",
         "_public_key",
         "_rest_client",
+        "_router",
         "_running_generator_listeners",
         "_server",
+        "_signature_verifier",
     )
 
     def __init__(
         self,
         *,
+        auto_defer_after: float | None = None,
+        auto_defer_flags: int | messages.MessageFlag = messages.MessageFlag.NONE,
         dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         entity_factory: entity_factory_api.EntityFactory,
         executor: concurrent.futures.Executor | None = None,
         loads: data_binding.JSONDecoder = data_binding.default_json_loads,
         rest_client: rest_api.RESTClient,
         public_key: bytes | None = None,
+        verification_executor: concurrent.futures.Executor | None = None,
     ) -> None:
         # This is kept inline as pynacl is an optional dependency.
         try:
@@ -244,10 +427,17 @@ def __init__(
             msg = "You must install the optional `hikari[server]` dependencies to use the default interaction server."
             raise RuntimeError(msg) from exc
 
+        if auto_defer_after is not None and not 0 <= auto_defer_after < _RESPONSE_DEADLINE:
+            msg = f"auto_defer_after must be between 0 and {_RESPONSE_DEADLINE} seconds"
+            raise ValueError(msg)
+
         # Building asyncio.Lock when there isn't a running loop may lead to runtime errors.
         self._application_fetch_lock: asyncio.Lock | None = None
+        self._auto_defer_after = auto_defer_after
+        self._auto_defer_flags = messages.MessageFlag(auto_defer_flags)
         # Building asyncio.Event when there isn't a running loop may lead to runtime errors.
         self._close_event: asyncio.Event | None = None
+        self._deferral_statistics = InteractionDeferralStatistics() if auto_defer_after is not None else None
         self._dumps = dumps
         self._entity_factory = entity_factory
         self._executor = executor
@@ -256,9 +446,31 @@ def __init__(
         self._loads = loads
         self._nacl = nacl
         self._rest_client = rest_client
+        self._router = interaction_router.InteractionRouter()
         self._server: aiohttp.web_runner.AppRunner | None = None
         self._public_key = nacl.signing.VerifyKey(public_key) if public_key is not None else None
         self._running_generator_listeners: set[asyncio.Task[None]] = set()
+        self._signature_verifier = _SignatureVerifier(
+            verification_executor, (nacl.exceptions.BadSignatureError, ValueError)
+        )
+
+    @property
+    def router(self) -> interaction_router.InteractionRouter:
+        """Router which dispatches interactions by command name or custom ID.
+
+        Interactions are routed before they are deserialized, ahead of the
+        listeners set for their type. Interactions which neither have a route
+        nor a listener are not deserialized.
+        """
+        return self._router
+
+    @property
+    def deferral_statistics(self) -> InteractionDeferralStatistics | None:
+        """Snapshot of the statistics of the interactions deferred automatically.
+
+        This will be [`None`][] unless `auto_defer_after` was set.
+        """
+        return attrs.evolve(self._deferral_statistics) if self._deferral_statistics is not None else None
 
     @property
     def is_alive(self) -> bool:
@@ -405,6 +617,158 @@ async def join(self) -> None:
 
         await self._close_event.wait()
 
+    def _may_have_listener(self, interaction_type: int, /) -> bool:
+        listener_type = _LISTENER_TYPES.get(interaction_type)
+        # Unknown interaction types are left for deserialization to reject
+        return listener_type is None or any(issubclass(listener_type, cls) for cls in self._listeners)
+
+    def _add_background_task(self, coroutine: typing.Coroutine[typing.Any, typing.Any, None], /) -> None:
+        task = asyncio.create_task(coroutine)
+        self._running_generator_listeners.add(task)
+        task.add_done_callback(self._running_generator_listeners.discard)
+
+    def _deferred_response_type(
+        self, interaction: base_interactions.PartialInteraction, /
+    ) -> base_interactions.DeferredResponseTypesT | None:
+        if self._auto_defer_after is None:
+            return None
+
+        if isinstance(interaction, component_interactions.ComponentInteraction):
+            return base_interactions.ResponseType.DEFERRED_MESSAGE_UPDATE
+
+        if isinstance(interaction, (command_interactions.CommandInteraction, modal_interactions.ModalInteraction)):
+            return base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE
+
+        # Autocomplete interactions can't be deferred
+        return None
+
+    async def _dispatch(
+        self,
+        listener: interaction_server.ListenerT[typing.Any, special_endpoints.InteractionResponseBuilder],
+        interaction: base_interactions.PartialInteraction,
+        received_at: float,
+        /,
+    ) -> special_endpoints.InteractionResponseBuilder | None:
+        call = listener(interaction)
+        generator: typing.AsyncGenerator[special_endpoints.InteractionResponseBuilder | None, None] | None = None
+
+        if inspect.isasyncgen(call):
+            generator = typing.cast(
+                "typing.AsyncGenerator[special_endpoints.InteractionResponseBuilder | None, None]", call
+            )
+            call = generator.__anext__()
+
+        call = typing.cast("typing.Awaitable[special_endpoints.InteractionResponseBuilder | None]", call)
+        deferred_type = self._deferred_response_type(interaction)
+
+        if deferred_type is None:
+            result = await call
+
+        else:
+            assert self._auto_defer_after is not None
+            assert self._deferral_statistics is not None
+            self._deferral_statistics.dispatched += 1
+
+            task = asyncio.ensure_future(call)
+            timeout = received_at + self._auto_defer_after - time.perf_counter()
+            done, _ = await asyncio.wait((task,), timeout=max(timeout, 0.0))
+
+            if not done:
+                _LOGGER.debug("Deferring interaction %s as its listener missed the deadline", interaction.id)
+                self._deferral_statistics.deferred += 1
+                self._add_background_task(self._respond_after_deferral(interaction, task, generator, deferred_type))
+                builder = self._rest_client.interaction_deferred_builder(deferred_type)
+                if deferred_type == base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE and self._auto_defer_flags:
+                    builder.set_flags(self._auto_defer_flags)
+
+                return builder
+
+            result = task.result()
+
+        if generator is not None:
+            self._add_background_task(_consume_generator_listener(generator))
+
+        return result
+
+    async def _respond_after_deferral(
+        self,
+        interaction: base_interactions.PartialInteraction,
+        task: asyncio.Future[special_endpoints.InteractionResponseBuilder | None],
+        generator: typing.AsyncGenerator[special_endpoints.InteractionResponseBuilder | None, None] | None,
+        deferred_type: base_interactions.DeferredResponseTypesT,
+        /,
+    ) -> None:
+        try:
+            result = await task
+            if result is not None and not isinstance(result, special_endpoints.InteractionDeferredBuilder):
+                await self._send_deferred_response(interaction, result, deferred_type)
+
+        except Exception as exc:  # noqa: BLE001 - Blind except
+            if self._deferral_statistics is not None:
+                self._deferral_statistics.failed += 1
+
+            asyncio.get_running_loop().call_exception_handler(
+                {"message": "Exception occurred while responding to a deferred interaction", "exception": exc}
+            )
+
+        if generator is not None:
+            await _consume_generator_listener(generator)
+
+    async def _send_deferred_response(
+        self,
+        interaction: base_interactions.PartialInteraction,
+        result: special_endpoints.InteractionResponseBuilder,
+        deferred_type: base_interactions.DeferredResponseTypesT,
+        /,
+    ) -> None:
+        if not isinstance(result, special_endpoints.InteractionMessageBuilder):
+            msg = f"Cannot respond with {type(result).__name__} once the interaction has been deferred"
+            raise TypeError(msg)
+
+        if (
+            deferred_type == base_interactions.ResponseType.DEFERRED_MESSAGE_UPDATE
+            and result.type == base_interactions.ResponseType.MESSAGE_CREATE
+        ):
+            await self._rest_client.execute_webhook(
+                interaction.application_id,
+                interaction.token,
+                result.content if result.content is not None else undefined.UNDEFINED,
+                attachments=result.attachments or undefined.UNDEFINED,
+                components=result.components or undefined.UNDEFINED,
+                embeds=result.embeds or undefined.UNDEFINED,
+                poll=result.poll,
+                tts=result.is_tts,
+                mentions_everyone=result.mentions_everyone,
+                user_mentions=result.user_mentions,
+                role_mentions=result.role_mentions,
+                flags=result.flags,
+            )
+            return
+
+        if (
+            deferred_type == base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE
+            and result.flags is not undefined.UNDEFINED
+            and messages.MessageFlag.EPHEMERAL & result.flags
+            and messages.MessageFlag.EPHEMERAL not in self._auto_defer_flags
+        ):
+            msg = (
+                "Cannot respond with an ephemeral message once the interaction has been deferred publicly, "
+                "set auto_defer_flags to defer it as ephemeral instead"
+            )
+            raise ValueError(msg)
+
+        await self._rest_client.edit_interaction_response(
+            interaction.application_id,
+            interaction.token,
+            result.content,
+            attachments=result.attachments,
+            components=result.components,
+            embeds=result.embeds,
+            mentions_everyone=result.mentions_everyone,
+            user_mentions=result.user_mentions,
+            role_mentions=result.role_mentions,
+        )
+
     @typing_extensions.override
     async def on_interaction(self, body: bytes, signature: bytes, timestamp: bytes) -> interaction_server.Response:  # noqa: PLR0911
         """Handle an interaction received from Discord as a REST server.
@@ -429,10 +793,11 @@ async def on_interaction(self, body: bytes, signature: bytes, timestamp: bytes)
             Instructions on how the REST server calling this should respond to
             the interaction request.
         """
+        received_at = time.perf_counter()
         public_key = self._public_key or await self._fetch_public_key()
 
         try:
-            public_key.verify(timestamp + body, signature)
+            await self._signature_verifier.verify(public_key, timestamp + body, signature)
 
         except (self._nacl.exceptions.BadSignatureError, ValueError):
             _LOGGER.exception("Received a request with an invalid signature")
@@ -455,6 +820,12 @@ async def on_interaction(self, body: bytes, signature: bytes, timestamp: bytes)
             _LOGGER.debug("Responding to ping interaction")
             return _PONG_RESPONSE
 
+        # Interactions are routed before they are deserialized, so that those which can't be handled are not.
+        listener: typing.Any = self._router.resolve_payload(payload)
+        if listener is None and not self._may_have_listener(interaction_type):
+            _LOGGER.debug("Ignoring interaction of type %s without registered listener", interaction_type)
+            return _Response(_NOT_IMPLEMENTED, b"Handler not set for this interaction type")
+
         try:
             interaction = self._entity_factory.deserialize_interaction(payload)
 
@@ -472,27 +843,21 @@ async def on_interaction(self, body: bytes, signature: bytes, timestamp: bytes)
             )
             return _Response(_INTERNAL_SERVER_ERROR_STATUS, b"Exception occurred during interaction deserialization")
 
-        if listener := self._listeners.get(type(interaction)):
+        if listener := listener or self._listeners.get(type(interaction)):
             _LOGGER.debug("Dispatching interaction %s", interaction.id)
             try:
-                call = listener(interaction)
-
-                if inspect.isasyncgen(call):
-                    call = typing.cast("typing.AsyncGenerator[typing.Any, typing.Any]", call)
-                    result = await call.__anext__()
-                    task = asyncio.create_task(_consume_generator_listener(call))
-
-                    self._running_generator_listeners.add(task)
-                    task.add_done_callback(self._running_generator_listeners.discard)
-
-                else:
-                    result = await call
+                result = await self._dispatch(listener, interaction, received_at)
 
                 if result is None:
                     return _Response(_NO_CONTENT_STATUS)
 
-                raw_payload, files = result.build(self._entity_factory)
-                payload = self._dumps(raw_payload)
+                if isinstance(result, special_endpoints_impl.InteractionMessageBuilder):
+                    # Frozen components are spliced into the response body as is
+                    raw_payload, files = result._build_fragments(self._entity_factory)  # noqa: SLF001 - Private member accessed
+                else:
+                    raw_payload, files = result.build(self._entity_factory)
+
+                payload = data_binding.dump_json(raw_payload, self._dumps)
 
             except Exception as exc:  # noqa: BLE001 - Blind except
                 asyncio.get_running_loop().call_exception_handler(
@@ -558,7 +923,7 @@ async def start(
         self._close_event = asyncio.Event()
         self._is_closing = False
 
-        await self._fetch_public_key()
+        await self._signature_verifier.start(await self._fetch_public_key())
 
         aio_app = aiohttp.web.Application()
         aio_app.add_routes([aiohttp.web.post("/", self.aiohttp_hook)])
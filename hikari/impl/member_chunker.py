@@ -0,0 +1,344 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Orchestration of guild member chunk requests across shards."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("MemberChunker", "MemberChunkerMetrics")
+
+import asyncio
+import itertools
+import logging
+import secrets
+import typing
+
+import attrs
+
+from hikari import snowflakes
+from hikari import undefined
+from hikari.events import shard_events
+from hikari.internal import attrs_extensions
+from hikari.internal import ux
+
+if typing.TYPE_CHECKING:
+    from hikari import guilds
+    from hikari import traits
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.member_chunker")
+
+
+@attrs_extensions.with_copy
+@attrs.define(kw_only=True, weakref_slot=False)
+class MemberChunkerMetrics:
+    """A snapshot of the progress of a [`hikari.impl.member_chunker.MemberChunker`][]."""
+
+    queued: int = attrs.field(repr=True)
+    """The number of guilds waiting for their member request to be sent."""
+
+    pending: int = attrs.field(repr=True)
+    """The number of guilds which were requested but have not received all their chunks yet."""
+
+    completed: int = attrs.field(repr=True)
+    """The number of guilds which received all their chunks."""
+
+    failed: int = attrs.field(repr=True)
+    """The number of guilds which failed to be requested or timed out."""
+
+    chunks_received: int = attrs.field(repr=True)
+    """The number of chunks received for requests made by the chunker."""
+
+    members_received: int = attrs.field(repr=True)
+    """The number of members received for requests made by the chunker."""
+
+
+class _GuildRequest:
+    __slots__: typing.Sequence[str] = (
+        "chunk_indexes",
+        "future",
+        "guild_id",
+        "include_presences",
+        "nonce",
+        "priority",
+        "shard_id",
+        "timeout_handle",
+    )
+
+    def __init__(
+        self,
+        guild_id: snowflakes.Snowflake,
+        shard_id: int,
+        future: asyncio.Future[None],
+        *,
+        include_presences: undefined.UndefinedOr[bool],
+        priority: bool,
+    ) -> None:
+        self.chunk_indexes: set[int] = set()
+        self.future = future
+        self.guild_id = guild_id
+        self.include_presences = include_presences
+        self.nonce: str | None = None
+        self.priority = priority
+        self.shard_id = shard_id
+        self.timeout_handle: asyncio.TimerHandle | None = None
+
+
+class MemberChunker:
+    """Queue guild member requests across the shards of a gateway bot.
+
+    Guilds are queued per shard and sent by one worker per shard. Each request
+    goes through the shard's own gateway rate limiter one at a time, so the
+    chunker uses all of the shard's send budget without taking it away from other
+    requests, such as presence updates, which are queued alongside it.
+
+    Each request is sent with a unique nonce, which is used to match the
+    received [`hikari.events.shard_events.MemberChunkEvent`][]s back to the guild
+    and know when all of its chunks were received.
+
+    !!! note
+        The chunker listens to [`hikari.events.shard_events.MemberChunkEvent`][]
+        while it has pending requests, which means the members are deserialized
+        as entities rather than cached straight from the payload during that time.
+
+    Parameters
+    ----------
+    app
+        The gateway bot to request the members with.
+    timeout
+        The time in seconds to wait for all the chunks of a guild after its
+        request was sent before failing it with [`asyncio.TimeoutError`][].
+    max_pending_per_shard
+        The maximum amount of guilds per shard which can be waiting for their
+        chunks at once. Any other guild will wait in the queue.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_app",
+        "_chunks_received",
+        "_completed",
+        "_failed",
+        "_is_listening",
+        "_max_pending_per_shard",
+        "_members_received",
+        "_nonces",
+        "_queues",
+        "_requests",
+        "_semaphores",
+        "_sequence",
+        "_timeout",
+        "_workers",
+    )
+
+    def __init__(
+        self, app: traits.GatewayBotAware, /, *, timeout: float = 60.0, max_pending_per_shard: int = 25
+    ) -> None:
+        if max_pending_per_shard < 1:
+            msg = "'max_pending_per_shard' must be greater than 0"
+            raise ValueError(msg)
+
+        self._app = app
+        self._chunks_received = 0
+        self._completed = 0
+        self._failed = 0
+        self._is_listening = False
+        self._max_pending_per_shard = max_pending_per_shard
+        self._members_received = 0
+        self._nonces: dict[str, _GuildRequest] = {}
+        self._queues: dict[int, asyncio.PriorityQueue[tuple[int, int, _GuildRequest]]] = {}
+        self._requests: dict[snowflakes.Snowflake, _GuildRequest] = {}
+        self._semaphores: dict[int, asyncio.Semaphore] = {}
+        self._sequence = itertools.count()
+        self._timeout = timeout
+        self._workers: dict[int, asyncio.Task[None]] = {}
+
+    @property
+    def metrics(self) -> MemberChunkerMetrics:
+        """Progress of the chunker."""
+        pending = len(self._nonces)
+        return MemberChunkerMetrics(
+            queued=len(self._requests) - pending,
+            pending=pending,
+            completed=self._completed,
+            failed=self._failed,
+            chunks_received=self._chunks_received,
+            members_received=self._members_received,
+        )
+
+    def request(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        /,
+        *,
+        include_presences: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        priority: bool = False,
+    ) -> asyncio.Future[None]:
+        """Queue a request for all the members of a guild.
+
+        Requesting a guild which is already queued or pending returns the
+        existing future.
+
+        Parameters
+        ----------
+        guild
+            The guild to request the members of.
+        include_presences
+            Whether to request presences too.
+        priority
+            Whether to send this request before any non-priority one queued
+            for the same shard. This also moves an already queued request up.
+
+        Returns
+        -------
+        asyncio.Future[None]
+            A future which completes once all the chunks for the guild were
+            received. It fails if the request could not be sent or the chunks
+            were not received in time.
+        """
+        guild_id = snowflakes.Snowflake(guild)
+        if request := self._requests.get(guild_id):
+            if priority and not request.priority and request.nonce is None:
+                request.priority = True
+                self._enqueue(request)
+
+            return request.future
+
+        shard_id = snowflakes.calculate_shard_id(self._app, guild_id)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        request = _GuildRequest(guild_id, shard_id, future, include_presences=include_presences, priority=priority)
+        future.add_done_callback(lambda _: self._finish(request))
+        self._requests[guild_id] = request
+        self._enqueue(request)
+        return future
+
+    async def close(self) -> None:
+        """Stop the chunker and cancel all the queued and pending requests."""
+        workers = tuple(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+        self._semaphores.clear()
+
+        for request in tuple(self._requests.values()):
+            request.future.cancel()
+
+    def _enqueue(self, request: _GuildRequest) -> None:
+        shard_id = request.shard_id
+        if shard_id not in self._queues:
+            self._queues[shard_id] = asyncio.PriorityQueue()
+            self._semaphores[shard_id] = asyncio.Semaphore(self._max_pending_per_shard)
+            self._workers[shard_id] = asyncio.create_task(
+                self._run_shard(shard_id), name=f"shard {shard_id} member chunker"
+            )
+
+        # The sequence keeps requests of the same priority in insertion order.
+        self._queues[shard_id].put_nowait((0 if request.priority else 1, next(self._sequence), request))
+
+    async def _run_shard(self, shard_id: int) -> None:
+        queue = self._queues[shard_id]
+        semaphore = self._semaphores[shard_id]
+
+        while True:
+            _, _, request = await queue.get()
+            # Requests moved up by priority are queued twice
+            if request.future.done() or request.nonce is not None:
+                continue
+
+            await semaphore.acquire()
+            if request.future.done():
+                semaphore.release()
+                continue
+
+            request.nonce = f"{request.guild_id}.{secrets.token_hex(4)}"
+            self._nonces[request.nonce] = request
+            self._set_listening(listening=True)
+
+            try:
+                shard = self._app.shards[shard_id]
+                await shard.request_guild_members(
+                    request.guild_id, include_presences=request.include_presences, nonce=request.nonce
+                )
+
+            except Exception as ex:
+                _LOGGER.debug("failed to request members for guild %s", request.guild_id, exc_info=ex)
+                self._fail(request, ex)
+                continue
+
+            if not request.future.done():
+                request.timeout_handle = asyncio.get_running_loop().call_later(self._timeout, self._on_timeout, request)
+
+    def _on_timeout(self, request: _GuildRequest) -> None:
+        msg = f"Timed out waiting for the member chunks of guild {request.guild_id}"
+        self._fail(request, asyncio.TimeoutError(msg))
+
+    def _fail(self, request: _GuildRequest, exception: Exception) -> None:
+        if not request.future.done():
+            self._failed += 1
+            request.future.set_exception(exception)
+            # Avoid the "exception was never retrieved" warning for requests nobody awaits
+            request.future.exception()
+
+        self._finish(request)
+
+    async def _on_member_chunk(self, event: shard_events.MemberChunkEvent) -> None:
+        if event.nonce is None or (request := self._nonces.get(event.nonce)) is None:
+            return
+
+        self._chunks_received += 1
+        self._members_received += len(event.members)
+        request.chunk_indexes.add(event.chunk_index)
+        _LOGGER.log(
+            ux.TRACE, "received chunk %s/%s for guild %s", event.chunk_index + 1, event.chunk_count, request.guild_id
+        )
+
+        if len(request.chunk_indexes) >= event.chunk_count and not request.future.done():
+            self._completed += 1
+            request.future.set_result(None)
+            self._finish(request)
+
+    def _finish(self, request: _GuildRequest) -> None:
+        # This is also called by the future's done callback to clean up cancelled requests.
+        if self._requests.get(request.guild_id) is not request:
+            return
+
+        del self._requests[request.guild_id]
+        if request.timeout_handle is not None:
+            request.timeout_handle.cancel()
+
+        if request.nonce is not None:
+            del self._nonces[request.nonce]
+            if semaphore := self._semaphores.get(request.shard_id):
+                semaphore.release()
+
+            if not self._nonces:
+                self._set_listening(listening=False)
+
+    def _set_listening(self, *, listening: bool) -> None:
+        if listening is self._is_listening:
+            return
+
+        if listening:
+            self._app.event_manager.subscribe(shard_events.MemberChunkEvent, self._on_member_chunk)
+        else:
+            self._app.event_manager.unsubscribe(shard_events.MemberChunkEvent, self._on_member_chunk)
+
+        self._is_listening = listening
@@ -33,7 +33,9 @@
 import contextlib
 import copy
 import datetime
+import hashlib
 import http
+import json
 import logging
 import math
 import os
@@ -75,6 +77,7 @@
 from hikari.impl import rate_limits
 from hikari.impl import special_endpoints as special_endpoints_impl
 from hikari.interactions import base_interactions
+from hikari.internal import aio
 from hikari.internal import data_binding
 from hikari.internal import mentions
 from hikari.internal import net
@@ -119,6 +122,29 @@
 _X_RATELIMIT_SCOPE_HEADER: typing.Final[str] = sys.intern("X-RateLimit-Scope")
 _RETRY_ERROR_CODES: typing.Final[frozenset[int]] = frozenset((500, 502, 503, 504))
 _MAX_BACKOFF_DURATION: typing.Final[int] = 16
+_SYNCED_COMMAND_FIELDS: typing.Final[tuple[str, ...]] = (
+    "type",
+    "name",
+    "description",
+    "options",
+    "name_localizations",
+    "description_localizations",
+    "default_member_permissions",
+    "nsfw",
+    "integration_types",
+    "contexts",
+)
+# Discord fills these in with its own defaults when they're left out, so they're only compared when set locally.
+_DEFAULTED_COMMAND_FIELDS: typing.Final[frozenset[str]] = frozenset(("integration_types", "contexts"))
+# What to send to reset a field which was removed from a command, as edits leave out fields untouched.
+_COMMAND_FIELD_RESETS: typing.Final[typing.Mapping[str, typing.Any]] = {
+    "description": "",
+    "options": [],
+    "name_localizations": None,
+    "description_localizations": None,
+    "default_member_permissions": None,
+    "nsfw": False,
+}
 
 
 class ClientCredentialsStrategy(rest_api.TokenStrategy):
@@ -531,6 +557,66 @@ def _build_prompts(
     return prompt_bodys
 
 
+def _is_empty_command_value(value: object, /) -> bool:
+    return value is None or value is False or (isinstance(value, (str, list, tuple, dict)) and not value)
+
+
+def _canonicalize_command_value(value: typing.Any, /) -> typing.Any:  # noqa: ANN401 - Dynamically typed
+    if isinstance(value, typing.Mapping):
+        return {
+            str(key): _canonicalize_command_value(item)
+            for key, item in value.items()
+            if not _is_empty_command_value(item)
+        }
+
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize_command_value(item) for item in value]
+
+    # Enums are reduced to their values so that local and remote commands compare and hash the same.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(value)
+
+    if isinstance(value, str):
+        return str(value)
+
+    return value
+
+
+def _canonicalize_command(payload: typing.Mapping[str, typing.Any], /) -> dict[str, typing.Any]:
+    command = _canonicalize_command_value({field: payload.get(field) for field in _SYNCED_COMMAND_FIELDS})
+    assert isinstance(command, dict)
+    if "default_member_permissions" in command:
+        command["default_member_permissions"] = str(command["default_member_permissions"])
+
+    for field in _DEFAULTED_COMMAND_FIELDS:
+        if field in command:
+            command[field] = sorted(command[field])
+
+    return command
+
+
+def _diff_command(
+    local_payload: data_binding.JSONObjectBuilder, remote_payload: data_binding.JSONObject, /
+) -> data_binding.JSONObjectBuilder | None:
+    local_command = _canonicalize_command(local_payload)
+    remote_command = _canonicalize_command(remote_payload)
+    for field in _DEFAULTED_COMMAND_FIELDS - local_command.keys():
+        remote_command.pop(field, None)
+
+    if local_command == remote_command:
+        return None
+
+    body = data_binding.JSONObjectBuilder()
+    body.update((field, _COMMAND_FIELD_RESETS[field]) for field in remote_command.keys() - local_command.keys())
+    body.update(local_payload)
+    return body
+
+
+def _hash_commands(commands: typing.Iterable[typing.Mapping[str, typing.Any]], /) -> str:
+    encoded = json.dumps([_canonicalize_command(command) for command in commands], sort_keys=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
 class RESTClientImpl(rest_api.RESTClient):
     """Implementation of the V10-compatible Discord HTTP API.
 
@@ -843,7 +929,9 @@ async def _request(  # noqa: C901, PLR0912, PLR0915
                             uuid,
                             compiled_route.method,
                             url,
-                            _stringify_http_message(headers, self._dumps(json)) if json else None,
+                            _stringify_http_message(headers, data_binding.dump_json(json, self._dumps))
+                            if json
+                            else None,
                         )
                         start = time.time()
 
@@ -1516,6 +1604,7 @@ def _build_message_payload(  # noqa: C901, PLR0912, PLR0915
             final_attachments.extend(attachments)
 
         serialized_components: undefined.UndefinedOr[list[data_binding.JSONObject]] = undefined.UNDEFINED
+        frozen: tuple[data_binding.JSONFragment, typing.Sequence[files.Resource[files.AsyncReader]]] | None = None
         if component is not undefined.UNDEFINED:
             if component is not None:
                 component_payload, component_attachments = component.build()
@@ -1531,11 +1620,15 @@ def _build_message_payload(  # noqa: C901, PLR0912, PLR0915
 
         elif components is not undefined.UNDEFINED:
             serialized_components = []
+            if components and (frozen := special_endpoints_impl.FrozenComponentBuilder.join(components)) is not None:
+                resources.extend(frozen[1])
+
             if components is not None:
                 for comp in components:
-                    component_payload, component_attachments = comp.build()
-                    serialized_components.append(component_payload)
-                    resources.extend(component_attachments)
+                    if frozen is None:
+                        component_payload, component_attachments = comp.build()
+                        serialized_components.append(component_payload)
+                        resources.extend(component_attachments)
 
                     if comp.type in components_.COMPONENT_V2_TYPES:
                         if flags is undefined.UNDEFINED:
@@ -1567,6 +1660,9 @@ def _build_message_payload(  # noqa: C901, PLR0912, PLR0915
         body.put("flags", flags)
         body.put("embeds", serialized_embeds)
         body.put("components", serialized_components)
+        if frozen is not None:
+            # These are spliced into the request body as is
+            body["components"] = frozen[0]  # type: ignore[assignment]
         body.put("poll", poll, conversion=lambda p: p.build())
         body.put(
             "allowed_mentions",
@@ -1716,7 +1812,9 @@ async def create_message(
             body.put("message_reference", message_reference)
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
             response = await self._request(route, form_builder=form_builder)
         else:
             response = await self._request(route, json=body)
@@ -1748,7 +1846,9 @@ async def create_voice_message(
             mentions_reply=mentions_reply,
             flags=flags,
         )
-        form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+        form_builder.add_field(
+            "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+        )
 
         response = await self._request(route, form_builder=form_builder)
         assert isinstance(response, dict)
@@ -1841,7 +1941,9 @@ async def edit_message(
         )
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
             response = await self._request(route, form_builder=form_builder)
         else:
             response = await self._request(route, json=body)
@@ -2138,7 +2240,9 @@ async def execute_webhook_voice_message(
         )
         body.put("username", username)
         body.put("avatar_url", avatar_url, conversion=str)
-        form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+        form_builder.add_field(
+            "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+        )
 
         response = await self._request(route, form_builder=form_builder, query=query, auth=None)
         assert isinstance(response, dict)
@@ -2199,7 +2303,9 @@ async def execute_webhook(
         body.put("avatar_url", avatar_url, conversion=str)
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
             response = await self._request(route, form_builder=form_builder, query=query, auth=None)
         else:
             response = await self._request(route, json=body, query=query, auth=None)
@@ -2207,6 +2313,105 @@ async def execute_webhook(
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_message(response)
 
+    @typing_extensions.override
+    async def execute_webhooks(
+        self,
+        targets: typing.Iterable[tuple[webhooks.ExecutableWebhook | snowflakes.Snowflakeish, str]],
+        content: undefined.UndefinedOr[typing.Any] = undefined.UNDEFINED,
+        *,
+        username: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        avatar_url: undefined.UndefinedType | str | files.URL = undefined.UNDEFINED,
+        attachment: undefined.UndefinedOr[files.Resourceish] = undefined.UNDEFINED,
+        attachments: undefined.UndefinedOr[typing.Sequence[files.Resourceish]] = undefined.UNDEFINED,
+        component: undefined.UndefinedOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
+        components: undefined.UndefinedOr[typing.Sequence[special_endpoints.ComponentBuilder]] = undefined.UNDEFINED,
+        embed: undefined.UndefinedOr[embeds_.Embed] = undefined.UNDEFINED,
+        embeds: undefined.UndefinedOr[typing.Sequence[embeds_.Embed]] = undefined.UNDEFINED,
+        poll: undefined.UndefinedOr[special_endpoints.PollBuilder] = undefined.UNDEFINED,
+        tts: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        mentions_everyone: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        user_mentions: undefined.UndefinedOr[
+            snowflakes.SnowflakeishSequence[users_.PartialUser] | bool
+        ] = undefined.UNDEFINED,
+        role_mentions: undefined.UndefinedOr[
+            snowflakes.SnowflakeishSequence[guilds.PartialRole] | bool
+        ] = undefined.UNDEFINED,
+        flags: undefined.UndefinedType | int | messages_.MessageFlag = undefined.UNDEFINED,
+        max_concurrency: int = 50,
+    ) -> typing.AsyncIterator[
+        tuple[webhooks.ExecutableWebhook | snowflakes.Snowflakeish, messages_.Message | errors.HTTPError]
+    ]:
+        if max_concurrency < 1:
+            msg = "max_concurrency must be greater than 0"
+            raise ValueError(msg)
+
+        query = data_binding.StringMapBuilder()
+        query.put("wait", True)
+        query.put("with_components", True)
+
+        body, form_builder = self._build_message_payload(
+            content=content,
+            attachment=attachment,
+            attachments=attachments,
+            component=component,
+            components=components,
+            embed=embed,
+            embeds=embeds,
+            poll=poll,
+            tts=tts,
+            flags=flags,
+            mentions_everyone=mentions_everyone,
+            user_mentions=user_mentions,
+            role_mentions=role_mentions,
+        )
+        body.put("username", username)
+        body.put("avatar_url", avatar_url, conversion=str)
+
+        if form_builder is not None:
+            # The form is built again for every webhook, so its attachments are only read once here.
+            await form_builder.read_resources(executor=self._executor)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def execute(
+            webhook: webhooks.ExecutableWebhook | snowflakes.Snowflakeish, token: str
+        ) -> tuple[webhooks.ExecutableWebhook | snowflakes.Snowflakeish, messages_.Message | errors.HTTPError]:
+            # int(ExecutableWebhook) isn't guaranteed to be valid nor the ID used to execute this entity as a webhook.
+            webhook_id = webhook if isinstance(webhook, int) else webhook.webhook_id
+            route = routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=webhook_id, token=token)
+
+            async with semaphore:
+                try:
+                    if form_builder is not None:
+                        response = await self._request(route, form_builder=form_builder, query=query, auth=None)
+                    else:
+                        response = await self._request(route, json=body, query=query, auth=None)
+
+                # Connection errors and timeouts are retried and then raised as HTTPError by _request
+                except errors.HTTPError as exc:
+                    return webhook, exc
+
+                except aiohttp.ClientError as exc:
+                    # Anything else aiohttp raises, such as the response being cut off, only concerns this webhook
+                    error = errors.HTTPError(message=str(exc))
+                    error.__cause__ = exc
+                    return webhook, error
+
+            assert isinstance(response, dict)
+            return webhook, self._entity_factory.deserialize_message(response)
+
+        tasks = [asyncio.create_task(execute(webhook, token)) for webhook, token in targets]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
     @typing_extensions.override
     async def fetch_webhook_message(
         self,
@@ -2274,7 +2479,9 @@ async def edit_webhook_message(
         )
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
             response = await self._request(route, form_builder=form_builder, query=query, auth=None)
         else:
             response = await self._request(route, json=body, query=query, auth=None)
@@ -3573,7 +3780,9 @@ async def create_forum_post(  # noqa: PLR0913
         body.put("message", message_body)
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
             response = await self._request(route, form_builder=form_builder, reason=reason)
         else:
             response = await self._request(route, json=body, reason=reason)
@@ -4571,6 +4780,85 @@ async def set_application_commands(
         guild_id = snowflakes.Snowflake(guild) if guild is not undefined.UNDEFINED else None
         return self._deserialize_command_list(response, guild_id)
 
+    @typing_extensions.override
+    async def sync_application_commands(
+        self,
+        application: snowflakes.SnowflakeishOr[guilds.PartialApplication],
+        commands: typing.Sequence[special_endpoints.CommandBuilder],
+        guild: undefined.UndefinedOr[snowflakes.SnowflakeishOr[guilds.PartialGuild]] = undefined.UNDEFINED,
+        *,
+        hashes: typing.MutableMapping[str, str] | None = None,
+    ) -> typing.Sequence[commands.PartialCommand] | None:
+        guild_id = snowflakes.Snowflake(guild) if guild is not undefined.UNDEFINED else None
+        local_commands: dict[tuple[int, str], data_binding.JSONObjectBuilder] = {}
+        for command in commands:
+            payload = data_binding.JSONObjectBuilder()
+            payload.update(command.build(self._entity_factory))
+            payload.pop("id", None)
+            local_commands[int(command.type), command.name] = payload
+
+        hash_key = f"{snowflakes.Snowflake(application)}:{guild_id or 'global'}"
+        commands_hash = _hash_commands(local_commands.values())
+        if hashes is not None and hashes.get(hash_key) == commands_hash:
+            _LOGGER.debug("skipping syncing commands for %s as they are unchanged", hash_key)
+            return None
+
+        if guild is undefined.UNDEFINED:
+            route = routes.GET_APPLICATION_COMMANDS.compile(application=application)
+            create_route = routes.POST_APPLICATION_COMMAND.compile(application=application)
+            edit_route = routes.PATCH_APPLICATION_COMMAND
+            delete_route = routes.DELETE_APPLICATION_COMMAND
+
+        else:
+            route = routes.GET_APPLICATION_GUILD_COMMANDS.compile(application=application, guild=guild)
+            create_route = routes.POST_APPLICATION_GUILD_COMMAND.compile(application=application, guild=guild)
+            edit_route = routes.PATCH_APPLICATION_GUILD_COMMAND
+            delete_route = routes.DELETE_APPLICATION_GUILD_COMMAND
+
+        query = data_binding.StringMapBuilder()
+        query.put("with_localizations", True)
+        response = await self._request(route, query=query)
+        assert isinstance(response, list)
+
+        synced_commands: dict[tuple[int, str], data_binding.JSONObject] = {}
+        requests: dict[tuple[int, str], typing.Awaitable[data_binding.JSONObject | data_binding.JSONArray | None]] = {}
+        deletions: list[typing.Awaitable[data_binding.JSONObject | data_binding.JSONArray | None]] = []
+        for remote_payload in response:
+            key = (int(remote_payload["type"]), remote_payload["name"])
+            local_payload = local_commands.get(key)
+            if local_payload is None:
+                route = delete_route.compile(application=application, command=remote_payload["id"], guild=guild)
+                deletions.append(self._request(route))
+
+            elif (edit := _diff_command(local_payload, remote_payload)) is None:
+                synced_commands[key] = remote_payload
+
+            else:
+                route = edit_route.compile(application=application, command=remote_payload["id"], guild=guild)
+                requests[key] = self._request(route, json=edit)
+
+        for key, local_payload in local_commands.items():
+            if key not in synced_commands and key not in requests:
+                requests[key] = self._request(create_route, json=local_payload)
+
+        _LOGGER.debug(
+            "syncing commands for %s with %s unchanged, %s created or edited and %s deleted",
+            hash_key,
+            len(synced_commands),
+            len(requests),
+            len(deletions),
+        )
+        # If any request fails, the others are cancelled rather than left running after the error is raised
+        results = await aio.all_of(*requests.values(), *deletions)
+        for key, result in zip(requests, results):
+            assert isinstance(result, dict)
+            synced_commands[key] = result
+
+        if hashes is not None:
+            hashes[hash_key] = commands_hash
+
+        return self._deserialize_command_list([synced_commands[key] for key in local_commands], guild_id)
+
     @typing_extensions.override
     async def edit_application_command(
         self,
@@ -4750,7 +5038,7 @@ async def create_interaction_response(
         query.put("with_response", True)
 
         if form is not None:
-            form.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form.add_field("payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON)
             response = await self._request(route, form_builder=form, query=query, auth=None)
         else:
             response = await self._request(route, json=body, query=query, auth=None)
@@ -4779,7 +5067,9 @@ async def create_interaction_voice_message_response(
         body.put("type", base_interactions.ResponseType.MESSAGE_CREATE)
         body.put("data", data)
 
-        form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+        form_builder.add_field(
+            "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+        )
 
         query = data_binding.StringMapBuilder()
         query.put("with_response", True)
@@ -4831,7 +5121,9 @@ async def edit_interaction_response(
         )
 
         if form_builder is not None:
-            form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+            form_builder.add_field(
+                "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+            )
             response = await self._request(route, form_builder=form_builder, auth=None)
         else:
             response = await self._request(route, json=body, auth=None)
@@ -4853,7 +5145,9 @@ async def edit_interaction_voice_message_response(
         body, form_builder = self._build_voice_message_payload(
             attachment=attachment, waveform=waveform, duration=duration
         )
-        form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
+        form_builder.add_field(
+            "payload_json", data_binding.dump_json(body, self._dumps), content_type=_APPLICATION_JSON
+        )
 
         response = await self._request(route, form_builder=form_builder, auth=None)
         assert isinstance(response, dict)
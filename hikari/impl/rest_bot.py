@@ -25,22 +25,26 @@
 __all__: typing.Sequence[str] = ("RESTBot",)
 
 import asyncio
+import functools
 import logging
 import sys
 import typing
 
 from hikari import applications
 from hikari import errors
+from hikari import messages
 from hikari import traits
 from hikari.api import interaction_server as interaction_server_
 from hikari.impl import config as config_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import interaction_server as interaction_server_impl
 from hikari.impl import rest as rest_impl
+from hikari.impl import watchdog as watchdog_impl
 from hikari.internal import aio
 from hikari.internal import signals
 from hikari.internal import typing_extensions
 from hikari.internal import ux
+from hikari.internal import workers as workers_
 
 if typing.TYPE_CHECKING:
     import concurrent.futures
@@ -51,6 +55,7 @@
     from hikari.api import entity_factory as entity_factory_api
     from hikari.api import rest as rest_api
     from hikari.api import special_endpoints
+    from hikari.impl import interaction_router
     from hikari.interactions import base_interactions
     from hikari.interactions import command_interactions
     from hikari.interactions import component_interactions
@@ -89,6 +94,16 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         awkward or not support features in a standard way, the option to
         explicitly disable this is provided. See `force_color` for an
         alternative.
+    auto_defer_after
+        If set, interactions whose listener hasn't returned a response within
+        this many seconds of being received are deferred automatically, with
+        the response being sent once the listener returns.
+
+        See [`hikari.impl.interaction_server.InteractionServer`][] for more
+        information.
+    auto_defer_flags
+        The message flags to automatically defer command and modal interactions
+        with, such as [`hikari.messages.MessageFlag.EPHEMERAL`][].
     banner
         The package to search for a `banner.txt` in.
 
@@ -173,6 +188,19 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         overridden if you are attempting to point to an unofficial endpoint, or
         if you are attempting to mock/stub the Discord API for any reason.
         Generally you do not want to change this.
+    verification_executor
+        If provided, the executor to verify the signatures of interaction
+        requests on, in batches, rather than on the event loop.
+
+        See [`hikari.impl.interaction_server.InteractionServer`][] for more
+        information.
+    watchdog_threshold
+        If provided, how long the event loop must be blocked for, in seconds,
+        for the watchdog to log it along with the name of the task which blocked
+        the event loop and a sample of its stack. Callbacks can be subscribed to
+        the reports through [`hikari.impl.rest_bot.RESTBot.watchdog`][].
+
+        Defaults to [`None`][], which disables the watchdog.
 
     Raises
     ------
@@ -226,6 +254,8 @@ class RESTBot(traits.RESTBotAware, interaction_server_.InteractionServer):
         "_proxy_settings",
         "_rest",
         "_server",
+        "_watchdog",
+        "_worker_id",
     )
 
     @typing.overload
@@ -235,6 +265,8 @@ def __init__(
         *,
         public_key: bytes | str | None = None,
         allow_color: bool = True,
+        auto_defer_after: float | None = None,
+        auto_defer_flags: int | messages.MessageFlag = messages.MessageFlag.NONE,
         banner: str | None = "hikari",
         suppress_optimization_warning: bool = False,
         executor: concurrent.futures.Executor | None = None,
@@ -245,6 +277,8 @@ def __init__(
         max_retries: int = 3,
         proxy_settings: config_impl.ProxySettings | None = None,
         rest_url: str | None = None,
+        verification_executor: concurrent.futures.Executor | None = None,
+        watchdog_threshold: float | None = None,
     ) -> None: ...
 
     @typing.overload
@@ -255,6 +289,8 @@ def __init__(
         public_key: bytes | str | None = None,
         *,
         allow_color: bool = True,
+        auto_defer_after: float | None = None,
+        auto_defer_flags: int | messages.MessageFlag = messages.MessageFlag.NONE,
         banner: str | None = "hikari",
         suppress_optimization_warning: bool = False,
         executor: concurrent.futures.Executor | None = None,
@@ -265,6 +301,8 @@ def __init__(
         max_retries: int = 3,
         proxy_settings: config_impl.ProxySettings | None = None,
         rest_url: str | None = None,
+        verification_executor: concurrent.futures.Executor | None = None,
+        watchdog_threshold: float | None = None,
     ) -> None: ...
 
     def __init__(
@@ -274,6 +312,8 @@ def __init__(
         public_key: bytes | str | None = None,
         *,
         allow_color: bool = True,
+        auto_defer_after: float | None = None,
+        auto_defer_flags: int | messages.MessageFlag = messages.MessageFlag.NONE,
         banner: str | None = "hikari",
         suppress_optimization_warning: bool = False,
         executor: concurrent.futures.Executor | None = None,
@@ -284,6 +324,8 @@ def __init__(
         max_retries: int = 3,
         proxy_settings: config_impl.ProxySettings | None = None,
         rest_url: str | None = None,
+        verification_executor: concurrent.futures.Executor | None = None,
+        watchdog_threshold: float | None = None,
     ) -> None:
         if isinstance(public_key, str):
             public_key = bytes.fromhex(public_key)
@@ -307,6 +349,7 @@ def __init__(
         self._on_shutdown: list[typing.Callable[[RESTBot], typing.Coroutine[typing.Any, typing.Any, None]]] = []
         self._on_startup: list[typing.Callable[[RESTBot], typing.Coroutine[typing.Any, typing.Any, None]]] = []
         self._proxy_settings = proxy_settings if proxy_settings is not None else config_impl.ProxySettings()
+        self._worker_id: int | None = None
 
         # Entity creation
         self._entity_factory = entity_factory_impl.EntityFactoryImpl(self)
@@ -327,9 +370,48 @@ def __init__(
 
         # InteractionServer
         self._server = interaction_server_impl.InteractionServer(
-            entity_factory=self._entity_factory, public_key=public_key, rest_client=self._rest
+            auto_defer_after=auto_defer_after,
+            auto_defer_flags=auto_defer_flags,
+            entity_factory=self._entity_factory,
+            public_key=public_key,
+            rest_client=self._rest,
+            verification_executor=verification_executor,
         )
 
+        # Event loop watchdog
+        self._watchdog = (
+            watchdog_impl.LoopWatchdog(threshold=watchdog_threshold) if watchdog_threshold is not None else None
+        )
+
+    @property
+    def watchdog(self) -> watchdog_impl.LoopWatchdog | None:
+        """Watchdog which reports blocking of the event loop, if enabled.
+
+        This will be [`None`][] unless `watchdog_threshold` was set when
+        creating the bot.
+        """
+        return self._watchdog
+
+    @property
+    def router(self) -> interaction_router.InteractionRouter:
+        """Router which dispatches interactions by command name or custom ID.
+
+        Routes take precedence over the listeners set for each interaction
+        type. See [`hikari.impl.interaction_router.InteractionRouter`][].
+        """
+        return self._server.router
+
+    @property
+    def worker_id(self) -> int | None:
+        """ID of the worker process this bot is running in.
+
+        This is set when the bot is run with multiple `workers`, from `0` to
+        `workers - 1`, and lets startup and shutdown callbacks keep one-off
+        work (such as syncing application commands) to a single worker.
+        Otherwise, this will be [`None`][].
+        """
+        return self._worker_id
+
     @property
     @typing_extensions.override
     def is_alive(self) -> bool:
@@ -460,6 +542,9 @@ async def close(self) -> None:
 
         finally:
             await self._rest.close()
+            if self._watchdog is not None and self._watchdog.is_alive:
+                await self._watchdog.close()
+
             self._close_event.set()
             self._close_event = None
             self._is_closing = False
@@ -498,6 +583,7 @@ def run(
         shutdown_timeout: float = 60.0,
         socket: socket_.socket | None = None,
         ssl_context: ssl.SSLContext | None = None,
+        workers: int = 1,
     ) -> None:
         """Open this REST server and block until it closes.
 
@@ -571,11 +657,123 @@ def run(
             disconnecting all open client sockets.
         ssl_context
             SSL context for HTTPS servers.
+        workers
+            The number of worker processes to serve interactions from.
+
+            When greater than `1`, the listening sockets are bound up front and
+            this process is forked into that many workers. Each worker runs its
+            own copy of this bot, with its own event loop, REST client and rate
+            limit buckets, and calls the startup and shutdown callbacks on its
+            own (see [`hikari.impl.rest_bot.RESTBot.worker_id`][]). On Linux,
+            each worker accepts connections on its own `SO_REUSEPORT` socket,
+            leaving it to the kernel to balance them.
+
+            Interrupts received by this process are forwarded to the workers,
+            which then shut down gracefully, and `propagate_interrupts` is
+            ignored. If any worker exits, the others are shut down too.
+
+            This requires a platform which supports forking.
+
+        Raises
+        ------
+        ValueError
+            If `workers` is greater than `1` and `path` or more than one
+            host is passed.
+        RuntimeError
+            If `workers` is greater than `1` and any worker exited with an
+            error.
         """
         if self.is_alive:
             msg = "Cannot start a bot that's already active"
             raise errors.ComponentStateConflictError(msg)
 
+        run = functools.partial(
+            self._run,
+            asyncio_debug=asyncio_debug,
+            backlog=backlog,
+            check_for_updates=check_for_updates,
+            close_loop=close_loop,
+            close_passed_executor=close_passed_executor,
+            coroutine_tracking_depth=coroutine_tracking_depth,
+            enable_signal_handlers=enable_signal_handlers,
+            reuse_address=reuse_address,
+            reuse_port=reuse_port,
+            shutdown_timeout=shutdown_timeout,
+            ssl_context=ssl_context,
+        )
+
+        if workers <= 1:
+            run(host=host, path=path, port=port, propagate_interrupts=propagate_interrupts, socket=socket)
+            return
+
+        if path is not None:
+            msg = "Multiple workers cannot be run on a unix domain socket"
+            raise ValueError(msg)
+
+        if host is not None and not isinstance(host, str):
+            if len(host) != 1:
+                msg = "Multiple workers can only be bound to a single host"
+                raise ValueError(msg)
+
+            host = host[0]
+
+        if socket is not None:
+            sockets = [socket]
+        else:
+            sockets = workers_.bind_sockets(
+                host or "0.0.0.0",  # noqa: S104 - Binding to all interfaces is the default behaviour
+                port or (8443 if ssl_context else 8080),
+                workers,
+                reuse_address=reuse_address,
+            )
+
+        def run_worker(worker_id: int, notify_started: typing.Callable[[], None]) -> None:
+            self._worker_id = worker_id
+            worker_socket = sockets[worker_id % len(sockets)]
+            for other_socket in sockets:
+                if other_socket is not worker_socket:
+                    other_socket.close()
+
+            # The event loop of the supervisor (if any) can't be shared with the worker
+            asyncio.set_event_loop(asyncio.new_event_loop())
+            run(
+                host=None,
+                path=None,
+                port=None,
+                propagate_interrupts=False,
+                socket=worker_socket,
+                on_started=notify_started,
+            )
+
+        try:
+            workers_.run_workers(workers, run_worker)
+
+        finally:
+            if socket is None:
+                for worker_socket in sockets:
+                    worker_socket.close()
+
+    def _run(
+        self,
+        *,
+        asyncio_debug: bool,
+        backlog: int,
+        check_for_updates: bool,
+        close_loop: bool,
+        close_passed_executor: bool,
+        coroutine_tracking_depth: int | None,
+        enable_signal_handlers: bool | None,
+        host: str | typing.Sequence[str] | None,
+        path: str | None,
+        port: int | None,
+        propagate_interrupts: bool,
+        reuse_address: bool | None,
+        reuse_port: bool | None,
+        shutdown_timeout: float,
+        socket: socket_.socket | None,
+        ssl_context: ssl.SSLContext | None,
+        on_started: typing.Callable[[], None] | None = None,
+    ) -> None:
         loop = aio.get_or_make_loop()
         if asyncio_debug:
             loop.set_debug(True)
@@ -605,6 +803,9 @@ def run(
                         ssl_context=ssl_context,
                     )
                 )
+                if on_started is not None:
+                    on_started()
+
                 loop.run_until_complete(self.join())
 
             finally:
@@ -685,6 +886,9 @@ async def start(
         self._is_closing = False
         self._close_event = asyncio.Event()
 
+        if self._watchdog is not None:
+            self._watchdog.start()
+
         if check_for_updates:
             asyncio.create_task(  # noqa: RUF006 - We want this to be a dangling asyncio task
                 ux.check_for_updates(self._http_settings, self._proxy_settings), name="check for package updates"
@@ -697,6 +901,9 @@ async def start(
 
         except Exception:
             await self._rest.close()
+            if self._watchdog is not None:
+                await self._watchdog.close()
+
             raise
 
         await self._server.start(
@@ -0,0 +1,532 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Cache implementation which shares entities between processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SQLiteCacheBackend", "SharedCacheImpl")
+
+import asyncio
+import concurrent.futures
+import contextlib
+import copy
+import logging
+import pathlib
+import sqlite3
+import threading
+import typing
+
+from hikari import channels as channels_
+from hikari import emojis
+from hikari import guilds
+from hikari import snowflakes
+from hikari.api import cache
+from hikari.api import config as config_api
+from hikari.impl import cache as cache_impl
+from hikari.internal import cache as cache_utility
+from hikari.internal import typing_extensions
+
+if typing.TYPE_CHECKING:
+    import os
+
+    from hikari import traits
+    from hikari import users
+    from hikari.impl import config as config_impl
+    from hikari.internal import data_binding
+
+_T = typing.TypeVar("_T")
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cache")
+
+
+class SQLiteCacheBackend(cache.CacheBackend):
+    """Cache backend which stores entities in a local SQLite database.
+
+    The database is opened in write-ahead-logging mode, so multiple processes
+    can read from it while another one is writing to it. Reads go through a
+    separate, read-only connection, so they aren't blocked by the writes of
+    this process either. It may be used from multiple threads.
+
+    Parameters
+    ----------
+    path
+        Path to the database file. This will be created if it doesn't exist.
+    timeout
+        How long to wait in seconds for another process to release its lock
+        on the database before failing.
+    """
+
+    __slots__: typing.Sequence[str] = ("_connection", "_lock", "_read_connection", "_read_lock")
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout: float = 5.0) -> None:
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        # Autocommit mode, as every operation other than a batch of changes is a single statement.
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Cached entities can be recovered from Discord, so there is no need to wait for writes to hit the disk.
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID"
+        )
+        # In WAL mode, this can read the last committed state while the other connection is writing.
+        self._read_connection = sqlite3.connect(
+            pathlib.Path(path).resolve().as_uri() + "?mode=ro",
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            uri=True,
+        )
+
+    @typing_extensions.override
+    def get(self, key: str, /) -> bytes | None:
+        with self._read_lock:
+            row = self._read_connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+
+        return row[0] if row else None
+
+    @typing_extensions.override
+    def set(self, key: str, value: bytes, /) -> None:
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", (key, value))
+
+    @typing_extensions.override
+    def delete(self, keys: typing.Iterable[str], /) -> None:
+        keys = [(key,) for key in keys]
+        with self._lock:
+            self._connection.executemany("DELETE FROM entries WHERE key = ?", keys)
+
+    @typing_extensions.override
+    def write(self, changes: typing.Mapping[str, bytes | None], /) -> None:
+        values = [(key, value) for key, value in changes.items() if value is not None]
+        keys = [(key,) for key, value in changes.items() if value is None]
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany("INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", values)
+                self._connection.executemany("DELETE FROM entries WHERE key = ?", keys)
+
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+            self._connection.execute("COMMIT")
+
+    @typing_extensions.override
+    def close(self) -> None:
+        with self._read_lock:
+            self._read_connection.close()
+
+        with self._lock:
+            self._connection.close()
+
+
+class SharedCacheImpl(cache_impl.CacheImpl):
+    """In-memory cache implementation which shares entities through a [`hikari.api.cache.CacheBackend`][].
+
+    Guilds, guild channels, roles, emojis and members are written to the
+    backend as they are cached. When they are not found in this cache, the
+    backend is checked, which allows looking up entities cached by other
+    processes sharing the same backend (e.g. ones running other shards).
+
+    Changes are collected while an event is being handled and written to the
+    backend afterwards in a single batch, on a separate thread, so that large
+    events (such as `GUILD_CREATE`s) don't block the event loop. This means
+    other processes see them shortly after this one does. When no event loop
+    is running, changes are written straight away.
+
+    Views only contain the entities cached by this process.
+
+    [`hikari.impl.shared_cache.SharedCacheImpl.close`][] should be called
+    when shutting down, so that no change is lost.
+
+    Parameters
+    ----------
+    app
+        The object of the REST aware app this is bound to.
+    settings
+        The cache settings to use.
+    backend
+        The backend to share entities through.
+    """
+
+    __slots__: typing.Sequence[str] = ("_backend", "_flush_handle", "_in_flight", "_pending", "_writer")
+
+    def __init__(self, app: traits.RESTAware, settings: config_impl.CacheSettings, backend: cache.CacheBackend) -> None:
+        self._backend = backend
+        self._flush_handle: asyncio.Handle | None = None
+        # Changes which haven't been written to the backend yet, keyed by their key. Removals are
+        # stored as None. Pending changes haven't been handed to the writer yet.
+        self._pending: dict[str, object | None] = {}
+        self._in_flight: dict[str, object | None] = {}
+        # A single worker, so that batches are written in order.
+        self._writer = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="hikari.shared_cache")
+        super().__init__(app, settings)
+
+    @property
+    def backend(self) -> cache.CacheBackend:
+        """Backend which entities are shared through."""
+        return self._backend
+
+    def flush(self) -> None:
+        """Write all the changes which haven't been written to the backend yet and wait for them.
+
+        This blocks until they are written, so should only be used when
+        shutting down.
+        """
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        changes, self._pending = self._pending, {}
+        self._writer.submit(self._write, changes).result()
+
+    def close(self) -> None:
+        """Write all the changes which haven't been written to the backend yet, then close it.
+
+        This blocks until they are written, so should only be used when
+        shutting down. The cache can't share entities anymore once closed.
+        """
+        self.flush()
+        self._writer.shutdown(wait=True)
+        self._backend.close()
+
+    def _write(self, changes: dict[str, object | None]) -> None:
+        # This is run on the writer thread.
+        if not changes:
+            return
+
+        try:
+            self._backend.write(
+                {
+                    key: None if entity is None else cache_utility.dump_snapshot(entity, app=self._app)
+                    for key, entity in changes.items()
+                }
+            )
+
+        except Exception:
+            _LOGGER.exception("failed to write %s changes to the shared cache backend", len(changes))
+
+    def _written(self, changes: dict[str, object | None]) -> None:
+        for key, entity in changes.items():
+            # The key may have been changed again since.
+            if key in self._in_flight and self._in_flight[key] is entity:
+                del self._in_flight[key]
+
+    def _flush_pending(self) -> None:
+        self._flush_handle = None
+        changes, self._pending = self._pending, {}
+        self._in_flight.update(changes)
+        loop = asyncio.get_running_loop()
+
+        def on_written(_: concurrent.futures.Future[None]) -> None:
+            # The loop may have been closed while the changes were being written.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._written, changes)
+
+        self._writer.submit(self._write, changes).add_done_callback(on_written)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle or not self._pending:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+
+        except RuntimeError:
+            self.flush()
+
+        else:
+            # Everything the current event changes is written together once it has been handled.
+            self._flush_handle = loop.call_soon(self._flush_pending)
+
+    def _publish(self, key: str, entity: object) -> None:
+        # The entity is serialized on the writer thread, so it is copied to not be affected by later changes to it.
+        self._pending[key] = copy.copy(entity)
+        self._schedule_flush()
+
+    def _unpublish(self, keys: typing.Iterable[str]) -> None:
+        self._pending.update(dict.fromkeys(keys))
+        self._schedule_flush()
+
+    def _lookup(self, key: str, entity_type: type[_T]) -> _T | None:
+        # Changes which haven't been written yet must take precedence over the backend's stale values.
+        if key in self._pending or key in self._in_flight:
+            entity = self._pending[key] if key in self._pending else self._in_flight[key]
+            return entity if isinstance(entity, entity_type) else None
+
+        data = self._backend.get(key)
+        if data is None:
+            return None
+
+        entity = cache_utility.load_snapshot(data, app=self._app)
+        return entity if isinstance(entity, entity_type) else None
+
+    @staticmethod
+    def _member_key(
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], user: snowflakes.SnowflakeishOr[users.PartialUser]
+    ) -> str:
+        return f"member:{int(guild)}:{int(user)}"
+
+    def _iter_shared_keys(self) -> typing.Iterator[str]:
+        for guild_id, guild_record in self._guild_entries.items():
+            if guild_record.guild:
+                yield f"guild:{guild_id}"
+
+            if guild_record.members:
+                yield from (self._member_key(guild_id, user_id) for user_id in guild_record.members)
+
+        yield from (f"channel:{channel_id}" for channel_id in self._guild_channel_entries)
+        yield from (f"emoji:{emoji_id}" for emoji_id in self._emoji_entries)
+        yield from (f"role:{role_id}" for role_id in self._role_entries)
+
+    @typing_extensions.override
+    def clear(self) -> None:
+        self._unpublish(list(self._iter_shared_keys()))
+        super().clear()
+
+    @typing_extensions.override
+    def load_snapshot(self, snapshot: bytes, /) -> None:
+        self._unpublish(list(self._iter_shared_keys()))
+        super().load_snapshot(snapshot)
+
+        pending = self._pending
+        pending.update((f"guild:{guild_id}", guild) for guild_id, guild in self.get_guilds_view().items())
+        pending.update(
+            (f"channel:{channel_id}", channel) for channel_id, channel in self.get_guild_channels_view().items()
+        )
+        pending.update((f"emoji:{emoji_id}", emoji) for emoji_id, emoji in self.get_emojis_view().items())
+        pending.update((f"role:{role_id}", role) for role_id, role in self.get_roles_view().items())
+        for guild_id, members in self.get_members_view().items():
+            pending.update((self._member_key(guild_id, user_id), member) for user_id, member in members.items())
+
+        self._schedule_flush()
+
+    @typing_extensions.override
+    def clear_emojis(self) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        view = super().clear_emojis()
+        self._unpublish(f"emoji:{emoji_id}" for emoji_id in view)
+        return view
+
+    @typing_extensions.override
+    def clear_emojis_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        view = super().clear_emojis_for_guild(guild)
+        self._unpublish(f"emoji:{emoji_id}" for emoji_id in view)
+        return view
+
+    @typing_extensions.override
+    def delete_emoji(self, emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji], /) -> emojis.KnownCustomEmoji | None:
+        if self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            self._unpublish((f"emoji:{int(emoji)}",))
+
+        return super().delete_emoji(emoji)
+
+    @typing_extensions.override
+    def get_emoji(self, emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji], /) -> emojis.KnownCustomEmoji | None:
+        if cached_emoji := super().get_emoji(emoji):
+            return cached_emoji
+
+        if not self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            return None
+
+        return self._lookup(f"emoji:{int(emoji)}", emojis.KnownCustomEmoji)
+
+    @typing_extensions.override
+    def set_emoji(self, emoji: emojis.KnownCustomEmoji, /) -> None:
+        super().set_emoji(emoji)
+        if self._is_cache_enabled_for(config_api.CacheComponents.EMOJIS):
+            self._publish(f"emoji:{emoji.id}", emoji)
+
+    @typing_extensions.override
+    def clear_guilds(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        view = super().clear_guilds()
+        self._unpublish(f"guild:{guild_id}" for guild_id in view)
+        return view
+
+    @typing_extensions.override
+    def delete_guild(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> guilds.GatewayGuild | None:
+        if self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            self._unpublish((f"guild:{int(guild)}",))
+
+        return super().delete_guild(guild)
+
+    @typing_extensions.override
+    def get_guild(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /) -> guilds.GatewayGuild | None:
+        if cached_guild := super().get_guild(guild):
+            return cached_guild
+
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            return None
+
+        return self._lookup(f"guild:{int(guild)}", guilds.GatewayGuild)
+
+    @typing_extensions.override
+    def set_guild(self, guild: guilds.GatewayGuild, /) -> None:
+        super().set_guild(guild)
+        if self._is_cache_enabled_for(config_api.CacheComponents.GUILDS):
+            self._publish(f"guild:{guild.id}", guild)
+
+    @typing_extensions.override
+    def clear_guild_channels(self) -> cache.CacheView[snowflakes.Snowflake, channels_.PermissibleGuildChannel]:
+        view = super().clear_guild_channels()
+        self._unpublish(f"channel:{channel_id}" for channel_id in view)
+        return view
+
+    @typing_extensions.override
+    def clear_guild_channels_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, channels_.PermissibleGuildChannel]:
+        view = super().clear_guild_channels_for_guild(guild)
+        self._unpublish(f"channel:{channel_id}" for channel_id in view)
+        return view
+
+    @typing_extensions.override
+    def delete_guild_channel(
+        self, channel: snowflakes.SnowflakeishOr[channels_.PartialChannel], /
+    ) -> channels_.PermissibleGuildChannel | None:
+        if self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            self._unpublish((f"channel:{int(channel)}",))
+
+        return super().delete_guild_channel(channel)
+
+    @typing_extensions.override
+    def get_guild_channel(
+        self, channel: snowflakes.SnowflakeishOr[channels_.PartialChannel], /
+    ) -> channels_.PermissibleGuildChannel | None:
+        if cached_channel := super().get_guild_channel(channel):
+            return cached_channel
+
+        if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            return None
+
+        return self._lookup(f"channel:{int(channel)}", channels_.PermissibleGuildChannel)
+
+    @typing_extensions.override
+    def set_guild_channel(self, channel: channels_.PermissibleGuildChannel, /) -> None:
+        super().set_guild_channel(channel)
+        if self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
+            self._publish(f"channel:{channel.id}", channel)
+
+    @typing_extensions.override
+    def clear_members_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        guild_id = snowflakes.Snowflake(guild)
+        # The returned view only contains the members which could be removed from memory, but all of
+        # them should be removed from the backend.
+        guild_record = self._guild_entries.get(guild_id)
+        user_ids = list(guild_record.members) if guild_record and guild_record.members else []
+        view = super().clear_members_for_guild(guild_id)
+
+        if self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            self._unpublish(self._member_key(guild_id, user_id) for user_id in user_ids)
+
+        return view
+
+    @typing_extensions.override
+    def delete_member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> guilds.Member | None:
+        if self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            self._unpublish((self._member_key(guild, user),))
+
+        return super().delete_member(guild, user)
+
+    @typing_extensions.override
+    def get_member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> guilds.Member | None:
+        if cached_member := super().get_member(guild, user):
+            return cached_member
+
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return None
+
+        return self._lookup(self._member_key(guild, user), guilds.Member)
+
+    @typing_extensions.override
+    def set_member(self, member: guilds.Member, /) -> None:
+        super().set_member(member)
+        if self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            self._publish(self._member_key(member.guild_id, member.user.id), member)
+
+    @typing_extensions.override
+    def set_members_from_payloads(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        payloads: typing.Iterable[data_binding.JSONObject],
+        /,
+    ) -> None:
+        payloads = list(payloads)
+        super().set_members_from_payloads(guild, payloads)
+        if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
+            return
+
+        for payload in payloads:
+            user_id = snowflakes.Snowflake(payload["user"]["id"])
+            if member := super().get_member(guild, user_id):
+                self._pending[self._member_key(guild, user_id)] = member
+
+        self._schedule_flush()
+
+    @typing_extensions.override
+    def clear_roles(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        view = super().clear_roles()
+        self._unpublish(f"role:{role_id}" for role_id in view)
+        return view
+
+    @typing_extensions.override
+    def clear_roles_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        view = super().clear_roles_for_guild(guild)
+        self._unpublish(f"role:{role_id}" for role_id in view)
+        return view
+
+    @typing_extensions.override
+    def delete_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> guilds.Role | None:
+        if self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            self._unpublish((f"role:{int(role)}",))
+
+        return super().delete_role(role)
+
+    @typing_extensions.override
+    def get_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> guilds.Role | None:
+        if cached_role := super().get_role(role):
+            return cached_role
+
+        if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            return None
+
+        return self._lookup(f"role:{int(role)}", guilds.Role)
+
+    @typing_extensions.override
+    def set_role(self, role: guilds.Role, /) -> None:
+        super().set_role(role)
+        if self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
+            self._publish(f"role:{role.id}", role)
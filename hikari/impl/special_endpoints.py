@@ -41,6 +41,7 @@
     "ContainerComponentBuilder",
     "ContextMenuCommandBuilder",
     "FileComponentBuilder",
+    "FrozenComponentBuilder",
     "InteractionAutocompleteBuilder",
     "InteractionDeferredBuilder",
     "InteractionMessageBuilder",
@@ -1357,27 +1358,46 @@ def set_poll(self, poll: undefined.UndefinedOr[special_endpoints.PollBuilder], /
         return self
 
     def _build_components(
-        self,
+        self, *, keep_frozen: bool
     ) -> tuple[
-        typing.Sequence[typing.MutableMapping[str, typing.Any]], typing.Sequence[files.Resource[files.AsyncReader]]
+        typing.Sequence[typing.MutableMapping[str, typing.Any]] | data_binding.JSONFragment,
+        typing.Sequence[files.Resource[files.AsyncReader]],
     ]:
+        if not self._components:
+            return [], []
+
+        for component in self._components:
+            if component.type in component_models.COMPONENT_V2_TYPES:
+                if self._flags is undefined.UNDEFINED:
+                    self._flags = 0
+                self._flags |= messages.MessageFlag.IS_COMPONENTS_V2
+
+        if keep_frozen and (frozen := FrozenComponentBuilder.join(self._components)) is not None:
+            return frozen
+
         components = []
         attachments: list[files.Resource[files.AsyncReader]] = []
-        if self._components:
-            for component in self._components:
-                component_payload, component_attachments = component.build()
-                components.append(component_payload)
-                attachments.extend(component_attachments)
-
-                if component.type in component_models.COMPONENT_V2_TYPES:
-                    if self._flags is undefined.UNDEFINED:
-                        self._flags = 0
-                    self._flags |= messages.MessageFlag.IS_COMPONENTS_V2
+        for component in self._components:
+            component_payload, component_attachments = component.build()
+            components.append(component_payload)
+            attachments.extend(component_attachments)
+
         return components, attachments
 
     @typing_extensions.override
     def build(
         self, entity_factory: entity_factory_.EntityFactory, /
+    ) -> tuple[typing.MutableMapping[str, typing.Any], typing.Sequence[files.Resource[files.AsyncReader]]]:
+        return self._build(entity_factory, keep_frozen=False)
+
+    def _build_fragments(
+        self, entity_factory: entity_factory_.EntityFactory, /
+    ) -> tuple[typing.MutableMapping[str, typing.Any], typing.Sequence[files.Resource[files.AsyncReader]]]:
+        # The same as build, but frozen components are left encoded for data_binding.dump_json to splice in
+        return self._build(entity_factory, keep_frozen=True)
+
+    def _build(  # noqa: PLR0912 - Too many branches
+        self, entity_factory: entity_factory_.EntityFactory, /, *, keep_frozen: bool
     ) -> tuple[typing.MutableMapping[str, typing.Any], typing.Sequence[files.Resource[files.AsyncReader]]]:
         data = data_binding.JSONObjectBuilder()
         data.put("content", self.content)
@@ -1409,11 +1429,15 @@ def build(
         elif self._embeds is None:
             data.put("embeds", None)
 
+        frozen_components: data_binding.JSONFragment | None = None
         if self._components:
-            components, component_attachments = self._build_components()
+            components, component_attachments = self._build_components(keep_frozen=keep_frozen)
             final_attachments.extend(component_attachments)
 
-            data["components"] = components
+            if isinstance(components, data_binding.JSONFragment):
+                frozen_components = components
+            else:
+                data["components"] = components
         elif self._components is None:
             data.put("components", None)
 
@@ -1429,6 +1453,9 @@ def build(
                 self.mentions_everyone, undefined.UNDEFINED, self.user_mentions, self.role_mentions
             )
 
+        if frozen_components is not None:
+            return {"type": self._type, "data": {**data, "components": frozen_components}}, final_attachments
+
         return {"type": self._type, "data": data}, final_attachments
 
 
@@ -3057,6 +3084,100 @@ def build(
         return payload, attachments
 
 
+@typing.final
+class FrozenComponentBuilder(special_endpoints.ComponentBuilder):
+    """A component builder which has been built and encoded ahead of time.
+
+    Static components which are sent over and over, such as menus, can be
+    frozen once so they aren't built and encoded again for each message.
+    When all the components of a message are frozen, their encoded payloads
+    are spliced into the request body as is.
+
+    Changes made to the builder after it was frozen are not reflected.
+
+    Parameters
+    ----------
+    builder
+        The finished component builder to freeze.
+    dumps
+        The JSON encoder to encode the component with. As the encoded payload
+        is sent as is, this should be the same encoder as the one passed to
+        the REST client if a custom one is used.
+    """
+
+    __slots__: typing.Sequence[str] = ("_attachments", "_fragment", "_id", "_type")
+
+    def __init__(
+        self,
+        builder: special_endpoints.ComponentBuilder,
+        /,
+        *,
+        dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
+    ) -> None:
+        payload, attachments = builder.build()
+        self._attachments = tuple(attachments)
+        self._fragment = data_binding.JSONFragment(dumps(payload))
+        self._id = builder.id
+        self._type = builder.type
+
+    @property
+    @typing_extensions.override
+    def type(self) -> int | component_models.ComponentType:
+        return self._type
+
+    @property
+    @typing_extensions.override
+    def id(self) -> undefined.UndefinedOr[int]:
+        return self._id
+
+    @property
+    def attachments(self) -> typing.Sequence[files.Resource[files.AsyncReader]]:
+        """The attachments added by the component."""
+        return self._attachments
+
+    @property
+    def fragment(self) -> data_binding.JSONFragment:
+        """The encoded payload of the component."""
+        return self._fragment
+
+    @staticmethod
+    def join(
+        components: typing.Iterable[special_endpoints.ComponentBuilder], /
+    ) -> tuple[data_binding.JSONFragment, typing.Sequence[files.Resource[files.AsyncReader]]] | None:
+        """Join the encoded payloads of components into an array if they're all frozen.
+
+        Parameters
+        ----------
+        components
+            The components to join.
+
+        Returns
+        -------
+        typing.Optional[tuple[hikari.internal.data_binding.JSONFragment, typing.Sequence[hikari.files.Resource[hikari.files.AsyncReader]]]]
+            The encoded array of the components and their attachments, or
+            [`None`][] if any of them isn't frozen.
+        """  # noqa: E501 - Line too long
+        fragments: list[data_binding.JSONFragment] = []
+        attachments: list[files.Resource[files.AsyncReader]] = []
+        for component in components:
+            if not isinstance(component, FrozenComponentBuilder):
+                return None
+
+            fragments.append(component.fragment)
+            attachments.extend(component.attachments)
+
+        return data_binding.JSONFragment.from_array(fragments), attachments
+
+    @typing_extensions.override
+    def build(
+        self,
+    ) -> tuple[typing.MutableMapping[str, typing.Any], typing.Sequence[files.Resource[files.AsyncReader]]]:
+        # Decoding gives each caller its own copy to modify, and is faster than building the payload again
+        payload = data_binding.default_json_loads(self._fragment.data)
+        assert isinstance(payload, dict)
+        return payload, self._attachments
+
+
 @attrs.define(kw_only=True, weakref_slot=False)
 class PollBuilder(special_endpoints.PollBuilder):
     """Standard implementation of [`hikari.api.special_endpoints.PollBuilder`][]."""
@@ -0,0 +1,111 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Schema-driven JSON decoding for hot gateway dispatches."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("TypedGatewayDecoder",)
+
+import typing
+
+from hikari.internal import data_binding
+
+_DISPATCH_PREFIX: typing.Final[bytes] = b'{"t":"'
+_DISPATCH_PREFIX_LENGTH: typing.Final[int] = len(_DISPATCH_PREFIX)
+
+
+class TypedGatewayDecoder:
+    """A JSON decoder which decodes hot gateway dispatches into typed records.
+
+    This can be passed as the `loads` argument of
+    [`hikari.impl.gateway_bot.GatewayBot`][] in place of the default decoder.
+
+    The data of `MESSAGE_CREATE` and `GUILD_MEMBER_UPDATE` dispatches is
+    decoded straight from the raw payload into typed records, which are
+    validated as they are decoded and which the entity factory builds entities
+    from directly, without going through an intermediate dict. Everything else,
+    including REST responses and any dispatch which doesn't match its record, is
+    decoded by the default decoder.
+
+    Records can be read like any other JSON object, so raw event consumers and
+    [`hikari.events.shard_events.ShardPayloadEvent`][] listeners keep working.
+    However, keys which the records don't describe are dropped and the records
+    can't be encoded by the default JSON encoder, so this decoder should not be
+    used if the raw payloads of those dispatches need to be kept intact.
+
+    !!! note
+        This requires the optional `hikari[msgspec]` dependencies to be
+        installed, which provide [`msgspec`](https://github.com/jcrist/msgspec).
+
+    Raises
+    ------
+    RuntimeError
+        If the optional `hikari[msgspec]` dependencies are not installed.
+    """
+
+    __slots__: typing.Sequence[str] = ("_decode_error", "_dispatch_decoders", "_loads")
+
+    def __init__(self) -> None:
+        # This is kept inline as msgspec is an optional dependency.
+        try:
+            import msgspec  # noqa: PLC0415
+
+            from hikari.internal import gateway_records  # noqa: PLC0415
+
+        except ModuleNotFoundError as exc:
+            msg = "You must install the optional `hikari[msgspec]` dependencies to use the typed gateway decoder."
+            raise RuntimeError(msg) from exc
+
+        self._decode_error = msgspec.DecodeError
+        self._dispatch_decoders = {
+            name.encode(): msgspec.json.Decoder(frame).decode for name, frame in gateway_records.DISPATCH_FRAMES.items()
+        }
+        self._loads = data_binding.default_json_loads
+
+    def __call__(self, data: str | bytes, /) -> data_binding.JSONArray | data_binding.JSONObject:
+        """Decode a JSON payload.
+
+        Parameters
+        ----------
+        data
+            The JSON payload to decode.
+
+        Returns
+        -------
+        typing.Union[hikari.internal.data_binding.JSONArray, hikari.internal.data_binding.JSONObject]
+            The decoded payload.
+        """
+        # Discord sends the name of a dispatch first, which lets us pick its decoder without decoding the
+        # payload twice. Anything else, including dispatches sent in another order or which are malformed,
+        # is left to the default decoder.
+        if isinstance(data, bytes) and data.startswith(_DISPATCH_PREFIX):
+            decode_dispatch = self._dispatch_decoders.get(
+                data[_DISPATCH_PREFIX_LENGTH : data.find(b'"', _DISPATCH_PREFIX_LENGTH)]
+            )
+            if decode_dispatch is not None:
+                try:
+                    frame = decode_dispatch(data)
+                except self._decode_error:
+                    pass
+                else:
+                    return {"op": frame.op, "d": frame.d, "s": frame.s, "t": frame.t}
+
+        return self._loads(data)
@@ -0,0 +1,282 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Watchdog which detects and reports blocking of the event loop."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BlockedLoopReport", "LoopWatchdog")
+
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+import typing
+
+import attrs
+
+from hikari import errors
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    _SampleT = tuple[float, str | None, typing.Sequence[str]]
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.watchdog")
+
+
+@attrs.define(kw_only=True, weakref_slot=False)
+class BlockedLoopReport:
+    """Report of a period during which the event loop was blocked."""
+
+    duration: float = attrs.field()
+    """How long the event loop was blocked for, in seconds."""
+
+    task_name: str | None = attrs.field()
+    """Name of the task which was running while the event loop was blocked.
+
+    For listeners, this is `"handler '<listener name>' for '<event name>'"`.
+
+    This will be [`None`][] if the event loop wasn't running a task or if it
+    could not be sampled while it was blocked.
+    """
+
+    stack: typing.Sequence[str] = attrs.field(repr=False)
+    """Formatted stack of the event loop thread, sampled while it was blocked.
+
+    The outermost frame is first. This will be empty if the event loop could
+    not be sampled while it was blocked.
+    """
+
+
+class LoopWatchdog:
+    """Watchdog which detects and reports blocking of the event loop.
+
+    A task on the event loop ticks every `interval` seconds and measures how
+    late each tick is. Meanwhile, a background thread checks that the event
+    loop keeps ticking and, once it has been blocked for `threshold` seconds,
+    samples the running task and the stack of the event loop thread.
+
+    Once the event loop recovers, a warning is logged and a
+    [`hikari.impl.watchdog.BlockedLoopReport`][] is passed to each subscribed
+    callback.
+
+    Parameters
+    ----------
+    threshold
+        How long the event loop must be blocked for to be reported, in seconds.
+    interval
+        How often to check the event loop, in seconds. Defaults to half of the
+        threshold, capped to 100 milliseconds.
+    stack_limit
+        The maximum number of frames to keep from the sampled stacks. The
+        innermost frames are kept.
+
+    Raises
+    ------
+    ValueError
+        If `threshold` or `interval` are not positive, or if `interval` is greater
+        than `threshold`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_callbacks",
+        "_interval",
+        "_lag",
+        "_last_tick",
+        "_loop",
+        "_loop_thread_id",
+        "_sample",
+        "_stack_limit",
+        "_stop_event",
+        "_task",
+        "_thread",
+        "_threshold",
+    )
+
+    def __init__(self, *, threshold: float = 0.5, interval: float | None = None, stack_limit: int = 20) -> None:
+        if interval is None:
+            interval = min(threshold / 2, 0.1)
+
+        if threshold <= 0 or interval <= 0:
+            msg = "'threshold' and 'interval' must be positive"
+            raise ValueError(msg)
+
+        if interval > threshold:
+            msg = "'interval' must not be greater than 'threshold'"
+            raise ValueError(msg)
+
+        self._callbacks: list[typing.Callable[[BlockedLoopReport], None]] = []
+        self._interval = interval
+        self._lag = 0.0
+        self._last_tick = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id = 0
+        self._sample: _SampleT | None = None
+        self._stack_limit = stack_limit
+        self._stop_event = threading.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._threshold = threshold
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the watchdog is running."""
+        return self._task is not None
+
+    @property
+    def lag(self) -> float:
+        """How late the last tick of the event loop was, in seconds."""
+        return self._lag
+
+    @property
+    def threshold(self) -> float:
+        """How long the event loop must be blocked for to be reported, in seconds."""
+        return self._threshold
+
+    def subscribe(self, callback: typing.Callable[[BlockedLoopReport], None], /) -> None:
+        """Subscribe a callback to the reports of the watchdog.
+
+        Callbacks are called from the event loop and should not block.
+
+        Parameters
+        ----------
+        callback
+            The callback to subscribe.
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: typing.Callable[[BlockedLoopReport], None], /) -> None:
+        """Unsubscribe a callback from the reports of the watchdog.
+
+        Parameters
+        ----------
+        callback
+            The callback to unsubscribe.
+
+        Raises
+        ------
+        ValueError
+            If the callback is not subscribed.
+        """
+        self._callbacks.remove(callback)
+
+    def start(self) -> None:
+        """Start watching the running event loop.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the watchdog is already running.
+        """
+        if self._task is not None:
+            msg = "The watchdog is already running"
+            raise errors.ComponentStateConflictError(msg)
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._lag = 0.0
+        self._sample = None
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._tick(), name="event loop watchdog")
+        self._thread = threading.Thread(target=self._watch, name="hikari event loop watchdog", daemon=True)
+        self._thread.start()
+
+    async def close(self) -> None:
+        """Stop watching the event loop.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the watchdog is not running.
+        """
+        if self._task is None:
+            msg = "The watchdog is not running"
+            raise errors.ComponentStateConflictError(msg)
+
+        task = self._task
+        self._task = None
+        self._stop_event.set()
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        if self._thread is not None:
+            # The thread wakes up as soon as the stop event is set
+            self._thread.join()
+            self._thread = None
+
+        self._loop = None
+
+    async def _tick(self) -> None:
+        while True:
+            last_tick = self._last_tick
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            self._last_tick = now
+            self._lag = lag = now - last_tick - self._interval
+
+            if lag < self._threshold:
+                continue
+
+            task_name: str | None = None
+            stack: typing.Sequence[str] = ()
+            # The sample is only relevant if it was taken during this blocking period
+            if (sample := self._sample) is not None and sample[0] == last_tick:
+                _, task_name, stack = sample
+
+            self._report(BlockedLoopReport(duration=lag, task_name=task_name, stack=stack))
+
+    def _watch(self) -> None:
+        # This runs in a separate thread, so it can observe the event loop while it is blocked
+        while not self._stop_event.wait(self._interval):
+            last_tick = self._last_tick
+            if time.monotonic() - last_tick < self._threshold:
+                continue
+
+            if (sample := self._sample) is not None and sample[0] == last_tick:
+                # Already sampled this blocking period
+                continue
+
+            # This reads the state of the event loop without synchronising with it, so it is best-effort: if the
+            # loop unblocked in the meantime, the task and stack may be stale or belong to whatever it ran next.
+            # The reports are only diagnostics, so this is preferred over synchronising with the loop on each tick.
+            task = asyncio.current_task(self._loop)
+            frame = sys._current_frames().get(self._loop_thread_id)  # noqa: SLF001 - Private member access
+            stack = traceback.format_stack(frame, limit=self._stack_limit) if frame is not None else ()
+            self._sample = (last_tick, task.get_name() if task is not None else None, stack)
+
+    def _report(self, report: BlockedLoopReport) -> None:
+        _LOGGER.warning(
+            "event loop was blocked for %.3f seconds while running %s\n%s",
+            report.duration,
+            repr(report.task_name) if report.task_name is not None else "an unknown callback",
+            "".join(report.stack).rstrip(),
+        )
+
+        for callback in self._callbacks:
+            try:
+                callback(report)
+            except Exception:  # noqa: PERF203 - try-except within a loop
+                _LOGGER.exception("an exception occurred reporting a blocked event loop")
@@ -247,6 +247,8 @@ async def handle_command_interaction(
         return self.app.rest.interaction_deferred_builder(base_interactions.ResponseType.DEFERRED_MESSAGE_CREATE)
 
 
+# These are built on first access as autocomplete handlers usually only need the options.
+@attrs_extensions.with_deferred_fields("member", "channel")
 @attrs_extensions.with_copy
 @attrs.define(unsafe_hash=True, kw_only=True, weakref_slot=False)
 class AutocompleteInteraction(BaseCommandInteraction):
@@ -34,6 +34,7 @@
 import attrs
 
 from hikari.interactions import base_interactions
+from hikari.internal import attrs_extensions
 
 if typing.TYPE_CHECKING:
     from hikari import components as components_
@@ -81,6 +82,8 @@
 """
 
 
+# These are built on first access as component handlers usually only need the custom ID and values.
+@attrs_extensions.with_deferred_fields("member", "channel", "resolved", "message")
 @attrs.define(unsafe_hash=True, weakref_slot=False)
 class ComponentInteraction(
     base_interactions.MessageResponseMixin[ComponentResponseTypesT], base_interactions.ModalResponseMixin
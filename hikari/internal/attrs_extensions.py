@@ -23,11 +23,16 @@
 from __future__ import annotations
 
 __all__: typing.Sequence[str] = (
+    "DeferredCall",
+    "LazyField",
     "copy_attrs",
     "deep_copy_attrs",
+    "get_raw_field",
     "invalidate_deep_copy_cache",
     "invalidate_shallow_copy_cache",
     "with_copy",
+    "with_deferred_fields",
+    "with_lazy_fields",
 )
 
 import copy as std_copy
@@ -36,7 +41,11 @@
 
 import attrs
 
+if typing.TYPE_CHECKING:
+    import types
+
 ModelT = typing.TypeVar("ModelT", bound=attrs.AttrsInstance)
+ClassT = typing.TypeVar("ClassT", bound=type)
 SKIP_DEEP_COPY: typing.Final[str] = "skip_deep_copy"
 
 _DEEP_COPIERS: typing.MutableMapping[
@@ -104,13 +113,22 @@ def generate_shallow_copier(cls: type[ModelT]) -> typing.Callable[[ModelT], Mode
     from hikari.internal import ux  # noqa: PLC0415
 
     kwargs, setters = get_fields_definition(cls)
-    kwargs = ",".join(f"{kwarg}=m.{attribute.name}" for attribute, kwarg in kwargs)
-    setters = ";".join(f"r.{attribute.name}=m.{attribute.name}" for attribute in setters) + ";" if setters else ""
+    globals_: dict[str, typing.Any] = {"cls": cls}
+
+    def getter(name: str) -> str:
+        # Copy lazy fields as they are, rather than converting them.
+        if isinstance(field := getattr(cls, name, None), LazyField):
+            globals_[f"lazy_{name}"] = field
+            return f"lazy_{name}.get_raw(m)"
+
+        return f"m.{name}"
+
+    kwargs = ",".join(f"{kwarg}={getter(attribute.name)}" for attribute, kwarg in kwargs)
+    setters = ";".join(f"r.{attribute.name}={getter(attribute.name)}" for attribute in setters) + ";" if setters else ""
     code = f"def copy(m):r=cls({kwargs});{setters}return r"
-    globals_ = {"cls": cls}
     _LOGGER.log(ux.TRACE, "generating shallow copy function for %r: %r", cls, code)
     exec(code, globals_)  # noqa: S102 - Use of exec detected.
-    return globals_["copy"]
+    return typing.cast("typing.Callable[[ModelT], ModelT]", globals_["copy"])
 
 
 def get_or_generate_shallow_copier(cls: type[ModelT]) -> typing.Callable[[ModelT], ModelT]:
@@ -253,3 +271,199 @@ def with_copy(cls: type[ModelT]) -> type[ModelT]:
     cls.__copy__ = copy_attrs  # type: ignore[attr-defined]
     cls.__deepcopy__ = deep_copy_attrs  # type: ignore[attr-defined]
     return cls
+
+
+class LazyField:
+    """Descriptor for a field of a slotted attrs class which may be set to a raw value.
+
+    Raw values are converted on first access and the converted value replaces
+    them, so they are only converted once. Any other value is left as is.
+
+    Parameters
+    ----------
+    slot
+        The descriptor of the slot holding the value.
+    raw_type
+        The type of the raw values.
+    convert
+        The function used to convert raw values.
+    """
+
+    __slots__: typing.Sequence[str] = ("_convert", "_raw_type", "_slot")
+
+    def __init__(
+        self,
+        slot: types.MemberDescriptorType,
+        raw_type: type[typing.Any],
+        convert: typing.Callable[[typing.Any], typing.Any],
+    ) -> None:
+        self._convert = convert
+        self._raw_type = raw_type
+        self._slot = slot
+
+    @typing.overload
+    def __get__(self, instance: None, owner: type[typing.Any] | None = None) -> LazyField: ...
+
+    @typing.overload
+    def __get__(self, instance: object, owner: type[typing.Any] | None = None) -> typing.Any: ...  # noqa: ANN401 - Fields may hold anything
+
+    def __get__(self, instance: object | None, owner: type[typing.Any] | None = None) -> typing.Any:
+        if instance is None:
+            return self
+
+        value = self._slot.__get__(instance, owner)
+        if type(value) is self._raw_type:
+            value = self._convert(value)
+            self._slot.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance: object, value: typing.Any) -> None:  # noqa: ANN401 - Fields may hold anything
+        self._slot.__set__(instance, value)
+
+    def __delete__(self, instance: object) -> None:
+        self._slot.__delete__(instance)
+
+    def get_raw(self, instance: object) -> typing.Any:  # noqa: ANN401 - Fields may hold anything
+        """Get the value of the field without converting it.
+
+        Parameters
+        ----------
+        instance
+            The object to get the value from.
+
+        Returns
+        -------
+        typing.Any
+            The raw value if it hasn't been converted yet, otherwise the
+            converted value.
+        """
+        return self._slot.__get__(instance, type(instance))
+
+
+def with_lazy_fields(
+    raw_type: type[typing.Any], convert: typing.Callable[[typing.Any], typing.Any], /, *names: str
+) -> typing.Callable[[ClassT], ClassT]:
+    """Let fields of a slotted attrs class be set to raw values which are converted on first access.
+
+    This lets deserializers skip converting values which may never be used,
+    while keeping the public types of the fields. This must be applied after
+    the attrs class has been created.
+
+    Parameters
+    ----------
+    raw_type
+        The type of the raw values.
+    convert
+        The function used to convert raw values.
+    *names
+        The names of the fields.
+
+    Returns
+    -------
+    typing.Callable[[ClassT], ClassT]
+        The class decorator.
+    """
+
+    def decorator(cls: ClassT) -> ClassT:
+        for name in names:
+            # The slot may be defined by a base class if the field was redefined.
+            slot = next(vars(base)[name] for base in cls.__mro__ if name in vars(base))
+            setattr(cls, name, LazyField(slot, raw_type, convert))
+
+        return cls
+
+    return decorator
+
+
+@typing.final
+class DeferredCall:
+    """A call to make when the deferred field it's set to is first accessed.
+
+    See [`hikari.internal.attrs_extensions.with_deferred_fields`][].
+
+    Parameters
+    ----------
+    function
+        The function to call.
+    *args
+        The positional arguments to call it with.
+    **kwargs
+        The keyword arguments to call it with.
+    """
+
+    __slots__: typing.Sequence[str] = ("_args", "_function", "_kwargs")
+
+    def __init__(
+        self,
+        function: typing.Callable[..., typing.Any],
+        /,
+        *args: typing.Any,  # noqa: ANN401 - Any arguments may be passed
+        **kwargs: typing.Any,  # noqa: ANN401 - Any arguments may be passed
+    ) -> None:
+        self._args = args
+        self._function = function
+        self._kwargs = kwargs
+
+    def __call__(self) -> typing.Any:  # noqa: ANN401 - Functions may return anything
+        """Make the call."""
+        return self._function(*self._args, **self._kwargs)
+
+
+def with_deferred_fields(*names: str) -> typing.Callable[[ClassT], ClassT]:
+    """Let fields of a slotted attrs class be set to calls which are made on first access.
+
+    This is [`hikari.internal.attrs_extensions.with_lazy_fields`][] for
+    values which are a [`hikari.internal.attrs_extensions.DeferredCall`][],
+    so only values which were explicitly deferred are ever called. The fields
+    must be excluded from equality and hashing, so that comparing and hashing
+    models doesn't make the calls.
+
+    Parameters
+    ----------
+    *names
+        The names of the fields.
+
+    Returns
+    -------
+    typing.Callable[[ClassT], ClassT]
+        The class decorator.
+
+    Raises
+    ------
+    TypeError
+        If any of the fields is compared or hashed.
+    """
+    add_lazy_fields = with_lazy_fields(DeferredCall, DeferredCall.__call__, *names)
+
+    def decorator(cls: ClassT) -> ClassT:
+        fields = attrs.fields_dict(cls)
+        for name in names:
+            if fields[name].eq or fields[name].hash:
+                msg = f"Deferred field {name!r} of {cls.__name__} must be excluded from equality and hashing"
+                raise TypeError(msg)
+
+        return add_lazy_fields(cls)
+
+    return decorator
+
+
+def get_raw_field(model: object, name: str) -> typing.Any:  # noqa: ANN401 - Fields may hold anything
+    """Get the value of a field without converting it if it's a lazy field.
+
+    Parameters
+    ----------
+    model
+        The model to get the value from.
+    name
+        The name of the field.
+
+    Returns
+    -------
+    typing.Any
+        The value of the field.
+    """
+    if isinstance(field := getattr(type(model), name, None), LazyField):
+        return field.get_raw(model)
+
+    return getattr(model, name)
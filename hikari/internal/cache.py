@@ -28,6 +28,7 @@
     "CacheMappingView",
     "DataT",
     "EmptyCacheView",
+    "GuildChannelOrder",
     "GuildRecord",
     "InviteData",
     "KeyT",
@@ -39,16 +40,26 @@
     "RichActivityData",
     "ValueT",
     "VoiceStateData",
+    "compute_guild_version",
     "copy_guild_channel",
+    "dump_snapshot",
+    "load_snapshot",
     "unwrap_ref_cell",
 )
 
 import abc
+import bisect
 import copy
+import hashlib
+import io
+import json
+import pickle
 import typing
+import zlib
 
 import attrs
 
+from hikari import channels as channels_
 from hikari import embeds as embeds_
 from hikari import emojis
 from hikari import guilds
@@ -58,10 +69,12 @@
 from hikari import snowflakes
 from hikari import stickers as stickers_
 from hikari import undefined
+from hikari import users as users_
 from hikari import voices
 from hikari.api import cache
 from hikari.internal import attrs_extensions
 from hikari.internal import collections
+from hikari.internal import time
 
 if not typing.TYPE_CHECKING:
     # This is insanely hacky, but it is needed for ruff to not complain until it gets type inference
@@ -75,13 +88,12 @@
     from typing_extensions import Self
 
     from hikari import applications
-    from hikari import channels as channels_
     from hikari import components as components_
     from hikari import polls as polls_
     from hikari import scheduled_events as scheduled_events_
     from hikari import traits
-    from hikari import users as users_
     from hikari.interactions import base_interactions
+    from hikari.internal import data_binding
 
 ChannelT = typing.TypeVar("ChannelT", bound="channels_.PermissibleGuildChannel")
 DataT = typing.TypeVar("DataT", bound="BaseData[typing.Any]")
@@ -91,6 +103,62 @@
 ValueT = typing.TypeVar("ValueT")
 """Type-hint for mapping values."""
 
+_DEFAULT_INTERN_GENERATION_SIZE: typing.Final[int] = 50_000
+
+
+class InternPools:
+    """Pools used by a cache to share equal values between its data objects.
+
+    Large caches hold many equal strings (e.g. names and hashes) and snowflakes
+    (e.g. role IDs) which would otherwise each be stored as a separate object.
+
+    Parameters
+    ----------
+    generation_size
+        The maximum number of values to keep in each generation of the pools.
+        If `0`, values will not be shared.
+    """
+
+    __slots__: typing.Sequence[str] = ("_snowflakes", "_strings")
+
+    def __init__(self, *, generation_size: int = _DEFAULT_INTERN_GENERATION_SIZE) -> None:
+        self._strings: collections.InternPool[str] = collections.InternPool(generation_size=generation_size)
+        self._snowflakes: collections.InternPool[snowflakes.Snowflake] = collections.InternPool(
+            generation_size=generation_size
+        )
+
+    @typing.overload
+    def intern_string(self, value: str, /) -> str: ...
+
+    @typing.overload
+    def intern_string(self, value: str | None, /) -> str | None: ...
+
+    def intern_string(self, value: str | None, /) -> str | None:
+        """Get the shared instance of a string, if not [`None`][]."""
+        return value if value is None else self._strings.intern(value)
+
+    def intern_strings(self, values: typing.Iterable[str], /) -> tuple[str, ...]:
+        """Get the shared instances of strings."""
+        return tuple(map(self._strings.intern, values))
+
+    @typing.overload
+    def intern_snowflake(self, value: snowflakes.Snowflake, /) -> snowflakes.Snowflake: ...
+
+    @typing.overload
+    def intern_snowflake(self, value: snowflakes.Snowflake | None, /) -> snowflakes.Snowflake | None: ...
+
+    def intern_snowflake(self, value: snowflakes.Snowflake | None, /) -> snowflakes.Snowflake | None:
+        """Get the shared instance of a snowflake, if not [`None`][]."""
+        return value if value is None else self._snowflakes.intern(value)
+
+    def intern_snowflakes(self, values: typing.Iterable[snowflakes.Snowflake], /) -> tuple[snowflakes.Snowflake, ...]:
+        """Get the shared instances of snowflakes."""
+        return tuple(map(self._snowflakes.intern, values))
+
+
+# Used when no pools are passed, to keep data objects from sharing values with any cache.
+_UNSHARED: typing.Final[InternPools] = InternPools(generation_size=0)
+
 
 class CacheMappingView(cache.CacheView[KeyT, ValueT]):
     """A cache mapping view implementation used for representing cached data.
@@ -184,6 +252,124 @@ def get_item_at(self, index: slice | int) -> typing.NoReturn:
         raise IndexError(index)
 
 
+class GuildChannelOrder:
+    """Incrementally maintained display order of the channels cached for a guild.
+
+    Categories are ordered by position, with each followed by its text-like
+    channels and then its voice channels (ordered by position). Channels
+    without a category come first.
+
+    Iterating over this yields the channel IDs in this order.
+    """
+
+    __slots__: typing.Sequence[str] = ("_children", "_entries", "_order", "sorted_channels")
+
+    _children: dict[snowflakes.Snowflake, set[snowflakes.Snowflake]]
+    _entries: dict[snowflakes.Snowflake, tuple[tuple[int, int, int, int], snowflakes.Snowflake | None]]
+    _order: list[tuple[int, int, int, int]]
+
+    sorted_channels: typing.Mapping[snowflakes.Snowflake, channels_.PermissibleGuildChannel] | None
+    """A mapping of the channels in this order, built by the cache.
+
+    This is reset to [`None`][] whenever a channel is added or removed.
+    """
+
+    def __init__(self) -> None:
+        # Category ID to the IDs of its children, which may be cached before the category is.
+        self._children = {}
+        # Channel ID to its sort key and parent ID.
+        self._entries = {}
+        # The sort keys, ending with the channel ID to keep them unique and break ties.
+        self._order = []
+        self.sorted_channels = None
+
+    def __iter__(self) -> typing.Iterator[snowflakes.Snowflake]:
+        return (snowflakes.Snowflake(key[-1]) for key in self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getstate__(self) -> tuple[typing.Any, ...]:
+        return self._children, self._entries, self._order
+
+    def __setstate__(self, state: tuple[typing.Any, ...]) -> None:
+        self._children, self._entries, self._order = state
+        self.sorted_channels = None
+
+    def _get_position(self, channel_id: snowflakes.Snowflake | None) -> int:
+        entry = self._entries.get(channel_id) if channel_id is not None else None
+        if not entry:
+            return -1
+
+        key = entry[0]
+        return key[0] if key[1] == -1 else key[2]
+
+    def _insert(self, key: tuple[int, int, int, int], parent_id: snowflakes.Snowflake | None) -> None:
+        self._entries[snowflakes.Snowflake(key[-1])] = (key, parent_id)
+        bisect.insort(self._order, key)
+
+    def _discard(self, channel_id: snowflakes.Snowflake) -> tuple[int, int, int, int] | None:
+        entry = self._entries.pop(channel_id, None)
+        if not entry:
+            return None
+
+        key, parent_id = entry
+        del self._order[bisect.bisect_left(self._order, key)]
+        if parent_id is not None and (children := self._children.get(parent_id)):
+            children.discard(channel_id)
+            if not children:
+                del self._children[parent_id]
+
+        return key
+
+    def _reorder_children(self, category_id: snowflakes.Snowflake) -> None:
+        position = self._get_position(category_id)
+
+        for child_id in self._children.get(category_id, ()):
+            key = self._entries[child_id][0]
+            if key[0] != position:
+                del self._order[bisect.bisect_left(self._order, key)]
+                self._insert((position, key[1], key[2], key[3]), category_id)
+
+    def add(self, channel: channels_.PermissibleGuildChannel, /) -> None:
+        """Add or move a channel.
+
+        Parameters
+        ----------
+        channel
+            The channel to add or move.
+        """
+        self._discard(channel.id)
+        self.sorted_channels = None
+
+        if isinstance(channel, channels_.GuildCategory):
+            self._insert((channel.position, -1, 0, channel.id), None)
+            self._reorder_children(channel.id)
+            return
+
+        kind = 1 if isinstance(channel, channels_.GuildVoiceChannel) else 0
+        self._insert((self._get_position(channel.parent_id), kind, channel.position, channel.id), channel.parent_id)
+
+        if channel.parent_id is not None:
+            self._children.setdefault(channel.parent_id, set()).add(channel.id)
+
+    def remove(self, channel_id: snowflakes.Snowflake, /) -> None:
+        """Remove a channel.
+
+        Parameters
+        ----------
+        channel_id
+            The ID of the channel to remove.
+        """
+        key = self._discard(channel_id)
+        if key is None:
+            return
+
+        self.sorted_channels = None
+        if key[1] == -1:
+            self._reorder_children(channel_id)
+
+
 @attrs_extensions.with_copy
 @attrs.define(repr=False, weakref_slot=False)
 class GuildRecord:
@@ -213,6 +399,12 @@ class GuildRecord:
     This will be [`None`][] if no channels are cached for this guild.
     """
 
+    channel_order: GuildChannelOrder | None = attrs.field(default=None)
+    """The display order of the guild channels cached for this guild.
+
+    This will be [`None`][] if no channels are cached for this guild.
+    """
+
     threads: typing.MutableSet[snowflakes.Snowflake] | None = attrs.field(default=None)
     """A set of the IDs of the guild threads cached for this guild.
 
@@ -267,6 +459,13 @@ class GuildRecord:
     This will be [`None`][] if no voice states are cached for this guild.
     """
 
+    version: bytes | None = attrs.field(default=None)
+    """The version of the guild's channels, emojis and roles as last received in a `GUILD_CREATE`.
+
+    This will be [`None`][] if no version has been recorded or if any of
+    these have been modified since it was recorded.
+    """
+
     def empty(self) -> bool:
         """Check whether this guild record has any resources attached to it.
 
@@ -421,6 +620,10 @@ def build_from_entity(
         )
 
 
+# These are kept raw until they're first accessed, like on Member.
+@attrs_extensions.with_lazy_fields(
+    str, time.iso8601_datetime_string_to_datetime, "joined_at", "premium_since", "raw_communication_disabled_until"
+)
 @attrs_extensions.with_copy
 @attrs.define(kw_only=True, repr=False, weakref_slot=False)
 class MemberData(BaseData[guilds.Member]):
@@ -445,24 +648,26 @@ class MemberData(BaseData[guilds.Member]):
 
     @classmethod
     @typing_extensions.override
-    def build_from_entity(cls, member: guilds.Member, /, *, user: RefCell[users_.User] | None = None) -> MemberData:
+    def build_from_entity(
+        cls, member: guilds.Member, /, *, user: RefCell[users_.User] | None = None, pools: InternPools = _UNSHARED
+    ) -> MemberData:
         return cls(
-            guild_id=member.guild_id,
-            nickname=member.nickname,
-            joined_at=member.joined_at,
-            premium_since=member.premium_since,
+            guild_id=pools.intern_snowflake(member.guild_id),
+            nickname=pools.intern_string(member.nickname),
+            joined_at=attrs_extensions.get_raw_field(member, "joined_at"),
+            premium_since=attrs_extensions.get_raw_field(member, "premium_since"),
             guild_avatar_decoration=member.guild_avatar_decoration,
-            guild_avatar_hash=member.guild_avatar_hash,
-            guild_banner_hash=member.guild_banner_hash,
+            guild_avatar_hash=pools.intern_string(member.guild_avatar_hash),
+            guild_banner_hash=pools.intern_string(member.guild_banner_hash),
             is_deaf=member.is_deaf,
             is_mute=member.is_mute,
             is_pending=member.is_pending,
             user=user or RefCell(copy.copy(member.user)),
-            raw_communication_disabled_until=member.raw_communication_disabled_until,
+            raw_communication_disabled_until=attrs_extensions.get_raw_field(member, "raw_communication_disabled_until"),
             guild_flags=member.guild_flags,
             # role_ids is a special case as it may be mutable so we want to ensure it's
             # immutable when cached.
-            role_ids=tuple(member.role_ids),
+            role_ids=pools.intern_snowflakes(member.role_ids),
         )
 
     @typing_extensions.override
@@ -503,7 +708,12 @@ class KnownCustomEmojiData(BaseData[emojis.KnownCustomEmoji]):
     @classmethod
     @typing_extensions.override
     def build_from_entity(
-        cls, emoji: emojis.KnownCustomEmoji, /, *, user: RefCell[users_.User] | None = None
+        cls,
+        emoji: emojis.KnownCustomEmoji,
+        /,
+        *,
+        user: RefCell[users_.User] | None = None,
+        pools: InternPools = _UNSHARED,
     ) -> KnownCustomEmojiData:
         if not user and emoji.user:
             user = RefCell(copy.copy(emoji.user))
@@ -513,16 +723,16 @@ def build_from_entity(
 
         return cls(
             id=emoji.id,
-            name=emoji.name,
+            name=pools.intern_string(emoji.name),
             is_animated=emoji.is_animated,
-            guild_id=emoji.guild_id,
+            guild_id=pools.intern_snowflake(emoji.guild_id),
             is_colons_required=emoji.is_colons_required,
             is_managed=emoji.is_managed,
             is_available=emoji.is_available,
             user=user,
             # role_ids is a special case as it may be a mutable sequence so we want to ensure it's
             # immutable when cached.
-            role_ids=tuple(emoji.role_ids),
+            role_ids=pools.intern_snowflakes(emoji.role_ids),
         )
 
     @typing_extensions.override
@@ -558,17 +768,22 @@ class GuildStickerData(BaseData[stickers_.GuildSticker]):
     @classmethod
     @typing_extensions.override
     def build_from_entity(
-        cls, sticker: stickers_.GuildSticker, /, *, user: RefCell[users_.User] | None = None
+        cls,
+        sticker: stickers_.GuildSticker,
+        /,
+        *,
+        user: RefCell[users_.User] | None = None,
+        pools: InternPools = _UNSHARED,
     ) -> GuildStickerData:
         if not user and sticker.user:
             user = RefCell(copy.copy(sticker.user))
 
         return cls(
             id=sticker.id,
-            name=sticker.name,
+            name=pools.intern_string(sticker.name),
             description=sticker.description,
-            guild_id=sticker.guild_id,
-            tag=sticker.tag,
+            guild_id=pools.intern_snowflake(sticker.guild_id),
+            tag=pools.intern_string(sticker.tag),
             is_available=sticker.is_available,
             format_type=sticker.format_type,
             user=user,
@@ -588,6 +803,8 @@ def build_entity(self, app: traits.RESTAware, /) -> stickers_.GuildSticker:
         )
 
 
+# This is kept raw until it's first accessed, like on RichActivity.
+@attrs_extensions.with_lazy_fields(int, time.unix_epoch_to_datetime, "created_at")
 @attrs_extensions.with_copy
 @attrs.define(kw_only=True, repr=False, weakref_slot=False)
 class RichActivityData(BaseData[presences.RichActivity]):
@@ -612,7 +829,12 @@ class RichActivityData(BaseData[presences.RichActivity]):
     @classmethod
     @typing_extensions.override
     def build_from_entity(
-        cls, activity: presences.RichActivity, /, *, emoji: RefCell[emojis.CustomEmoji] | str | None = None
+        cls,
+        activity: presences.RichActivity,
+        /,
+        *,
+        emoji: RefCell[emojis.CustomEmoji] | str | None = None,
+        pools: InternPools = _UNSHARED,
     ) -> RichActivityData:
         if emoji:
             pass
@@ -621,20 +843,20 @@ def build_from_entity(
             emoji = RefCell(copy.copy(activity.emoji))
 
         elif activity.emoji:
-            emoji = activity.emoji.name
+            emoji = pools.intern_string(activity.emoji.name)
 
         timestamps = copy.copy(activity.timestamps) if activity.timestamps is not None else None
         party = copy.copy(activity.party) if activity.party is not None else None
         assets = copy.copy(activity.assets) if activity.assets is not None else None
         secrets = copy.copy(activity.secrets) if activity.secrets is not None else None
         return cls(
-            name=activity.name,
-            url=activity.url,
+            name=pools.intern_string(activity.name),
+            url=pools.intern_string(activity.url),
             type=activity.type,
-            created_at=activity.created_at,
-            application_id=activity.application_id,
-            details=activity.details,
-            state=activity.state,
+            created_at=attrs_extensions.get_raw_field(activity, "created_at"),
+            application_id=pools.intern_snowflake(activity.application_id),
+            details=pools.intern_string(activity.details),
+            state=pools.intern_string(activity.state),
             is_instance=activity.is_instance,
             flags=activity.flags,
             emoji=emoji,
@@ -642,7 +864,7 @@ def build_from_entity(
             party=party,
             assets=assets,
             secrets=secrets,
-            buttons=tuple(activity.buttons),
+            buttons=pools.intern_strings(activity.buttons),
         )
 
     @typing_extensions.override
@@ -686,14 +908,18 @@ class MemberPresenceData(BaseData[presences.MemberPresence]):
 
     @classmethod
     @typing_extensions.override
-    def build_from_entity(cls, presence: presences.MemberPresence, /) -> MemberPresenceData:
+    def build_from_entity(
+        cls, presence: presences.MemberPresence, /, *, pools: InternPools = _UNSHARED
+    ) -> MemberPresenceData:
         # role_ids and activities are special cases as may be mutable sequences, therefore we want to ensure they're
         # stored in immutable sequences (tuples). Plus activities need to be converted to Data objects.
         return cls(
             user_id=presence.user_id,
-            guild_id=presence.guild_id,
+            guild_id=pools.intern_snowflake(presence.guild_id),
             visible_status=presence.visible_status,
-            activities=tuple(RichActivityData.build_from_entity(activity) for activity in presence.activities),
+            activities=tuple(
+                RichActivityData.build_from_entity(activity, pools=pools) for activity in presence.activities
+            ),
             client_status=copy.copy(presence.client_status),
         )
 
@@ -967,11 +1193,16 @@ def build_entity(self, app: traits.RESTAware, /) -> voices.VoiceState:
     @classmethod
     @typing_extensions.override
     def build_from_entity(
-        cls, voice_state: voices.VoiceState, /, *, member: RefCell[MemberData] | None = None
+        cls,
+        voice_state: voices.VoiceState,
+        /,
+        *,
+        member: RefCell[MemberData] | None = None,
+        pools: InternPools = _UNSHARED,
     ) -> VoiceStateData:
         return cls(
-            channel_id=voice_state.channel_id,
-            guild_id=voice_state.guild_id,
+            channel_id=pools.intern_snowflake(voice_state.channel_id),
+            guild_id=pools.intern_snowflake(voice_state.guild_id),
             user_id=voice_state.user_id,
             is_self_deafened=voice_state.is_self_deafened,
             is_self_muted=voice_state.is_self_muted,
@@ -1067,3 +1298,190 @@ class Cache3DMappingView(CacheMappingView[snowflakes.Snowflake, cache.CacheView[
     @typing_extensions.override
     def _copy(value: cache.CacheView[KeyT, ValueT]) -> cache.CacheView[KeyT, ValueT]:
         return value
+
+
+def compute_guild_version(payload: data_binding.JSONObject, /) -> bytes:
+    """Compute the version of the channels, emojis and roles in a `GUILD_CREATE` payload.
+
+    This is a digest of the raw payload, so it can be compared against the
+    version recorded in the cache (including one restored from a snapshot)
+    without deserializing any of these entities.
+
+    Parameters
+    ----------
+    payload
+        The raw `GUILD_CREATE` payload.
+
+    Returns
+    -------
+    bytes
+        The version of the payload.
+    """
+    # The version is persisted in snapshots, so it's computed from a canonical encoding which doesn't depend on
+    # the key order of the payload or on the types the JSON decoder decoded it to.
+    data = json.dumps(
+        [payload.get("channels"), payload.get("emojis"), payload.get("roles")], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.blake2b(data.encode(), digest_size=16).digest()
+
+
+_SNAPSHOT_APP_ID: typing.Final[str] = "app"
+# The globals which snapshots may reference: the cache records, the entities they hold and the types of their fields.
+# Anything else is rejected, as unpickling arbitrary globals allows running arbitrary code.
+_SNAPSHOT_GLOBALS: typing.Final[frozenset[tuple[str, str]]] = frozenset(
+    (
+        ("array", "_array_reconstructor"),
+        ("array", "array"),
+        ("builtins", "bytearray"),
+        ("builtins", "complex"),
+        ("builtins", "frozenset"),
+        ("builtins", "set"),
+        ("datetime", "datetime"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+        ("hikari.api.config", "CacheComponents"),
+        ("hikari.channels", "ChannelFlag"),
+        ("hikari.channels", "ChannelType"),
+        ("hikari.channels", "ForumLayoutType"),
+        ("hikari.channels", "ForumSortOrderType"),
+        ("hikari.channels", "ForumTag"),
+        ("hikari.channels", "GuildCategory"),
+        ("hikari.channels", "GuildForumChannel"),
+        ("hikari.channels", "GuildMediaChannel"),
+        ("hikari.channels", "GuildNewsChannel"),
+        ("hikari.channels", "GuildStageChannel"),
+        ("hikari.channels", "GuildTextChannel"),
+        ("hikari.channels", "GuildVoiceChannel"),
+        ("hikari.channels", "PermissionOverwrite"),
+        ("hikari.channels", "PermissionOverwriteType"),
+        ("hikari.channels", "VideoQualityMode"),
+        ("hikari.colors", "Color"),
+        ("hikari.colors", "ColorGradient"),
+        ("hikari.emojis", "CustomEmoji"),
+        ("hikari.emojis", "UnicodeEmoji"),
+        ("hikari.guilds", "GatewayGuild"),
+        ("hikari.guilds", "GuildExplicitContentFilterLevel"),
+        ("hikari.guilds", "GuildFeature"),
+        ("hikari.guilds", "GuildIncidents"),
+        ("hikari.guilds", "GuildMFALevel"),
+        ("hikari.guilds", "GuildMemberFlags"),
+        ("hikari.guilds", "GuildMessageNotificationsLevel"),
+        ("hikari.guilds", "GuildNSFWLevel"),
+        ("hikari.guilds", "GuildPremiumTier"),
+        ("hikari.guilds", "GuildSystemChannelFlag"),
+        ("hikari.guilds", "GuildVerificationLevel"),
+        ("hikari.guilds", "Member"),
+        ("hikari.guilds", "Role"),
+        ("hikari.internal.cache", "GuildChannelOrder"),
+        ("hikari.internal.cache", "GuildRecord"),
+        ("hikari.internal.cache", "KnownCustomEmojiData"),
+        ("hikari.internal.cache", "MemberData"),
+        ("hikari.internal.cache", "RefCell"),
+        ("hikari.internal.collections", "FreezableDict"),
+        ("hikari.internal.collections", "SnowflakeSet"),
+        ("hikari.locales", "Locale"),
+        ("hikari.permissions", "Permissions"),
+        ("hikari.snowflakes", "Snowflake"),
+        ("hikari.undefined", "UNDEFINED"),
+        ("hikari.users", "AvatarDecoration"),
+        ("hikari.users", "OwnUser"),
+        ("hikari.users", "PremiumType"),
+        ("hikari.users", "PrimaryGuild"),
+        ("hikari.users", "UserFlag"),
+        ("hikari.users", "UserImpl"),
+    )
+)
+
+
+class _SnapshotPickler(pickle.Pickler):
+    __slots__: typing.Sequence[str] = ("_app",)
+
+    def __init__(self, file: typing.IO[bytes], app: traits.RESTAware) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._app = app
+
+    @typing_extensions.override
+    def persistent_id(self, obj: object) -> str | None:
+        # The app is shared by most entities and can't be serialized, so it is swapped out for a
+        # placeholder and the current app is put back in its place when loading.
+        return _SNAPSHOT_APP_ID if obj is self._app else None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    __slots__: typing.Sequence[str] = ("_app",)
+
+    def __init__(self, file: typing.IO[bytes], app: traits.RESTAware) -> None:
+        super().__init__(file)
+        self._app = app
+
+    @typing_extensions.override
+    def persistent_load(self, pid: typing.Any) -> traits.RESTAware:
+        if pid != _SNAPSHOT_APP_ID:
+            msg = f"Unknown persistent ID {pid!r} in cache snapshot"
+            raise pickle.UnpicklingError(msg)
+
+        return self._app
+
+    @typing_extensions.override
+    def find_class(self, module: str, name: str, /) -> typing.Any:
+        # Dotted names are resolved attribute by attribute, which would reach past the allowed globals.
+        if "." not in name and (module, name) in _SNAPSHOT_GLOBALS:
+            return super().find_class(module, name)
+
+        msg = f"Cannot load {module}.{name} from a cache snapshot"
+        raise pickle.UnpicklingError(msg)
+
+
+def dump_snapshot(obj: object, /, *, app: traits.RESTAware) -> bytes:
+    """Serialize cached data into a compact binary snapshot.
+
+    Parameters
+    ----------
+    obj
+        The cached data to serialize.
+    app
+        The app the cached entities are bound to. References to this are
+        not serialized and will be replaced by the app passed to
+        [`load_snapshot`][] when loading the snapshot.
+
+    Returns
+    -------
+    bytes
+        The compressed snapshot.
+    """
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, app).dump(obj)
+    return zlib.compress(buffer.getbuffer())
+
+
+def load_snapshot(snapshot: bytes, /, *, app: traits.RESTAware) -> object:
+    """Load cached data from a snapshot created by [`dump_snapshot`][].
+
+    !!! warning
+        Only load snapshots from a trusted source. While loading is limited
+        to the types which may be found in the cache, the loaded entities are
+        not validated any further.
+
+    Parameters
+    ----------
+    snapshot
+        The compressed snapshot.
+    app
+        The app to bind the loaded entities to.
+
+    Returns
+    -------
+    object
+        The loaded data.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot is malformed or contains disallowed types.
+    """
+    try:
+        return _SnapshotUnpickler(io.BytesIO(zlib.decompress(snapshot)), app).load()
+
+    except (pickle.UnpicklingError, zlib.error, EOFError) as ex:
+        msg = "Invalid cache snapshot"
+        raise ValueError(msg) from ex
@@ -25,6 +25,7 @@
 __all__: typing.Sequence[str] = (
     "ExtendedMutableMapping",
     "FreezableDict",
+    "InternPool",
     "KeyT",
     "LimitedCapacityCacheMap",
     "SnowflakeSet",
@@ -220,6 +221,69 @@ def __setitem__(self, key: KeyT, value: ValueT) -> None:
         self._garbage_collect()
 
 
+class InternPool(typing.Generic[KeyT]):
+    """Pool used to share a single instance between equal immutable values.
+
+    To keep its memory use bounded, the pool is split into two generations.
+    Values are added to the young generation and, once it is full, it replaces
+    the old generation. Values from the old generation are moved back to the
+    young one when they are interned again, so only the values which weren't
+    used during a whole generation are dropped. Instances which were already
+    shared stay shared.
+
+    Parameters
+    ----------
+    generation_size
+        The maximum number of values to keep in each generation. If `0`,
+        values will not be shared.
+    """
+
+    __slots__: typing.Sequence[str] = ("_generation_size", "_old", "_young")
+
+    def __init__(self, *, generation_size: int) -> None:
+        self._generation_size = generation_size
+        self._young: dict[KeyT, KeyT] = {}
+        self._old: dict[KeyT, KeyT] = {}
+
+    def __len__(self) -> int:
+        return len(self._young) + len(self._old)
+
+    def intern(self, value: KeyT, /) -> KeyT:
+        """Get the shared instance equal to a value.
+
+        Parameters
+        ----------
+        value
+            The value to get the shared instance for. This will become the
+            shared instance if there isn't one yet.
+
+        Returns
+        -------
+        KeyT
+            The shared instance.
+        """
+        try:
+            return self._young[value]
+        except KeyError:
+            pass
+
+        value = self._old.pop(value, value)
+        if not self._generation_size:
+            return value
+
+        if len(self._young) >= self._generation_size:
+            self._old = self._young
+            self._young = {}
+
+        self._young[value] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop all the values from the pool."""
+        self._young.clear()
+        self._old.clear()
+
+
 # TODO: can this be immutable?
 class SnowflakeSet(typing.MutableSet[snowflakes.Snowflake]):
     r"""Set of [`hikari.snowflakes.Snowflake`][] objects.
@@ -306,6 +370,51 @@ def discard(self, value: int, /) -> None:
         if index < len(self) and self._ids[index] == value:
             del self._ids[index]
 
+    def get_range(
+        self, *, after: int | None = None, before: int | None = None, limit: int | None = None
+    ) -> typing.Sequence[snowflakes.Snowflake]:
+        """Get the snowflakes in this set which fall within a range.
+
+        As the set is kept sorted, this only needs to bisect for the bounds
+        of the range rather than scanning every entry.
+
+        Parameters
+        ----------
+        after
+            If provided, only snowflakes greater than this will be returned.
+        before
+            If provided, only snowflakes less than this will be returned.
+        limit
+            If provided, the maximum number of snowflakes to return. When the
+            range holds more than this, the greatest (newest) snowflakes are kept.
+
+        Returns
+        -------
+        typing.Sequence[hikari.snowflakes.Snowflake]
+            The snowflakes within the range, in ascending order.
+        """
+        start = 0 if after is None else bisect.bisect_right(self._ids, after)
+        stop = len(self._ids) if before is None else bisect.bisect_left(self._ids, before)
+
+        if limit is not None:
+            start = max(start, stop - limit)
+
+        return [snowflakes.Snowflake(sf) for sf in self._ids[start:stop]]
+
+    def pop_oldest(self) -> snowflakes.Snowflake:
+        """Remove and return the smallest (oldest) snowflake in this set.
+
+        Raises
+        ------
+        KeyError
+            If the set is empty.
+        """
+        if not self._ids:
+            msg = "pop from an empty set"
+            raise KeyError(msg)
+
+        return snowflakes.Snowflake(self._ids.pop(0))
+
     @typing_extensions.override
     def __contains__(self, value: object) -> bool:
         if not isinstance(value, int):
@@ -25,18 +25,23 @@
 __all__: typing.Sequence[str] = (
     "Headers",
     "JSONArray",
+    "JSONFragment",
     "JSONObject",
     "JSONObjectBuilder",
     "JSONPayload",
+    "JSONRecord",
     "JSONish",
     "Query",
     "StringMapBuilder",
     "URLEncodedFormBuilder",
     "default_json_dumps",
     "default_json_loads",
+    "dump_json",
 )
 
+import collections.abc
 import datetime
+import json
 import typing
 
 import aiohttp
@@ -46,6 +51,7 @@
 from hikari import files
 from hikari import snowflakes
 from hikari import undefined
+from hikari.internal import typing_extensions
 
 if typing.TYPE_CHECKING:
     import concurrent.futures
@@ -112,8 +118,6 @@ def default_json_dumps(obj: JSONArray | JSONObject) -> bytes:
 
     default_json_loads = orjson.loads
 except ModuleNotFoundError:
-    import json
-
     _json_separators = (",", ":")
 
     def default_json_dumps(obj: JSONArray | JSONObject) -> bytes:
@@ -123,12 +127,139 @@ def default_json_dumps(obj: JSONArray | JSONObject) -> bytes:
     default_json_loads = json.loads
 
 
+class JSONRecord:
+    """Base class for typed records decoded straight from JSON.
+
+    Typed decoders such as [`hikari.impl.typed_decoding.TypedGatewayDecoder`][]
+    may produce records in place of dicts. Records can be read like any other
+    [`JSONObject`][hikari.internal.data_binding.JSONObject], but also expose
+    their fields as attributes, which the entity factory uses to build entities
+    without going through the mapping interface.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+
+collections.abc.Mapping.register(JSONRecord)
+
+
+@typing.final
+class JSONFragment:
+    """A JSON value which has already been encoded.
+
+    Fragments can be set as values of JSON objects encoded with
+    [`hikari.internal.data_binding.dump_json`][], which splices them into
+    the encoded payload as is rather than encoding them again. JSON encoders
+    will refuse to encode them by themselves.
+
+    Parameters
+    ----------
+    data
+        The encoded JSON value.
+    """
+
+    __slots__: typing.Sequence[str] = ("_data",)
+
+    def __init__(self, data: bytes, /) -> None:
+        self._data = data
+
+    @classmethod
+    def from_array(cls, fragments: typing.Iterable[JSONFragment], /) -> JSONFragment:
+        """Join fragments into the fragment of a JSON array.
+
+        Parameters
+        ----------
+        fragments
+            The fragments of the items of the array.
+
+        Returns
+        -------
+        JSONFragment
+            The fragment of the array.
+        """
+        return cls(b"[" + b",".join(fragment.data for fragment in fragments) + b"]")
+
+    @property
+    def data(self) -> bytes:
+        """The encoded JSON value."""
+        return self._data
+
+    @typing_extensions.override
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, JSONFragment) and other._data == self._data
+
+    @typing_extensions.override
+    def __hash__(self) -> int:
+        return hash(self._data)
+
+    @typing_extensions.override
+    def __repr__(self) -> str:
+        return f"JSONFragment({self._data!r})"
+
+
+def _dump_object_with_fragments(value: JSONObject, dumps: JSONEncoder) -> bytes | None:
+    spliced: dict[str, bytes] | None = None
+    for key, item in value.items():
+        if isinstance(item, JSONFragment):
+            data = item.data
+
+        elif not isinstance(item, dict) or (data := _dump_object_with_fragments(item, dumps)) is None:
+            continue
+
+        if spliced is None:
+            spliced = {}
+
+        spliced[key] = data
+
+    if spliced is None:
+        return None
+
+    encoded = dumps({key: item for key, item in value.items() if key not in spliced}).rstrip()
+    # Anything but an empty object needs a comma before the spliced values
+    start = encoded[:-1] + b"," if encoded[1:-1].strip() else b"{"
+    return start + b",".join(json.dumps(key).encode(_UTF_8) + b":" + data for key, data in spliced.items()) + b"}"
+
+
+def dump_json(value: JSONArray | JSONObject, dumps: JSONEncoder = default_json_dumps) -> bytes:
+    """Encode a JSON payload which may contain [`hikari.internal.data_binding.JSONFragment`][]s.
+
+    Fragments may be set as the values of the payload or of any JSON object
+    nested in it through other objects. They aren't looked for in arrays.
+
+    Parameters
+    ----------
+    value
+        The payload to encode.
+    dumps
+        The JSON encoder to encode everything but the fragments with.
+
+    Returns
+    -------
+    bytes
+        The encoded payload.
+
+    Raises
+    ------
+    TypeError
+        If the payload can't be encoded.
+    """
+    # The fragments are looked for explicitly, as an encoder may not reject them (e.g. if it stringifies unknown types)
+    if isinstance(value, dict) and (data := _dump_object_with_fragments(value, dumps)) is not None:
+        return data
+
+    return dumps(value)
+
+
 @typing.final
 class JSONPayload(aiohttp.BytesPayload):
-    """A JSON payload to use in an aiohttp request."""
+    """A JSON payload to use in an aiohttp request.
+
+    This may contain [`hikari.internal.data_binding.JSONFragment`][]s (see
+    [`hikari.internal.data_binding.dump_json`][]).
+    """
 
     def __init__(self, value: JSONArray | JSONObject, dumps: JSONEncoder = default_json_dumps) -> None:
-        super().__init__(dumps(value), content_type=_JSON_CONTENT_TYPE, encoding=_UTF_8)
+        super().__init__(dump_json(value, dumps), content_type=_JSON_CONTENT_TYPE, encoding=_UTF_8)
 
 
 @typing.final
@@ -139,7 +270,7 @@ class URLEncodedFormBuilder:
 
     def __init__(self) -> None:
         self._fields: list[tuple[str, str | aiohttp.BytesPayload, str | None]] = []
-        self._resources: list[tuple[str, files.Resource[files.AsyncReader]]] = []
+        self._resources: list[tuple[str, files.Resource[typing.Any]]] = []
 
     def add_field(self, name: str, data: str | bytes, *, content_type: str | None = None) -> None:
         field_data: str | aiohttp.BytesPayload = aiohttp.BytesPayload(data) if isinstance(data, bytes) else data
@@ -148,6 +279,17 @@ def add_field(self, name: str, data: str | bytes, *, content_type: str | None =
     def add_resource(self, name: str, resource: files.Resource[files.AsyncReader]) -> None:
         self._resources.append((name, resource))
 
+    async def read_resources(self, executor: concurrent.futures.Executor | None = None) -> None:
+        """Read the resources in this form into memory.
+
+        This lets the form be built many times without reading them again.
+        """
+        for index, (name, resource) in enumerate(self._resources):
+            async with resource.stream(executor=executor) as stream:
+                data = await stream.read()
+                mimetype = stream.mimetype or _APPLICATION_OCTET_STREAM
+                self._resources[index] = (name, files.Bytes(data, stream.filename, mimetype))
+
     async def build(
         self, stack: contextlib.AsyncExitStack, executor: concurrent.futures.Executor | None = None
     ) -> aiohttp.FormData:
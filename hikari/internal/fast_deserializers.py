@@ -0,0 +1,445 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Generated fast-path deserializers for the hottest entities.
+
+Each entity is described by a spec mapping its constructor arguments to the
+expressions used to build them from a payload. The specs are compiled into flat
+functions which fill in the slots of the entity directly, skipping the overhead
+of the regular constructor and of the intermediate variables and helper calls
+used by [`hikari.impl.entity_factory.EntityFactoryImpl`][].
+
+The specs of the user, member and message deserializers are shared with
+[`hikari.internal.gateway_records`][], which rewrites them to read the fields
+of its records. They must only read the payload through `payload['field']`,
+`payload.get('field')`, `payload.get('field', default)` and
+`'field' in payload`.
+
+The generated functions do not handle errors. Callers are expected to fall back
+to the regular deserializers if one raises a [`KeyError`][], [`TypeError`][] or
+[`ValueError`][] (such as for a missing or malformed field), which will then
+handle or raise the error properly.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "MEMBER_FIELDS",
+    "MEMBER_PRELUDE",
+    "MESSAGE_FIELDS",
+    "MESSAGE_PRELUDE",
+    "USER_FIELDS",
+    "FastDeserializers",
+    "generate_deserializer",
+    "get_fast_deserializers",
+    "with_user_identity_map",
+)
+
+import functools
+import linecache
+import typing
+
+import attrs
+
+from hikari import colors
+from hikari import embeds
+from hikari import files
+from hikari import guilds
+from hikari import messages
+from hikari import snowflakes
+from hikari import undefined
+from hikari import users
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari.impl import entity_factory
+    from hikari.internal import data_binding
+
+_NAMESPACE: typing.Final[typing.Mapping[str, object]] = {
+    "Color": colors.Color,
+    "GuildMemberFlags": guilds.GuildMemberFlags,
+    "MessageFlag": messages.MessageFlag,
+    "MessageType": messages.MessageType,
+    "Snowflake": snowflakes.Snowflake,
+    "UNDEFINED": undefined.UNDEFINED,
+    "UserFlag": users.UserFlag,
+    "ensure_resource": files.ensure_resource,
+    "parse_datetime": time.iso8601_datetime_string_to_datetime,
+}
+
+
+def generate_deserializer(
+    name: str,
+    target: typing.Callable[..., typing.Any],
+    /,
+    *,
+    args: typing.Sequence[str],
+    fields: typing.Mapping[str, str],
+    prelude: typing.Sequence[str] = (),
+    namespace: typing.Mapping[str, object],
+) -> typing.Callable[..., typing.Any]:
+    """Compile a deserializer function from a spec.
+
+    If `target` is an attrs class, the generated function creates an instance
+    without calling its constructor and assigns every field directly. Fields
+    missing from `fields` are set to their default. Any other callable is
+    called with `fields` as keyword arguments.
+
+    Parameters
+    ----------
+    name
+        The name of the generated function.
+    target
+        The attrs class or callable to build.
+    args
+        The arguments of the generated function.
+    fields
+        Mapping of constructor argument names to the source of the expressions
+        that build them.
+    prelude
+        Source of the statements to run before building the object.
+    namespace
+        The globals available to the expressions.
+
+    Returns
+    -------
+    typing.Callable[..., typing.Any]
+        The generated function.
+
+    Raises
+    ------
+    TypeError
+        If the attrs class can't be built by assigning its fields, or if
+        `fields` is missing a required field or contains an unknown one.
+    """
+    globals_ = {**namespace, "_target": target, "_new": object.__new__}
+    lines = [f"def {name}({', '.join(args)}):", *(f"    {statement}" for statement in prelude)]
+
+    if isinstance(target, type) and attrs.has(target):
+        if target.__setattr__ is not object.__setattr__ or hasattr(target, "__attrs_post_init__"):
+            msg = f"{target.__name__} can't be built by assigning its fields"
+            raise TypeError(msg)
+
+        remaining = dict(fields)
+        lines.append("    self = _new(_target)")
+        for field in attrs.fields(target):
+            if field.converter is not None or field.validator is not None:
+                msg = f"Field {field.name!r} of {target.__name__} has a converter or validator"
+                raise TypeError(msg)
+
+            if field.init and field.alias in remaining:
+                expression = remaining.pop(field.alias)
+
+            elif isinstance(field.default, attrs.Factory) and not field.default.takes_self:  # type: ignore[arg-type]
+                globals_[f"_factory_{field.name}"] = field.default.factory
+                expression = f"_factory_{field.name}()"
+
+            elif field.default is not attrs.NOTHING and not isinstance(field.default, attrs.Factory):  # type: ignore[arg-type]
+                globals_[f"_default_{field.name}"] = field.default
+                expression = f"_default_{field.name}"
+
+            else:
+                msg = f"Missing expression for field {field.alias!r} of {target.__name__}"
+                raise TypeError(msg)
+
+            lines.append(f"    self.{field.name} = {expression}")
+
+        if remaining:
+            msg = f"Unknown fields for {target.__name__}: {', '.join(remaining)}"
+            raise TypeError(msg)
+
+        lines.append("    return self")
+
+    else:
+        arguments = ", ".join(f"{key}={expression}" for key, expression in fields.items())
+        lines.append(f"    return _target({arguments})")
+
+    source = "\n".join(lines) + "\n"
+    filename = f"<generated hikari deserializer {name}>"
+    exec(compile(source, filename, "exec"), globals_)  # noqa: S102 - Use of exec
+    # Register the source so tracebacks through the generated code are readable.
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+    return typing.cast("typing.Callable[..., typing.Any]", globals_[name])
+
+
+USER_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "app": "factory._app",
+    "id": "Snowflake(payload['id'])",
+    "discriminator": "payload['discriminator']",
+    "username": "payload['username']",
+    "global_name": "payload.get('global_name')",
+    "avatar_decoration": (
+        "factory._deserialize_avatar_decoration(v) if (v := payload.get('avatar_decoration_data')) else None"
+    ),
+    "primary_guild": "factory._deserialize_primary_guild(v) if (v := payload.get('primary_guild')) else None",
+    "avatar_hash": "payload['avatar']",
+    "banner_hash": "payload.get('banner')",
+    "accent_color": "Color(v) if (v := payload.get('accent_color')) is not None else None",
+    "is_bot": "payload.get('bot', False)",
+    "is_system": "payload.get('system', False)",
+    "flags": "UserFlag(payload['public_flags']) if 'public_flags' in payload else UserFlag.NONE",
+}
+"""The spec of the user deserializer, also used for [`hikari.internal.gateway_records.UserRecord`][]."""
+
+MEMBER_PRELUDE: typing.Final[typing.Sequence[str]] = (
+    "if user is UNDEFINED: user = deserialize_user(factory, payload['user'])",
+    "if guild_id is UNDEFINED: guild_id = Snowflake(payload['guild_id'])",
+    "role_ids = [Snowflake(role_id) for role_id in payload['roles']]",
+    "if guild_id not in role_ids: role_ids.append(guild_id)",
+)
+"""The statements run before building a member, which may pass through the user and guild ID."""
+
+MEMBER_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "user": "user",
+    "guild_id": "guild_id",
+    "role_ids": "role_ids",
+    "joined_at": "payload['joined_at']",
+    "nickname": "payload.get('nick')",
+    "guild_avatar_decoration": (
+        "factory._deserialize_avatar_decoration(v) if (v := payload.get('avatar_decoration_data')) else None"
+    ),
+    "guild_avatar_hash": "payload.get('avatar')",
+    "guild_banner_hash": "payload.get('banner')",
+    "premium_since": "payload.get('premium_since')",
+    "is_deaf": "payload.get('deaf', UNDEFINED)",
+    "is_mute": "payload.get('mute', UNDEFINED)",
+    "is_pending": "payload.get('pending', UNDEFINED)",
+    "raw_communication_disabled_until": "payload.get('communication_disabled_until') or None",
+    "guild_flags": "GuildMemberFlags(payload.get('flags') or GuildMemberFlags.NONE)",
+}
+"""The spec of the member deserializer, also used for [`hikari.internal.gateway_records.MemberRecord`][]."""
+
+_EMBED_IMAGE_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "resource": "ensure_resource(payload['url'])",
+    "proxy_resource": "ensure_resource(payload['proxy_url']) if 'proxy_url' in payload else None",
+    "height": "payload.get('height')",
+    "width": "payload.get('width')",
+}
+
+_EMBED_VIDEO_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "resource": "ensure_resource(payload['url'])",
+    "proxy_resource": "ensure_resource(v) if (v := payload.get('proxy_url')) else None",
+    "height": "payload.get('height')",
+    "width": "payload.get('width')",
+}
+
+_EMBED_ICON_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "resource": "ensure_resource(payload['icon_url'])",
+    "proxy_resource": "ensure_resource(v) if (v := payload.get('proxy_icon_url')) else None",
+}
+
+_EMBED_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "title": "payload.get('title')",
+    "description": "payload.get('description')",
+    "url": "payload.get('url')",
+    "color": "Color(payload['color']) if 'color' in payload else None",
+    "timestamp": "parse_datetime(payload['timestamp']) if 'timestamp' in payload else None",
+    "image": "deserialize_embed_image(v) if (v := payload.get('image')) and 'url' in v else None",
+    "thumbnail": "deserialize_embed_image(v) if (v := payload.get('thumbnail')) and 'url' in v else None",
+    "video": "deserialize_embed_video(v) if (v := payload.get('video')) and 'url' in v else None",
+    "provider": "EmbedProvider(name=v.get('name'), url=v.get('url')) if (v := payload.get('provider')) else None",
+    "author": (
+        "EmbedAuthor(name=v.get('name'), url=v.get('url'), icon=deserialize_embed_icon(v) if 'icon_url' in v else None)"
+        " if (v := payload.get('author')) else None"
+    ),
+    "footer": (
+        "EmbedFooter(text=v.get('text'), icon=deserialize_embed_icon(v) if 'icon_url' in v else None)"
+        " if (v := payload.get('footer')) else None"
+    ),
+    "fields": (
+        "[EmbedField(name=f['name'], value=f['value'], inline=f.get('inline', False)) for f in v]"
+        " if (v := payload.get('fields')) else None"
+    ),
+}
+
+MESSAGE_PRELUDE: typing.Final[typing.Sequence[str]] = (
+    "author = deserialize_user(factory, payload['author'])",
+    "guild_id = Snowflake(payload['guild_id']) if 'guild_id' in payload else None",
+)
+"""The statements run before building a message."""
+
+MESSAGE_FIELDS: typing.Final[typing.Mapping[str, str]] = {
+    "app": "factory._app",
+    "id": "Snowflake(payload['id'])",
+    "channel_id": "Snowflake(payload['channel_id'])",
+    "guild_id": "guild_id",
+    "author": "author",
+    "member": (
+        "deserialize_member(factory, v, author, guild_id)"
+        " if guild_id is not None and (v := payload.get('member')) else None"
+    ),
+    "content": "payload['content'] or None",
+    "timestamp": "payload['timestamp']",
+    "edited_timestamp": "payload['edited_timestamp']",
+    "is_tts": "payload['tts']",
+    "attachments": "[factory._deserialize_message_attachment(a) for a in payload['attachments']]",
+    "embeds": "[deserialize_embed(factory, e) for e in payload['embeds']]",
+    "poll": "factory.deserialize_poll(payload['poll']) if 'poll' in payload else None",
+    "reactions": (
+        "[factory._deserialize_message_reaction(r) for r in payload['reactions']] if 'reactions' in payload else []"
+    ),
+    "is_pinned": "payload['pinned']",
+    "webhook_id": "Snowflake(payload['webhook_id']) if 'webhook_id' in payload else None",
+    "type": "MessageType(payload['type'])",
+    "activity": "factory._deserialize_message_activity(payload['activity']) if 'activity' in payload else None",
+    "application": (
+        "factory._deserialize_message_application(payload['application']) if 'application' in payload else None"
+    ),
+    "message_reference": (
+        "factory._deserialize_message_reference(payload['message_reference'])"
+        " if 'message_reference' in payload else None"
+    ),
+    "referenced_message": (
+        "factory.deserialize_partial_message(v) if (v := payload.get('referenced_message')) else None"
+    ),
+    "message_snapshots": (
+        "[factory.deserialize_message_snapshot(s) for s in v]"
+        " if (v := payload.get('message_snapshots')) is not None else []"
+    ),
+    "flags": "MessageFlag(payload['flags'])",
+    "stickers": (
+        "[factory.deserialize_partial_sticker(s) for s in payload['sticker_items']] if 'sticker_items' in payload"
+        " else [factory.deserialize_partial_sticker(s) for s in payload['stickers']] if 'stickers' in payload"
+        " else []"
+    ),
+    "nonce": "payload.get('nonce')",
+    "application_id": "Snowflake(payload['application_id']) if 'application_id' in payload else None",
+    "components": "factory._deserialize_top_level_components(v) if (v := payload.get('components')) else []",
+    "user_mentions": "{u.id: u for u in (deserialize_user(factory, m) for m in payload.get('mentions', ()))}",
+    "channel_mentions": (
+        "{c.id: c for c in map(factory.deserialize_partial_channel, payload.get('mention_channels', ()))}"
+    ),
+    "role_mention_ids": "[Snowflake(i) for i in payload.get('mention_roles', ())]",
+    "mentions_everyone": "payload.get('mention_everyone', False)",
+    "thread": "factory.deserialize_guild_thread(v) if (v := payload.get('thread')) else None",
+    "interaction_metadata": (
+        "factory._deserialize_interaction_metadata(v) if (v := payload.get('interaction_metadata')) else None"
+    ),
+}
+"""The spec of the message deserializer, also used for [`hikari.internal.gateway_records.MessageRecord`][]."""
+
+
+def with_user_identity_map(
+    build_user: typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], users.User], /
+) -> typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], users.User]:
+    """Make a generated user deserializer go through the user identity map of the entity factory.
+
+    Parameters
+    ----------
+    build_user
+        The generated user deserializer.
+
+    Returns
+    -------
+    typing.Callable[[hikari.impl.entity_factory.EntityFactoryImpl, hikari.internal.data_binding.JSONObject], hikari.users.User]
+        The user deserializer to call from other generated deserializers.
+    """  # noqa: E501 - Line too long
+
+    def deserialize_user(factory: entity_factory.EntityFactoryImpl, payload: data_binding.JSONObject) -> users.User:
+        # These are internal to the entity factory, which the generated deserializers are an extension of.
+        if factory._user_identity_map is None:  # noqa: SLF001 - Private member accessed
+            return build_user(factory, payload)
+
+        return factory._get_or_build_user(payload, build_user)  # noqa: SLF001 - Private member accessed
+
+    return deserialize_user
+
+
+class FastDeserializers(typing.NamedTuple):
+    """The generated deserializers."""
+
+    user: typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], users.User]
+    """Deserialize a user, taking the entity factory and the payload."""
+
+    member: typing.Callable[
+        [
+            entity_factory.EntityFactoryImpl,
+            data_binding.JSONObject,
+            undefined.UndefinedOr[users.User],
+            undefined.UndefinedOr[snowflakes.Snowflake],
+        ],
+        guilds.Member,
+    ]
+    """Deserialize a member, taking the entity factory, the payload, the user and the guild ID."""
+
+    embed: typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], embeds.Embed]
+    """Deserialize an embed, taking the entity factory and the payload."""
+
+    message: typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], messages.Message]
+    """Deserialize a message, taking the entity factory and the payload."""
+
+
+@functools.cache
+def get_fast_deserializers() -> FastDeserializers:
+    """Get the generated deserializers, generating them on first use."""
+    namespace: dict[str, object] = {
+        **_NAMESPACE,
+        "EmbedAuthor": embeds.EmbedAuthor,
+        "EmbedField": embeds.EmbedField,
+        "EmbedFooter": embeds.EmbedFooter,
+        "EmbedProvider": embeds.EmbedProvider,
+    }
+    # Later deserializers call the earlier ones directly through the namespace.
+    user = generate_deserializer(
+        "deserialize_user", users.UserImpl, args=("factory", "payload"), fields=USER_FIELDS, namespace=namespace
+    )
+    namespace["deserialize_user"] = with_user_identity_map(user)
+    namespace["deserialize_member"] = generate_deserializer(
+        "deserialize_member",
+        guilds.Member,
+        args=("factory", "payload", "user", "guild_id"),
+        prelude=MEMBER_PRELUDE,
+        fields=MEMBER_FIELDS,
+        namespace=namespace,
+    )
+    namespace["deserialize_embed_image"] = generate_deserializer(
+        "deserialize_embed_image", embeds.EmbedImage, args=("payload",), fields=_EMBED_IMAGE_FIELDS, namespace=namespace
+    )
+    namespace["deserialize_embed_video"] = generate_deserializer(
+        "deserialize_embed_video", embeds.EmbedVideo, args=("payload",), fields=_EMBED_VIDEO_FIELDS, namespace=namespace
+    )
+    namespace["deserialize_embed_icon"] = generate_deserializer(
+        "deserialize_embed_icon",
+        embeds.EmbedResourceWithProxy,
+        args=("payload",),
+        fields=_EMBED_ICON_FIELDS,
+        namespace=namespace,
+    )
+    namespace["deserialize_embed"] = generate_deserializer(
+        "deserialize_embed",
+        embeds.Embed.from_received_embed,
+        args=("factory", "payload"),
+        fields=_EMBED_FIELDS,
+        namespace=namespace,
+    )
+    message = generate_deserializer(
+        "deserialize_message",
+        messages.Message,
+        args=("factory", "payload"),
+        prelude=MESSAGE_PRELUDE,
+        fields=MESSAGE_FIELDS,
+        namespace=namespace,
+    )
+    return FastDeserializers(
+        user=user,
+        member=typing.cast("typing.Any", namespace["deserialize_member"]),
+        embed=typing.cast("typing.Any", namespace["deserialize_embed"]),
+        message=message,
+    )
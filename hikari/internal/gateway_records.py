@@ -0,0 +1,326 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Typed records for hot gateway dispatches.
+
+The records are decoded by `msgspec` straight from the raw payload, which
+validates their shape and skips building intermediate dicts for the fields
+hikari knows about. Nested objects which aren't described by a record are
+decoded to plain dicts.
+
+Records keep the payload as sent by Discord: fields which were missing are set
+to `msgspec.UNSET` and are hidden from the mapping interface, and fields which
+are not described by the record are dropped.
+
+!!! note
+    This module requires the optional `hikari[msgspec]` dependencies to be
+    installed, and raises [`ModuleNotFoundError`][] on import otherwise.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "DISPATCH_FRAMES",
+    "DispatchFrame",
+    "GatewayRecord",
+    "MemberRecord",
+    "MessageRecord",
+    "RecordDeserializers",
+    "UserRecord",
+    "get_record_deserializers",
+)
+
+import collections.abc
+import functools
+import re
+import typing
+
+try:
+    import msgspec
+
+except ModuleNotFoundError as exc:
+    msg = "You must install the optional `hikari[msgspec]` dependencies to use the typed gateway records."
+    raise ModuleNotFoundError(msg, name=exc.name) from exc
+
+from hikari import colors
+from hikari import guilds
+from hikari import messages
+from hikari import snowflakes
+from hikari import undefined
+from hikari import users
+from hikari.internal import data_binding
+from hikari.internal import fast_deserializers
+
+if typing.TYPE_CHECKING:
+    from hikari import embeds
+    from hikari.impl import entity_factory
+
+
+# Records only ever hold decoded JSON, so they can't take part in reference cycles.
+class GatewayRecord(data_binding.JSONRecord, msgspec.Struct, frozen=True, gc=False):
+    """Base class for the gateway records, implementing the mapping interface."""
+
+    def __getitem__(self, key: str) -> typing.Any:  # noqa: ANN401 - Records hold arbitrary JSON
+        if key in self.__struct_fields__ and (value := getattr(self, key)) is not msgspec.UNSET:
+            return value
+
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__struct_fields__ and getattr(self, key) is not msgspec.UNSET
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return (key for key in self.__struct_fields__ if getattr(self, key) is not msgspec.UNSET)
+
+    def __len__(self) -> int:
+        return sum(getattr(self, key) is not msgspec.UNSET for key in self.__struct_fields__)
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:  # noqa: ANN401 - Records hold arbitrary JSON
+        """Get the value of a field, or `default` if it's missing."""
+        if key in self.__struct_fields__ and (value := getattr(self, key)) is not msgspec.UNSET:
+            return value
+
+        return default
+
+    def keys(self) -> collections.abc.KeysView[str]:
+        """Get a view of the fields which are set."""
+        return collections.abc.KeysView(typing.cast("typing.Mapping[str, typing.Any]", self))
+
+    def values(self) -> collections.abc.ValuesView[typing.Any]:
+        """Get a view of the values of the fields which are set."""
+        return collections.abc.ValuesView(typing.cast("typing.Mapping[str, typing.Any]", self))
+
+    def items(self) -> collections.abc.ItemsView[str, typing.Any]:
+        """Get a view of the fields which are set and their values."""
+        return collections.abc.ItemsView(typing.cast("typing.Mapping[str, typing.Any]", self))
+
+
+class UserRecord(GatewayRecord, frozen=True):
+    """A user object."""
+
+    id: str
+    username: str
+    discriminator: str
+    avatar: str | None
+    global_name: str | msgspec.UnsetType | None = msgspec.UNSET
+    avatar_decoration_data: typing.Any = msgspec.UNSET
+    primary_guild: typing.Any = msgspec.UNSET
+    banner: str | msgspec.UnsetType | None = msgspec.UNSET
+    accent_color: int | msgspec.UnsetType | None = msgspec.UNSET
+    bot: bool | msgspec.UnsetType = msgspec.UNSET
+    system: bool | msgspec.UnsetType = msgspec.UNSET
+    public_flags: int | msgspec.UnsetType = msgspec.UNSET
+
+
+class MemberRecord(GatewayRecord, frozen=True):
+    """A guild member object, as sent on its own or as part of another dispatch."""
+
+    roles: list[str]
+    joined_at: str | None
+    user: UserRecord | msgspec.UnsetType = msgspec.UNSET
+    guild_id: str | msgspec.UnsetType = msgspec.UNSET
+    nick: str | msgspec.UnsetType | None = msgspec.UNSET
+    avatar: str | msgspec.UnsetType | None = msgspec.UNSET
+    avatar_decoration_data: typing.Any = msgspec.UNSET
+    banner: str | msgspec.UnsetType | None = msgspec.UNSET
+    premium_since: str | msgspec.UnsetType | None = msgspec.UNSET
+    deaf: bool | msgspec.UnsetType = msgspec.UNSET
+    mute: bool | msgspec.UnsetType = msgspec.UNSET
+    pending: bool | msgspec.UnsetType = msgspec.UNSET
+    communication_disabled_until: str | msgspec.UnsetType | None = msgspec.UNSET
+    flags: int | msgspec.UnsetType = msgspec.UNSET
+
+
+class MessageRecord(GatewayRecord, frozen=True):
+    """A `MESSAGE_CREATE` dispatch."""
+
+    id: str
+    channel_id: str
+    author: UserRecord
+    content: str
+    timestamp: str
+    edited_timestamp: str | None
+    tts: bool
+    attachments: list[typing.Any]
+    embeds: list[typing.Any]
+    pinned: bool
+    type: int
+    flags: int
+    guild_id: str | msgspec.UnsetType = msgspec.UNSET
+    member: MemberRecord | msgspec.UnsetType = msgspec.UNSET
+    mentions: list[UserRecord] | msgspec.UnsetType = msgspec.UNSET
+    mention_roles: list[str] | msgspec.UnsetType = msgspec.UNSET
+    mention_channels: list[typing.Any] | msgspec.UnsetType = msgspec.UNSET
+    mention_everyone: bool | msgspec.UnsetType = msgspec.UNSET
+    poll: typing.Any = msgspec.UNSET
+    reactions: list[typing.Any] | msgspec.UnsetType = msgspec.UNSET
+    nonce: typing.Any = msgspec.UNSET
+    webhook_id: str | msgspec.UnsetType = msgspec.UNSET
+    activity: typing.Any = msgspec.UNSET
+    application: typing.Any = msgspec.UNSET
+    application_id: str | msgspec.UnsetType = msgspec.UNSET
+    message_reference: typing.Any = msgspec.UNSET
+    referenced_message: typing.Any = msgspec.UNSET
+    message_snapshots: typing.Any = msgspec.UNSET
+    sticker_items: list[typing.Any] | msgspec.UnsetType = msgspec.UNSET
+    stickers: list[typing.Any] | msgspec.UnsetType = msgspec.UNSET
+    components: typing.Any = msgspec.UNSET
+    thread: typing.Any = msgspec.UNSET
+    interaction_metadata: typing.Any = msgspec.UNSET
+
+
+RecordT = typing.TypeVar("RecordT", bound=GatewayRecord)
+
+
+class DispatchFrame(msgspec.Struct, typing.Generic[RecordT], gc=False):
+    """A gateway dispatch payload, holding its data as a record."""
+
+    op: int
+    d: RecordT
+    s: int
+    t: str
+
+
+DISPATCH_FRAMES: typing.Final[typing.Mapping[str, typing.Any]] = {
+    "MESSAGE_CREATE": DispatchFrame[MessageRecord],
+    "GUILD_MEMBER_UPDATE": DispatchFrame[MemberRecord],
+}
+"""Mapping of dispatch event names to the types to decode them as."""
+
+_NAMESPACE: typing.Final[typing.Mapping[str, object]] = {
+    "Color": colors.Color,
+    "GuildMemberFlags": guilds.GuildMemberFlags,
+    "MessageFlag": messages.MessageFlag,
+    "MessageType": messages.MessageType,
+    "Snowflake": snowflakes.Snowflake,
+    "UNDEFINED": undefined.UNDEFINED,
+    "UNSET": msgspec.UNSET,
+    "UserFlag": users.UserFlag,
+}
+
+_GET_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"\bpayload\.get\('(\w+)'(?:, (\(\)|[\w.]+))?\)")
+_GET_ITEM_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"\bpayload\['(\w+)'\]")
+_CONTAINS_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"'(\w+)' in payload\b")
+_UNHANDLED_PATTERN: typing.Final[re.Pattern[str]] = re.compile(r"\bpayload\.get\b|\bin payload(?![\w.\[])")
+
+
+def _rewrite_for_record(source: str, record: type[GatewayRecord]) -> str:
+    # Rewrite the payload accesses of a spec from fast_deserializers to read the fields of the record instead,
+    # keeping the behaviour of the spec for missing fields.
+    fields = {field.name: field for field in msgspec.structs.fields(record)}
+
+    def get_field(match: re.Match[str]) -> msgspec.structs.FieldInfo:
+        if (field := fields.get(match[1])) is None:
+            msg = f"{record.__name__} has no field {match[1]!r}"
+            raise TypeError(msg)
+
+        return field
+
+    def rewrite_get(match: re.Match[str]) -> str:
+        field = get_field(match)
+        if field.required:
+            return f"payload.{field.name}"
+
+        return f"({match[2] or 'None'} if payload.{field.name} is UNSET else payload.{field.name})"
+
+    def rewrite_get_item(match: re.Match[str]) -> str:
+        # Optional fields keep going through the mapping interface, which raises KeyError when they're missing.
+        return f"payload.{field.name}" if (field := get_field(match)).required else match[0]
+
+    def rewrite_contains(match: re.Match[str]) -> str:
+        return "True" if (field := get_field(match)).required else f"payload.{field.name} is not UNSET"
+
+    source = _GET_PATTERN.sub(rewrite_get, source)
+    source = _GET_ITEM_PATTERN.sub(rewrite_get_item, source)
+    source = _CONTAINS_PATTERN.sub(rewrite_contains, source)
+
+    if _UNHANDLED_PATTERN.search(source):
+        msg = f"Can't rewrite {source!r} to read a {record.__name__}"
+        raise TypeError(msg)
+
+    return source
+
+
+def _record_fields(fields: typing.Mapping[str, str], record: type[GatewayRecord]) -> dict[str, str]:
+    return {name: _rewrite_for_record(expression, record) for name, expression in fields.items()}
+
+
+def _record_prelude(prelude: typing.Sequence[str], record: type[GatewayRecord]) -> list[str]:
+    return [_rewrite_for_record(statement, record) for statement in prelude]
+
+
+def _deserialize_embed(factory: entity_factory.EntityFactoryImpl, payload: data_binding.JSONObject) -> embeds.Embed:
+    # Embeds aren't described by a record, so they go through the entity factory like any other dict.
+    return factory.deserialize_embed(payload)
+
+
+class RecordDeserializers(typing.NamedTuple):
+    """The generated deserializers for the gateway records."""
+
+    user: typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], users.User]
+    """Deserialize a user record, taking the entity factory and the record."""
+
+    member: typing.Callable[
+        [
+            entity_factory.EntityFactoryImpl,
+            data_binding.JSONObject,
+            undefined.UndefinedOr[users.User],
+            undefined.UndefinedOr[snowflakes.Snowflake],
+        ],
+        guilds.Member,
+    ]
+    """Deserialize a member record, taking the entity factory, the record, the user and the guild ID."""
+
+    message: typing.Callable[[entity_factory.EntityFactoryImpl, data_binding.JSONObject], messages.Message]
+    """Deserialize a message record, taking the entity factory and the record."""
+
+
+@functools.cache
+def get_record_deserializers() -> RecordDeserializers:
+    """Get the generated record deserializers, generating them on first use."""
+    namespace: dict[str, object] = {**_NAMESPACE, "deserialize_embed": _deserialize_embed}
+    # Later deserializers call the earlier ones directly through the namespace.
+    user = fast_deserializers.generate_deserializer(
+        "deserialize_user_record",
+        users.UserImpl,
+        args=("factory", "payload"),
+        fields=_record_fields(fast_deserializers.USER_FIELDS, UserRecord),
+        namespace=namespace,
+    )
+    namespace["deserialize_user"] = fast_deserializers.with_user_identity_map(user)
+    namespace["deserialize_member"] = fast_deserializers.generate_deserializer(
+        "deserialize_member_record",
+        guilds.Member,
+        args=("factory", "payload", "user", "guild_id"),
+        prelude=_record_prelude(fast_deserializers.MEMBER_PRELUDE, MemberRecord),
+        fields=_record_fields(fast_deserializers.MEMBER_FIELDS, MemberRecord),
+        namespace=namespace,
+    )
+    message = fast_deserializers.generate_deserializer(
+        "deserialize_message_record",
+        messages.Message,
+        args=("factory", "payload"),
+        prelude=_record_prelude(fast_deserializers.MESSAGE_PRELUDE, MessageRecord),
+        fields=_record_fields(fast_deserializers.MESSAGE_FIELDS, MessageRecord),
+        namespace=namespace,
+    )
+    return RecordDeserializers(
+        user=user, member=typing.cast("typing.Any", namespace["deserialize_member"]), message=message
+    )
@@ -28,6 +28,8 @@
     "datetime_to_discord_epoch",
     "discord_epoch_to_datetime",
     "local_datetime",
+    "monotonic",
+    "perf_counter",
     "time",
     "time_ns",
     "timespan_to_int",
@@ -206,6 +208,14 @@ def time_ns() -> int:
         """Epoch time in nanoseconds (since 00:00:00 UTC on January 1, 1970)."""
         raise NotImplementedError
 
+    def monotonic() -> float:
+        """Value in seconds of a clock which can't go backwards, to measure durations."""
+        raise NotImplementedError
+
+    def perf_counter() -> float:
+        """Value in seconds of the highest resolution clock available, to measure short durations."""
+        raise NotImplementedError
+
 else:
     time = time_.time
     """Epoch time in seconds (since 00:00:00 UTC on January 1, 1970)."""
@@ -213,6 +223,12 @@ def time_ns() -> int:
     time_ns = time_.time_ns
     """Epoch time in nanoseconds (since 00:00:00 UTC on January 1, 1970)."""
 
+    monotonic = time_.monotonic
+    """Value in seconds of a clock which can't go backwards, to measure durations."""
+
+    perf_counter = time_.perf_counter
+    """Value in seconds of the highest resolution clock available, to measure short durations."""
+
 
 def uuid() -> str:
     """Generate a unique UUID (1ns precision)."""
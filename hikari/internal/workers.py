@@ -0,0 +1,276 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Utilities to run an application across several pre-forked worker processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("bind_sockets", "run_workers")
+
+import contextlib
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    import types
+
+    _WorkerT = typing.Callable[[int, typing.Callable[[], None]], None]
+
+_INTERRUPT_SIGNALS: typing.Final[tuple[signal.Signals, ...]] = (signal.SIGINT, signal.SIGTERM)
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.workers")
+_POLL_INTERVAL: typing.Final[float] = 0.1
+
+
+def bind_sockets(host: str, port: int, count: int, *, reuse_address: bool | None = None) -> list[socket.socket]:
+    """Bind the listening sockets to share between workers.
+
+    On Linux, each worker gets its own socket bound with `SO_REUSEPORT`, so that
+    the kernel balances the incoming connections between them. Everywhere else,
+    a single socket is bound and shared by all the workers.
+
+    Parameters
+    ----------
+    host
+        The host to bind to.
+    port
+        The port to bind to. If `0`, an ephemeral port is picked and shared by
+        all the sockets.
+    count
+        The number of workers.
+    reuse_address
+        Whether to set `SO_REUSEADDR` on the sockets. Defaults to [`True`][].
+
+    Returns
+    -------
+    list[socket.socket]
+        The bound sockets. This either contains a socket for each worker or a
+        single socket shared by all of them.
+    """
+    family, type_, proto, _, address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE)[
+        0
+    ]
+    reuse_port = sys.platform == "linux" and hasattr(socket, "SO_REUSEPORT")
+    sockets: list[socket.socket] = []
+
+    try:
+        for _ in range(count if reuse_port else 1):
+            sock = socket.socket(family, type_, proto)
+            sockets.append(sock)
+
+            if reuse_address is not False:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+            if reuse_port:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+            sock.bind(address)
+            # Bind every following socket to the port picked for the first one
+            address = sock.getsockname()
+
+    except BaseException:
+        for sock in sockets:
+            sock.close()
+
+        raise
+
+    return sockets
+
+
+def _run_worker(worker_id: int, worker: _WorkerT, notify_fd: int, /) -> typing.NoReturn:
+    def notify_started() -> None:
+        os.write(notify_fd, b"\x00")
+
+    code = 0
+    try:
+        for signum in _INTERRUPT_SIGNALS:
+            signal.signal(signum, signal.SIG_DFL)
+
+        # Interrupts received since forking were held back until the handlers of the supervisor were reset
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _INTERRUPT_SIGNALS)
+
+        # Keep terminal signals from reaching the workers directly, the supervisor forwards them
+        os.setpgid(0, 0)
+        worker(worker_id, notify_started)
+
+    except BaseException:
+        _LOGGER.exception("worker %s crashed", worker_id)
+        code = 1
+
+    finally:
+        logging.shutdown()
+        os._exit(code)
+
+
+class _Supervisor:
+    __slots__: typing.Sequence[str] = ("_count", "_failed", "_pids", "_started", "_stopping")
+
+    def __init__(self, count: int, /) -> None:
+        self._count = count
+        self._failed: list[int] = []
+        self._pids: dict[int, int] = {}
+        self._started = 0
+        self._stopping = False
+
+    def fork(self, worker: _WorkerT, ready_fd: int, notify_fd: int, /) -> None:
+        for worker_id in range(self._count):
+            signal.pthread_sigmask(signal.SIG_BLOCK, _INTERRUPT_SIGNALS)
+            try:
+                pid = os.fork()
+                if pid == 0:
+                    os.close(ready_fd)
+                    _run_worker(worker_id, worker, notify_fd)
+
+            finally:
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, _INTERRUPT_SIGNALS)
+
+            self._pids[pid] = worker_id
+
+        _LOGGER.info("started %s workers", self._count)
+        if self._stopping:
+            # Interrupted before every worker was forked
+            self.kill()
+
+    def kill(self, signal_number: int = signal.SIGTERM, /) -> None:
+        for pid in self._pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal_number)
+
+    def handle_interrupt(self, signum: int, _: types.FrameType | None, /) -> None:
+        if self._stopping:
+            _LOGGER.warning("received %s while shutting down, killing the workers", signal.strsignal(signum))
+            self.kill(signal.SIGKILL)
+            return
+
+        _LOGGER.info("received %s, shutting down the workers", signal.strsignal(signum))
+        self._stopping = True
+        self.kill()
+
+    def supervise(self, ready_fd: int, /) -> list[int]:
+        listening = True
+        while self._pids:
+            if listening:
+                if select.select([ready_fd], [], [], _POLL_INTERVAL)[0]:
+                    # An empty read means that every worker has exited
+                    notifications = os.read(ready_fd, self._count)
+                    listening = bool(notifications)
+                    self._notify_started(len(notifications))
+
+            else:
+                time.sleep(_POLL_INTERVAL)
+
+            self._reap()
+
+        return self._failed
+
+    def _notify_started(self, count: int, /) -> None:
+        self._started += count
+        if count and self._started == self._count:
+            _LOGGER.info("all %s workers have started", self._count)
+
+    def _reap(self) -> None:
+        # Only wait for the workers, other children of the process are left to whatever started them
+        for pid in tuple(self._pids):
+            try:
+                reaped_pid, status = os.waitpid(pid, os.WNOHANG)
+
+            except ChildProcessError:
+                # Something else in the process reaped the worker, so its exit code is lost
+                _LOGGER.warning("worker %s was reaped by another part of the process", self._pids[pid])
+                reaped_pid, status = pid, 1 << 8
+
+            if not reaped_pid:
+                continue
+
+            worker_id = self._pids.pop(pid)
+            code = os.waitstatus_to_exitcode(status)
+
+            # Workers which don't handle SIGTERM themselves are expected to die from it once shutting down
+            if code != 0 and not (self._stopping and code == -signal.SIGTERM):
+                self._failed.append(worker_id)
+                _LOGGER.error("worker %s exited with code %s", worker_id, code)
+            else:
+                _LOGGER.info("worker %s exited", worker_id)
+
+            if not self._stopping:
+                _LOGGER.info("shutting down the remaining workers")
+                self._stopping = True
+                self.kill()
+
+
+def run_workers(count: int, worker: _WorkerT, /) -> None:
+    """Fork workers and supervise them until they have all exited.
+
+    The workers are forked from the current process and start in their own
+    process group. Interrupt signals received by the supervisor are forwarded
+    to them as `SIGTERM`. A second interrupt kills them.
+
+    Once a worker exits, whether it crashed or was closed, the others are
+    asked to shut down as well.
+
+    Parameters
+    ----------
+    count
+        The number of workers to fork.
+    worker
+        The function to run in each worker. It is called with the worker ID
+        (from `0` to `count - 1`) and a function to call once the worker has
+        started.
+
+    Raises
+    ------
+    NotImplementedError
+        If the platform does not support forking.
+    RuntimeError
+        If any worker exited with an error.
+    """
+    if not hasattr(os, "fork"):
+        msg = "Running multiple workers requires a platform which supports forking"
+        raise NotImplementedError(msg)
+
+    supervisor = _Supervisor(count)
+    previous_handlers = {signum: signal.signal(signum, supervisor.handle_interrupt) for signum in _INTERRUPT_SIGNALS}
+    ready_fd, notify_fd = os.pipe()
+
+    try:
+        try:
+            supervisor.fork(worker, ready_fd, notify_fd)
+        finally:
+            os.close(notify_fd)
+
+        failed = supervisor.supervise(ready_fd)
+
+    except BaseException:
+        supervisor.kill(signal.SIGKILL)
+        raise
+
+    finally:
+        os.close(ready_fd)
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+    if failed:
+        msg = f"Workers {', '.join(map(str, sorted(failed)))} exited with an error"
+        raise RuntimeError(msg)
@@ -51,6 +51,7 @@
 from hikari.internal import attrs_extensions
 from hikari.internal import enums
 from hikari.internal import routes
+from hikari.internal import time
 from hikari.internal import typing_extensions
 
 if typing.TYPE_CHECKING:
@@ -1521,6 +1522,8 @@ async def remove_all_reactions(
             )
 
 
+# These are parsed on first access as they're rarely used.
+@attrs_extensions.with_lazy_fields(str, time.iso8601_datetime_string_to_datetime, "timestamp", "edited_timestamp")
 @attrs.define(unsafe_hash=True, kw_only=True, weakref_slot=False)
 class Message(PartialMessage):
     """Represents a message with all known details."""
@@ -46,6 +46,7 @@
 from hikari.internal import attrs_extensions
 from hikari.internal import enums
 from hikari.internal import routes
+from hikari.internal import time
 from hikari.internal import typing_extensions
 
 if typing.TYPE_CHECKING:
@@ -90,6 +91,8 @@ class ActivityType(int, enums.Enum):
     """Shows up as `Competing in <name>`."""
 
 
+# These are parsed on first access as presence updates are frequent and they're rarely used.
+@attrs_extensions.with_lazy_fields(int, time.unix_epoch_to_datetime, "start", "end")
 @attrs_extensions.with_copy
 @attrs.define(kw_only=True, weakref_slot=False)
 class ActivityTimestamps:
@@ -345,6 +348,8 @@ def __str__(self) -> str:
         return self.name
 
 
+# This is parsed on first access as presence updates are frequent and it's rarely used.
+@attrs_extensions.with_lazy_fields(int, time.unix_epoch_to_datetime, "created_at")
 @attrs.define(kw_only=True, weakref_slot=False)
 class RichActivity(Activity):
     """Represents a rich activity that can be associated with a presence."""
@@ -34,7 +34,7 @@ def pyright(session: nox.Session) -> None:
     as hikari does not have 100% compatibility with pyright just yet. This
     exists to make it easier to test and eventually reach that 100% compatibility.
     """
-    nox.sync(session, self=True, extras=["speedups", "server"], groups=["pyright"])
+    nox.sync(session, self=True, extras=["speedups", "server", "msgspec"], groups=["pyright"])
     session.run("pyright")
 
 
@@ -0,0 +1,106 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import tracemalloc
+from unittest import mock
+
+from hikari import snowflakes
+from hikari.impl import cache
+from hikari.impl import config
+from hikari.impl import entity_factory
+from hikari.internal import collections
+
+MEMBER_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+GUILD_ID = 123456789
+ROLE_COUNT = 50
+ACTIVITY_NAMES = ("Spotify", "Visual Studio Code", "Minecraft", "League of Legends", "Custom Status")
+
+
+def make_member_payload(user_id: int) -> dict[str, object]:
+    return {
+        "user": {
+            "id": str(user_id),
+            "username": f"user{user_id}",
+            "discriminator": "0",
+            "avatar": None,
+            "global_name": None,
+        },
+        "nick": f"nick{user_id % 100}" if user_id % 3 else None,
+        "roles": [str(GUILD_ID + 1 + (user_id + i) % ROLE_COUNT) for i in range(user_id % 5)],
+        "joined_at": "2020-01-01T00:00:00+00:00",
+        "deaf": False,
+        "mute": False,
+    }
+
+
+def make_presence_payload(user_id: int) -> dict[str, object]:
+    return {
+        "user": {"id": str(user_id)},
+        "status": "online",
+        "activities": [
+            {
+                "name": ACTIVITY_NAMES[user_id % len(ACTIVITY_NAMES)],
+                "type": 0,
+                "created_at": 1600000000000,
+                "state": "In a match",
+                "details": "Ranked",
+            }
+        ],
+        "client_status": {"desktop": "online"},
+    }
+
+
+def measure_cache_memory() -> int:
+    app = object()
+    factory = entity_factory.EntityFactoryImpl(app)  # type: ignore[arg-type]
+    cache_impl = cache.CacheImpl(app, config.CacheSettings())  # type: ignore[arg-type]
+    guild_id = snowflakes.Snowflake(GUILD_ID)
+    member_payloads = [make_member_payload(i) for i in range(1, MEMBER_COUNT + 1)]
+    presence_payloads = [make_presence_payload(i) for i in range(1, MEMBER_COUNT + 1, 2)]
+    tracemalloc.start()
+
+    # Round trip through JSON so that equal strings are separate objects, as they are when received from Discord.
+    for payload in json.loads(json.dumps(member_payloads)):
+        cache_impl.set_member(factory.deserialize_member(payload, guild_id=guild_id))
+
+    for payload in json.loads(json.dumps(presence_payloads)):
+        cache_impl.set_presence(factory.deserialize_member_presence(payload, guild_id=guild_id))
+
+    # Only measure what is kept alive by the cache.
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory
+
+
+with mock.patch.object(collections.InternPool, "intern", lambda _, value: value):
+    memory_without_pools = measure_cache_memory()
+
+memory_with_pools = measure_cache_memory()
+
+print("Members", MEMBER_COUNT)
+print("Cache memory without pools", memory_without_pools / 1024 / 1024, "MiB")
+print("Cache memory with pools", memory_with_pools / 1024 / 1024, "MiB")
+print("Reduction", (1 - memory_with_pools / memory_without_pools) * 100, "%")
@@ -0,0 +1,161 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import sys
+import time
+
+from hikari.impl import cache
+from hikari.impl import config
+from hikari.impl import entity_factory
+from hikari.internal import cache as cache_utility
+
+GUILD_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+
+class App:
+    """Stand-in for the bot app, which is not part of the snapshot."""
+
+
+def make_guild_payload(guild_id: int) -> dict[str, object]:
+    return {
+        "id": str(guild_id),
+        "name": f"guild {guild_id}",
+        "icon": None,
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": "1",
+        "afk_channel_id": None,
+        "afk_timeout": 60,
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "features": [],
+        "mfa_level": 0,
+        "application_id": None,
+        "system_channel_id": None,
+        "system_channel_flags": 0,
+        "rules_channel_id": None,
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": 0,
+        "preferred_locale": "en-US",
+        "public_updates_channel_id": None,
+        "nsfw_level": 0,
+        "joined_at": "2020-01-01T00:00:00+00:00",
+        "large": False,
+        "member_count": 3,
+        "channels": [
+            {
+                "id": str(guild_id * 10 + i),
+                "type": 0,
+                "name": f"channel-{i}",
+                "position": i,
+                "permission_overwrites": [],
+                "nsfw": False,
+                "parent_id": None,
+                "topic": None,
+                "last_message_id": None,
+                "rate_limit_per_user": 0,
+            }
+            for i in range(5)
+        ],
+        "roles": [
+            {
+                "id": str(guild_id if i == 0 else guild_id * 10 + i),
+                "name": f"role {i}",
+                "color": 0,
+                "hoist": False,
+                "position": i,
+                "permissions": "0",
+                "managed": False,
+                "mentionable": False,
+                "flags": 0,
+            }
+            for i in range(3)
+        ],
+        "emojis": [
+            {
+                "id": str(guild_id * 10 + i),
+                "name": f"emoji_{i}",
+                "roles": [],
+                "require_colons": True,
+                "managed": False,
+                "animated": False,
+                "available": True,
+            }
+            for i in range(2)
+        ],
+        "members": [
+            {
+                "user": {
+                    "id": str(user_id),
+                    "username": f"user {user_id}",
+                    "discriminator": "0",
+                    "avatar": None,
+                    "global_name": None,
+                },
+                "roles": [],
+                "joined_at": "2020-01-01T00:00:00+00:00",
+                "deaf": False,
+                "mute": False,
+            }
+            # Share some users between guilds, as is the case for real bots.
+            for user_id in (1, 2 + guild_id % 1000, 10_000 + guild_id)
+        ],
+        "presences": [],
+        "voice_states": [],
+        "threads": [],
+        "stickers": [],
+    }
+
+
+app = App()
+factory = entity_factory.EntityFactoryImpl(app)  # type: ignore[arg-type]
+cache_impl = cache.CacheImpl(app, config.CacheSettings())  # type: ignore[arg-type]
+
+for guild_id in range(1, GUILD_COUNT + 1):
+    payload = make_guild_payload(guild_id)
+    guild_data = factory.deserialize_gateway_guild(payload, user_id=1)
+    cache_impl.update_guild(guild_data.guild())
+    for channel in guild_data.channels().values():
+        cache_impl.set_guild_channel(channel)
+    for emoji in guild_data.emojis().values():
+        cache_impl.set_emoji(emoji)
+    for role in guild_data.roles().values():
+        cache_impl.set_role(role)
+    for member in guild_data.members().values():
+        cache_impl.set_member(member)
+    cache_impl.set_guild_version(guild_id, cache_utility.compute_guild_version(payload))
+
+start = time.perf_counter()
+snapshot = cache_impl.dump_snapshot()
+dump_time = time.perf_counter() - start
+
+start = time.perf_counter()
+cache.CacheImpl(app, config.CacheSettings()).load_snapshot(snapshot)  # type: ignore[arg-type]
+load_time = time.perf_counter() - start
+
+print("Guilds", GUILD_COUNT)
+print("Snapshot size", len(snapshot) / 1024 / 1024, "MiB")
+print("Dump time", dump_time, "s")
+print("Load time", load_time, "s")
@@ -0,0 +1,207 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the gateway transports on the same traffic with each compression.
+
+The traffic is compressed the way Discord sends it for each compression and
+received through the matching transport of `GatewayShardImpl`, with a stub
+websocket in place of the connection. For each compression, this reports the
+bytes which would go over the wire, the compression ratio and the time spent
+decompressing, as recorded in the transport statistics of the shard.
+
+Compressions which take the least time to decompress suit CPU-bound hosts,
+while the ones which send the fewest bytes suit bandwidth-bound hosts.
+
+The traffic is a mix of the scenarios from `payload_generator`, or the
+payloads previously recorded with `pipeline_benchmark.py --record`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import pathlib
+import sys
+import time
+import typing
+import zlib
+
+import aiohttp
+import payload_generator
+
+from hikari.api import shard as shard_api
+from hikari.impl import shard
+from hikari.internal import data_binding
+
+if typing.TYPE_CHECKING:
+    import types
+
+Message = tuple[aiohttp.WSMsgType, bytes]
+
+
+def _import_zstd() -> types.ModuleType | None:
+    if sys.version_info >= (3, 14):
+        from compression import zstd  # noqa: PLC0415
+    else:
+        try:
+            from backports import zstd  # noqa: PLC0415
+        except ImportError:
+            return None
+
+    return zstd
+
+
+def generate_traffic(scale: float) -> list[payload_generator.Dispatch]:
+    def scaled(value: int) -> int:
+        return max(1, int(value * scale))
+
+    return [
+        *payload_generator.make_guild_create(1, member_count=scaled(2_500)),
+        *payload_generator.make_member_chunks(2, chunk_count=scaled(5)),
+        *payload_generator.make_message_flood(3, count=scaled(5_000)),
+        *payload_generator.make_presence_storm(4, count=scaled(10_000)),
+    ]
+
+
+def encode(compression: shard_api.GatewayCompression | None, payloads: typing.Sequence[bytes]) -> list[Message] | None:
+    if compression is None:
+        return [(aiohttp.WSMsgType.TEXT, payload) for payload in payloads]
+
+    if compression == shard_api.GatewayCompression.PAYLOAD_ZLIB_STREAM:
+        return [(aiohttp.WSMsgType.BINARY, zlib.compress(payload)) for payload in payloads]
+
+    if compression == shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM:
+        compressor = zlib.compressobj()
+        return [
+            (aiohttp.WSMsgType.BINARY, compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH))
+            for payload in payloads
+        ]
+
+    if (zstd := _import_zstd()) is None:
+        return None
+
+    # The whole connection is a single frame, with a block flushed after each payload
+    zstd_compressor = zstd.ZstdCompressor()
+    return [
+        (aiohttp.WSMsgType.BINARY, zstd_compressor.compress(payload, mode=zstd_compressor.FLUSH_BLOCK))
+        for payload in payloads
+    ]
+
+
+class StubWebSocket:
+    """Websocket which receives pre-encoded messages."""
+
+    def __init__(self, messages: typing.Sequence[Message]) -> None:
+        self._messages = iter(messages)
+
+    async def receive(self) -> aiohttp.WSMessage:
+        message_type, data = next(self._messages)
+        return aiohttp.WSMessage(message_type, data, None)
+
+
+async def receive_all(
+    compression: shard_api.GatewayCompression | None, messages: typing.Sequence[Message]
+) -> tuple[shard.GatewayTransportStatistics, float]:
+    transport_cls: type[shard._GatewayTransport]
+    if compression == shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+        transport_cls = shard._GatewayZstdStreamTransport  # noqa: SLF001 - Private member access
+    elif compression == shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM:
+        transport_cls = shard._GatewayZlibStreamTransport  # noqa: SLF001 - Private member access
+    elif compression == shard_api.GatewayCompression.PAYLOAD_ZLIB_STREAM:
+        transport_cls = shard._GatewayZlibMessageTransport  # noqa: SLF001 - Private member access
+    else:
+        transport_cls = shard._GatewayBasicTransport  # noqa: SLF001 - Private member access
+
+    statistics = shard.GatewayTransportStatistics()
+    transport = transport_cls(
+        ws=StubWebSocket(messages),  # type: ignore[arg-type]
+        exit_stack=contextlib.AsyncExitStack(),
+        logger=logging.getLogger("hikari.benchmark"),
+        log_filterer=lambda payload: payload,
+        dumps=data_binding.default_json_dumps,
+        loads=data_binding.default_json_loads,
+        statistics=statistics,
+    )
+
+    start = time.process_time()
+    for _ in range(len(messages)):
+        await transport._receive_and_check()  # noqa: SLF001 - Private member access
+
+    return statistics, time.process_time() - start
+
+
+async def benchmark(payloads: typing.Sequence[bytes], *, repeat: int) -> None:
+    compressions: list[shard_api.GatewayCompression | None] = [None, *shard_api.GatewayCompression]
+    encoded = {compression: encode(compression, payloads) for compression in compressions}
+    raw_size = sum(len(payload) for payload in payloads)
+    print(f"{len(payloads)} payloads, {raw_size / 1024 / 1024:.1f}MiB uncompressed\n")
+
+    best: dict[shard_api.GatewayCompression | None, tuple[shard.GatewayTransportStatistics, float]] = {}
+    # Runs are interleaved so that noise from the host affects every compression alike
+    for _ in range(repeat):
+        for compression, messages in encoded.items():
+            if messages is None:
+                continue
+
+            statistics, cpu_time = await receive_all(compression, messages)
+            if compression not in best or statistics.decompression_time < best[compression][0].decompression_time:
+                best[compression] = (statistics, cpu_time)
+
+    print(f"{'compression':<24}{'wire':>10}{'ratio':>8}{'decompress':>13}{'per payload':>13}{'receive cpu':>13}")
+    for compression, messages in encoded.items():
+        name = compression.value if compression is not None else "none"
+        if messages is None:
+            print(f"{name:<24}  skipped, zstd is not installed")
+            continue
+
+        statistics, cpu_time = best[compression]
+        assert statistics.decompressed_bytes == raw_size
+        print(
+            f"{name:<24}{statistics.compressed_bytes / 1024 / 1024:>8.1f}MiB{statistics.compression_ratio:>7.1f}x"
+            f"{statistics.decompression_time * 1000:>11.1f}ms"
+            f"{statistics.decompression_time / statistics.messages * 1_000_000:>11.1f}us"
+            f"{cpu_time * 1000:>11.1f}ms"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="scale the size of the generated traffic")
+    parser.add_argument("--repeat", type=int, default=5, help="how many times to receive the traffic")
+    parser.add_argument("--replay", type=pathlib.Path, help="use payloads recorded with pipeline_benchmark.py")
+    args = parser.parse_args()
+
+    if args.replay:
+        dispatches = [dispatch for scenario in payload_generator.replay(args.replay).values() for dispatch in scenario]
+    else:
+        dispatches = generate_traffic(args.scale)
+
+    payloads = [
+        data_binding.default_json_dumps({"op": 0, "t": name, "s": sequence, "d": payload})
+        for sequence, (name, payload) in enumerate(dispatches, start=1)
+    ]
+    asyncio.run(benchmark(payloads, repeat=args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import functools
+import sys
+import timeit
+from unittest import mock
+
+from hikari import snowflakes
+from hikari.impl import entity_factory
+
+NUMBER = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+USER_PAYLOAD = {
+    "id": "115590097100865541",
+    "username": "nyaa",
+    "global_name": "Nyaa",
+    "avatar": "b3b24c6d7cbcdec129d5d537067061a8",
+    "discriminator": "0",
+    "public_flags": 64,
+    "avatar_decoration_data": None,
+    "primary_guild": None,
+}
+MEMBER_PAYLOAD = {
+    "user": USER_PAYLOAD,
+    "nick": "foobarbaz",
+    "roles": ["11111", "22222", "33333"],
+    "joined_at": "2015-04-26T06:26:56.936000+00:00",
+    "premium_since": None,
+    "deaf": False,
+    "mute": False,
+    "pending": False,
+    "flags": 0,
+    "communication_disabled_until": None,
+}
+EMBED_PAYLOAD = {
+    "type": "rich",
+    "title": "Some title",
+    "description": "A description which is a little bit longer than the title",
+    "color": 14014915,
+    "timestamp": "2020-03-22T16:40:39.218000+00:00",
+    "footer": {"text": "footer text"},
+    "author": {"name": "some name"},
+    "fields": [{"name": f"field {i}", "value": f"value {i}", "inline": i % 2 == 0} for i in range(5)],
+}
+MESSAGE_PAYLOAD = {
+    "id": "123456789012345678",
+    "channel_id": "456456456456456456",
+    "guild_id": "678678678678678678",
+    "author": USER_PAYLOAD,
+    "member": {k: v for k, v in MEMBER_PAYLOAD.items() if k != "user"},
+    "content": "Hello there, this is a message",
+    "timestamp": "2020-03-21T21:20:16.510000+00:00",
+    "edited_timestamp": None,
+    "tts": False,
+    "mention_everyone": False,
+    "mentions": [],
+    "mention_roles": [],
+    "attachments": [],
+    "embeds": [],
+    "pinned": False,
+    "type": 0,
+    "flags": 0,
+    "nonce": "171000788183678976",
+    "components": [],
+}
+MESSAGE_WITH_EMBED_PAYLOAD = {**MESSAGE_PAYLOAD, "embeds": [EMBED_PAYLOAD]}
+
+app = mock.Mock()
+factories = {
+    "Regular": entity_factory.EntityFactoryImpl(app),
+    "Fast paths": entity_factory.EntityFactoryImpl(app, fast_paths=True),
+    "User identity map": entity_factory.EntityFactoryImpl(app, user_identity_map_size=1000),
+    "Fast paths and user identity map": entity_factory.EntityFactoryImpl(
+        app, fast_paths=True, user_identity_map_size=1000
+    ),
+}
+guild_id = snowflakes.Snowflake(678678678678678678)
+
+cases = {
+    "user": lambda factory: factory.deserialize_user(USER_PAYLOAD),
+    "member": lambda factory: factory.deserialize_member(MEMBER_PAYLOAD, guild_id=guild_id),
+    "embed": lambda factory: factory.deserialize_embed(EMBED_PAYLOAD),
+    "message": lambda factory: factory.deserialize_message(MESSAGE_PAYLOAD),
+    "message with embed": lambda factory: factory.deserialize_message(MESSAGE_WITH_EMBED_PAYLOAD),
+}
+
+for name, case in cases.items():
+    times: dict[str, list[float]] = {factory_name: [] for factory_name in factories}
+    # Interleave the factories so that they are equally affected by noise.
+    for _ in range(5):
+        for factory_name, factory in factories.items():
+            times[factory_name].append(timeit.timeit(functools.partial(case, factory), number=NUMBER))
+
+    print(name)
+    regular_time = min(times["Regular"])
+    for factory_name, factory_times in times.items():
+        time = min(factory_times)
+        print(f"    {factory_name}", NUMBER / time, "per second", f"({regular_time / time:.2f}x)")
@@ -0,0 +1,530 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A local server which mimics Discord's REST API, to benchmark the REST client offline.
+
+It rate limits requests the way Discord does:
+
+- Every route has a bucket for each channel, guild or webhook, which allows
+  `route_limit` requests every `route_period` seconds and is described by the
+  `X-RateLimit-*` headers of every response. Going over it returns a 429 with
+  the `user` scope.
+- Authorized requests also share a global limit of `global_limit` requests per
+  second. Going over it returns a global 429.
+
+And it serves enough of the API to exercise the client's hot paths:
+
+- `GET /channels/{channel}/messages`, paginated with `before`, `after`,
+  `around` and `limit`.
+- `GET /channels/{channel}/messages/{message}`.
+- `POST /channels/{channel}/messages`.
+- `GET /guilds/{guild}/members`, paginated with `after` and `limit`.
+- `GET /guilds/{guild}/audit-logs`, paginated with `before`, `after` and
+  `limit`, and filtered by `user_id` and `action_type`.
+- `POST /webhooks/{webhook}/{token}`.
+
+Every channel has the same messages and every guild the same members and audit
+log entries, which are generated from a seed. The requests which were made and
+rate limited are counted and can be fetched from `GET /_fake/stats`.
+
+This can be run on its own (see `--help`), in which case it prints the URL to
+pass as `rest_url` once it is listening, or in process with
+[`FakeDiscordREST`][].
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import datetime
+import hashlib
+import json
+import random
+import socket
+import time
+import typing
+
+import aiohttp.web
+import payload_generator
+import typing_extensions
+
+API_PREFIX: typing.Final[str] = "/api/v10"
+
+_Handler = typing.Callable[[aiohttp.web.Request], typing.Awaitable[aiohttp.web.StreamResponse]]
+
+_DISCORD_EPOCH: typing.Final[int] = 1_420_070_400_000
+_SNOWFLAKE_STEP: typing.Final[int] = 1 << 22
+_FIRST_MESSAGE_ID: typing.Final[int] = 1_100_000_000_000_000_000
+_FIRST_USER_ID: typing.Final[int] = 200_000_000_000_000_000
+_FIRST_AUDIT_LOG_ENTRY_ID: typing.Final[int] = 1_200_000_000_000_000_000
+_AUTHOR_COUNT: typing.Final[int] = 20
+_MODERATOR_COUNT: typing.Final[int] = 5
+# Kick, ban, member update, member role update and message delete.
+_AUDIT_LOG_ACTIONS: typing.Final[tuple[int, ...]] = (20, 22, 24, 25, 72)
+_MAX_MESSAGES_LIMIT: typing.Final[int] = 100
+_MAX_MEMBERS_LIMIT: typing.Final[int] = 1000
+_MAX_AUDIT_LOG_LIMIT: typing.Final[int] = 100
+
+
+class _Bucket:
+    __slots__: typing.Sequence[str] = ("remaining", "reset_at")
+
+    def __init__(self) -> None:
+        self.remaining = 0
+        self.reset_at = 0.0
+
+    def acquire(self, now: float, limit: int, period: float) -> bool:
+        if now >= self.reset_at:
+            self.remaining = limit
+            self.reset_at = now + period
+
+        if self.remaining <= 0:
+            return False
+
+        self.remaining -= 1
+        return True
+
+
+class _Page(typing.NamedTuple):
+    ids: list[int]
+    payloads: list[bytes]
+
+
+def _snowflake_timestamp(snowflake: int) -> str:
+    timestamp = ((snowflake >> 22) + _DISCORD_EPOCH) / 1_000
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).isoformat()
+
+
+def _json_response(
+    payload: object, *, status: int = 200, headers: dict[str, str] | None = None
+) -> aiohttp.web.Response:
+    return aiohttp.web.Response(
+        body=json.dumps(payload).encode(), status=status, headers=headers, content_type="application/json"
+    )
+
+
+def _encode_array(payloads: typing.Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(payloads) + b"]"
+
+
+def _int_query(request: aiohttp.web.Request, name: str) -> int | None:
+    value = request.query.get(name)
+    # Raises ValueError for malformed values, which the middleware turns into a 400.
+    return None if value is None else int(value)
+
+
+def _limit_query(request: aiohttp.web.Request, maximum: int) -> int:
+    limit = _int_query(request, "limit")
+    if limit is None:
+        return min(50, maximum)
+
+    if not 1 <= limit <= maximum:
+        msg = f"limit must be between 1 and {maximum}"
+        raise ValueError(msg)
+
+    return limit
+
+
+def _paginate(page: _Page, request: aiohttp.web.Request, maximum: int, *, newest_first: bool = True) -> bytes:
+    # Encodes up to `limit` payloads before, after or around a snowflake, or the first ones if none is given.
+    limit = _limit_query(request, maximum)
+    if (before := _int_query(request, "before")) is not None:
+        stop = bisect.bisect_left(page.ids, before)
+        start = max(stop - limit, 0)
+    elif (after := _int_query(request, "after")) is not None:
+        start = bisect.bisect_right(page.ids, after)
+        stop = start + limit
+    elif (around := _int_query(request, "around")) is not None:
+        start = max(bisect.bisect_left(page.ids, around) - limit // 2, 0)
+        stop = start + limit
+    elif newest_first:
+        start = max(len(page.ids) - limit, 0)
+        stop = len(page.ids)
+    else:
+        start = 0
+        stop = limit
+
+    payloads = page.payloads[start:stop]
+    return _encode_array(reversed(payloads) if newest_first else payloads)
+
+
+class FakeDiscordREST:
+    """A local server which mimics Discord's REST API.
+
+    Parameters
+    ----------
+    route_limit
+        How many requests every route bucket allows per period.
+    route_period
+        The period of the route buckets, in seconds.
+    global_limit
+        How many authorized requests are allowed per second.
+    latency
+        How long to wait before responding to every request, in seconds.
+    message_count
+        How many messages every channel has.
+    member_count
+        How many members every guild has.
+    audit_log_entry_count
+        How many audit log entries every guild has.
+    seed
+        The seed to generate the entities from.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_app",
+        "_audit_log",
+        "_buckets",
+        "_global_buckets",
+        "_global_limit",
+        "_latency",
+        "_members",
+        "_message_count",
+        "_message_ids",
+        "_messages",
+        "_messages_by_channel",
+        "_moderators",
+        "_rng",
+        "_route_limit",
+        "_route_period",
+        "_runner",
+        "_sent_count",
+        "rest_url",
+        "stats",
+    )
+
+    def __init__(
+        self,
+        *,
+        route_limit: int = 5,
+        route_period: float = 5.0,
+        global_limit: int = 50,
+        latency: float = 0.0,
+        message_count: int = 1_000,
+        member_count: int = 1_000,
+        audit_log_entry_count: int = 500,
+        seed: int = 0,
+    ) -> None:
+        self._route_limit = route_limit
+        self._route_period = route_period
+        self._global_limit = global_limit
+        self._latency = latency
+        self._rng = random.Random(seed)  # noqa: S311 - Payloads don't need cryptographic randomness
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        self._global_buckets: dict[str, _Bucket] = {}
+        self._runner: aiohttp.web.AppRunner | None = None
+        self._sent_count = 0
+        self.rest_url: str | None = None
+        """The URL to pass as `rest_url` to the REST client, once started."""
+        self.stats: dict[str, typing.Any] = {
+            "requests": 0,
+            "route_rate_limited": 0,
+            "global_rate_limited": 0,
+            "routes": {},
+        }
+        """How many requests were made, and how many of them were rate limited."""
+
+        authors = [
+            payload_generator.make_user(self._rng, str(_FIRST_USER_ID + index * _SNOWFLAKE_STEP))
+            for index in range(_AUTHOR_COUNT)
+        ]
+        self._moderators = authors[:_MODERATOR_COUNT]
+        self._message_count = message_count
+        self._message_ids = [_FIRST_MESSAGE_ID + index * _SNOWFLAKE_STEP for index in range(message_count)]
+        self._messages = {
+            message_id: self._make_message(message_id, self._rng.choice(authors)) for message_id in self._message_ids
+        }
+        # Messages are encoded for each channel the first time they are requested.
+        self._messages_by_channel: dict[str, _Page] = {}
+        member_ids = [_FIRST_USER_ID + index * _SNOWFLAKE_STEP for index in range(member_count)]
+        self._members = _Page(
+            member_ids,
+            [
+                json.dumps(
+                    payload_generator.make_member(self._rng, payload_generator.make_user(self._rng, str(user_id)))
+                ).encode()
+                for user_id in member_ids
+            ],
+        )
+        self._audit_log = [
+            self._make_audit_log_entry(_FIRST_AUDIT_LOG_ENTRY_ID + index * _SNOWFLAKE_STEP, member_ids)
+            for index in range(audit_log_entry_count)
+        ]
+
+        self._app = aiohttp.web.Application(middlewares=[self._middleware], client_max_size=32 * 1024 * 1024)
+        self._app.add_routes(
+            [
+                aiohttp.web.get("/_fake/stats", self._get_stats),
+                aiohttp.web.get(f"{API_PREFIX}/channels/{{channel}}/messages", self._get_messages),
+                aiohttp.web.get(f"{API_PREFIX}/channels/{{channel}}/messages/{{message}}", self._get_message),
+                aiohttp.web.post(f"{API_PREFIX}/channels/{{channel}}/messages", self._create_message),
+                aiohttp.web.get(f"{API_PREFIX}/guilds/{{guild}}/members", self._get_members),
+                aiohttp.web.get(f"{API_PREFIX}/guilds/{{guild}}/audit-logs", self._get_audit_log),
+                aiohttp.web.post(f"{API_PREFIX}/webhooks/{{webhook}}/{{token}}", self._execute_webhook),
+            ]
+        )
+
+    @property
+    def app(self) -> aiohttp.web.Application:
+        """The application which serves the fake API."""
+        return self._app
+
+    async def __aenter__(self) -> typing_extensions.Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving the fake API.
+
+        Parameters
+        ----------
+        host
+            The host to listen on.
+        port
+            The port to listen on. If `0`, a free port is picked.
+
+        Returns
+        -------
+        str
+            The URL to pass as `rest_url` to the REST client.
+        """
+        sock = socket.socket()
+        sock.bind((host, port))
+        self._runner = aiohttp.web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        await aiohttp.web.SockSite(self._runner, sock).start()
+        self.rest_url = f"http://{host}:{sock.getsockname()[1]}{API_PREFIX}"
+        return self.rest_url
+
+    async def close(self) -> None:
+        """Stop serving the fake API."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self.rest_url = None
+
+    def _make_message(self, message_id: int, author: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        return {
+            "id": str(message_id),
+            "channel_id": None,
+            "author": author,
+            "content": " ".join(self._rng.choice(("hello", "there", "fake", "discord", "message")) for _ in range(10)),
+            "timestamp": _snowflake_timestamp(message_id),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            "flags": 0,
+            "components": [],
+        }
+
+    def _make_audit_log_entry(self, entry_id: int, member_ids: list[int]) -> dict[str, typing.Any]:
+        action_type = self._rng.choice(_AUDIT_LOG_ACTIONS)
+        entry: dict[str, typing.Any] = {
+            "id": str(entry_id),
+            "action_type": action_type,
+            "user_id": self._rng.choice(self._moderators)["id"],
+            "target_id": str(self._rng.choice(member_ids)) if member_ids else None,
+            "reason": self._rng.choice((None, "spam", "being rude")),
+        }
+        if action_type == 24:
+            entry["changes"] = [{"key": "nick", "old_value": "before", "new_value": "after"}]
+
+        return entry
+
+    def _channel_messages(self, channel: str) -> _Page:
+        if (page := self._messages_by_channel.get(channel)) is None:
+            payloads = []
+            for message_id in self._message_ids:
+                message = self._messages[message_id]
+                message["channel_id"] = channel
+                payloads.append(json.dumps(message).encode())
+
+            page = self._messages_by_channel[channel] = _Page(self._message_ids, payloads)
+
+        return page
+
+    @aiohttp.web.middleware
+    async def _middleware(self, request: aiohttp.web.Request, handler: _Handler) -> aiohttp.web.StreamResponse:
+        match_info = request.match_info
+        if match_info.http_exception is not None:
+            return _json_response({"message": "404: Not Found", "code": 0}, status=404)
+
+        resource = match_info.route.resource
+        assert resource is not None
+        if not resource.canonical.startswith(API_PREFIX):
+            return await handler(request)
+
+        route = f"{request.method} {resource.canonical.removeprefix(API_PREFIX)}"
+        self.stats["requests"] += 1
+        self.stats["routes"][route] = self.stats["routes"].get(route, 0) + 1
+        now = time.time()
+
+        if (authorization := request.headers.get("Authorization")) is not None:
+            global_bucket = self._global_buckets.setdefault(authorization, _Bucket())
+            if not global_bucket.acquire(now, self._global_limit, 1.0):
+                self.stats["global_rate_limited"] += 1
+                retry_after = global_bucket.reset_at - now
+                return _json_response(
+                    {"message": "You are being rate limited.", "retry_after": retry_after, "global": True},
+                    status=429,
+                    headers={
+                        "Retry-After": f"{retry_after:.3f}",
+                        "X-RateLimit-Global": "true",
+                        "X-RateLimit-Scope": "global",
+                    },
+                )
+
+        bucket_hash = hashlib.sha256(route.encode()).hexdigest()[:32]
+        major_parameter = match_info.get("channel") or match_info.get("guild") or match_info.get("webhook") or ""
+        bucket = self._buckets.setdefault((bucket_hash, major_parameter), _Bucket())
+        admitted = bucket.acquire(now, self._route_limit, self._route_period)
+        headers = {
+            "X-RateLimit-Bucket": bucket_hash,
+            "X-RateLimit-Limit": str(self._route_limit),
+            "X-RateLimit-Remaining": str(bucket.remaining),
+            "X-RateLimit-Reset": f"{bucket.reset_at:.3f}",
+            "X-RateLimit-Reset-After": f"{bucket.reset_at - now:.3f}",
+        }
+        if not admitted:
+            self.stats["route_rate_limited"] += 1
+            retry_after = bucket.reset_at - now
+            headers["Retry-After"] = f"{retry_after:.3f}"
+            headers["X-RateLimit-Scope"] = "user"
+            return _json_response(
+                {"message": "You are being rate limited.", "retry_after": retry_after, "global": False},
+                status=429,
+                headers=headers,
+            )
+
+        if self._latency:
+            await asyncio.sleep(self._latency)
+
+        try:
+            response = await handler(request)
+        except ValueError as exc:
+            response = _json_response({"message": f"Invalid Form Body ({exc})", "code": 50035}, status=400)
+
+        response.headers.update(headers)
+        return response
+
+    async def _get_stats(self, _: aiohttp.web.Request) -> aiohttp.web.Response:
+        return _json_response(self.stats)
+
+    async def _get_messages(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        body = _paginate(self._channel_messages(request.match_info["channel"]), request, _MAX_MESSAGES_LIMIT)
+        return aiohttp.web.Response(body=body, content_type="application/json")
+
+    async def _get_message(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        page = self._channel_messages(request.match_info["channel"])
+        message_id = int(request.match_info["message"])
+        index = bisect.bisect_left(page.ids, message_id)
+        if index == len(page.ids) or page.ids[index] != message_id:
+            return _json_response({"message": "Unknown Message", "code": 10008}, status=404)
+
+        return aiohttp.web.Response(body=page.payloads[index], content_type="application/json")
+
+    def _sent_message(self, channel: str) -> aiohttp.web.Response:
+        message_id = _FIRST_MESSAGE_ID + (self._message_count + self._sent_count) * _SNOWFLAKE_STEP
+        self._sent_count += 1
+        message = self._make_message(message_id, self._moderators[0])
+        message["channel_id"] = channel
+        return _json_response(message)
+
+    async def _create_message(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        await request.read()
+        return self._sent_message(request.match_info["channel"])
+
+    async def _execute_webhook(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        await request.read()
+        if request.query.get("wait") != "true":
+            return aiohttp.web.Response(status=204)
+
+        return self._sent_message(request.match_info["webhook"])
+
+    async def _get_members(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        body = _paginate(self._members, request, _MAX_MEMBERS_LIMIT, newest_first=False)
+        return aiohttp.web.Response(body=body, content_type="application/json")
+
+    async def _get_audit_log(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        entries = self._audit_log
+        if (user_id := request.query.get("user_id")) is not None:
+            entries = [entry for entry in entries if entry["user_id"] == user_id]
+        if (action_type := _int_query(request, "action_type")) is not None:
+            entries = [entry for entry in entries if entry["action_type"] == action_type]
+
+        page = _Page([int(entry["id"]) for entry in entries], [json.dumps(entry).encode() for entry in entries])
+        body = (
+            b'{"audit_log_entries":'
+            + _paginate(page, request, _MAX_AUDIT_LOG_LIMIT)
+            + b',"users":'
+            + json.dumps(self._moderators).encode()
+            + b',"application_commands":[],"auto_moderation_rules":[],"guild_scheduled_events":[],'
+            + b'"integrations":[],"threads":[],"webhooks":[]}'
+        )
+        return aiohttp.web.Response(body=body, content_type="application/json")
+
+
+async def _serve(server: FakeDiscordREST, host: str, port: int) -> None:
+    print(await server.start(host, port), flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+    parser.add_argument("--port", type=int, default=0, help="the port to listen on, or 0 to pick a free one")
+    parser.add_argument("--route-limit", type=int, default=5, help="requests allowed per route bucket and period")
+    parser.add_argument("--route-period", type=float, default=5.0, help="the period of route buckets, in seconds")
+    parser.add_argument("--global-limit", type=int, default=50, help="authorized requests allowed per second")
+    parser.add_argument("--latency", type=float, default=0.0, help="how long to wait before responding, in seconds")
+    parser.add_argument("--message-count", type=int, default=1_000, help="how many messages every channel has")
+    parser.add_argument("--member-count", type=int, default=1_000, help="how many members every guild has")
+    parser.add_argument("--audit-log-entry-count", type=int, default=500, help="how many entries every audit log has")
+    parser.add_argument("--seed", type=int, default=0, help="the seed to generate the entities from")
+    args = parser.parse_args()
+
+    server = FakeDiscordREST(
+        route_limit=args.route_limit,
+        route_period=args.route_period,
+        global_limit=args.global_limit,
+        latency=args.latency,
+        message_count=args.message_count,
+        member_count=args.member_count,
+        audit_log_entry_count=args.audit_log_entry_count,
+        seed=args.seed,
+    )
+    asyncio.run(_serve(server, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark sending a static, component heavy message with frozen components.
+
+This compares building and encoding the body of a message with a container of
+sections and a few rows of buttons when its components are built on every send
+against when they were frozen ahead of time with
+`hikari.impl.special_endpoints.FrozenComponentBuilder`, both for REST message
+bodies and interaction responses.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import typing
+from unittest import mock
+
+from hikari import components
+from hikari.impl import config
+from hikari.impl import rest
+from hikari.impl import special_endpoints
+from hikari.interactions import base_interactions
+from hikari.internal import data_binding
+
+NUMBER = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+REPEAT = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+
+def make_components() -> list[special_endpoints.ComponentBuilder]:
+    container = special_endpoints.ContainerComponentBuilder(accent_color=0x5865F2).add_text_display(
+        "## Pick a role\nRoles are handed out as soon as you press a button."
+    )
+    for index in range(8):
+        container.add_component(
+            special_endpoints.SectionComponentBuilder(
+                accessory=special_endpoints.InteractiveButtonBuilder(
+                    style=components.ButtonStyle.SECONDARY, custom_id=f"role:{index}", label="Join"
+                )
+            ).add_text_display(f"**Role {index}**\nA short description of what role {index} is for.")
+        )
+    container.add_separator()
+
+    rows: list[special_endpoints.ComponentBuilder] = [container]
+    for row_index in range(3):
+        row = special_endpoints.MessageActionRowBuilder()
+        for index in range(5):
+            row.add_interactive_button(
+                components.ButtonStyle.PRIMARY, f"page:{row_index}:{index}", label=f"Page {row_index * 5 + index}"
+            )
+        rows.append(row)
+
+    return rows
+
+
+COMPONENTS = make_components()
+FROZEN_COMPONENTS = [special_endpoints.FrozenComponentBuilder(component) for component in COMPONENTS]
+
+client = rest.RESTClientImpl(
+    cache=None,
+    entity_factory=mock.Mock(),
+    executor=None,
+    http_settings=config.HTTPSettings(),
+    proxy_settings=config.ProxySettings(),
+    token=None,
+    token_type=None,
+    rest_url=None,
+)
+entity_factory = mock.Mock()
+
+
+def rest_body(components_: typing.Sequence[special_endpoints.ComponentBuilder]) -> bytes:
+    body, _ = client._build_message_payload(components=components_)  # noqa: SLF001 - Private member accessed
+    return data_binding.dump_json(body)
+
+
+def interaction_response(components_: typing.Sequence[special_endpoints.ComponentBuilder]) -> bytes:
+    builder = special_endpoints.InteractionMessageBuilder(
+        base_interactions.ResponseType.MESSAGE_CREATE, components=components_
+    )
+    payload, _ = builder.build(entity_factory)
+    return data_binding.dump_json(payload)
+
+
+assert data_binding.default_json_loads(rest_body(COMPONENTS)) == data_binding.default_json_loads(
+    rest_body(FROZEN_COMPONENTS)
+)
+assert data_binding.default_json_loads(interaction_response(COMPONENTS)) == data_binding.default_json_loads(
+    interaction_response(FROZEN_COMPONENTS)
+)
+
+for name, function in (("REST message body", rest_body), ("Interaction response", interaction_response)):
+    times: dict[str, list[float]] = {"Built on every send": [], "Frozen": []}
+    # Interleave the cases so that they are equally affected by noise.
+    for _ in range(REPEAT):
+        times["Built on every send"].append(timeit.timeit(lambda: function(COMPONENTS), number=NUMBER))  # noqa: B023
+        times["Frozen"].append(timeit.timeit(lambda: function(FROZEN_COMPONENTS), number=NUMBER))  # noqa: B023
+
+    print(f"{name} ({len(function(COMPONENTS))} bytes)")
+    baseline = min(times["Built on every send"])
+    for case, case_times in times.items():
+        case_time = min(case_times) / NUMBER
+        speedup = baseline / NUMBER / case_time
+        print(f"    {case}: {case_time * 1_000_000:.1f}µs, {1 / case_time:,.0f} sends/s ({speedup:.2f}x)")
@@ -0,0 +1,339 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Load test a `RESTBot` with signed interaction requests.
+
+A bot is started in a subprocess with each of the given numbers of workers and
+replies to command, autocomplete and component interactions. The same signed
+requests, as Discord would send them, are then replayed against it by
+concurrent clients and this reports the requests served per second and their
+latency.
+
+By default as many requests as possible are sent. `--rate` instead sends them
+at a fixed rate, which measures the round-trip latency of a bot that isn't
+saturated.
+
+The clients run on the same host as the bot, so the workers compete with them
+for CPU time and the results are only meaningful relative to each other.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+import aiohttp
+import nacl.signing
+
+import hikari
+
+TIMESTAMP = b"1700000000"
+
+
+USER_PAYLOAD = {"id": "115590097100865541", "username": "nyaa", "discriminator": "0", "avatar": None}
+MEMBER_PAYLOAD = {
+    "user": USER_PAYLOAD,
+    "nick": "nyaa",
+    "roles": ["582345963851743243", "582689893965365248", "734164204679856290"],
+    "joined_at": "2020-09-27T22:58:10.282000+00:00",
+    "premium_since": None,
+    "deaf": False,
+    "mute": False,
+    "pending": False,
+    "flags": 0,
+    "permissions": "17179869183",
+}
+GUILD_INTERACTION_PAYLOAD = {
+    "application_id": "76234234",
+    "guild_id": "290926798626357999",
+    "channel_id": "43123123",
+    "channel": {"id": "43123123", "type": 0, "name": "general", "permissions": "17179869183", "parent_id": "1234"},
+    "member": MEMBER_PAYLOAD,
+    "token": "token",
+    "locale": "en-US",
+    "guild_locale": "en-US",
+    "version": 1,
+    "app_permissions": "54123",
+    "entitlements": [],
+    "authorizing_integration_owners": {"0": "290926798626357999"},
+    "context": 0,
+    "attachment_size_limit": 12345,
+}
+MESSAGE_PAYLOAD = {
+    "id": "123456789012345678",
+    "channel_id": "43123123",
+    "author": {**USER_PAYLOAD, "id": "76234234", "bot": True},
+    "content": "Pick a colour",
+    "timestamp": "2020-03-21T21:20:16.510000+00:00",
+    "edited_timestamp": None,
+    "tts": False,
+    "mention_everyone": False,
+    "mentions": [],
+    "mention_roles": [],
+    "attachments": [],
+    "embeds": [],
+    "pinned": False,
+    "type": 0,
+    "flags": 0,
+    "components": [
+        {
+            "type": 1,
+            "id": 1,
+            "components": [
+                {
+                    "type": 3,
+                    "id": 2,
+                    "custom_id": "colour",
+                    "options": [{"label": colour, "value": colour} for colour in ("red", "green", "blue")],
+                }
+            ],
+        }
+    ],
+}
+COLOURS = ("amber", "azure", "beige", "black", "blue", "brown", "crimson", "cyan", "gold", "green")
+
+
+def make_interaction(kind: str) -> bytes:
+    if kind == "ping":
+        return json.dumps({"id": "1", "type": 1, "application_id": "2", "token": "token", "version": 1}).encode()
+
+    if kind == "autocomplete":
+        return json.dumps(
+            {
+                **GUILD_INTERACTION_PAYLOAD,
+                "id": "3490190239012093",
+                "type": 4,
+                "data": {
+                    "id": "43123123",
+                    "name": "colour",
+                    "type": 1,
+                    "options": [{"name": "name", "type": 3, "value": "b", "focused": True}],
+                },
+            }
+        ).encode()
+
+    if kind == "component":
+        return json.dumps(
+            {
+                **GUILD_INTERACTION_PAYLOAD,
+                "id": "3490190239012093",
+                "type": 3,
+                "message": MESSAGE_PAYLOAD,
+                "data": {"custom_id": "colour", "component_type": 3, "values": ["blue"]},
+            }
+        ).encode()
+
+    return json.dumps(
+        {
+            "id": "3490190239012093",
+            "type": 2,
+            "application_id": "76234234",
+            "channel_id": "43123123",
+            "channel": {"id": "43123123", "type": 1, "recipients": []},
+            "data": {
+                "id": "43123123",
+                "name": "ping",
+                "type": 1,
+                "options": [{"name": "count", "type": 4, "value": 42}],
+            },
+            "user": USER_PAYLOAD,
+            "token": "token",
+            "locale": "en-US",
+            "version": 1,
+            "app_permissions": "54123",
+            "entitlements": [],
+            "authorizing_integration_owners": {"1": "115590097100865541"},
+            "context": 1,
+            "attachment_size_limit": 12345,
+        }
+    ).encode()
+
+
+def serve(public_key: str, port: int, workers: int) -> None:
+    bot = hikari.RESTBot(
+        "token", "Bot", public_key=public_key, banner=None, logs="WARNING", suppress_optimization_warning=True
+    )
+
+    async def on_command(interaction: hikari.CommandInteraction) -> hikari.api.InteractionMessageBuilder:
+        return interaction.build_response().set_content(f"pong from worker {bot.worker_id}")
+
+    async def on_autocomplete(interaction: hikari.AutocompleteInteraction) -> hikari.api.InteractionAutocompleteBuilder:
+        prefix = str(interaction.options[0].value)
+        return interaction.build_response(
+            [hikari.impl.AutocompleteChoiceBuilder(name=c, value=c) for c in COLOURS if c.startswith(prefix)]
+        )
+
+    async def on_component(interaction: hikari.ComponentInteraction) -> hikari.api.InteractionMessageBuilder:
+        return interaction.build_response(hikari.ResponseType.MESSAGE_UPDATE).set_content(
+            f"You picked {interaction.values[0]}"
+        )
+
+    bot.set_listener(hikari.CommandInteraction, on_command)
+    bot.set_listener(hikari.AutocompleteInteraction, on_autocomplete)
+    bot.set_listener(hikari.ComponentInteraction, on_component)
+    bot.run(check_for_updates=False, host="127.0.0.1", port=port, workers=workers)
+
+
+async def wait_for_server(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:  # noqa: PERF203 - try-except within a loop
+            if time.monotonic() > deadline:
+                raise
+
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+async def load(
+    port: int, body: bytes, signature: str, *, requests: int, concurrency: int, rate: float | None = None
+) -> list[float]:
+    url = f"http://127.0.0.1:{port}/"
+    headers = {
+        "Content-Type": "application/json",
+        "X-Signature-Ed25519": signature,
+        "X-Signature-Timestamp": TIMESTAMP.decode(),
+    }
+    latencies: list[float] = []
+
+    async def send(session: aiohttp.ClientSession) -> None:
+        start = time.perf_counter()
+        async with session.post(url, data=body, headers=headers) as response:
+            await response.read()
+            if response.status != 200:
+                msg = f"Unexpected response {response.status}: {await response.text()}"
+                raise RuntimeError(msg)
+
+        latencies.append(time.perf_counter() - start)
+
+    async def client(session: aiohttp.ClientSession, remaining: typing.Iterator[int]) -> None:
+        for _ in remaining:
+            await send(session)
+
+    async def paced(session: aiohttp.ClientSession, rate: float) -> None:
+        # Requests are sent on schedule regardless of how long earlier ones take, like Discord would.
+        start = time.perf_counter()
+        tasks: list[asyncio.Task[None]] = []
+        for i in range(requests):
+            await asyncio.sleep(max(0.0, start + i / rate - time.perf_counter()))
+            tasks.append(asyncio.create_task(send(session)))
+
+        await asyncio.gather(*tasks)
+
+    connector = aiohttp.TCPConnector(limit=concurrency, force_close=False)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        if rate is None:
+            remaining = iter(range(requests))
+            await asyncio.gather(*(client(session, remaining) for _ in range(concurrency)))
+        else:
+            await paced(session, rate)
+
+    return latencies
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_load_test(workers: int, args: argparse.Namespace) -> None:
+    signing_key = nacl.signing.SigningKey.generate()
+    body = make_interaction(args.kind)
+    signature = signing_key.sign(TIMESTAMP + body).signature.hex()
+    public_key = signing_key.verify_key.encode().hex()
+    port = free_port()
+
+    server = subprocess.Popen(  # noqa: S603 - Only runs this script
+        [sys.executable, __file__, "--serve", public_key, str(port), str(workers)],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    try:
+        asyncio.run(wait_for_server(port))
+        # Warm up every worker before measuring
+        asyncio.run(load(port, body, signature, requests=args.concurrency * 10, concurrency=args.concurrency))
+
+        start = time.perf_counter()
+        latencies = asyncio.run(
+            load(port, body, signature, requests=args.requests, concurrency=args.concurrency, rate=args.rate)
+        )
+        elapsed = time.perf_counter() - start
+
+    finally:
+        server.terminate()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            server.wait(timeout=30)
+
+    latencies.sort()
+    print(
+        f"{workers:>7}  {len(latencies) / elapsed:>9.0f}"
+        f"  {statistics.median(latencies) * 1_000:>8.2f}ms"
+        f"  {latencies[int(len(latencies) * 0.99)] * 1_000:>8.2f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="comma separated numbers of workers to test with")
+    parser.add_argument("--requests", type=int, default=5_000, help="how many requests to send to each bot")
+    parser.add_argument("--concurrency", type=int, default=32, help="how many requests to keep in flight")
+    parser.add_argument(
+        "--kind",
+        choices=("ping", "command", "autocomplete", "component"),
+        default="command",
+        help="the interaction to send",
+    )
+    parser.add_argument("--rate", type=float, help="send this many requests per second instead of as many as possible")
+    parser.add_argument("--serve", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        public_key, port, workers = args.serve
+        serve(public_key, int(port), int(workers))
+        return 0
+
+    if args.rate is None:
+        print(f"{os.cpu_count()} CPUs, {args.requests} {args.kind} requests, {args.concurrency} in flight")
+    else:
+        print(f"{os.cpu_count()} CPUs, {args.requests} {args.kind} requests, {args.rate:.0f} per second")
+
+    print("workers  requests/s    median       p99")
+    for workers in map(int, args.workers.split(",")):
+        run_load_test(workers, args)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark deserializing a large GUILD_CREATE when its timestamps are parsed lazily.
+
+This compares building the members and presences of a GUILD_CREATE as they are
+now, with their timestamps left raw, against also reading every timestamp,
+which costs about the same as parsing them all eagerly.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import sys
+import timeit
+import tracemalloc
+import typing
+from unittest import mock
+
+from hikari import guilds
+from hikari import presences
+from hikari.impl import entity_factory
+from hikari.internal import time
+
+MEMBER_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+NUMBER = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+GUILD_ID = 123456789
+
+
+def make_member_payload(user_id: int) -> dict[str, object]:
+    return {
+        "user": {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0", "avatar": None},
+        "nick": f"nick{user_id % 100}" if user_id % 3 else None,
+        "roles": [str(GUILD_ID + 1 + (user_id + i) % 50) for i in range(user_id % 5)],
+        "joined_at": f"2020-01-{1 + user_id % 28:02}T00:{user_id % 60:02}:00.{user_id % 1000:03}000+00:00",
+        "premium_since": "2021-01-01T00:00:00.000000+00:00" if user_id % 10 == 0 else None,
+        "communication_disabled_until": None,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def make_presence_payload(user_id: int) -> dict[str, object]:
+    return {
+        "user": {"id": str(user_id)},
+        "status": "online",
+        "activities": [
+            {
+                "name": "Custom Status",
+                "type": 4,
+                "created_at": 1600000000000 + user_id,
+                "state": "Benchmarking",
+                "timestamps": {"start": 1600000000000 + user_id},
+            }
+        ],
+        "client_status": {"desktop": "online"},
+    }
+
+
+GUILD_CREATE_PAYLOAD = {
+    "id": str(GUILD_ID),
+    "name": "Benchmark guild",
+    "icon": None,
+    "owner_id": "1",
+    "afk_channel_id": None,
+    "afk_timeout": 300,
+    "verification_level": 0,
+    "default_message_notifications": 0,
+    "explicit_content_filter": 0,
+    "roles": [],
+    "emojis": [],
+    "stickers": [],
+    "features": [],
+    "mfa_level": 0,
+    "application_id": None,
+    "system_channel_id": None,
+    "system_channel_flags": 0,
+    "rules_channel_id": None,
+    "vanity_url_code": None,
+    "description": None,
+    "banner": None,
+    "premium_tier": 0,
+    "preferred_locale": "en-US",
+    "public_updates_channel_id": None,
+    "nsfw_level": 0,
+    "premium_progress_bar_enabled": False,
+    "joined_at": "2020-01-01T00:00:00.000000+00:00",
+    "large": True,
+    "member_count": MEMBER_COUNT,
+    "channels": [],
+    "threads": [],
+    "voice_states": [],
+    "members": [make_member_payload(user_id) for user_id in range(1, MEMBER_COUNT + 1)],
+    "presences": [make_presence_payload(user_id) for user_id in range(1, MEMBER_COUNT // 2 + 1)],
+}
+
+factory = entity_factory.EntityFactoryImpl(mock.Mock())
+
+
+def deserialize() -> tuple[list[guilds.Member], list[presences.MemberPresence]]:
+    guild = factory.deserialize_gateway_guild(GUILD_CREATE_PAYLOAD, user_id=mock.Mock())
+    return list(guild.members().values()), list(guild.presences().values())
+
+
+def deserialize_and_read() -> tuple[list[guilds.Member], list[presences.MemberPresence]]:
+    members, presences_ = deserialize()
+    for member in members:
+        _ = member.joined_at, member.premium_since, member.raw_communication_disabled_until
+
+    for presence in presences_:
+        for activity in presence.activities:
+            _ = activity.created_at
+            if activity.timestamps:
+                _ = activity.timestamps.start, activity.timestamps.end
+
+    return members, presences_
+
+
+def measure_memory(function: typing.Callable[[], object]) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    # The raw timestamps are shared with the payload here, whereas a real payload would be freed.
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def run(parser_name: str) -> None:
+    times: dict[str, list[float]] = {"Lazy": [], "Lazy, every timestamp read": []}
+    # Interleave the cases so that they are equally affected by noise.
+    for _ in range(NUMBER):
+        times["Lazy"].append(timeit.timeit(deserialize, number=1))
+        times["Lazy, every timestamp read"].append(timeit.timeit(deserialize_and_read, number=1))
+
+    print(f"GUILD_CREATE with {MEMBER_COUNT} members ({parser_name})")
+    lazy_time = min(times["Lazy"])
+    for case, case_times in times.items():
+        case_time = min(case_times)
+        print(f"    {case}: {case_time * 1000:.1f}ms", f"({case_time / lazy_time:.2f}x)")
+
+
+print("Memory allocated (retained / peak)")
+for case, function in (("Lazy", deserialize), ("Lazy, every timestamp read", deserialize_and_read)):
+    current, peak = measure_memory(function)
+    print(f"    {case}: {current / 1024 / 1024:.1f}MiB / {peak / 1024 / 1024:.1f}MiB")
+
+run("ciso8601" if time.fast_iso8601_datetime_string_to_datetime else "standard library parser")
+
+if time.fast_iso8601_datetime_string_to_datetime:
+    with contextlib.ExitStack() as stack:
+        for name in ("joined_at", "premium_since", "raw_communication_disabled_until"):
+            field = vars(guilds.Member)[name]
+            stack.enter_context(mock.patch.object(field, "_convert", time.slow_iso8601_datetime_string_to_datetime))
+
+        run("standard library parser")
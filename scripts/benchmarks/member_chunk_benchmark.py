@@ -0,0 +1,115 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import time
+from unittest import mock
+
+from hikari.impl import cache
+from hikari.impl import config
+from hikari.impl import entity_factory
+from hikari.impl import event_factory
+
+CHUNK_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+CHUNK_SIZE = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+GUILD_ID = 123456789
+ROLE_COUNT = 50
+
+
+def make_member_payload(user_id: int) -> dict[str, object]:
+    return {
+        "user": {
+            "id": str(user_id),
+            "username": f"user{user_id}",
+            "discriminator": "0",
+            "avatar": None,
+            "global_name": None,
+        },
+        "nick": f"nick{user_id % 100}" if user_id % 3 else None,
+        "roles": [str(GUILD_ID + 1 + (user_id + i) % ROLE_COUNT) for i in range(user_id % 5)],
+        "joined_at": "2020-01-01T00:00:00+00:00",
+        "premium_since": "2021-01-01T00:00:00+00:00" if user_id % 10 == 0 else None,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def make_chunk_payload(index: int) -> dict[str, object]:
+    first_id = index * CHUNK_SIZE + 1
+    return {
+        "guild_id": str(GUILD_ID),
+        "members": [make_member_payload(user_id) for user_id in range(first_id, first_id + CHUNK_SIZE)],
+        "chunk_index": index,
+        "chunk_count": CHUNK_COUNT,
+    }
+
+
+def make_app() -> mock.Mock:
+    app = mock.Mock()
+    app.entity_factory = entity_factory.EntityFactoryImpl(app)
+    return app
+
+
+def run_event_path(raw_chunks: str) -> float:
+    # Mirrors what the event manager does when there is a listener for member chunks.
+    app = make_app()
+    factory = event_factory.EventFactoryImpl(app)
+    cache_impl = cache.CacheImpl(app, config.CacheSettings())
+    shard = mock.Mock()
+    chunks = json.loads(raw_chunks)
+    gc.collect()
+
+    start = time.perf_counter()
+    for payload in chunks:
+        event = factory.deserialize_guild_member_chunk_event(shard, payload)
+        for member in event.members.values():
+            cache_impl.set_member(member)
+
+    return time.perf_counter() - start
+
+
+def run_direct_path(raw_chunks: str) -> float:
+    # Mirrors what the event manager does when there are no listeners for member chunks.
+    app = make_app()
+    cache_impl = cache.CacheImpl(app, config.CacheSettings())
+    chunks = json.loads(raw_chunks)
+    gc.collect()
+
+    start = time.perf_counter()
+    for payload in chunks:
+        cache_impl.set_members_from_payloads(GUILD_ID, payload["members"])
+
+    return time.perf_counter() - start
+
+
+raw_chunks = json.dumps([make_chunk_payload(index) for index in range(CHUNK_COUNT)])
+member_count = CHUNK_COUNT * CHUNK_SIZE
+event_time = run_event_path(raw_chunks)
+direct_time = run_direct_path(raw_chunks)
+
+print("Members", member_count, "in", CHUNK_COUNT, "chunks")
+print("Event path", event_time, "s", member_count / event_time, "members/s")
+print("Direct path", direct_time, "s", member_count / direct_time, "members/s")
+print("Speedup", event_time / direct_time, "x")
@@ -0,0 +1,301 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Synthetic but realistic gateway payloads for the benchmarks.
+
+Every scenario is generated from a seed, so the same arguments always produce
+the same payloads. Scenarios are lists of `(event name, payload)` pairs which
+can be encoded into gateway frames or recorded to a file and replayed.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import typing
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+GUILD_ID: typing.Final[int] = 574921006817476608
+CHANNEL_COUNT: typing.Final[int] = 40
+ROLE_COUNT: typing.Final[int] = 30
+
+Dispatch = tuple[str, dict[str, typing.Any]]
+
+_WORDS = (
+    "hikari", "gateway", "shard", "cache", "message", "guild", "member", "presence", "hello", "there",
+    "benchmark", "python", "discord", "bot", "event", "payload", "fast", "slow", "what", "why",
+)  # fmt: skip
+_ACTIVITIES = ("Visual Studio Code", "Spotify", "Minecraft", "League of Legends", "Custom Status")
+_STATUSES = ("online", "idle", "dnd", "offline")
+
+
+def _rng(seed: int) -> random.Random:
+    return random.Random(seed)  # noqa: S311 - Payloads don't need cryptographic randomness
+
+
+def _snowflake(rng: random.Random) -> str:
+    return str(rng.randrange(100_000_000_000_000_000, 999_999_999_999_999_999))
+
+
+def _timestamp(rng: random.Random) -> str:
+    return (
+        f"20{rng.randint(16, 24)}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}"
+        f"T{rng.randint(0, 23):02}:{rng.randint(0, 59):02}:{rng.randint(0, 59):02}.{rng.randrange(1_000_000):06}+00:00"
+    )
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def make_user(rng: random.Random, user_id: str, *, bot: bool = False) -> dict[str, typing.Any]:
+    """Make a user payload."""
+    name = f"{rng.choice(_WORDS)}{user_id[-4:]}"
+    payload: dict[str, typing.Any] = {
+        "id": user_id,
+        "username": name,
+        "global_name": name.title() if rng.random() < 0.7 else None,
+        "avatar": f"{rng.getrandbits(128):032x}" if rng.random() < 0.8 else None,
+        "discriminator": "0",
+        "public_flags": rng.choice((0, 0, 0, 64, 128, 256)),
+        "avatar_decoration_data": None,
+        "primary_guild": None,
+        "clan": None,
+    }
+    if bot:
+        payload["bot"] = True
+
+    return payload
+
+
+def make_member(rng: random.Random, user: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Make a member payload without its guild ID."""
+    return {
+        "user": user,
+        "nick": _text(rng, 1) if rng.random() < 0.3 else None,
+        "avatar": None,
+        "banner": None,
+        "roles": [str(GUILD_ID + 1 + i) for i in rng.sample(range(ROLE_COUNT), rng.randint(0, 5))],
+        "joined_at": _timestamp(rng),
+        "premium_since": _timestamp(rng) if rng.random() < 0.05 else None,
+        "deaf": False,
+        "mute": False,
+        "pending": False,
+        "flags": 0,
+        "communication_disabled_until": None,
+    }
+
+
+def make_presence(rng: random.Random, user_id: str, guild_id: str | None = None) -> dict[str, typing.Any]:
+    """Make a presence payload."""
+    status = rng.choice(_STATUSES[:-1])
+    activities = []
+    for _ in range(rng.randint(0, 2)):
+        name = rng.choice(_ACTIVITIES)
+        activity: dict[str, typing.Any] = {
+            "name": name,
+            "type": 4 if name == "Custom Status" else rng.choice((0, 2)),
+            "created_at": rng.randrange(1_600_000_000_000, 1_700_000_000_000),
+        }
+        if name == "Custom Status":
+            activity["state"] = _text(rng, 3)
+        else:
+            activity["timestamps"] = {"start": activity["created_at"]}
+            activity["details"] = _text(rng, 2)
+
+        activities.append(activity)
+
+    payload: dict[str, typing.Any] = {
+        "user": {"id": user_id},
+        "status": status,
+        "activities": activities,
+        "client_status": {rng.choice(("desktop", "mobile", "web")): status},
+    }
+    if guild_id is not None:
+        payload["guild_id"] = guild_id
+
+    return payload
+
+
+def _make_channel(rng: random.Random, position: int) -> dict[str, typing.Any]:
+    return {
+        "id": str(GUILD_ID + 1000 + position),
+        "type": 0 if position % 8 else 2,
+        "name": f"{rng.choice(_WORDS)}-{position}",
+        "position": position,
+        "parent_id": None,
+        "nsfw": False,
+        "permission_overwrites": [
+            {"id": str(GUILD_ID + 1 + i), "type": 0, "allow": "1024", "deny": "2048"} for i in range(position % 3)
+        ],
+        "topic": _text(rng, 6) if position % 8 else None,
+        "last_message_id": None,
+        "rate_limit_per_user": 0,
+        "bitrate": 64000,
+        "user_limit": 0,
+        "rtc_region": None,
+    }
+
+
+def _make_role(position: int) -> dict[str, typing.Any]:
+    role_id = str(GUILD_ID if position == 0 else GUILD_ID + position)
+    return {
+        "id": role_id,
+        "name": "@everyone" if position == 0 else f"role {position}",
+        "color": position * 1000,
+        "colors": {"primary_color": position * 1000, "secondary_color": None, "tertiary_color": None},
+        "hoist": position % 5 == 0,
+        "icon": None,
+        "unicode_emoji": None,
+        "position": position,
+        "permissions": "104324673",
+        "managed": False,
+        "mentionable": False,
+        "flags": 0,
+    }
+
+
+def make_guild_create(seed: int, *, member_count: int, presence_ratio: float = 0.3) -> list[Dispatch]:
+    """Make a single GUILD_CREATE with the given number of members."""
+    rng = _rng(seed)
+    user_ids = [_snowflake(rng) for _ in range(member_count)]
+    members = [make_member(rng, make_user(rng, user_id, bot=rng.random() < 0.02)) for user_id in user_ids]
+    presences = [make_presence(rng, user_id) for user_id in user_ids[: int(member_count * presence_ratio)]]
+    payload = {
+        "id": str(GUILD_ID),
+        "name": "Benchmark guild",
+        "icon": None,
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": user_ids[0] if user_ids else "1",
+        "afk_channel_id": None,
+        "afk_timeout": 300,
+        "verification_level": 1,
+        "default_message_notifications": 1,
+        "explicit_content_filter": 2,
+        "roles": [_make_role(position) for position in range(ROLE_COUNT + 1)],
+        "emojis": [],
+        "stickers": [],
+        "features": ["COMMUNITY", "NEWS"],
+        "mfa_level": 0,
+        "application_id": None,
+        "system_channel_id": None,
+        "system_channel_flags": 0,
+        "rules_channel_id": None,
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": 2,
+        "premium_subscription_count": 9,
+        "preferred_locale": "en-US",
+        "public_updates_channel_id": None,
+        "nsfw_level": 0,
+        "premium_progress_bar_enabled": False,
+        "joined_at": _timestamp(rng),
+        "large": member_count > 250,
+        "member_count": member_count,
+        "channels": [_make_channel(rng, position) for position in range(CHANNEL_COUNT)],
+        "threads": [],
+        "voice_states": [],
+        "members": members,
+        "presences": presences,
+    }
+    return [("GUILD_CREATE", payload)]
+
+
+def make_message_flood(seed: int, *, count: int, author_count: int = 50) -> list[Dispatch]:
+    """Make MESSAGE_CREATEs from a small set of chatty authors."""
+    rng = _rng(seed)
+    authors = [make_member(rng, make_user(rng, _snowflake(rng))) for _ in range(author_count)]
+    dispatches: list[Dispatch] = []
+    for index in range(count):
+        member = dict(rng.choice(authors))
+        author = member.pop("user")
+        payload = {
+            "id": str(1_100_000_000_000_000_000 + index),
+            "channel_id": str(GUILD_ID + 1000 + rng.randrange(CHANNEL_COUNT)),
+            "guild_id": str(GUILD_ID),
+            "author": author,
+            "member": member,
+            "content": _text(rng, rng.randint(1, 30)),
+            "timestamp": _timestamp(rng),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            "flags": 0,
+            "nonce": _snowflake(rng),
+            "components": [],
+        }
+        dispatches.append(("MESSAGE_CREATE", payload))
+
+    return dispatches
+
+
+def make_presence_storm(seed: int, *, count: int, user_count: int = 1000) -> list[Dispatch]:
+    """Make PRESENCE_UPDATEs for a set of users in a guild."""
+    rng = _rng(seed)
+    user_ids = [_snowflake(rng) for _ in range(user_count)]
+    return [("PRESENCE_UPDATE", make_presence(rng, rng.choice(user_ids), str(GUILD_ID))) for _ in range(count)]
+
+
+def make_member_chunks(seed: int, *, chunk_count: int, chunk_size: int = 1000) -> list[Dispatch]:
+    """Make the GUILD_MEMBERS_CHUNKs of a member request with presences."""
+    rng = _rng(seed)
+    dispatches: list[Dispatch] = []
+    for index in range(chunk_count):
+        user_ids = [_snowflake(rng) for _ in range(chunk_size)]
+        payload = {
+            "guild_id": str(GUILD_ID),
+            "members": [make_member(rng, make_user(rng, user_id)) for user_id in user_ids],
+            "presences": [make_presence(rng, user_id) for user_id in user_ids if rng.random() < 0.3],
+            "chunk_index": index,
+            "chunk_count": chunk_count,
+            "nonce": "benchmark",
+        }
+        dispatches.append(("GUILD_MEMBERS_CHUNK", payload))
+
+    return dispatches
+
+
+def record(path: pathlib.Path, scenarios: typing.Mapping[str, typing.Sequence[Dispatch]]) -> None:
+    """Record scenarios to a JSON lines file."""
+    with path.open("w") as file:
+        for scenario, dispatches in scenarios.items():
+            for event_name, payload in dispatches:
+                file.write(json.dumps({"scenario": scenario, "t": event_name, "d": payload}) + "\n")
+
+
+def replay(path: pathlib.Path) -> dict[str, list[Dispatch]]:
+    """Load scenarios recorded with [`record`][]."""
+    scenarios: dict[str, list[Dispatch]] = {}
+    with path.open() as file:
+        for line in file:
+            entry = json.loads(line)
+            scenarios.setdefault(entry["scenario"], []).append((entry["t"], entry["d"]))
+
+    return scenarios
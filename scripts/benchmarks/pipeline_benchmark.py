@@ -0,0 +1,256 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the gateway event pipeline stage by stage.
+
+Each stage includes the ones before it:
+
+- `decode`: decoding the raw gateway frames.
+- `deserialize`: building the events with the event and entity factories.
+- `cache`: consuming the events with `EventManagerImpl.consume_raw_event` and
+  a `CacheImpl`, with no listeners registered.
+- `dispatch`: the same, with a listener registered for every event and the
+  event loop running them as the events come in.
+
+Every stage reports its throughput, the peak memory allocated while it runs
+and the memory blocks it leaves allocated. The payloads come from
+`payload_generator`, or from a file previously recorded with `--record`.
+
+Results can be saved with `--save` and compared against a saved baseline with
+`--baseline`, which exits with a non-zero status if a stage got slower or used
+more memory than the tolerance allows, so that this can be run in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+import typing
+from unittest import mock
+
+import payload_generator
+
+from hikari import intents
+from hikari.events import guild_events
+from hikari.events import message_events
+from hikari.events import shard_events
+from hikari.impl import cache
+from hikari.impl import config
+from hikari.impl import entity_factory
+from hikari.impl import event_factory
+from hikari.impl import event_manager
+from hikari.internal import data_binding
+
+STAGES: typing.Final[typing.Sequence[str]] = ("decode", "deserialize", "cache", "dispatch")
+DESERIALIZERS: typing.Final[typing.Mapping[str, str]] = {
+    "GUILD_CREATE": "deserialize_guild_join_event",
+    "MESSAGE_CREATE": "deserialize_message_create_event",
+    "PRESENCE_UPDATE": "deserialize_presence_update_event",
+    "GUILD_MEMBERS_CHUNK": "deserialize_guild_member_chunk_event",
+}
+LISTENED_EVENTS: typing.Final[typing.Sequence[type[typing.Any]]] = (
+    guild_events.GuildJoinEvent,
+    message_events.GuildMessageCreateEvent,
+    guild_events.PresenceUpdateEvent,
+    shard_events.MemberChunkEvent,
+)
+
+Frames = list[tuple[str, bytes]]
+Results = dict[str, dict[str, dict[str, float]]]
+
+
+def generate_scenarios(scale: float) -> dict[str, list[payload_generator.Dispatch]]:
+    def scaled(value: int) -> int:
+        return max(1, int(value * scale))
+
+    return {
+        "guild_create_small": payload_generator.make_guild_create(1, member_count=scaled(100)),
+        "guild_create_medium": payload_generator.make_guild_create(2, member_count=scaled(2_500)),
+        "guild_create_large": payload_generator.make_guild_create(3, member_count=scaled(25_000)),
+        "message_flood": payload_generator.make_message_flood(4, count=scaled(5_000)),
+        "presence_storm": payload_generator.make_presence_storm(5, count=scaled(10_000)),
+        "member_chunks": payload_generator.make_member_chunks(6, chunk_count=scaled(20)),
+    }
+
+
+def encode_frames(dispatches: typing.Sequence[payload_generator.Dispatch]) -> Frames:
+    return [
+        (name, data_binding.default_json_dumps({"op": 0, "t": name, "s": sequence, "d": payload}))
+        for sequence, (name, payload) in enumerate(dispatches, start=1)
+    ]
+
+
+class Pipeline:
+    """Fresh components to push a scenario's frames through."""
+
+    def __init__(self) -> None:
+        self.shard = mock.Mock(id=0)
+        self.app = mock.Mock()
+        self.app.entity_factory = entity_factory.EntityFactoryImpl(self.app)
+        self.event_factory = event_factory.EventFactoryImpl(self.app)
+        self.manager = event_manager.EventManagerImpl(
+            self.app.entity_factory,
+            self.event_factory,
+            intents.Intents.ALL,
+            auto_chunk_members=False,
+            cache=cache.CacheImpl(self.app, config.CacheSettings()),
+        )
+
+    async def decode(self, frames: Frames) -> None:
+        for _, raw in frames:
+            data_binding.default_json_loads(raw)
+
+    async def deserialize(self, frames: Frames) -> None:
+        for name, raw in frames:
+            payload = data_binding.default_json_loads(raw)
+            assert isinstance(payload, dict)
+            getattr(self.event_factory, DESERIALIZERS[name])(self.shard, payload["d"])
+
+    async def cache(self, frames: Frames) -> None:
+        for name, raw in frames:
+            payload = data_binding.default_json_loads(raw)
+            assert isinstance(payload, dict)
+            self.manager.consume_raw_event(name, self.shard, payload["d"])
+
+    async def dispatch(self, frames: Frames) -> None:
+        async def listener(_: object) -> None: ...
+
+        for event_type in LISTENED_EVENTS:
+            self.manager.subscribe(event_type, listener)
+
+        for name, raw in frames:
+            payload = data_binding.default_json_loads(raw)
+            assert isinstance(payload, dict)
+            self.manager.consume_raw_event(name, self.shard, payload["d"])
+            # Let the listeners run, as the event loop would between frames.
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*(asyncio.all_tasks() - {asyncio.current_task()}))
+
+
+async def measure_time(stage: str, frames: Frames) -> float:
+    # The components are built outside of the measurement so that each run starts with an empty cache.
+    run = getattr(Pipeline(), stage)
+    gc.collect()
+    start = time.perf_counter()
+    await run(frames)
+    return time.perf_counter() - start
+
+
+async def measure_memory(stage: str, frames: Frames) -> tuple[int, int]:
+    pipeline = Pipeline()
+    run = getattr(pipeline, stage)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    await run(frames)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    return peak, sys.getallocatedblocks() - blocks
+
+
+async def benchmark(scenarios: typing.Mapping[str, Frames], *, repeat: int) -> Results:
+    results: Results = {}
+    for scenario, frames in scenarios.items():
+        print(f"{scenario} ({len(frames)} events, {sum(len(raw) for _, raw in frames) / 1024 / 1024:.1f}MiB)")
+        results[scenario] = {}
+        for stage in STAGES:
+            elapsed = min([await measure_time(stage, frames) for _ in range(repeat)])
+            peak, blocks = await measure_memory(stage, frames)
+            results[scenario][stage] = {
+                "events_per_second": len(frames) / elapsed,
+                "peak_mib": peak / 1024 / 1024,
+                "retained_blocks": blocks,
+            }
+            print(
+                f"    {stage:<12} {len(frames) / elapsed:>12.1f} events/s {elapsed * 1000:>10.1f}ms"
+                f" {peak / 1024 / 1024:>8.1f}MiB peak {blocks:>9} blocks retained"
+            )
+
+    return results
+
+
+def compare(results: Results, baseline: Results, *, tolerance: float) -> list[str]:
+    regressions: list[str] = []
+    for scenario, stages in results.items():
+        for stage, result in stages.items():
+            if (expected := baseline.get(scenario, {}).get(stage)) is None:
+                continue
+
+            if result["events_per_second"] < expected["events_per_second"] * (1 - tolerance):
+                regressions.append(
+                    f"{scenario}/{stage}: {result['events_per_second']:.1f} events/s"
+                    f" (baseline {expected['events_per_second']:.1f})"
+                )
+
+            if result["peak_mib"] > expected["peak_mib"] * (1 + tolerance):
+                regressions.append(
+                    f"{scenario}/{stage}: {result['peak_mib']:.1f}MiB peak (baseline {expected['peak_mib']:.1f})"
+                )
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="scale the size of the generated scenarios")
+    parser.add_argument("--repeat", type=int, default=3, help="how many times to time each stage")
+    parser.add_argument("--scenario", action="append", help="only run these scenarios")
+    parser.add_argument("--record", type=pathlib.Path, help="record the generated payloads to a file and exit")
+    parser.add_argument("--replay", type=pathlib.Path, help="use payloads recorded with --record")
+    parser.add_argument("--save", type=pathlib.Path, help="save the results to a file")
+    parser.add_argument("--baseline", type=pathlib.Path, help="compare the results against saved results")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed regression against the baseline")
+    args = parser.parse_args()
+
+    dispatches = payload_generator.replay(args.replay) if args.replay else generate_scenarios(args.scale)
+
+    if args.scenario:
+        dispatches = {scenario: dispatches[scenario] for scenario in args.scenario}
+
+    if args.record:
+        payload_generator.record(args.record, dispatches)
+        return 0
+
+    scenarios = {scenario: encode_frames(scenario_dispatches) for scenario, scenario_dispatches in dispatches.items()}
+    results = asyncio.run(benchmark(scenarios, repeat=args.repeat))
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=4))
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), tolerance=args.tolerance)
+        for regression in regressions:
+            print("Regression:", regression)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
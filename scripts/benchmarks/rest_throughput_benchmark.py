@@ -0,0 +1,198 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark the REST client against a local fake Discord.
+
+Every scenario runs against `fake_discord_rest` in a subprocess:
+
+- `fetch_messages`, `fetch_members` and `fetch_audit_log`: iterating through
+  every page, with rate limits too high to get in the way.
+- `create_message (route limits)`: sending messages to many channels at once,
+  where every channel allows a few messages per period, which shows how close
+  `RESTBucketManager` gets to the rate limits.
+- `create_message (global limit)`: the same, bounded by the global rate limit
+  instead.
+
+Every scenario reports how long it took, the client CPU time, how many requests
+it made and how many of them the server rate limited. The rate limited
+scenarios also report how long they would ideally take. As the server runs on
+the same host, only the relative results are meaningful.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import math
+import subprocess
+import sys
+import time
+import typing
+
+import aiohttp
+import fake_discord_rest
+
+import hikari
+from hikari.impl import config
+
+_LOOSE_LIMITS: typing.Final[tuple[str, ...]] = ("--route-limit", "1000000", "--global-limit", "1000000")
+
+
+class Scenario(typing.NamedTuple):
+    server_args: tuple[str, ...]
+    run: typing.Callable[[hikari.impl.RESTClientImpl], typing.Awaitable[int]]
+    ideal: float | None = None
+
+
+@contextlib.contextmanager
+def fake_discord(*args: str) -> typing.Iterator[str]:
+    server = subprocess.Popen(  # noqa: S603 - Only runs the fake server
+        [sys.executable, fake_discord_rest.__file__, *args], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert server.stdout is not None
+        yield server.stdout.readline().strip()
+
+    finally:
+        server.terminate()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            server.wait(timeout=30)
+
+
+async def fetch_stats(rest_url: str) -> dict[str, typing.Any]:
+    async with (
+        aiohttp.ClientSession() as session,
+        session.get(f"{rest_url.removesuffix('/api/v10')}/_fake/stats") as response,
+    ):
+        return await response.json()
+
+
+async def count_messages(rest: hikari.impl.RESTClientImpl) -> int:
+    return await rest.fetch_messages(1).count()
+
+
+async def count_members(rest: hikari.impl.RESTClientImpl) -> int:
+    return await rest.fetch_members(1).count()
+
+
+async def count_audit_log_entries(rest: hikari.impl.RESTClientImpl) -> int:
+    return sum([len(log.entries) async for log in rest.fetch_audit_log(1)])
+
+
+def send_messages(
+    channels: int, per_channel: int
+) -> typing.Callable[[hikari.impl.RESTClientImpl], typing.Awaitable[int]]:
+    async def run(rest: hikari.impl.RESTClientImpl) -> int:
+        await asyncio.gather(
+            *(rest.create_message(channel, "hello") for channel in range(1, channels + 1) for _ in range(per_channel))
+        )
+        return channels * per_channel
+
+    return run
+
+
+def make_scenarios(scale: float) -> dict[str, Scenario]:
+    messages = max(int(10_000 * scale), 1)
+    members = max(int(20_000 * scale), 1)
+    audit_log_entries = max(int(2_000 * scale), 1)
+    channels, per_channel, route_limit, route_period = 10, max(int(20 * scale), 1), 5, 0.25
+    global_channels, global_per_channel, global_limit = 20, max(int(15 * scale), 1), 100
+
+    return {
+        "fetch_messages": Scenario((*_LOOSE_LIMITS, "--message-count", str(messages)), count_messages),
+        "fetch_members": Scenario((*_LOOSE_LIMITS, "--member-count", str(members)), count_members),
+        "fetch_audit_log": Scenario(
+            (*_LOOSE_LIMITS, "--audit-log-entry-count", str(audit_log_entries)), count_audit_log_entries
+        ),
+        "create_message (route limits)": Scenario(
+            ("--route-limit", str(route_limit), "--route-period", str(route_period), "--global-limit", "1000000"),
+            send_messages(channels, per_channel),
+            # Every channel can send `route_limit` messages at once and as many again every period.
+            (math.ceil(per_channel / route_limit) - 1) * route_period,
+        ),
+        "create_message (global limit)": Scenario(
+            ("--route-limit", "1000000", "--global-limit", str(global_limit)),
+            send_messages(global_channels, global_per_channel),
+            math.ceil(global_channels * global_per_channel / global_limit) - 1.0,
+        ),
+    }
+
+
+async def run_scenario(rest_url: str, scenario: Scenario) -> tuple[float, float, int, dict[str, typing.Any]]:
+    rest = hikari.impl.RESTClientImpl(
+        cache=None,
+        entity_factory=hikari.impl.EntityFactoryImpl(hikari.RESTApp()),
+        executor=None,
+        http_settings=config.HTTPSettings(),
+        proxy_settings=config.ProxySettings(),
+        token="fake",  # noqa: S106 - Not a real token
+        token_type=hikari.TokenType.BOT,
+        rest_url=rest_url,
+    )
+    rest.start()
+    try:
+        start, cpu_start = time.perf_counter(), time.process_time()
+        count = await scenario.run(rest)
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+
+    finally:
+        await rest.close()
+
+    return elapsed, cpu, count, await fetch_stats(rest_url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="scale the size of the scenarios")
+    parser.add_argument("--repeat", type=int, default=3, help="how many times to run each scenario")
+    parser.add_argument("--scenario", action="append", help="only run these scenarios")
+    args = parser.parse_args()
+
+    scenarios = make_scenarios(args.scale)
+    for name in args.scenario or ():
+        if name not in scenarios:
+            parser.error(f"unknown scenario {name!r}, expected one of {', '.join(scenarios)}")
+
+    results: dict[str, list[tuple[float, float, int, dict[str, typing.Any]]]] = {
+        name: [] for name in args.scenario or scenarios
+    }
+    # Interleave the scenarios so that they are equally affected by noise. Every run gets a new server,
+    # so that it starts with fresh rate limits.
+    for _ in range(args.repeat):
+        for name, runs in results.items():
+            with fake_discord(*scenarios[name].server_args) as rest_url:
+                runs.append(asyncio.run(run_scenario(rest_url, scenarios[name])))
+
+    for name, runs in results.items():
+        elapsed, cpu, count, stats = min(runs, key=lambda run: run[0])
+        rate_limited = stats["route_rate_limited"] + stats["global_rate_limited"]
+        line = (
+            f"{name}: {count:,} in {elapsed * 1_000:.0f}ms ({count / elapsed:,.0f}/s), client CPU {cpu * 1_000:.0f}ms, "
+            f"{stats['requests']:,} requests, {rate_limited:,} rate limited"
+        )
+        if (ideal := scenarios[name].ideal) is not None:
+            line += f", ideally {ideal * 1_000:.0f}ms"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark verifying interaction signatures on the event loop against on an executor.
+
+Signed ping interactions are passed to an interaction server at a fixed rate,
+as Discord would send them, and this reports the latency of each from when it
+was due to when it was responded to. Meanwhile, a probe measures how late the
+event loop runs a callback scheduled every millisecond, which is how long
+anything else on the loop would be held up for.
+
+Usage: signature_verification_benchmark.py [rate] [seconds] [repeat]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import statistics
+import sys
+import time
+from unittest import mock
+
+import nacl.signing
+
+from hikari.impl import interaction_server
+
+RATE = float(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+SECONDS = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+REPEAT = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+PROBE_INTERVAL = 0.001
+TIMESTAMP = b"1700000000"
+BODY = b'{"application_id":"658822586720976907","id":"938421734825140264","token":"' + b"a" * 200 + b'","type":1}'
+
+signing_key = nacl.signing.SigningKey.generate()
+SIGNATURE = signing_key.sign(TIMESTAMP + BODY).signature
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return sorted(values)[int(len(values) * fraction)]
+
+
+async def probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        due = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - due)
+
+
+async def run(executor: concurrent.futures.Executor | None) -> tuple[list[float], list[float], float]:
+    server = interaction_server.InteractionServer(
+        entity_factory=mock.Mock(),
+        rest_client=mock.Mock(),
+        public_key=signing_key.verify_key.encode(),
+        verification_executor=executor,
+    )
+    await server._signature_verifier.start(signing_key.verify_key)  # noqa: SLF001 - Private member accessed
+
+    latencies: list[float] = []
+    lags: list[float] = []
+
+    async def send(due: float) -> None:
+        response = await server.on_interaction(BODY, SIGNATURE, TIMESTAMP)
+        assert response.status_code == 200
+        latencies.append(time.perf_counter() - due)
+
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    tasks: list[asyncio.Task[None]] = []
+    start = time.perf_counter()
+    for i in range(int(RATE * SECONDS)):
+        # Requests are sent on schedule regardless of how long earlier ones take.
+        due = start + i / RATE
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        tasks.append(asyncio.create_task(send(due)))
+
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe_task
+    return latencies, lags, len(tasks) / elapsed
+
+
+def main() -> None:
+    print(f"{RATE:.0f} requests per second for {SECONDS:.0f}s, best of {REPEAT}")
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        cases = {"On the event loop": None, "Batched on an executor": executor}
+        results: dict[str, list[tuple[list[float], list[float], float]]] = {case: [] for case in cases}
+        # Interleave the cases so that they are equally affected by noise.
+        for _ in range(REPEAT):
+            for case, case_executor in cases.items():
+                results[case].append(asyncio.run(run(case_executor)))
+
+    for case, case_results in results.items():
+        latencies, lags, rate = min(case_results, key=lambda result: percentile(result[0], 0.99))
+        print(
+            f"    {case}: {rate:,.0f} req/s,"
+            f" latency p50 {statistics.median(latencies) * 1_000:.2f}ms"
+            f" p99 {percentile(latencies, 0.99) * 1_000:.2f}ms,"
+            f" loop lag p99 {percentile(lags, 0.99) * 1_000:.2f}ms max {max(lags) * 1_000:.2f}ms"
+        )
+
+
+main()
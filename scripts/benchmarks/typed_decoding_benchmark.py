@@ -0,0 +1,134 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import functools
+import sys
+import timeit
+from unittest import mock
+
+from hikari.impl import entity_factory
+from hikari.impl import event_factory
+from hikari.impl import typed_decoding
+from hikari.internal import data_binding
+
+NUMBER = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+USER_PAYLOAD = {
+    "id": "115590097100865541",
+    "username": "nyaa",
+    "global_name": "Nyaa",
+    "avatar": "b3b24c6d7cbcdec129d5d537067061a8",
+    "discriminator": "0",
+    "public_flags": 64,
+    "avatar_decoration_data": None,
+    "primary_guild": None,
+    "clan": None,
+}
+MEMBER_PAYLOAD = {
+    "nick": "foobarbaz",
+    "roles": ["11111", "22222", "33333"],
+    "joined_at": "2015-04-26T06:26:56.936000+00:00",
+    "premium_since": None,
+    "deaf": False,
+    "mute": False,
+    "pending": False,
+    "flags": 0,
+    "communication_disabled_until": None,
+}
+MESSAGE_CREATE_PAYLOAD = {
+    "id": "123456789012345678",
+    "channel_id": "456456456456456456",
+    "guild_id": "678678678678678678",
+    "author": USER_PAYLOAD,
+    "member": MEMBER_PAYLOAD,
+    "content": "Hello there, this is a message",
+    "timestamp": "2020-03-21T21:20:16.510000+00:00",
+    "edited_timestamp": None,
+    "tts": False,
+    "mention_everyone": False,
+    "mentions": [],
+    "mention_roles": [],
+    "attachments": [],
+    "embeds": [],
+    "pinned": False,
+    "type": 0,
+    "flags": 0,
+    "nonce": "171000788183678976",
+    "components": [],
+}
+PRESENCE_UPDATE_PAYLOAD = {
+    "user": {"id": "115590097100865541"},
+    "guild_id": "678678678678678678",
+    "status": "online",
+    "activities": [{"name": "Custom Status", "type": 4, "created_at": 1600000000000, "state": "Benchmarking"}],
+    "client_status": {"desktop": "online"},
+}
+GUILD_MEMBER_UPDATE_PAYLOAD = {**MEMBER_PAYLOAD, "user": USER_PAYLOAD, "guild_id": "678678678678678678"}
+TYPING_START_PAYLOAD = {
+    "channel_id": "456456456456456456",
+    "guild_id": "678678678678678678",
+    "user_id": "115590097100865541",
+    "timestamp": 1600000000,
+    "member": {**MEMBER_PAYLOAD, "user": USER_PAYLOAD},
+}
+
+
+def _frame(name: str, payload: data_binding.JSONObject) -> bytes:
+    return data_binding.default_json_dumps({"t": name, "s": 42, "op": 0, "d": payload})
+
+
+shard = mock.Mock()
+regular_app = mock.Mock(entity_factory=entity_factory.EntityFactoryImpl(mock.Mock()))
+fast_app = mock.Mock(entity_factory=entity_factory.EntityFactoryImpl(mock.Mock(), fast_paths=True))
+pipelines = {
+    "Regular": (data_binding.default_json_loads, event_factory.EventFactoryImpl(regular_app)),
+    "Fast paths": (data_binding.default_json_loads, event_factory.EventFactoryImpl(fast_app)),
+    "Typed decoder": (typed_decoding.TypedGatewayDecoder(), event_factory.EventFactoryImpl(regular_app)),
+    "Typed decoder and fast paths": (typed_decoding.TypedGatewayDecoder(), event_factory.EventFactoryImpl(fast_app)),
+}
+cases = {
+    "MESSAGE_CREATE": (MESSAGE_CREATE_PAYLOAD, "deserialize_message_create_event"),
+    "PRESENCE_UPDATE": (PRESENCE_UPDATE_PAYLOAD, "deserialize_presence_update_event"),
+    "GUILD_MEMBER_UPDATE": (GUILD_MEMBER_UPDATE_PAYLOAD, "deserialize_guild_member_update_event"),
+    "TYPING_START": (TYPING_START_PAYLOAD, "deserialize_typing_start_event"),
+}
+
+
+def run(loads: data_binding.JSONDecoder, factory: event_factory.EventFactoryImpl, method: str, raw: bytes) -> object:
+    payload = loads(raw)
+    assert isinstance(payload, dict)
+    return getattr(factory, method)(shard, payload["d"])
+
+
+for name, (payload, method) in cases.items():
+    raw = _frame(name, payload)
+    times: dict[str, list[float]] = {pipeline: [] for pipeline in pipelines}
+    # Interleave the pipelines so that they are equally affected by noise.
+    for _ in range(5):
+        for pipeline, (loads, factory) in pipelines.items():
+            times[pipeline].append(timeit.timeit(functools.partial(run, loads, factory, method, raw), number=NUMBER))
+
+    print(name)
+    regular_time = min(times["Regular"])
+    for pipeline, pipeline_times in times.items():
+        time = min(pipeline_times)
+        print(f"    {pipeline}", NUMBER / time, "per second", f"({regular_time / time:.2f}x)")
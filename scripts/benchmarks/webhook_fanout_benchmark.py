@@ -0,0 +1,194 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark broadcasting a message to many webhooks.
+
+A fake Discord HTTP server is started in a subprocess, which reads each
+request and replies with a message. The same message, with an embed,
+components and a file attachment, is then sent to every webhook by calling
+`execute_webhook` for each of them concurrently and by `execute_webhooks`.
+
+This reports the wall time and the CPU time used by the client. The server runs
+on the same host, so only the relative results are meaningful.
+
+Usage: webhook_fanout_benchmark.py [webhooks] [attachment KiB] [repeat]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import pathlib
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import aiohttp
+import aiohttp.web
+
+import hikari
+from hikari.impl import config
+from hikari.impl import special_endpoints
+
+WEBHOOKS = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1] != "--serve" else 200
+ATTACHMENT_SIZE = int(sys.argv[2]) * 1024 if len(sys.argv) > 2 and sys.argv[1] != "--serve" else 256 * 1024
+REPEAT = int(sys.argv[3]) if len(sys.argv) > 3 and sys.argv[1] != "--serve" else 3
+CONCURRENCY = 50
+
+MESSAGE_PAYLOAD = json.dumps(
+    {
+        "id": "123456789012345678",
+        "channel_id": "43123123",
+        "webhook_id": "1",
+        "author": {"id": "1", "username": "Announcements", "discriminator": "0000", "avatar": None, "bot": True},
+        "content": "Release notes",
+        "timestamp": "2020-03-21T21:20:16.510000+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+        "flags": 0,
+    }
+).encode()
+
+
+def serve(port: int) -> None:
+    async def execute(request: aiohttp.web.Request) -> aiohttp.web.Response:
+        await request.read()
+        return aiohttp.web.Response(body=MESSAGE_PAYLOAD, content_type="application/json")
+
+    app = aiohttp.web.Application(client_max_size=ATTACHMENT_SIZE * 4 + 1024 * 1024)
+    app.add_routes([aiohttp.web.post("/api/v10/webhooks/{webhook}/{token}", execute)])
+    aiohttp.web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+def make_message_kwargs(attachment: pathlib.Path) -> dict[str, object]:
+    embed = hikari.Embed(title="Release notes", description="Everything which changed this week.", color=0x5865F2)
+    for index in range(10):
+        embed.add_field(f"Change {index}", "A short description of what changed and why.")
+
+    row = special_endpoints.MessageActionRowBuilder()
+    for index in range(5):
+        row.add_link_button(f"https://example.com/changes/{index}", label=f"Change {index}")
+
+    return {
+        "content": "Release notes",
+        "embed": embed,
+        "components": [row],
+        "attachment": hikari.File(attachment),
+        "username": "Announcements",
+    }
+
+
+async def wait_for_server(port: int) -> None:
+    for _ in range(300):
+        with contextlib.suppress(OSError):
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+
+        await asyncio.sleep(0.1)
+
+    msg = "Fake server didn't start"
+    raise RuntimeError(msg)
+
+
+async def run(port: int, attachment: pathlib.Path, *, fan_out: bool) -> tuple[float, float]:
+    rest = hikari.impl.RESTClientImpl(
+        cache=None,
+        entity_factory=hikari.impl.EntityFactoryImpl(hikari.RESTApp()),
+        executor=None,
+        http_settings=config.HTTPSettings(),
+        proxy_settings=config.ProxySettings(),
+        token=None,
+        token_type=None,
+        rest_url=f"http://127.0.0.1:{port}/api/v10",
+    )
+    rest.start()
+    targets = [(webhook_id, f"token{webhook_id}") for webhook_id in range(1, WEBHOOKS + 1)]
+    kwargs = make_message_kwargs(attachment)
+    try:
+        start, cpu_start = time.perf_counter(), time.process_time()
+        if fan_out:
+            async for _, result in rest.execute_webhooks(targets, max_concurrency=CONCURRENCY, **kwargs):
+                assert isinstance(result, hikari.Message), result
+
+        else:
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+
+            async def execute(webhook_id: int, token: str) -> None:
+                async with semaphore:
+                    await rest.execute_webhook(webhook_id, token, **kwargs)
+
+            await asyncio.gather(*(execute(webhook_id, token) for webhook_id, token in targets))
+
+        return time.perf_counter() - start, time.process_time() - cpu_start
+
+    finally:
+        await rest.close()
+
+
+def main() -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = subprocess.Popen(  # noqa: S603 - Only runs this script
+        [sys.executable, __file__, "--serve", str(port)], env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    )
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            attachment = pathlib.Path(directory) / "notes.bin"
+            attachment.write_bytes(os.urandom(ATTACHMENT_SIZE))
+            asyncio.run(wait_for_server(port))
+
+            cases = {"execute_webhook for each": False, "execute_webhooks": True}
+            times: dict[str, list[tuple[float, float]]] = {case: [] for case in cases}
+            # Interleave the cases so that they are equally affected by noise.
+            for _ in range(REPEAT):
+                for case, fan_out in cases.items():
+                    times[case].append(asyncio.run(run(port, attachment, fan_out=fan_out)))
+
+    finally:
+        server.terminate()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            server.wait(timeout=30)
+
+    print(f"{WEBHOOKS} webhooks, {ATTACHMENT_SIZE // 1024}KiB attachment, {CONCURRENCY} at once, best of {REPEAT}")
+    for case, case_times in times.items():
+        elapsed, cpu = min(case_times)
+        rate = WEBHOOKS / elapsed
+        print(f"    {case}: {elapsed * 1_000:.0f}ms ({rate:,.0f} webhooks/s), client CPU {cpu * 1_000:.0f}ms")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--serve"]:
+        serve(int(sys.argv[2]))
+    else:
+        main()
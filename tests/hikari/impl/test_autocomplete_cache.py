@@ -0,0 +1,197 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import mock
+import pytest
+
+from hikari import commands
+from hikari.impl import autocomplete_cache
+from hikari.impl import special_endpoints
+from hikari.interactions import command_interactions
+
+
+def make_interaction(value, *, name="colour", subcommand=None, guild_id=None, focused=True):
+    options = [
+        command_interactions.AutocompleteInteractionOption(
+            name="name", type=commands.OptionType.STRING, value=value, options=None, is_focused=focused
+        )
+    ]
+    if subcommand is not None:
+        options = [
+            command_interactions.AutocompleteInteractionOption(
+                name=subcommand, type=commands.OptionType.SUB_COMMAND, value=None, options=options
+            )
+        ]
+
+    return mock.Mock(command_name=name, options=options, guild_id=guild_id)
+
+
+def make_choices(*names):
+    return [special_endpoints.AutocompleteChoiceBuilder(name=name, value=name) for name in names]
+
+
+def starts_with(choice, value):
+    return choice.name.startswith(value)
+
+
+class TestAutocompleteCache:
+    @pytest.fixture
+    def cache(self):
+        return autocomplete_cache.AutocompleteCache()
+
+    @pytest.mark.parametrize(("ttl", "max_entries"), [(0, 1), (-1, 1), (1, 0)])
+    def test_init_when_invalid(self, ttl, max_entries):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            autocomplete_cache.AutocompleteCache(ttl=ttl, max_entries=max_entries)
+
+    def test_get_when_cached(self, cache):
+        choices = make_choices("blue", "brown")
+        cache.put(make_interaction("b"), choices)
+
+        assert cache.get(make_interaction("b")) == tuple(choices)
+
+    def test_get_when_not_cached(self, cache):
+        cache.put(make_interaction("b"), make_choices("blue"))
+
+        assert cache.get(make_interaction("bl")) is None
+        assert cache.get(make_interaction("b", name="fruit")) is None
+        assert cache.get(make_interaction("b", subcommand="set")) is None
+
+    def test_get_for_subcommand(self, cache):
+        choices = make_choices("blue")
+        cache.put(make_interaction("b", subcommand="set"), choices)
+
+        assert cache.get(make_interaction("b", subcommand="set")) == tuple(choices)
+
+    def test_put_and_get_without_focused_option(self, cache):
+        cache.put(make_interaction("b", focused=False), make_choices("blue"))
+
+        assert len(cache) == 0
+        assert cache.get(make_interaction("b", focused=False)) is None
+
+    def test_get_when_per_guild(self):
+        cache = autocomplete_cache.AutocompleteCache(per_guild=True)
+        choices = make_choices("blue")
+        cache.put(make_interaction("b", guild_id=123), choices)
+
+        assert cache.get(make_interaction("b", guild_id=123)) == tuple(choices)
+        assert cache.get(make_interaction("b", guild_id=456)) is None
+
+    def test_get_when_not_per_guild(self, cache):
+        choices = make_choices("blue")
+        cache.put(make_interaction("b", guild_id=123), choices)
+
+        assert cache.get(make_interaction("b", guild_id=456)) == tuple(choices)
+
+    def test_get_when_expired(self):
+        cache = autocomplete_cache.AutocompleteCache(ttl=10)
+
+        with mock.patch.object(autocomplete_cache.time, "perf_counter", return_value=100):
+            cache.put(make_interaction("b"), make_choices("blue"))
+
+        with mock.patch.object(autocomplete_cache.time, "perf_counter", return_value=111):
+            assert cache.get(make_interaction("b")) is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_removed_first(self):
+        cache = autocomplete_cache.AutocompleteCache(max_entries=2)
+        cache.put(make_interaction("a"), make_choices("amber"))
+        cache.put(make_interaction("b"), make_choices("blue"))
+        cache.get(make_interaction("a"))
+
+        cache.put(make_interaction("c"), make_choices("cyan"))
+
+        assert len(cache) == 2
+        assert cache.get(make_interaction("b")) is None
+        assert cache.get(make_interaction("a")) is not None
+        assert cache.get(make_interaction("c")) is not None
+
+    def test_get_from_superset(self):
+        cache = autocomplete_cache.AutocompleteCache(match=starts_with)
+        blue, brown, black, cyan = make_choices("blue", "brown", "black", "cyan")
+        cache.put(make_interaction(""), [blue, brown, black, cyan])
+
+        assert cache.get(make_interaction("bl")) == (blue, black)
+        assert cache.get(make_interaction("blu")) == (blue,)
+        assert len(cache) == 3
+
+    def test_get_from_superset_keeps_expiry_of_superset(self):
+        cache = autocomplete_cache.AutocompleteCache(ttl=10, match=starts_with)
+
+        with mock.patch.object(autocomplete_cache.time, "perf_counter", return_value=100):
+            cache.put(make_interaction("b"), make_choices("blue", "brown"))
+
+        with mock.patch.object(autocomplete_cache.time, "perf_counter", return_value=105):
+            assert cache.get(make_interaction("bl")) is not None
+
+        with mock.patch.object(autocomplete_cache.time, "perf_counter", return_value=111):
+            assert cache.get(make_interaction("bl")) is None
+
+    def test_get_from_superset_when_superset_was_cut_short(self):
+        cache = autocomplete_cache.AutocompleteCache(match=starts_with)
+        cache.put(make_interaction("b"), make_choices(*(f"b{i}" for i in range(25))))
+
+        assert cache.get(make_interaction("b1")) is None
+
+    def test_get_from_superset_without_match(self, cache):
+        cache.put(make_interaction("b"), make_choices("blue"))
+
+        assert cache.get(make_interaction("bl")) is None
+
+    def test_clear(self, cache):
+        cache.put(make_interaction("b"), make_choices("blue"))
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_wrap_when_not_cached(self, cache):
+        interaction = make_interaction("b")
+        response = special_endpoints.InteractionAutocompleteBuilder(make_choices("blue"))
+        listener = mock.AsyncMock(return_value=response)
+
+        assert await cache.wrap(listener)(interaction) is response
+
+        listener.assert_awaited_once_with(interaction)
+        assert cache.get(make_interaction("b")) == tuple(response.choices)
+
+    @pytest.mark.asyncio
+    async def test_wrap_when_cached(self, cache):
+        interaction = make_interaction("b")
+        choices = make_choices("blue")
+        cache.put(interaction, choices)
+        listener = mock.AsyncMock()
+
+        assert await cache.wrap(listener)(interaction) is interaction.build_response.return_value
+
+        listener.assert_not_called()
+        interaction.build_response.assert_called_once_with(tuple(choices))
+
+    @pytest.mark.asyncio
+    async def test_wrap_when_listener_returns_none(self, cache):
+        listener = mock.AsyncMock(return_value=None)
+
+        assert await cache.wrap(listener)(make_interaction("b")) is None
+
+        assert len(cache) == 0
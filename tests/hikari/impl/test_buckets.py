@@ -112,6 +112,31 @@ def test_update_rate_limit_when_period_far_apart(self, compiled_route):
         assert bucket.period == 2.25
         assert bucket._out_of_sync is False
 
+    def test_get_time_until_increase_when_not_rate_limited(self, compiled_route):
+        bucket = buckets.RESTBucket("spaghetti", compiled_route, mock.Mock(), float("inf"))
+        bucket.remaining = 1
+
+        assert bucket.get_time_until_increase(time.time()) == 0.0
+
+    def test_get_time_until_increase_when_rate_limited(self, compiled_route):
+        bucket = buckets.RESTBucket("spaghetti", compiled_route, mock.Mock(), float("inf"))
+        bucket.remaining = 0
+        bucket.move_at = 12123125
+
+        assert bucket.get_time_until_increase(12123123) == 2
+
+    def test_get_time_until_increase_when_out_of_sync(self, compiled_route):
+        bucket = buckets.RESTBucket("spaghetti", compiled_route, mock.Mock(), float("inf"))
+        bucket.remaining = 0
+        bucket.limit = 5
+        bucket.period = 5
+        bucket.move_at = 12123122
+        bucket._out_of_sync = True
+        bucket._is_fixed = True
+
+        assert bucket.get_time_until_increase(12123123) == 4
+        assert bucket.remaining == 0
+
     @pytest.mark.asyncio
     async def test_acquire_when_too_long_ratelimit(self, compiled_route):
         bucket = buckets.RESTBucket("spaghetti", compiled_route, mock.Mock(), 60)
@@ -25,6 +25,7 @@
 import mock
 import pytest
 
+from hikari import channels
 from hikari import embeds
 from hikari import emojis
 from hikari import guilds
@@ -40,6 +41,7 @@
 from hikari.api import config as config_api
 from hikari.impl import cache as cache_impl_
 from hikari.impl import config
+from hikari.impl import entity_factory
 from hikari.internal import cache as cache_utilities
 from hikari.internal import collections
 from tests.hikari import hikari_test_helpers
@@ -69,6 +71,14 @@ def test__init___(self, app_impl):
 
         create_cache.assert_called_once_with()
 
+    def test__create_cache_creates_new_intern_pools(self, cache_impl):
+        intern_pools = cache_impl._intern_pools
+
+        cache_impl._create_cache()
+
+        assert isinstance(cache_impl._intern_pools, cache_utilities.InternPools)
+        assert cache_impl._intern_pools is not intern_pools
+
     def test__is_cache_enabled_for(self, cache_impl):
         cache_impl._settings.components = config_api.CacheComponents.MESSAGES | config_api.CacheComponents.GUILDS
 
@@ -1244,6 +1254,88 @@ def test_set_guild_availability_for_uncached_guild(self, cache_impl):
 
         assert 452234123 not in cache_impl._guild_entries
 
+    def test_get_guild_version(self, cache_impl):
+        cache_impl._guild_entries = collections.FreezableDict(
+            {snowflakes.Snowflake(54123): cache_utilities.GuildRecord(version=b"version")}
+        )
+
+        assert cache_impl.get_guild_version(StubModel(54123)) == b"version"
+
+    def test_get_guild_version_for_unknown_guild(self, cache_impl):
+        assert cache_impl.get_guild_version(StubModel(54123)) is None
+
+    def test_set_guild_version(self, cache_impl):
+        guild_record = cache_utilities.GuildRecord(guild=object())
+        cache_impl._guild_entries = collections.FreezableDict({snowflakes.Snowflake(54123): guild_record})
+
+        cache_impl.set_guild_version(StubModel(54123), b"version")
+
+        assert guild_record.version == b"version"
+
+    def test_set_guild_version_for_unknown_guild(self, cache_impl):
+        cache_impl.set_guild_version(StubModel(54123), b"version")
+
+        assert 54123 not in cache_impl._guild_entries
+
+    def test_set_role_invalidates_guild_version(self, cache_impl):
+        guild_record = cache_utilities.GuildRecord(guild=object(), version=b"version")
+        cache_impl._guild_entries = collections.FreezableDict({snowflakes.Snowflake(54123): guild_record})
+
+        cache_impl.set_role(mock.Mock(guilds.Role, id=snowflakes.Snowflake(123), guild_id=snowflakes.Snowflake(54123)))
+
+        assert guild_record.version is None
+
+    def test_snapshot_round_trip(self, cache_impl, app_impl):
+        role = entity_factory.EntityFactoryImpl(app_impl).deserialize_role(
+            {
+                "id": "123",
+                "name": "@everyone",
+                "color": 0,
+                "hoist": False,
+                "position": 0,
+                "permissions": "0",
+                "managed": False,
+                "mentionable": False,
+                "flags": 0,
+            },
+            guild_id=snowflakes.Snowflake(54123),
+        )
+        cache_impl.set_role(role)
+        cache_impl.set_guild_version(54123, b"version")
+        other_cache = cache_impl_.CacheImpl(app_impl, config.CacheSettings())
+
+        other_cache.load_snapshot(cache_impl.dump_snapshot())
+
+        assert other_cache.get_role(123) == role
+        assert other_cache.get_role(123).app is app_impl
+        assert other_cache.get_roles_view_for_guild(54123) == {123: role}
+        assert other_cache.get_guild_version(54123) == b"version"
+
+    def test_load_snapshot_when_components_differ(self, cache_impl, app_impl):
+        cache_impl._guild_entries = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(54123): cache_utilities.GuildRecord(
+                    channels=collections.SnowflakeSet(123), roles=collections.SnowflakeSet(54123), version=b"version"
+                )
+            }
+        )
+        other_cache = cache_impl_.CacheImpl(
+            app_impl, config.CacheSettings(components=config_api.CacheComponents.GUILD_CHANNELS)
+        )
+
+        other_cache.load_snapshot(cache_impl.dump_snapshot())
+
+        guild_record = other_cache._guild_entries[snowflakes.Snowflake(54123)]
+        assert list(guild_record.channels) == [123]
+        assert guild_record.roles is None
+        assert guild_record.version is None
+
+    def test_load_snapshot_when_incompatible_version(self, cache_impl, app_impl):
+        snapshot = cache_utilities.dump_snapshot((0, "0.0.0"), app=app_impl)
+
+        with pytest.raises(ValueError, match="incompatible version of hikari"):
+            cache_impl.load_snapshot(snapshot)
+
     @pytest.mark.skip(reason="TODO")
     def test_update_guild(self, cache_impl): ...
 
@@ -1262,8 +1354,71 @@ def test_get_guild_channel(self, cache_impl): ...
     @pytest.mark.skip(reason="TODO")
     def test_get_guild_channels_view(self, cache_impl): ...
 
-    @pytest.mark.skip(reason="TODO")
-    def test_get_guild_channels_view_for_guild(self, cache_impl): ...
+    def test_get_guild_channels_view_for_guild(self, cache_impl):
+        mock_category = mock.Mock(
+            channels.GuildCategory, id=snowflakes.Snowflake(10), guild_id=snowflakes.Snowflake(5), position=0
+        )
+        mock_voice_channel = mock.Mock(
+            channels.GuildVoiceChannel,
+            id=snowflakes.Snowflake(1),
+            guild_id=snowflakes.Snowflake(5),
+            position=0,
+            parent_id=snowflakes.Snowflake(10),
+        )
+        mock_text_channel = mock.Mock(
+            channels.GuildTextChannel,
+            id=snowflakes.Snowflake(2),
+            guild_id=snowflakes.Snowflake(5),
+            position=1,
+            parent_id=snowflakes.Snowflake(10),
+        )
+        mock_other_text_channel = mock.Mock(
+            channels.GuildTextChannel,
+            id=snowflakes.Snowflake(3),
+            guild_id=snowflakes.Snowflake(5),
+            position=0,
+            parent_id=None,
+        )
+
+        with mock.patch.object(cache_utilities, "copy_guild_channel", side_effect=lambda channel: channel):
+            for channel in (mock_voice_channel, mock_text_channel, mock_category, mock_other_text_channel):
+                cache_impl.set_guild_channel(channel)
+
+            result = cache_impl.get_guild_channels_view_for_guild(StubModel(5))
+
+            assert list(result.keys()) == [3, 10, 2, 1]
+            assert list(result.values()) == [
+                mock_other_text_channel,
+                mock_category,
+                mock_text_channel,
+                mock_voice_channel,
+            ]
+
+    def test_get_guild_channels_view_for_guild_reuses_order_until_changed(self, cache_impl):
+        mock_channel = mock.Mock(
+            channels.GuildTextChannel,
+            id=snowflakes.Snowflake(1),
+            guild_id=snowflakes.Snowflake(5),
+            position=0,
+            parent_id=None,
+            permission_overwrites={},
+        )
+        cache_impl.set_guild_channel(mock_channel)
+        channel_order = cache_impl._guild_entries[snowflakes.Snowflake(5)].channel_order
+
+        cache_impl.get_guild_channels_view_for_guild(5)
+        sorted_channels = channel_order.sorted_channels
+        cache_impl.get_guild_channels_view_for_guild(5)
+
+        assert channel_order.sorted_channels is sorted_channels
+
+        cache_impl.delete_guild_channel(1)
+
+        assert 5 not in cache_impl._guild_entries
+        assert cache_impl.get_guild_channels_view_for_guild(5) == {}
+
+    def test_get_guild_channels_view_for_guild_for_unknown_guild(self, cache_impl):
+        assert cache_impl.get_guild_channels_view_for_guild(StubModel(5)) == {}
 
     @pytest.mark.skip(reason="TODO")
     def test_set_guild_channel(self, cache_impl): ...
@@ -2302,6 +2457,108 @@ def test_set_member_doesnt_increment_user_ref_count_for_pre_cached_member(self,
         cache_impl._set_user.assert_called_once_with(mock_user)
         cache_impl._increment_user_ref_count.assert_not_called()
 
+    def test_set_members_from_payloads(self, cache_impl, app_impl):
+        app_impl.entity_factory = entity_factory.EntityFactoryImpl(app_impl)
+        payloads = [
+            {
+                "user": {"id": str(user_id), "username": "nyaa", "discriminator": "0", "avatar": None},
+                "nick": "nick",
+                "roles": ["11111"],
+                "joined_at": "2015-04-26T06:26:56.936000+00:00",
+                "deaf": False,
+                "mute": False,
+            }
+            for user_id in (1234, 5678)
+        ]
+
+        cache_impl.set_members_from_payloads(snowflakes.Snowflake(54123), payloads)
+
+        members = cache_impl.get_members_view_for_guild(54123)
+        assert list(members.keys()) == [1234, 5678]
+        for payload in payloads:
+            expected = app_impl.entity_factory.deserialize_member(payload, guild_id=snowflakes.Snowflake(54123))
+            assert members[expected.id] == expected
+            assert cache_impl._user_entries[expected.id].ref_count == 1
+
+    def test_set_members_from_payloads_for_pre_cached_member(self, cache_impl, app_impl):
+        app_impl.entity_factory = entity_factory.EntityFactoryImpl(app_impl)
+        payload = {
+            "user": {"id": "1234", "username": "nyaa", "discriminator": "0", "avatar": None},
+            "roles": [],
+            "joined_at": None,
+        }
+
+        cache_impl.set_members_from_payloads(snowflakes.Snowflake(54123), [payload])
+        cache_impl.set_members_from_payloads(snowflakes.Snowflake(54123), [{**payload, "nick": "new"}])
+
+        assert cache_impl.get_member(54123, 1234).nickname == "new"
+        assert cache_impl._user_entries[snowflakes.Snowflake(1234)].ref_count == 1
+
+    def test_set_members_from_payloads_when_user_identity_map_enabled(self, cache_impl, app_impl):
+        app_impl.entity_factory = entity_factory.EntityFactoryImpl(app_impl, user_identity_map_size=10)
+        user_payload = {"id": "1234", "username": "nyaa", "discriminator": "0", "avatar": None}
+        shared_user = app_impl.entity_factory.deserialize_user(user_payload)
+
+        cache_impl.set_members_from_payloads(
+            snowflakes.Snowflake(54123), [{"user": user_payload, "roles": [], "joined_at": None}]
+        )
+
+        assert cache_impl._user_entries[snowflakes.Snowflake(1234)].object == shared_user
+        assert cache_impl._user_entries[snowflakes.Snowflake(1234)].object is not shared_user
+
+    def test_set_members_from_payloads_uses_entity_factory(self, cache_impl, app_impl):
+        user = users.UserImpl(
+            id=snowflakes.Snowflake(1234),
+            app=app_impl,
+            discriminator="0",
+            username="nyaa",
+            global_name=None,
+            avatar_decoration=None,
+            primary_guild=None,
+            avatar_hash=None,
+            banner_hash=None,
+            accent_color=None,
+            is_bot=False,
+            is_system=False,
+            flags=users.UserFlag.NONE,
+        )
+        app_impl.entity_factory.deserialize_user.return_value = user
+        app_impl.entity_factory.deserialize_member.return_value = guilds.Member(
+            user=user,
+            guild_id=snowflakes.Snowflake(54123),
+            role_ids=[snowflakes.Snowflake(54123)],
+            joined_at=None,
+            nickname="nick",
+            guild_avatar_decoration=None,
+            guild_avatar_hash=None,
+            guild_banner_hash=None,
+            premium_since=None,
+            is_deaf=False,
+            is_mute=False,
+            is_pending=undefined.UNDEFINED,
+            raw_communication_disabled_until=None,
+            guild_flags=guilds.GuildMemberFlags.NONE,
+        )
+        payload = {"user": {"id": "1234"}, "roles": [], "joined_at": None}
+
+        cache_impl.set_members_from_payloads(snowflakes.Snowflake(54123), [payload])
+
+        app_impl.entity_factory.deserialize_user.assert_called_once_with({"id": "1234"})
+        app_impl.entity_factory.deserialize_member.assert_called_once_with(
+            payload, user=user, guild_id=snowflakes.Snowflake(54123)
+        )
+        assert cache_impl.get_member(54123, 1234).nickname == "nick"
+        assert cache_impl._user_entries[snowflakes.Snowflake(1234)].object == user
+        assert cache_impl._user_entries[snowflakes.Snowflake(1234)].object is not user
+
+    def test_set_members_from_payloads_when_not_enabled(self, app_impl):
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(components=config_api.CacheComponents.NONE))
+
+        cache_impl.set_members_from_payloads(snowflakes.Snowflake(54123), [{"user": {"id": "1234"}}])
+
+        app_impl.entity_factory.deserialize_user.assert_not_called()
+        assert cache_impl._guild_entries == {}
+
     def test_update_member(self, cache_impl):
         mock_old_cached_member = mock.Mock(guilds.Member)
         mock_new_cached_member = mock.Mock(guilds.Member)
@@ -3007,6 +3264,110 @@ def test_get_messages_view(self, cache_impl):
             [mock.call(mock_message_data_1), mock.call(mock_message_data_2), mock.call(mock_message_data_3)]
         )
 
+    def test_get_messages_view_for_channel(self, cache_impl):
+        mock_message_data_1 = object()
+        mock_message_data_2 = object()
+        mock_message_data_3 = object()
+        mock_message_1 = object()
+        mock_message_2 = object()
+        cache_impl._build_message = mock.Mock(side_effect=[mock_message_1, mock_message_2])
+        cache_impl._message_entries = collections.FreezableDict(
+            {
+                snowflakes.Snowflake(451231): mock_message_data_2,
+                snowflakes.Snowflake(32123): mock_message_data_1,
+                snowflakes.Snowflake(511231): mock_message_data_3,
+            }
+        )
+        cache_impl._channel_message_ids = collections.FreezableDict(
+            {snowflakes.Snowflake(6543): collections.SnowflakeSet(451231, 32123, 511231)}
+        )
+
+        result = cache_impl.get_messages_view_for_channel(StubModel(6543), before=511231)
+
+        assert list(result.items()) == [(32123, mock_message_1), (451231, mock_message_2)]
+        cache_impl._build_message.assert_has_calls([mock.call(mock_message_data_1), mock.call(mock_message_data_2)])
+
+    def test_get_messages_view_for_channel_with_datetime_and_limit(self, cache_impl):
+        timestamp = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+        old_id = snowflakes.Snowflake.from_datetime(timestamp - datetime.timedelta(days=1))
+        new_id_1 = snowflakes.Snowflake.from_datetime(timestamp + datetime.timedelta(days=1))
+        new_id_2 = snowflakes.Snowflake.from_datetime(timestamp + datetime.timedelta(days=2))
+        new_id_3 = snowflakes.Snowflake.from_datetime(timestamp + datetime.timedelta(days=3))
+        cache_impl._build_message = mock.Mock(side_effect=lambda data: data)
+        cache_impl._message_entries = collections.FreezableDict(
+            {old_id: "old", new_id_1: "new 1", new_id_2: "new 2", new_id_3: "new 3"}
+        )
+        cache_impl._channel_message_ids = collections.FreezableDict(
+            {snowflakes.Snowflake(6543): collections.SnowflakeSet(old_id, new_id_1, new_id_2, new_id_3)}
+        )
+
+        result = cache_impl.get_messages_view_for_channel(6543, after=timestamp, limit=2)
+
+        assert list(result.items()) == [(new_id_2, "new 2"), (new_id_3, "new 3")]
+
+    def test_get_messages_view_for_channel_for_unknown_channel(self, cache_impl):
+        result = cache_impl.get_messages_view_for_channel(StubModel(6543))
+
+        assert result == {}
+
+    def test_set_message_indexes_message_by_channel(self, cache_impl):
+        cache_impl._set_message = mock.Mock()
+        cache_impl._index_channel_message = mock.Mock()
+        message = mock.Mock(id=snowflakes.Snowflake(4321), channel_id=snowflakes.Snowflake(1234))
+
+        cache_impl.set_message(message)
+
+        cache_impl._set_message.assert_called_once_with(message, is_reference=False)
+        cache_impl._index_channel_message.assert_called_once_with(1234, 4321)
+
+    def test__index_channel_message(self, cache_impl):
+        cache_impl._index_channel_message(snowflakes.Snowflake(1234), snowflakes.Snowflake(4321))
+
+        assert list(cache_impl._channel_message_ids[snowflakes.Snowflake(1234)]) == [4321]
+
+    def test__index_channel_message_when_channel_limit_reached(self, cache_impl):
+        cache_impl._settings.max_messages_per_channel = 2
+        cache_impl._on_message_expire = mock.Mock()
+        mock_message_data = object()
+        cache_impl._message_entries[snowflakes.Snowflake(100)] = mock_message_data
+        cache_impl._message_entries[snowflakes.Snowflake(200)] = object()
+        cache_impl._message_entries[snowflakes.Snowflake(300)] = object()
+        cache_impl._channel_message_ids[snowflakes.Snowflake(1234)] = collections.SnowflakeSet(100, 200)
+
+        cache_impl._index_channel_message(snowflakes.Snowflake(1234), snowflakes.Snowflake(300))
+
+        assert list(cache_impl._channel_message_ids[snowflakes.Snowflake(1234)]) == [200, 300]
+        assert snowflakes.Snowflake(100) not in cache_impl._message_entries
+        cache_impl._on_message_expire.assert_called_once_with(mock_message_data)
+
+    def test__unindex_channel_message(self, cache_impl):
+        cache_impl._channel_message_ids[snowflakes.Snowflake(1234)] = collections.SnowflakeSet(100, 200)
+
+        cache_impl._unindex_channel_message(
+            mock.Mock(id=snowflakes.Snowflake(100), channel_id=snowflakes.Snowflake(1234))
+        )
+
+        assert list(cache_impl._channel_message_ids[snowflakes.Snowflake(1234)]) == [200]
+
+    def test__unindex_channel_message_removes_empty_channel(self, cache_impl):
+        cache_impl._channel_message_ids[snowflakes.Snowflake(1234)] = collections.SnowflakeSet(100)
+
+        cache_impl._unindex_channel_message(
+            mock.Mock(id=snowflakes.Snowflake(100), channel_id=snowflakes.Snowflake(1234))
+        )
+
+        assert snowflakes.Snowflake(1234) not in cache_impl._channel_message_ids
+
+    def test__on_message_expire_unindexes_message(self, cache_impl):
+        cache_impl._unindex_channel_message = mock.Mock()
+        cache_impl._garbage_collect_message = mock.Mock(return_value=object())
+        message = mock.Mock()
+
+        cache_impl._on_message_expire(message)
+
+        cache_impl._unindex_channel_message.assert_called_once_with(message.object)
+        cache_impl._garbage_collect_message.assert_called_once_with(message)
+
     @pytest.mark.skip(reason="TODO")
     def test_set_message(self, cache_impl):
         raise NotImplementedError
@@ -3108,6 +3469,7 @@ def test_update_message_for_unknown_partial_message(self, cache_impl):
             ("get_members_view_for_guild", config_api.CacheComponents.MEMBERS, cache_utilities.EmptyCacheView()),
             ("get_message", config_api.CacheComponents.MESSAGES, None),
             ("get_messages_view", config_api.CacheComponents.MESSAGES, cache_utilities.EmptyCacheView()),
+            ("get_messages_view_for_channel", config_api.CacheComponents.MESSAGES, cache_utilities.EmptyCacheView()),
             ("get_presence", config_api.CacheComponents.PRESENCES, None),
             ("get_presences_view", config_api.CacheComponents.PRESENCES, cache_utilities.EmptyCacheView()),
             ("get_presences_view_for_guild", config_api.CacheComponents.PRESENCES, cache_utilities.EmptyCacheView()),
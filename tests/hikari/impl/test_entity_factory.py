@@ -20,9 +20,11 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import copy
 import datetime
 import typing
 
+import attrs
 import mock
 import pytest
 
@@ -60,8 +62,20 @@
 from hikari.interactions import command_interactions
 from hikari.interactions import component_interactions
 from hikari.interactions import modal_interactions
+from hikari.internal import attrs_extensions
+from hikari.internal import fast_deserializers
+from hikari.internal import ux
 from tests.hikari import hikari_test_helpers
 
+try:
+    import msgspec
+
+    from hikari.internal import gateway_records
+
+    msgspec_present = True
+except ModuleNotFoundError:
+    msgspec_present = False
+
 
 @pytest.fixture
 def permission_overwrite_payload():
@@ -390,6 +404,51 @@ def test__deserialize_max_age_returns_null():
     assert entity_factory._deserialize_max_age(0) is None
 
 
+# The fast path of each deserializer, the fixture holding a payload for it and where it is within the fixture.
+_FAST_PATH_FIXTURES: list[tuple[str, str, tuple[str | int, ...]]] = [
+    ("user", "user_payload", ()),
+    ("user", "alternative_user_payload", ()),
+    ("user", "owner_payload", ()),
+    ("user", "my_user_payload", ()),
+    ("user", "member_payload", ("user",)),
+    ("user", "message_payload", ("author",)),
+    ("user", "message_payload", ("mentions", 0)),
+    ("user", "referenced_message", ("author",)),
+    ("user", "known_custom_emoji_payload", ("user",)),
+    ("user", "guild_member_ban_payload", ("user",)),
+    ("user", "integration_payload", ("user",)),
+    ("user", "guild_sticker_payload", ("user",)),
+    ("user", "incoming_webhook_payload", ("user",)),
+    ("user", "dm_channel_payload", ("recipients", 0)),
+    ("member", "member_payload", ()),
+    ("member", "interaction_member_payload", ()),
+    ("member", "voice_state_payload", ("member",)),
+    ("member", "message_payload", ("member",)),
+    ("embed", "embed_payload", ()),
+    ("embed", "message_payload", ("embeds", 0)),
+    ("message", "message_payload", ()),
+    ("message", "referenced_message", ()),
+    ("message", "modal_interaction_payload", ("message",)),
+]
+
+
+def _entity_fields(entity: object) -> object:
+    # Entities only compare their IDs, so compare everything they hold instead.
+    if attrs.has(type(entity)):
+        return type(entity), {f.name: _entity_fields(getattr(entity, f.name)) for f in attrs.fields(type(entity))}
+
+    if isinstance(entity, embed_models.Embed):
+        return type(entity), {name: _entity_fields(getattr(entity, name)) for name in embed_models.Embed.__slots__}
+
+    if isinstance(entity, (list, tuple)):
+        return [_entity_fields(item) for item in entity]
+
+    if isinstance(entity, dict):
+        return {key: _entity_fields(value) for key, value in entity.items()}
+
+    return entity
+
+
 @pytest.fixture
 def mock_app() -> traits.RESTAware:
     return mock.Mock()
@@ -3511,6 +3570,13 @@ def test_deserialize_member(self, entity_factory_impl, mock_app, member_payload,
         assert member.guild_flags == guild_models.GuildMemberFlags.DID_REJOIN
         assert isinstance(member, guild_models.Member)
 
+    def test_deserialize_member_parses_timestamps_lazily(self, entity_factory_impl, member_payload):
+        member = entity_factory_impl.deserialize_member(member_payload, guild_id=snowflakes.Snowflake(76543325))
+
+        assert attrs_extensions.get_raw_field(member, "joined_at") == "2015-04-26T06:26:56.936000+00:00"
+        assert member.joined_at == datetime.datetime(2015, 4, 26, 6, 26, 56, 936000, tzinfo=datetime.timezone.utc)
+        assert attrs_extensions.get_raw_field(member, "joined_at") is member.joined_at
+
     def test_deserialize_member_when_guild_id_already_in_role_array(
         self, entity_factory_impl, mock_app, member_payload, user_payload
     ):
@@ -5052,7 +5118,10 @@ def test_deserialize_autocomplete_interaction(
         assert interaction.channel == entity_factory_impl._deserialize_interaction_channel(guild_text_channel_payload)
         assert interaction.guild_id == 43123123
         assert interaction.member is entity_factory_impl._deserialize_interaction_member.return_value
-        entity_factory_impl._deserialize_interaction_member.assert_called_once_with(member_payload, guild_id=43123123)
+        entity_factory_impl._deserialize_interaction_member.assert_called_once_with(
+            member_payload, guild_id=43123123, user=interaction.user
+        )
+        assert interaction.user == entity_factory_impl.deserialize_user(member_payload["user"])
         assert interaction.locale is locales.Locale.ES_ES
         assert interaction.guild_locale is locales.Locale.EN_US
         assert interaction.registered_guild_id == 12345678
@@ -5093,6 +5162,24 @@ def test_deserialize_autocomplete_interaction(
 
         assert isinstance(interaction, command_interactions.AutocompleteInteraction)
 
+    def test_deserialize_autocomplete_interaction_builds_member_and_channel_on_first_access(
+        self, entity_factory_impl, autocomplete_interaction_payload
+    ):
+        entity_factory_impl._deserialize_interaction_member = mock.Mock()
+        entity_factory_impl._deserialize_interaction_channel = mock.Mock()
+
+        interaction = entity_factory_impl.deserialize_autocomplete_interaction(autocomplete_interaction_payload)
+
+        entity_factory_impl._deserialize_interaction_member.assert_not_called()
+        entity_factory_impl._deserialize_interaction_channel.assert_not_called()
+        assert interaction.member is entity_factory_impl._deserialize_interaction_member.return_value
+        assert interaction.member is entity_factory_impl._deserialize_interaction_member.return_value
+        assert interaction.channel is entity_factory_impl._deserialize_interaction_channel.return_value
+        entity_factory_impl._deserialize_interaction_member.assert_called_once()
+        entity_factory_impl._deserialize_interaction_channel.assert_called_once_with(
+            autocomplete_interaction_payload["channel"]
+        )
+
     def test_deserialize_autocomplete_interaction_with_null_fields(
         self, entity_factory_impl, user_payload, autocomplete_interaction_payload
     ):
@@ -5420,6 +5507,47 @@ def test_deserialize_component_interaction_with_undefined_fields(
         assert interaction.guild_locale is None
         assert isinstance(interaction, component_interactions.ComponentInteraction)
 
+    def test_deserialize_component_interaction_builds_nested_entities_on_first_access(
+        self, entity_factory_impl, component_interaction_payload, interaction_resolved_data_payload, message_payload
+    ):
+        entity_factory_impl._deserialize_interaction_member = mock.Mock()
+        entity_factory_impl._deserialize_interaction_channel = mock.Mock()
+        entity_factory_impl._deserialize_resolved_option_data = mock.Mock()
+        entity_factory_impl.deserialize_message = mock.Mock()
+
+        interaction = entity_factory_impl.deserialize_component_interaction(component_interaction_payload)
+
+        entity_factory_impl._deserialize_interaction_member.assert_not_called()
+        entity_factory_impl._deserialize_interaction_channel.assert_not_called()
+        entity_factory_impl._deserialize_resolved_option_data.assert_not_called()
+        entity_factory_impl.deserialize_message.assert_not_called()
+        assert interaction.custom_id == "click_one"
+        assert interaction.resolved is entity_factory_impl._deserialize_resolved_option_data.return_value
+        assert interaction.message is entity_factory_impl.deserialize_message.return_value
+        assert interaction.message is entity_factory_impl.deserialize_message.return_value
+        entity_factory_impl._deserialize_resolved_option_data.assert_called_once_with(
+            interaction_resolved_data_payload, guild_id=290926798626357999
+        )
+        entity_factory_impl.deserialize_message.assert_called_once_with(message_payload)
+
+    def test_deserialize_component_interaction_eq_and_hash_dont_build_nested_entities(
+        self, entity_factory_impl, component_interaction_payload
+    ):
+        entity_factory_impl._deserialize_interaction_member = mock.Mock()
+        entity_factory_impl._deserialize_interaction_channel = mock.Mock()
+        entity_factory_impl._deserialize_resolved_option_data = mock.Mock()
+        entity_factory_impl.deserialize_message = mock.Mock()
+
+        interaction = entity_factory_impl.deserialize_component_interaction(component_interaction_payload)
+        other = entity_factory_impl.deserialize_component_interaction(component_interaction_payload)
+
+        assert interaction == other
+        assert hash(interaction) == hash(other)
+        entity_factory_impl._deserialize_interaction_member.assert_not_called()
+        entity_factory_impl._deserialize_interaction_channel.assert_not_called()
+        entity_factory_impl._deserialize_resolved_option_data.assert_not_called()
+        entity_factory_impl.deserialize_message.assert_not_called()
+
     @pytest.fixture
     def modal_interaction_payload(self, interaction_member_payload, message_payload, guild_text_channel_payload):
         return {
@@ -7404,6 +7532,317 @@ def test_deserialize_message_deserializes_old_stickers_field(self, entity_factor
         assert sticker.format_type is sticker_models.StickerFormatType.LOTTIE
         assert isinstance(sticker, sticker_models.PartialSticker)
 
+    ##############
+    # FAST PATHS #
+    ##############
+
+    def test_fast_paths_disabled_by_default(self, mock_app):
+        assert entity_factory.EntityFactoryImpl(mock_app)._fast_deserializers is None
+
+    def test_fast_paths(self, mock_app):
+        factory = entity_factory.EntityFactoryImpl(mock_app, fast_paths=True)
+
+        assert factory._fast_deserializers is fast_deserializers.get_fast_deserializers()
+
+    def test_fast_user_matches_regular(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast = fast_deserializers.get_fast_deserializers().user(factory, user_payload)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_user(user_payload))
+
+    def test_fast_user_matches_regular_with_unset_fields(self, mock_app):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        payload = {"id": "115590097100865541", "username": "nyaa", "avatar": None, "discriminator": "0"}
+        fast = fast_deserializers.get_fast_deserializers().user(factory, payload)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_user(payload))
+
+    def test_fast_member_matches_regular(self, mock_app, member_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast = fast_deserializers.get_fast_deserializers().member(
+            factory, member_payload, undefined.UNDEFINED, snowflakes.Snowflake(76543325)
+        )
+
+        expected = factory.deserialize_member(member_payload, guild_id=snowflakes.Snowflake(76543325))
+        assert _entity_fields(fast) == _entity_fields(expected)
+
+    def test_fast_member_matches_regular_with_passed_through_user_and_unset_fields(self, mock_app):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        user = mock.Mock()
+        payload = {"guild_id": "123", "roles": ["123", "456"], "joined_at": None}
+        fast = fast_deserializers.get_fast_deserializers().member(factory, payload, user, undefined.UNDEFINED)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_member(payload, user=user))
+
+    def test_fast_embed_matches_regular(self, mock_app, embed_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast = fast_deserializers.get_fast_deserializers().embed(factory, embed_payload)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_embed(embed_payload))
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {},
+            {"image": {}, "thumbnail": {}, "video": {"url": "https://x.com/v.mp4", "proxy_url": None}},
+            {"author": {"name": "a"}, "footer": {"text": "b", "icon_url": "https://x.com/i.png"}, "fields": []},
+        ],
+    )
+    def test_fast_embed_matches_regular_with_partial_payloads(self, mock_app, payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast = fast_deserializers.get_fast_deserializers().embed(factory, payload)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_embed(payload))
+
+    def test_fast_message_matches_regular(self, mock_app, message_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast = fast_deserializers.get_fast_deserializers().message(factory, message_payload)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_message(message_payload))
+
+    def test_fast_message_matches_regular_with_unset_fields(self, mock_app, referenced_message):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        referenced_message["stickers"] = []
+        fast = fast_deserializers.get_fast_deserializers().message(factory, referenced_message)
+
+        assert _entity_fields(fast) == _entity_fields(factory.deserialize_message(referenced_message))
+
+    @pytest.mark.parametrize(
+        ("method", "fast_path", "args"),
+        [
+            ("deserialize_user", "user", ()),
+            ("deserialize_member", "member", (undefined.UNDEFINED, undefined.UNDEFINED)),
+            ("deserialize_embed", "embed", ()),
+            ("deserialize_message", "message", ()),
+        ],
+    )
+    def test_fast_path_is_used(self, mock_app, method, fast_path, args):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        factory._fast_deserializers = mock.Mock()
+        payload = object()
+
+        result = getattr(factory, method)(payload)
+
+        mock_fast_path = getattr(factory._fast_deserializers, fast_path)
+        assert result is mock_fast_path.return_value
+        mock_fast_path.assert_called_once_with(factory, payload, *args)
+
+    @pytest.mark.parametrize(("name", "fixture", "path"), _FAST_PATH_FIXTURES)
+    def test_fast_path_matches_regular_for_fixtures(
+        self, request: pytest.FixtureRequest, mock_app, name: str, fixture: str, path: tuple[str | int, ...]
+    ):
+        payload = request.getfixturevalue(fixture)
+        for key in path:
+            payload = payload[key]
+
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast_path = getattr(fast_deserializers.get_fast_deserializers(), name)
+
+        if name == "member":
+            user = (
+                undefined.UNDEFINED
+                if "user" in payload
+                else factory.deserialize_user(request.getfixturevalue("user_payload"))
+            )
+            guild_id = snowflakes.Snowflake(76543325)
+            fast = fast_path(factory, payload, user, guild_id)
+            expected = factory.deserialize_member(payload, user=user, guild_id=guild_id)
+
+        else:
+            fast = fast_path(factory, payload)
+            expected = getattr(factory, f"deserialize_{name}")(payload)
+
+        assert _entity_fields(fast) == _entity_fields(expected)
+
+    @pytest.mark.parametrize(("name", "fixture", "path"), _FAST_PATH_FIXTURES)
+    def test_fast_path_matches_regular_for_fixtures_with_each_field_missing(
+        self, request: pytest.FixtureRequest, mock_app, name: str, fixture: str, path: tuple[str | int, ...]
+    ):
+        payload = request.getfixturevalue(fixture)
+        for key in path:
+            payload = payload[key]
+
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        fast_path = getattr(fast_deserializers.get_fast_deserializers(), name)
+        user = factory.deserialize_user(request.getfixturevalue("user_payload"))
+        kwargs = {"user": user, "guild_id": snowflakes.Snowflake(76543325)} if name == "member" else {}
+        regular = getattr(factory, f"deserialize_{name}")
+
+        for field in payload:
+            partial_payload = {k: v for k, v in payload.items() if k != field}
+
+            try:
+                expected = regular(partial_payload, **kwargs)
+            except Exception:  # noqa: BLE001 - Any error here means the payload is invalid
+                expected = None
+
+            try:
+                fast = fast_path(factory, partial_payload, *kwargs.values())
+            except entity_factory._FAST_PATH_ERRORS:
+                # The regular deserializer is used as a fallback for these.
+                continue
+
+            assert expected is not None, f"the fast path accepted a payload missing {field!r}"
+            assert _entity_fields(fast) == _entity_fields(expected), f"the paths diverge when {field!r} is missing"
+
+    def test_fast_path_fixtures_cover_every_deserializer(self):
+        assert {name for name, _, _ in _FAST_PATH_FIXTURES} == set(fast_deserializers.FastDeserializers._fields)
+
+    @pytest.mark.parametrize("method", entity_factory._GENERATED_DESERIALIZERS)
+    def test_fast_paths_disabled_when_deserializer_overridden(self, mock_app, method):
+        factory_cls = type("EntityFactory", (entity_factory.EntityFactoryImpl,), {method: mock.Mock()})
+
+        factory = factory_cls(mock_app, fast_paths=True)
+
+        assert factory._fast_deserializers is None
+        assert factory._generated_records is False
+
+    def test_fast_paths_enabled_for_subclass_without_overrides(self, mock_app):
+        factory_cls = type("EntityFactory", (entity_factory.EntityFactoryImpl,), {})
+
+        factory = factory_cls(mock_app, fast_paths=True)
+
+        assert factory._fast_deserializers is fast_deserializers.get_fast_deserializers()
+        assert factory._generated_records is True
+
+    def test_fast_path_falls_back_to_regular_deserializer(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        factory._fast_deserializers = mock.Mock(user=mock.Mock(side_effect=KeyError("id")))
+
+        with mock.patch.object(entity_factory, "_LOGGER") as logger:
+            user = factory.deserialize_user(user_payload)
+
+        assert user.id == 115590097100865541
+        factory._fast_deserializers.user.assert_called_once_with(factory, user_payload)
+        logger.log.assert_called_once_with(ux.TRACE, "falling back to the regular user deserializer", exc_info=True)
+
+    def test_fast_path_does_not_hide_unexpected_errors(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        factory._fast_deserializers = mock.Mock(user=mock.Mock(side_effect=AttributeError("oops")))
+
+        with pytest.raises(AttributeError, match="oops"):
+            factory.deserialize_user(user_payload)
+
+    def test_fast_path_falls_back_to_regular_deserializer_errors(self, mock_app):
+        factory = entity_factory.EntityFactoryImpl(mock_app, fast_paths=True)
+
+        with pytest.raises(KeyError, match="'id'"):
+            factory.deserialize_user({})
+
+    ###########
+    # RECORDS #
+    ###########
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    @pytest.mark.parametrize("fast_paths", [True, False])
+    def test_deserialize_user_from_record(self, mock_app, user_payload, fast_paths):
+        factory = entity_factory.EntityFactoryImpl(mock_app, fast_paths=fast_paths)
+        record = msgspec.convert(user_payload, gateway_records.UserRecord)
+
+        assert _entity_fields(factory.deserialize_user(record)) == _entity_fields(
+            factory.deserialize_user(user_payload)
+        )
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    @pytest.mark.parametrize(
+        ("name", "fixture", "record_name"),
+        [
+            ("user", "user_payload", "UserRecord"),
+            ("member", "member_payload", "MemberRecord"),
+            ("message", "message_payload", "MessageRecord"),
+            ("message", "referenced_message", "MessageRecord"),
+        ],
+    )
+    def test_deserialize_from_record_matches_regular_with_each_field_missing(
+        self, request: pytest.FixtureRequest, mock_app, name: str, fixture: str, record_name: str
+    ):
+        payload = request.getfixturevalue(fixture)
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        kwargs = {"guild_id": snowflakes.Snowflake(76543325)} if name == "member" else {}
+        deserialize = getattr(factory, f"deserialize_{name}")
+
+        for field in payload:
+            partial_payload = {k: v for k, v in payload.items() if k != field}
+            try:
+                record = msgspec.convert(partial_payload, getattr(gateway_records, record_name))
+            except msgspec.ValidationError:
+                # Required by the record.
+                continue
+
+            try:
+                # Records drop the fields they don't describe, so compare against the payload they hold.
+                expected = deserialize(msgspec.to_builtins(record), **kwargs)
+            except KeyError:
+                with pytest.raises(KeyError):
+                    deserialize(record, **kwargs)
+
+                continue
+
+            assert _entity_fields(deserialize(record, **kwargs)) == _entity_fields(expected), (
+                f"the paths diverge when {field!r} is missing"
+            )
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    def test_deserialize_message_from_record_uses_overridden_deserializers(self, mock_app, message_payload):
+        class EntityFactory(entity_factory.EntityFactoryImpl):
+            deserialize_user = mock.Mock()
+
+        factory = EntityFactory(mock_app)
+        record = msgspec.convert(message_payload, gateway_records.MessageRecord)
+
+        result = factory.deserialize_message(record)
+
+        assert result.author is EntityFactory.deserialize_user.return_value
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    def test_deserialize_user_from_record_with_unset_fields(self, mock_app):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        payload = {"id": "115590097100865541", "username": "nyaa", "avatar": None, "discriminator": "0"}
+        record = msgspec.convert(payload, gateway_records.UserRecord)
+
+        assert _entity_fields(factory.deserialize_user(record)) == _entity_fields(factory.deserialize_user(payload))
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    def test_deserialize_member_from_record(self, mock_app, member_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        record = msgspec.convert(member_payload, gateway_records.MemberRecord)
+        guild_id = snowflakes.Snowflake(76543325)
+
+        result = factory.deserialize_member(record, guild_id=guild_id)
+
+        assert _entity_fields(result) == _entity_fields(factory.deserialize_member(member_payload, guild_id=guild_id))
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    def test_deserialize_member_from_record_with_passed_through_user_and_unset_fields(self, mock_app):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        user = mock.Mock()
+        payload = {"guild_id": "123", "roles": ["123", "456"], "joined_at": None}
+        record = msgspec.convert(payload, gateway_records.MemberRecord)
+
+        result = factory.deserialize_member(record, user=user)
+
+        assert _entity_fields(result) == _entity_fields(factory.deserialize_member(payload, user=user))
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    def test_deserialize_message_from_record(self, mock_app, message_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        record = msgspec.convert(message_payload, gateway_records.MessageRecord)
+
+        result = factory.deserialize_message(record)
+
+        assert _entity_fields(result) == _entity_fields(factory.deserialize_message(message_payload))
+
+    @pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+    def test_deserialize_message_from_record_with_unset_fields(self, mock_app, referenced_message):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+        referenced_message["stickers"] = []
+        referenced_message["flags"] = 2
+        record = msgspec.convert(referenced_message, gateway_records.MessageRecord)
+
+        result = factory.deserialize_message(record)
+
+        assert _entity_fields(result) == _entity_fields(factory.deserialize_message(referenced_message))
+
     ###################
     # PRESENCE MODELS #
     ###################
@@ -8126,6 +8565,49 @@ def test_deserialize_user_with_unset_fields(self, entity_factory_impl, mock_app,
         assert user.flags == user_models.UserFlag.NONE
         assert user.primary_guild is None
 
+    def test_user_identity_map_disabled_by_default(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app)
+
+        assert factory._user_identity_map is None
+        assert factory.deserialize_user(user_payload) is not factory.deserialize_user(user_payload)
+
+    def test_deserialize_user_with_user_identity_map(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app, user_identity_map_size=10)
+
+        user = factory.deserialize_user(user_payload)
+
+        assert factory.deserialize_user(copy.deepcopy(user_payload)) is user
+        assert _entity_fields(user) == _entity_fields(
+            entity_factory.EntityFactoryImpl(mock_app).deserialize_user(user_payload)
+        )
+
+    def test_deserialize_user_with_user_identity_map_when_changed(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app, user_identity_map_size=10)
+        user = factory.deserialize_user(user_payload)
+
+        result = factory.deserialize_user({**user_payload, "username": "meow"})
+
+        assert result is not user
+        assert result.username == "meow"
+        assert factory.deserialize_user({**user_payload, "username": "meow"}) is result
+
+    def test_deserialize_user_with_user_identity_map_is_bounded(self, mock_app, user_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app, user_identity_map_size=2)
+        user = factory.deserialize_user(user_payload)
+
+        factory.deserialize_user({**user_payload, "id": "1"})
+        factory.deserialize_user({**user_payload, "id": "2"})
+
+        assert len(factory._user_identity_map) == 2
+        assert factory.deserialize_user(user_payload) is not user
+
+    def test_fast_paths_with_user_identity_map(self, mock_app, user_payload, member_payload):
+        factory = entity_factory.EntityFactoryImpl(mock_app, fast_paths=True, user_identity_map_size=10)
+
+        user = factory.deserialize_user(user_payload)
+
+        assert factory.deserialize_member(member_payload, guild_id=snowflakes.Snowflake(123)).user is user
+
     @pytest.fixture
     def my_user_payload(self, primary_guild_payload: dict[str, Any]):
         return {
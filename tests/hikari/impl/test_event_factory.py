@@ -954,6 +954,17 @@ def test_deserialize_stopped_event(self, event_factory, mock_app):
         assert isinstance(event, lifetime_events.StoppedEvent)
         assert event.app is mock_app
 
+    def test_deserialize_event_loop_blocked_event(self, event_factory, mock_app):
+        event = event_factory.deserialize_event_loop_blocked_event(
+            duration=1.5, task_name="handler 'on_message' for 'MessageCreateEvent'", stack=["frame"]
+        )
+
+        assert isinstance(event, lifetime_events.EventLoopBlockedEvent)
+        assert event.app is mock_app
+        assert event.duration == 1.5
+        assert event.task_name == "handler 'on_message' for 'MessageCreateEvent'"
+        assert event.stack == ["frame"]
+
     ##################
     # MESSAGE EVENTS #
     ##################
@@ -34,8 +34,10 @@
 from hikari import presences
 from hikari.api import event_factory as event_factory_
 from hikari.events import guild_events
+from hikari.events import shard_events
 from hikari.impl import config
 from hikari.impl import event_manager
+from hikari.internal import cache as cache_utilities
 from hikari.internal import time
 from tests.hikari import hikari_test_helpers
 
@@ -541,7 +543,12 @@ def test_on_guild_create_when_not_dispatching_and_not_caching(
     def test_on_guild_create_when_not_dispatching_and_caching(
         self, event_manager_impl, shard, event_factory, entity_factory, include_unavailable, only_my_member
     ):
-        payload = {"unavailable": False} if include_unavailable else {}
+        member_payload_1 = {"user": {"id": "1"}}
+        member_payload_2 = {"user": {"id": "2"}}
+        payload = {"members": [member_payload_1, member_payload_2]}
+        if include_unavailable:
+            payload["unavailable"] = False
+
         event_manager_impl._intents = intents.Intents.NONE
         event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
         event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
@@ -553,7 +560,6 @@ def test_on_guild_create_when_not_dispatching_and_caching(
         gateway_guild.roles.return_value = {1: "role1", 2: "role2"}
         gateway_guild.voice_states.return_value = {1: "voice1", 2: "voice2"}
         gateway_guild.presences.return_value = {1: "presence1", 2: "presence2"}
-        gateway_guild.members.return_value = {1: "member1", 2: "member2"}
         gateway_guild.stickers.return_value = {1: "sticker1", 2: "sticker2"}
         gateway_guild.threads.return_value = {1: "thread1", 2: "thread2"}
 
@@ -582,20 +588,56 @@ def test_on_guild_create_when_not_dispatching_and_caching(
         event_manager_impl._cache.clear_roles_for_guild.assert_called_once_with(gateway_guild.id)
         event_manager_impl._cache.set_role.assert_has_calls([mock.call("role1"), mock.call("role2")])
         event_manager_impl._cache.clear_members_for_guild.assert_called_once_with(gateway_guild.id)
+        gateway_guild.members.assert_not_called()
+        event_manager_impl._cache.set_member.assert_not_called()
         if only_my_member:
-            event_manager_impl._cache.set_member.assert_called_once_with("member1")
+            event_manager_impl._cache.set_members_from_payloads.assert_called_once_with(
+                gateway_guild.id, [member_payload_1]
+            )
             shard.get_user_id.assert_has_calls([mock.call(), mock.call()])
         else:
-            event_manager_impl._cache.set_member.assert_has_calls([mock.call("member1"), mock.call("member2")])
+            event_manager_impl._cache.set_members_from_payloads.assert_called_once_with(
+                gateway_guild.id, [member_payload_1, member_payload_2]
+            )
             shard.get_user_id.assert_called_once_with()
         event_manager_impl._cache.clear_presences_for_guild.assert_called_once_with(gateway_guild.id)
         event_manager_impl._cache.set_presence.assert_has_calls([mock.call("presence1"), mock.call("presence2")])
         event_manager_impl._cache.clear_voice_states_for_guild.assert_called_once_with(gateway_guild.id)
         event_manager_impl._cache.set_voice_state.assert_has_calls([mock.call("voice1"), mock.call("voice2")])
+        event_manager_impl._cache.set_guild_version.assert_called_once_with(
+            gateway_guild.id, cache_utilities.compute_guild_version(payload)
+        )
         request_guild_members.assert_not_called()
 
         event_manager_impl.dispatch.assert_not_called()
 
+    def test_on_guild_create_when_not_dispatching_and_caching_unchanged_guild(
+        self, event_manager_impl, shard, entity_factory
+    ):
+        payload = {"channels": [], "emojis": [], "roles": []}
+        event_manager_impl._intents = intents.Intents.NONE
+        event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
+        event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
+        event_manager_impl._cache.get_guild_version.return_value = cache_utilities.compute_guild_version(payload)
+        gateway_guild = entity_factory.deserialize_gateway_guild.return_value
+        gateway_guild.voice_states.return_value = {1: "voice1"}
+        gateway_guild.presences.return_value = {}
+        gateway_guild.members.return_value = {}
+        gateway_guild.stickers.return_value = {}
+        gateway_guild.threads.return_value = {}
+
+        event_manager_impl.on_guild_create(shard, payload)
+
+        event_manager_impl._cache.get_guild_version.assert_called_once_with(gateway_guild.id)
+        gateway_guild.channels.assert_not_called()
+        gateway_guild.emojis.assert_not_called()
+        gateway_guild.roles.assert_not_called()
+        event_manager_impl._cache.clear_guild_channels_for_guild.assert_not_called()
+        event_manager_impl._cache.clear_emojis_for_guild.assert_not_called()
+        event_manager_impl._cache.clear_roles_for_guild.assert_not_called()
+        event_manager_impl._cache.update_guild.assert_called_once_with(gateway_guild.guild.return_value)
+        event_manager_impl._cache.set_voice_state.assert_called_once_with("voice1")
+
     @pytest.mark.parametrize("include_unavailable", [True, False])
     def test_on_guild_create_when_stateless(
         self, stateless_event_manager_impl, shard, event_factory, entity_factory, include_unavailable
@@ -1081,6 +1123,7 @@ def test_on_guild_members_chunk_stateful(self, event_manager_impl, shard, event_
         payload = {}
         event = mock.Mock(members={"TestMember": 123}, presences={"TestPresences": 456})
         event_factory.deserialize_guild_member_chunk_event.return_value = event
+        event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
 
         event_manager_impl.on_guild_members_chunk(shard, payload)
 
@@ -1089,6 +1132,42 @@ def test_on_guild_members_chunk_stateful(self, event_manager_impl, shard, event_
         event_factory.deserialize_guild_member_chunk_event.assert_called_once_with(shard, payload)
         event_manager_impl.dispatch.assert_called_once_with(event)
 
+    def test_on_guild_members_chunk_stateful_when_not_dispatching(
+        self, event_manager_impl, shard, event_factory, entity_factory
+    ):
+        member_payloads = [{"user": {"id": "1"}}, {"user": {"id": "2"}}]
+        payload = {"guild_id": "123", "members": member_payloads, "presences": [{"id": "1"}, {"id": "2"}]}
+        event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
+        event_manager_impl._cache_enabled_for = mock.Mock(return_value=True)
+        entity_factory.deserialize_member_presence.side_effect = ["presence1", "presence2"]
+
+        event_manager_impl.on_guild_members_chunk(shard, payload)
+
+        event_manager_impl._enabled_for_event.assert_called_once_with(shard_events.MemberChunkEvent)
+        event_manager_impl._cache.set_members_from_payloads.assert_called_once_with(123, member_payloads)
+        entity_factory.deserialize_member_presence.assert_has_calls(
+            [mock.call({"id": "1"}, guild_id=123), mock.call({"id": "2"}, guild_id=123)]
+        )
+        event_manager_impl._cache.set_presence.assert_has_calls([mock.call("presence1"), mock.call("presence2")])
+        event_manager_impl._cache.set_member.assert_not_called()
+        event_factory.deserialize_guild_member_chunk_event.assert_not_called()
+        event_manager_impl.dispatch.assert_not_called()
+
+    def test_on_guild_members_chunk_stateful_when_not_dispatching_and_presences_not_cached(
+        self, event_manager_impl, shard, event_factory, entity_factory
+    ):
+        payload = {"guild_id": "123", "members": [], "presences": [{"id": "1"}]}
+        event_manager_impl._enabled_for_event = mock.Mock(return_value=False)
+        event_manager_impl._cache_enabled_for = mock.Mock(return_value=False)
+
+        event_manager_impl.on_guild_members_chunk(shard, payload)
+
+        event_manager_impl._cache_enabled_for.assert_called_once_with(config.CacheComponents.PRESENCES)
+        event_manager_impl._cache.set_members_from_payloads.assert_called_once_with(123, [])
+        entity_factory.deserialize_member_presence.assert_not_called()
+        event_manager_impl._cache.set_presence.assert_not_called()
+        event_manager_impl.dispatch.assert_not_called()
+
     def test_on_guild_members_chunk_stateless(self, stateless_event_manager_impl, shard, event_factory):
         payload = {}
 
@@ -40,6 +40,7 @@
 from hikari.events import member_events
 from hikari.events import shard_events
 from hikari.impl import event_manager_base
+from hikari.impl import instrumentation
 from tests.hikari import hikari_test_helpers
 
 
@@ -514,6 +515,24 @@ async def test_consume_raw_event_when_found(self, event_manager):
         )
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_when_instrumented(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._instrumentation = instrumentation.PipelineInstrumentation(
+            clock=mock.Mock(side_effect=[2.0, 2.5])
+        )
+        on_existing_event = mock.Mock(is_enabled=True, callback=mock.Mock(__name__="testing"))
+        event_manager._consumers = {"existing_event": on_existing_event}
+        shard = object()
+        payload = {"berp": "baz"}
+
+        event_manager.consume_raw_event("EXISTING_EVENT", shard, payload)
+
+        on_existing_event.callback.assert_called_once_with(shard, payload)
+        statistics = event_manager._instrumentation.get_statistics()
+        assert statistics == {instrumentation.CONSUME_STAGE: {"EXISTING_EVENT": mock.ANY}}
+        assert statistics[instrumentation.CONSUME_STAGE]["EXISTING_EVENT"].total == 0.5
+
     @pytest.mark.asyncio
     async def test_consume_raw_event_skips_consumer_callback_when_not_enabled(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=True)
@@ -846,3 +865,24 @@ def test_listen_when_incorrect_type_in_typehint(self, event_manager):
 
             @event_manager.listen()
             async def test(event: list[member_events.MemberUpdateEvent]): ...
+
+    @pytest.mark.asyncio
+    async def test_dispatch_when_instrumented(self, event_manager):
+        class StubEvent:
+            @classmethod
+            def dispatches(cls):
+                return (cls,)
+
+        callback = mock.AsyncMock(__name__="callback")
+        event = StubEvent()
+        event_manager._listeners = {StubEvent: [callback]}
+        event_manager._instrumentation = instrumentation.PipelineInstrumentation(
+            clock=mock.Mock(side_effect=[1.0, 1.5, 2.0, 4.0])
+        )
+
+        await event_manager.dispatch(event, return_tasks=True)
+
+        callback.assert_awaited_once_with(event)
+        statistics = event_manager._instrumentation.get_statistics()
+        assert statistics[instrumentation.DISPATCH_STAGE]["StubEvent"].total == 0.5
+        assert statistics[instrumentation.LISTENER_STAGE]["StubEvent"].total == 2.0
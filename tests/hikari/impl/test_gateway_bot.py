@@ -40,9 +40,12 @@
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
 from hikari.impl import gateway_bot as bot_impl
+from hikari.impl import instrumentation
 from hikari.impl import rest as rest_impl
 from hikari.impl import shard as shard_impl
+from hikari.impl import shared_cache as shared_cache_impl
 from hikari.impl import voice as voice_impl
+from hikari.impl import watchdog
 from hikari.internal import aio
 from hikari.internal import signals
 from hikari.internal import ux
@@ -218,6 +221,7 @@ def test_init(self, token):
             intents,
             auto_chunk_members=False,
             cache=cache.return_value,
+            instrumentation=None,
         )
         assert bot._entity_factory is entity_factory.return_value
         entity_factory.assert_called_once_with(bot)
@@ -270,6 +274,21 @@ def test_init_when_no_settings(self, token):
         cache.assert_called_once_with(bot, cache_settings.return_value)
         cache_settings.assert_called_once_with()
 
+    def test_init_when_cache_backend(self, token):
+        stack = contextlib.ExitStack()
+        shared_cache = stack.enter_context(mock.patch.object(shared_cache_impl, "SharedCacheImpl"))
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
+        cache_settings = config.CacheSettings()
+        backend = object()
+
+        with stack:
+            bot = bot_impl.GatewayBot(token, cache_settings=cache_settings, cache_backend=backend)
+
+        assert bot._cache is shared_cache.return_value
+        shared_cache.assert_called_once_with(bot, cache_settings, backend)
+
     def test_init_strips_token(self, token):
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(ux, "init_logging"))
@@ -337,6 +356,49 @@ def test_intents(self, bot, intents):
     def test_capabilities(self, bot, capabilities):
         assert bot.capabilities is capabilities
 
+    def test_watchdog_when_disabled(self, bot):
+        assert bot.watchdog is None
+
+    def test_watchdog_when_enabled(self, token):
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
+        loop_watchdog = stack.enter_context(mock.patch.object(watchdog, "LoopWatchdog"))
+
+        with stack:
+            bot = bot_impl.GatewayBot(token, watchdog_threshold=2.5)
+
+        assert bot.watchdog is loop_watchdog.return_value
+        loop_watchdog.assert_called_once_with(threshold=2.5)
+        loop_watchdog.return_value.subscribe.assert_called_once_with(bot._on_loop_blocked)
+
+    def test__on_loop_blocked(self, bot, event_manager, event_factory):
+        report = watchdog.BlockedLoopReport(duration=1.5, task_name="handler 'a' for 'B'", stack=["frame"])
+
+        bot._on_loop_blocked(report)
+
+        event_factory.deserialize_event_loop_blocked_event.assert_called_once_with(
+            duration=1.5, task_name="handler 'a' for 'B'", stack=["frame"]
+        )
+        event_manager.dispatch.assert_called_once_with(event_factory.deserialize_event_loop_blocked_event.return_value)
+
+    def test_instrumentation_when_disabled(self, bot):
+        assert bot.instrumentation is None
+
+    def test_instrumentation_when_enabled(self, token):
+        stack = contextlib.ExitStack()
+        event_manager = stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl"))
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
+
+        with stack:
+            bot = bot_impl.GatewayBot(token, enable_instrumentation=True)
+
+        assert isinstance(bot.instrumentation, instrumentation.PipelineInstrumentation)
+        assert event_manager.call_args.kwargs["instrumentation"] is bot.instrumentation
+
     def test_get_me(self, bot, cache):
         assert bot.get_me() is cache.get_me.return_value
 
@@ -481,6 +543,19 @@ def assert_awaited_once(self):
             ]
         )
 
+    @pytest.mark.asyncio
+    async def test_close_closes_shared_cache(self, bot, event_manager, rest, voice):
+        event_manager.dispatch = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        bot._closed_event = mock.Mock()
+        bot._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
+        bot._cache = cache = mock.Mock(shared_cache_impl.SharedCacheImpl)
+
+        await bot.close()
+
+        cache.assert_has_calls([mock.call.clear(), mock.call.close()])
+
     def test_dispatch(self, bot, event_manager):
         event = mock.Mock()
 
@@ -1011,6 +1086,7 @@ async def test_start_one_shard(self, bot):
             dumps=bot._dumps,
             token=bot._token,
             url="https://some.website",
+            instrumentation=bot._instrumentation,
         )
         shard_obj.start.assert_awaited_once_with()
         assert bot._shards == {1: shard_obj}
@@ -0,0 +1,91 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+
+import mock
+
+from hikari.impl import instrumentation
+from hikari.internal import time
+
+
+class TestStageStatistics:
+    def test_mean(self):
+        statistics = instrumentation.StageStatistics(count=4, total=2.0)
+
+        assert statistics.mean == 0.5
+
+    def test_mean_when_empty(self):
+        assert instrumentation.StageStatistics().mean == 0.0
+
+    def test_add(self):
+        statistics = instrumentation.StageStatistics()
+
+        statistics.add(0.0002)
+        statistics.add(0.001)
+        statistics.add(5.0)
+
+        assert statistics.count == 3
+        assert statistics.total == 5.0012
+        assert statistics.max == 5.0
+        assert statistics.buckets == [0, 1, 0, 1, 0, 0, 0, 0, 0, 1]
+
+
+class TestPipelineInstrumentation:
+    def test_clock_defaults_to_perf_counter(self):
+        assert instrumentation.PipelineInstrumentation().clock is time.perf_counter
+
+    def test_clock(self):
+        clock = mock.Mock()
+
+        assert instrumentation.PipelineInstrumentation(clock=clock).clock is clock
+
+    def test_record(self):
+        pipeline = instrumentation.PipelineInstrumentation()
+
+        pipeline.record(instrumentation.LOADS_STAGE, "MESSAGE_CREATE", 0.5)
+        pipeline.record(instrumentation.LOADS_STAGE, "MESSAGE_CREATE", 1.5)
+        pipeline.record(instrumentation.CONSUME_STAGE, "MESSAGE_CREATE", 0.25)
+
+        statistics = pipeline.get_statistics()
+        assert statistics.keys() == {instrumentation.LOADS_STAGE, instrumentation.CONSUME_STAGE}
+        assert statistics[instrumentation.LOADS_STAGE]["MESSAGE_CREATE"].count == 2
+        assert statistics[instrumentation.LOADS_STAGE]["MESSAGE_CREATE"].total == 2.0
+        assert statistics[instrumentation.LOADS_STAGE]["MESSAGE_CREATE"].max == 1.5
+        assert statistics[instrumentation.CONSUME_STAGE]["MESSAGE_CREATE"].count == 1
+
+    def test_get_statistics_returns_copies(self):
+        pipeline = instrumentation.PipelineInstrumentation()
+        pipeline.record(instrumentation.LOADS_STAGE, "READY", 0.5)
+
+        statistics = pipeline.get_statistics()
+        pipeline.record(instrumentation.LOADS_STAGE, "READY", 0.5)
+
+        assert statistics[instrumentation.LOADS_STAGE]["READY"].count == 1
+        assert sum(statistics[instrumentation.LOADS_STAGE]["READY"].buckets) == 1
+
+    def test_reset(self):
+        pipeline = instrumentation.PipelineInstrumentation()
+        pipeline.record(instrumentation.LOADS_STAGE, "READY", 0.5)
+
+        pipeline.reset()
+
+        assert pipeline.get_statistics() == {}
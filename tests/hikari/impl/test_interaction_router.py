@@ -0,0 +1,224 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+
+import mock
+import pytest
+
+from hikari import commands
+from hikari.impl import interaction_router
+from hikari.interactions import command_interactions
+from hikari.interactions import component_interactions
+from hikari.interactions import modal_interactions
+
+
+def make_command_payload(name, options=None, *, interaction_type=2, command_type=1):
+    return {"type": interaction_type, "data": {"type": command_type, "name": name, "options": options}}
+
+
+class TestInteractionRouter:
+    @pytest.fixture
+    def router(self):
+        return interaction_router.InteractionRouter()
+
+    def test_set_command_when_already_set(self, router):
+        router.set_command("settings", mock.Mock())
+
+        with pytest.raises(TypeError, match="Listener already set for command 'settings'"):
+            router.set_command(" settings ", mock.Mock())
+
+    def test_set_command_with_replace(self, router):
+        listener = mock.Mock()
+        router.set_command("settings", mock.Mock())
+
+        router.set_command("settings", listener, replace=True)
+
+        assert router.resolve_payload(make_command_payload("settings")) is listener
+
+    def test_set_command_when_removing(self, router):
+        router.set_command("settings", mock.Mock())
+
+        router.set_command("settings", None)
+
+        assert router.resolve_payload(make_command_payload("settings")) is None
+
+    @pytest.mark.parametrize("path", ["", "   ", "a b c d"])
+    def test_set_command_with_invalid_path(self, router, path):
+        with pytest.raises(ValueError, match="Invalid command path"):
+            router.set_command(path, mock.Mock())
+
+    def test_resolve_payload_for_subcommand(self, router):
+        command_listener = mock.Mock()
+        group_listener = mock.Mock()
+        subcommand_listener = mock.Mock()
+        router.set_command("settings", command_listener)
+        router.set_command("settings notifications", group_listener)
+        router.set_command("settings  notifications enable", subcommand_listener)
+
+        def payload(group, subcommand):
+            return make_command_payload(
+                "settings", [{"type": 2, "name": group, "options": [{"type": 1, "name": subcommand, "options": []}]}]
+            )
+
+        assert router.resolve_payload(payload("notifications", "enable")) is subcommand_listener
+        assert router.resolve_payload(payload("notifications", "disable")) is group_listener
+        assert router.resolve_payload(payload("theme", "dark")) is command_listener
+        assert router.resolve_payload(make_command_payload("settings", [{"type": 3, "name": "a", "value": "b"}])) is (
+            command_listener
+        )
+
+    def test_resolve_payload_for_command_type(self, router):
+        slash_listener = mock.Mock()
+        user_listener = mock.Mock()
+        router.set_command("info", slash_listener)
+        router.set_command("info", user_listener, command_type=commands.CommandType.USER)
+
+        assert router.resolve_payload(make_command_payload("info")) is slash_listener
+        assert router.resolve_payload(make_command_payload("info", command_type=2)) is user_listener
+        assert router.resolve_payload(make_command_payload("info", command_type=3)) is None
+
+    def test_resolve_payload_for_autocomplete(self, router):
+        listener = mock.Mock()
+        router.set_autocomplete("search", listener)
+        router.set_command("search", mock.Mock())
+
+        assert router.resolve_payload(make_command_payload("search", interaction_type=4)) is listener
+
+    def test_set_autocomplete_when_already_set(self, router):
+        router.set_autocomplete("search", mock.Mock())
+
+        with pytest.raises(TypeError, match="Listener already set for the autocompletes of 'search'"):
+            router.set_autocomplete("search", mock.Mock())
+
+    def test_resolve_payload_for_component_uses_longest_prefix(self, router):
+        listener = mock.Mock()
+        specific_listener = mock.Mock()
+        router.set_component("vote:", listener)
+        router.set_component("vote:yes:", specific_listener)
+
+        assert router.resolve_payload({"type": 3, "data": {"custom_id": "vote:yes:123"}}) is specific_listener
+        assert router.resolve_payload({"type": 3, "data": {"custom_id": "vote:no:123"}}) is listener
+        assert router.resolve_payload({"type": 3, "data": {"custom_id": "other"}}) is None
+        assert router.resolve_payload({"type": 5, "data": {"custom_id": "vote:yes:123"}}) is None
+
+    def test_set_component_when_removing(self, router):
+        listener = mock.Mock()
+        router.set_component("vote:", listener)
+        router.set_component("vote:yes:", mock.Mock())
+
+        router.set_component("vote:yes:", None)
+
+        assert router.resolve_payload({"type": 3, "data": {"custom_id": "vote:yes:123"}}) is listener
+
+    def test_set_modal_when_already_set(self, router):
+        router.set_modal("report:", mock.Mock())
+
+        with pytest.raises(TypeError, match="Listener already set for custom ID prefix 'report:'"):
+            router.set_modal("report:", mock.Mock())
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"type": 2},
+            {"type": 2, "data": None},
+            {"type": 2, "data": {"name": "settings"}},
+            {"type": 3, "data": {}},
+            {"type": 1, "data": {"name": "settings"}},
+            {"data": {"type": 1, "name": "settings"}},
+        ],
+    )
+    def test_resolve_payload_when_malformed_or_unknown(self, router, payload):
+        router.set_command("settings", mock.Mock())
+        router.set_component("", mock.Mock())
+
+        assert router.resolve_payload(payload) is None
+
+    def test_resolve_for_command(self, router):
+        listener = mock.Mock()
+        router.set_command("settings notifications", listener)
+        interaction = mock.Mock(
+            command_interactions.CommandInteraction,
+            command_name="settings",
+            command_type=commands.CommandType.SLASH,
+            options=[mock.Mock(type=commands.OptionType.SUB_COMMAND, options=None)],
+        )
+        interaction.options[0].name = "notifications"
+
+        assert router.resolve(interaction) is listener
+
+    def test_resolve_for_autocomplete(self, router):
+        listener = mock.Mock()
+        router.set_autocomplete("search", listener)
+        interaction = mock.Mock(command_interactions.AutocompleteInteraction, command_name="search", options=[])
+
+        assert router.resolve(interaction) is listener
+
+    def test_resolve_for_component(self, router):
+        listener = mock.Mock()
+        router.set_component("vote:", listener)
+
+        assert router.resolve(mock.Mock(component_interactions.ComponentInteraction, custom_id="vote:1")) is listener
+
+    def test_resolve_for_modal(self, router):
+        listener = mock.Mock()
+        router.set_modal("report:", listener)
+
+        assert router.resolve(mock.Mock(modal_interactions.ModalInteraction, custom_id="report:1")) is listener
+
+    def test_resolve_for_unknown_interaction(self, router):
+        assert router.resolve(mock.Mock()) is None
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_create(self, router):
+        listener = mock.AsyncMock(return_value=None)
+        router.set_component("vote:", listener)
+        event = mock.Mock(interaction=mock.Mock(component_interactions.ComponentInteraction, custom_id="vote:1"))
+
+        with mock.patch.object(interaction_router, "_LOGGER") as logger:
+            await router.on_interaction_create(event)
+
+        listener.assert_awaited_once_with(event.interaction)
+        logger.warning.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_create_when_response_returned(self, router):
+        async def listener(_):
+            yield mock.Mock()
+
+        router.set_component("vote:", listener)
+        event = mock.Mock(interaction=mock.Mock(component_interactions.ComponentInteraction, custom_id="vote:1"))
+
+        with mock.patch.object(interaction_router, "_LOGGER") as logger:
+            await router.on_interaction_create(event)
+
+        logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_create_when_not_routed(self, router):
+        listener = mock.AsyncMock()
+        router.set_component("vote:", listener)
+
+        await router.on_interaction_create(
+            mock.Mock(interaction=mock.Mock(component_interactions.ComponentInteraction, custom_id="other"))
+        )
+
+        listener.assert_not_called()
@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import re
 import threading
@@ -46,10 +47,17 @@
 import pytest
 
 from hikari import errors
+from hikari import messages
+from hikari import undefined
 from hikari.impl import entity_factory as entity_factory_impl
+from hikari.impl import interaction_router
 from hikari.impl import interaction_server as interaction_server_impl
 from hikari.impl import rest as rest_impl
+from hikari.impl import special_endpoints as special_endpoints_impl
+from hikari.internal import data_binding
 from hikari.interactions import base_interactions
+from hikari.interactions import command_interactions
+from hikari.interactions import component_interactions
 from tests.hikari import hikari_test_helpers
 
 
@@ -239,6 +247,104 @@ def test_interaction_server_init_when_no_pynacl():
         interaction_server_impl.InteractionServer(entity_factory=mock.Mock(), rest_client=mock.Mock())
 
 
+@pytest.mark.skipif(not nacl_present, reason="PyNacl not present")
+class TestSignatureVerifier:
+    @pytest.fixture
+    def executor(self):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            yield executor
+
+    @pytest.fixture
+    def errors_(self):
+        return (nacl.exceptions.BadSignatureError, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_verify_without_executor(self, errors_, public_key, valid_edd25519, invalid_ed25519):
+        verifier = interaction_server_impl._SignatureVerifier(None, errors_)
+        verify_key = nacl.signing.VerifyKey(public_key)
+
+        await verifier.verify(verify_key, valid_edd25519[2] + valid_edd25519[0], valid_edd25519[1])
+
+        with pytest.raises(nacl.exceptions.BadSignatureError):
+            await verifier.verify(verify_key, invalid_ed25519[2] + invalid_ed25519[0], invalid_ed25519[1])
+
+    @pytest.mark.asyncio
+    async def test_verify_with_executor(self, executor, errors_, public_key, valid_edd25519, invalid_ed25519):
+        verifier = interaction_server_impl._SignatureVerifier(executor, errors_)
+        verify_key = nacl.signing.VerifyKey(public_key)
+
+        results = await asyncio.gather(
+            verifier.verify(verify_key, valid_edd25519[2] + valid_edd25519[0], valid_edd25519[1]),
+            verifier.verify(verify_key, invalid_ed25519[2] + invalid_ed25519[0], invalid_ed25519[1]),
+            verifier.verify(verify_key, b"", b"too short"),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], nacl.exceptions.BadSignatureError)
+        assert isinstance(results[2], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_verify_batches_signatures_queued_while_busy(self, executor, errors_):
+        verifier = interaction_server_impl._SignatureVerifier(executor, errors_, max_batch_size=2)
+        verify_key = mock.Mock()
+
+        with (
+            mock.patch.object(interaction_server_impl, "_MAX_VERIFICATION_BATCHES", 1),
+            mock.patch.object(
+                interaction_server_impl, "_verify_signatures", wraps=interaction_server_impl._verify_signatures
+            ) as verify_signatures,
+        ):
+            results = await asyncio.gather(*(verifier.verify(verify_key, bytes([i]), b"sig") for i in range(5)))
+
+        assert results == [None] * 5
+        assert [len(call.args[0]) for call in verify_signatures.call_args_list] == [1, 2, 2]
+        assert verify_key.verify.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_verify_when_batch_fails(self, executor, errors_):
+        verifier = interaction_server_impl._SignatureVerifier(executor, errors_)
+        error = RuntimeError("Oh no")
+
+        with (
+            mock.patch.object(interaction_server_impl, "_verify_signatures", side_effect=error),
+            pytest.raises(RuntimeError) as exc_info,
+        ):
+            await verifier.verify(mock.Mock(), b"message", b"signature")
+
+        assert exc_info.value is error
+
+    @pytest.mark.asyncio
+    async def test_verify_when_executor_shut_down(self, errors_):
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        executor.shutdown()
+        verifier = interaction_server_impl._SignatureVerifier(executor, errors_)
+
+        with pytest.raises(RuntimeError, match="cannot schedule new futures after shutdown"):
+            await verifier.verify(mock.Mock(), b"message", b"signature")
+
+        assert verifier._batches == 0
+        assert verifier._queue == []
+
+    @pytest.mark.asyncio
+    async def test_start_warms_up_executor(self, executor, errors_):
+        verifier = interaction_server_impl._SignatureVerifier(executor, errors_)
+        verify_key = mock.Mock(verify=mock.Mock(side_effect=nacl.exceptions.BadSignatureError))
+
+        await verifier.start(verify_key)
+
+        verify_key.verify.assert_called_once_with(b"", bytes(64))
+
+    @pytest.mark.asyncio
+    async def test_start_without_executor(self, errors_):
+        verifier = interaction_server_impl._SignatureVerifier(None, errors_)
+        verify_key = mock.Mock()
+
+        await verifier.start(verify_key)
+
+        verify_key.verify.assert_not_called()
+
+
 @pytest.mark.skipif(not nacl_present, reason="PyNacl not present")
 class TestInteractionServer:
     @pytest.fixture
@@ -283,6 +389,7 @@ def test___init__(
         assert result._loads is mock_loads
         assert result._rest_client is mock_rest_client
         assert result._public_key is None
+        assert isinstance(result.router, interaction_router.InteractionRouter)
 
     def test___init___with_public_key(
         self, mock_rest_client: rest_impl.RESTClientImpl, mock_entity_factory: entity_factory_impl.EntityFactoryImpl
@@ -304,6 +411,34 @@ def test___init___with_public_key(
 
         assert result._public_key is None
 
+    @pytest.mark.parametrize("auto_defer_after", [-0.1, 3.0])
+    def test___init___when_auto_defer_after_out_of_range(
+        self,
+        mock_rest_client: rest_impl.RESTClientImpl,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+        auto_defer_after: float,
+    ):
+        with pytest.raises(ValueError, match="auto_defer_after must be between 0 and 3.0 seconds"):
+            interaction_server_impl.InteractionServer(
+                auto_defer_after=auto_defer_after, entity_factory=mock_entity_factory, rest_client=mock_rest_client
+            )
+
+    def test_deferral_statistics_property_when_disabled(
+        self, mock_interaction_server: interaction_server_impl.InteractionServer
+    ):
+        assert mock_interaction_server.deferral_statistics is None
+
+    def test_deferral_statistics_property(self, mock_interaction_server: interaction_server_impl.InteractionServer):
+        mock_interaction_server._deferral_statistics = interaction_server_impl.InteractionDeferralStatistics(
+            dispatched=4, deferred=1
+        )
+
+        result = mock_interaction_server.deferral_statistics
+
+        assert result == mock_interaction_server._deferral_statistics
+        assert result is not mock_interaction_server._deferral_statistics
+        assert result.deferral_rate == 0.25
+
     def test_is_alive_property_when_inactive(self, mock_interaction_server: interaction_server_impl.InteractionServer):
         assert mock_interaction_server.is_alive is False
 
@@ -846,6 +981,25 @@ async def test_on_interaction_when_public_key_mismatch(
         assert result.payload == b"Invalid request signature"
         assert result.status_code == 400
 
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_verification_executor(
+        self, mock_entity_factory: entity_factory_impl.EntityFactoryImpl, public_key: bytes, invalid_ed25519: bytes
+    ):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            server = interaction_server_impl.InteractionServer(
+                entity_factory=mock_entity_factory,
+                rest_client=mock.Mock(),
+                public_key=public_key,
+                verification_executor=executor,
+            )
+
+            with mock.patch.object(interaction_server_impl, "_LOGGER") as logger:
+                result = await server.on_interaction(*invalid_ed25519)
+
+        assert result.payload == b"Invalid request signature"
+        assert result.status_code == 400
+        logger.exception.assert_called_once_with("Received a request with an invalid signature")
+
     @pytest.mark.parametrize("body", [b"not a json", b"\x80abc"])
     @pytest.mark.asyncio
     async def test_on_interaction_when_bad_body(
@@ -890,6 +1044,350 @@ async def test_on_interaction_on_ping(self, mock_interaction_server: interaction
         assert result.payload == b'{"type":1}'
         assert result.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_on_interaction_when_routed(
+        self,
+        mock_interaction_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_interaction_server._public_key = mock.Mock()
+        mock_builder = mock.Mock(build=mock.Mock(return_value=({"ok": "No boomer"}, [])))
+        mock_listener = mock.AsyncMock(return_value=mock_builder)
+        mock_type_listener = mock.AsyncMock()
+        mock_interaction_server.router.set_command("settings", mock_listener)
+        mock_interaction_server.set_listener(command_interactions.CommandInteraction, mock_type_listener)
+
+        result = await mock_interaction_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "settings"}}', b"signature", b"timestamp"
+        )
+
+        mock_listener.assert_awaited_once_with(mock_entity_factory.deserialize_interaction.return_value)
+        mock_type_listener.assert_not_called()
+        assert result.payload == b'{"ok":"No boomer"}'
+        assert result.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_when_not_routed_falls_back_to_type_listener(
+        self,
+        mock_interaction_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_interaction_server._public_key = mock.Mock()
+        mock_entity_factory.deserialize_interaction.return_value = base_interactions.PartialInteraction(
+            app=None,
+            id=123,
+            application_id=541324,
+            type=2,
+            token="ok",
+            version=1,
+            authorizing_integration_owners={},
+            context=applications.ApplicationContextType.GUILD,
+            app_permissions=123123123,
+            user=mock.Mock(),
+            member=mock.Mock(),
+            channel=mock.Mock(),
+            guild_id=123123,
+            guild_locale="en-GB",
+            locale="es-ES",
+            entitlements=[],
+            attachment_size_limit=12345,
+        )
+        mock_listener = mock.AsyncMock(return_value=None)
+        mock_interaction_server.router.set_command("settings", mock.AsyncMock())
+        mock_interaction_server.set_listener(base_interactions.PartialInteraction, mock_listener)
+
+        result = await mock_interaction_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "other"}}', b"signature", b"timestamp"
+        )
+
+        mock_listener.assert_awaited_once_with(mock_entity_factory.deserialize_interaction.return_value)
+        assert result.status_code == 204
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_when_no_route_or_listener_skips_deserialization(
+        self,
+        mock_interaction_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_interaction_server._public_key = mock.Mock()
+        mock_interaction_server.router.set_command("settings", mock.AsyncMock())
+
+        result = await mock_interaction_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "other"}}', b"signature", b"timestamp"
+        )
+
+        mock_entity_factory.deserialize_interaction.assert_not_called()
+        assert result.payload == b"Handler not set for this interaction type"
+        assert result.status_code == 501
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_splices_frozen_components(
+        self,
+        mock_interaction_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_interaction_server._public_key = mock.Mock()
+        mock_entity_factory.deserialize_interaction.return_value = mock.Mock(command_interactions.CommandInteraction)
+        row = special_endpoints_impl.FrozenComponentBuilder(
+            special_endpoints_impl.MessageActionRowBuilder().add_interactive_button(1, "yes")
+        )
+        builder = special_endpoints_impl.InteractionMessageBuilder(4, "hi", components=[row])
+        mock_interaction_server.router.set_command("cmd", mock.AsyncMock(return_value=builder))
+
+        with mock.patch.object(special_endpoints_impl.FrozenComponentBuilder, "build") as build:
+            result = await mock_interaction_server.on_interaction(
+                b'{"type": 2, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+            )
+
+        build.assert_not_called()
+        assert result.status_code == 200
+        assert data_binding.default_json_loads(result.payload)["data"]["components"] == [
+            data_binding.default_json_loads(row.fragment.data)
+        ]
+
+    @pytest.fixture
+    def auto_defer_server(
+        self,
+        mock_interaction_server: interaction_server_impl.InteractionServer,
+        mock_rest_client: rest_impl.RESTClientImpl,
+    ):
+        mock_interaction_server._public_key = mock.Mock()
+        mock_interaction_server._auto_defer_after = 0.01
+        mock_interaction_server._deferral_statistics = interaction_server_impl.InteractionDeferralStatistics()
+        mock_rest_client.interaction_deferred_builder = special_endpoints_impl.InteractionDeferredBuilder
+        mock_rest_client.edit_interaction_response = mock.AsyncMock()
+        mock_rest_client.execute_webhook = mock.AsyncMock()
+        return mock_interaction_server
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_when_listener_is_on_time(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_entity_factory.deserialize_interaction.return_value = mock.Mock(command_interactions.CommandInteraction)
+        builder = special_endpoints_impl.InteractionMessageBuilder(4, "hi")
+        auto_defer_server.router.set_command("cmd", mock.AsyncMock(return_value=builder))
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+        )
+
+        assert result.status_code == 200
+        assert result.payload.startswith(b'{"type":4,"data":{"content":"hi"')
+        assert auto_defer_server.deferral_statistics == interaction_server_impl.InteractionDeferralStatistics(
+            dispatched=1, deferred=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_when_listener_misses_deadline(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+        mock_rest_client: rest_impl.RESTClientImpl,
+    ):
+        interaction = mock.Mock(command_interactions.CommandInteraction, application_id=123, token="tok")
+        mock_entity_factory.deserialize_interaction.return_value = interaction
+        builder = special_endpoints_impl.InteractionMessageBuilder(4, "hi", mentions_everyone=False)
+        release = asyncio.Event()
+
+        async def listener(_):
+            await release.wait()
+            return builder
+
+        auto_defer_server.router.set_command("cmd", listener)
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+        )
+
+        assert result.status_code == 200
+        assert result.payload == b'{"type":5}'
+        mock_rest_client.edit_interaction_response.assert_not_called()
+
+        release.set()
+        await asyncio.gather(*auto_defer_server._running_generator_listeners)
+
+        mock_rest_client.edit_interaction_response.assert_awaited_once_with(
+            123,
+            "tok",
+            "hi",
+            attachments=builder.attachments,
+            components=builder.components,
+            embeds=builder.embeds,
+            mentions_everyone=False,
+            user_mentions=builder.user_mentions,
+            role_mentions=builder.role_mentions,
+        )
+        assert auto_defer_server.deferral_statistics == interaction_server_impl.InteractionDeferralStatistics(
+            dispatched=1, deferred=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_when_component_creates_message(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+        mock_rest_client: rest_impl.RESTClientImpl,
+    ):
+        interaction = mock.Mock(component_interactions.ComponentInteraction, application_id=123, token="tok")
+        mock_entity_factory.deserialize_interaction.return_value = interaction
+        builder = special_endpoints_impl.InteractionMessageBuilder(4, "hi", flags=64)
+        release = asyncio.Event()
+
+        async def listener(_):
+            await release.wait()
+            yield builder
+
+        auto_defer_server.router.set_component("vote:", listener)
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 3, "data": {"custom_id": "vote:1"}}', b"signature", b"timestamp"
+        )
+
+        assert result.payload == b'{"type":6}'
+
+        release.set()
+        await asyncio.gather(*auto_defer_server._running_generator_listeners)
+
+        mock_rest_client.execute_webhook.assert_awaited_once_with(
+            123,
+            "tok",
+            "hi",
+            attachments=undefined.UNDEFINED,
+            components=undefined.UNDEFINED,
+            embeds=undefined.UNDEFINED,
+            poll=undefined.UNDEFINED,
+            tts=undefined.UNDEFINED,
+            mentions_everyone=undefined.UNDEFINED,
+            user_mentions=undefined.UNDEFINED,
+            role_mentions=undefined.UNDEFINED,
+            flags=64,
+        )
+        mock_rest_client.edit_interaction_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_when_response_fails(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_entity_factory.deserialize_interaction.return_value = mock.Mock(command_interactions.CommandInteraction)
+        mock_exception = RuntimeError("oh no")
+        release = asyncio.Event()
+
+        async def listener(_):
+            await release.wait()
+            raise mock_exception
+
+        auto_defer_server.router.set_command("cmd", listener)
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+        )
+
+        assert result.payload == b'{"type":5}'
+
+        with mock.patch.object(asyncio, "get_running_loop") as get_running_loop:
+            release.set()
+            await asyncio.gather(*auto_defer_server._running_generator_listeners)
+
+        get_running_loop.return_value.call_exception_handler.assert_called_once_with(
+            {"message": "Exception occurred while responding to a deferred interaction", "exception": mock_exception}
+        )
+        assert auto_defer_server.deferral_statistics == interaction_server_impl.InteractionDeferralStatistics(
+            dispatched=1, deferred=1, failed=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_flags(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+        mock_rest_client: rest_impl.RESTClientImpl,
+    ):
+        interaction = mock.Mock(command_interactions.CommandInteraction, application_id=123, token="tok")
+        mock_entity_factory.deserialize_interaction.return_value = interaction
+        auto_defer_server._auto_defer_flags = messages.MessageFlag.EPHEMERAL
+        builder = special_endpoints_impl.InteractionMessageBuilder(4, "hi", flags=messages.MessageFlag.EPHEMERAL)
+        release = asyncio.Event()
+
+        async def listener(_):
+            await release.wait()
+            return builder
+
+        auto_defer_server.router.set_command("cmd", listener)
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+        )
+
+        assert result.payload == b'{"type":5,"data":{"flags":64}}'
+
+        release.set()
+        await asyncio.gather(*auto_defer_server._running_generator_listeners)
+
+        mock_rest_client.edit_interaction_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_when_ephemeral_response_after_public_deferral(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+        mock_rest_client: rest_impl.RESTClientImpl,
+    ):
+        mock_entity_factory.deserialize_interaction.return_value = mock.Mock(command_interactions.CommandInteraction)
+        builder = special_endpoints_impl.InteractionMessageBuilder(4, "secret", flags=messages.MessageFlag.EPHEMERAL)
+        release = asyncio.Event()
+
+        async def listener(_):
+            await release.wait()
+            return builder
+
+        auto_defer_server.router.set_command("cmd", listener)
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 2, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+        )
+
+        assert result.payload == b'{"type":5}'
+
+        with mock.patch.object(asyncio, "get_running_loop") as get_running_loop:
+            release.set()
+            await asyncio.gather(*auto_defer_server._running_generator_listeners)
+
+        mock_rest_client.edit_interaction_response.assert_not_called()
+        get_running_loop.return_value.call_exception_handler.assert_called_once_with(
+            {"message": "Exception occurred while responding to a deferred interaction", "exception": mock.ANY}
+        )
+        exception = get_running_loop.return_value.call_exception_handler.call_args.args[0]["exception"]
+        assert isinstance(exception, ValueError)
+        assert auto_defer_server.deferral_statistics == interaction_server_impl.InteractionDeferralStatistics(
+            dispatched=1, deferred=1, failed=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_interaction_with_auto_defer_ignores_autocomplete(
+        self,
+        auto_defer_server: interaction_server_impl.InteractionServer,
+        mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
+    ):
+        mock_entity_factory.deserialize_interaction.return_value = mock.Mock(
+            command_interactions.AutocompleteInteraction
+        )
+
+        async def listener(_):
+            await asyncio.sleep(0.05)
+
+        auto_defer_server.router.set_autocomplete("cmd", listener)
+
+        result = await auto_defer_server.on_interaction(
+            b'{"type": 4, "data": {"type": 1, "name": "cmd"}}', b"signature", b"timestamp"
+        )
+
+        assert result.status_code == 204
+        assert auto_defer_server.deferral_statistics == interaction_server_impl.InteractionDeferralStatistics()
+
     @pytest.mark.asyncio
     async def test_on_interaction_on_deserialize_unrecognised_entity_error(
         self,
@@ -897,6 +1395,7 @@ async def test_on_interaction_on_deserialize_unrecognised_entity_error(
         mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
     ):
         mock_interaction_server._public_key = mock.Mock()
+        mock_interaction_server.set_listener(command_interactions.CommandInteraction, mock.AsyncMock())
         mock_entity_factory.deserialize_interaction.side_effect = errors.UnrecognisedEntityError("blah")
 
         result = await mock_interaction_server.on_interaction(b'{"type": 2}', b"signature", b"timestamp")
@@ -915,6 +1414,7 @@ async def test_on_interaction_on_failed_deserialize(
         mock_entity_factory: entity_factory_impl.EntityFactoryImpl,
     ):
         mock_interaction_server._public_key = mock.Mock()
+        mock_interaction_server.set_listener(command_interactions.CommandInteraction, mock.AsyncMock())
         mock_exception = TypeError("OK")
         mock_entity_factory.deserialize_interaction.side_effect = mock_exception
 
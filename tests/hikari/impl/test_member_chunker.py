@@ -0,0 +1,215 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.events import shard_events
+from hikari.impl import member_chunker
+
+
+def _make_chunk_event(nonce, *, chunk_index=0, chunk_count=1, member_count=2):
+    return mock.Mock(
+        shard_events.MemberChunkEvent,
+        nonce=nonce,
+        chunk_index=chunk_index,
+        chunk_count=chunk_count,
+        members={i: object() for i in range(member_count)},
+    )
+
+
+class TestMemberChunker:
+    @pytest.fixture
+    def mock_app(self):
+        app = mock.Mock(shard_count=2)
+        app.shards = {0: mock.AsyncMock(), 1: mock.AsyncMock()}
+        return app
+
+    @pytest.fixture
+    def chunker(self, mock_app):
+        return member_chunker.MemberChunker(mock_app)
+
+    @staticmethod
+    def _sent_nonce(shard, index=-1):
+        return shard.request_guild_members.call_args_list[index].kwargs["nonce"]
+
+    def test___init___when_max_pending_per_shard_too_low(self, mock_app):
+        with pytest.raises(ValueError, match=r"'max_pending_per_shard' must be greater than 0"):
+            member_chunker.MemberChunker(mock_app, max_pending_per_shard=0)
+
+    @pytest.mark.asyncio
+    async def test_request(self, chunker, mock_app):
+        future = chunker.request(123, include_presences=True)
+        await asyncio.sleep(0)
+
+        shard = mock_app.shards[0]
+        shard.request_guild_members.assert_awaited_once_with(123, include_presences=True, nonce=mock.ANY)
+        nonce = self._sent_nonce(shard)
+        assert nonce.startswith("123.")
+        assert len(nonce) <= 32
+        mock_app.event_manager.subscribe.assert_called_once_with(
+            shard_events.MemberChunkEvent, chunker._on_member_chunk
+        )
+        assert chunker.metrics == member_chunker.MemberChunkerMetrics(
+            queued=0, pending=1, completed=0, failed=0, chunks_received=0, members_received=0
+        )
+
+        await chunker._on_member_chunk(_make_chunk_event(nonce, chunk_index=1, chunk_count=2, member_count=1000))
+        assert not future.done()
+        await chunker._on_member_chunk(_make_chunk_event(nonce, chunk_index=0, chunk_count=2, member_count=500))
+
+        assert await future is None
+        mock_app.event_manager.unsubscribe.assert_called_once_with(
+            shard_events.MemberChunkEvent, chunker._on_member_chunk
+        )
+        assert chunker.metrics == member_chunker.MemberChunkerMetrics(
+            queued=0, pending=0, completed=1, failed=0, chunks_received=2, members_received=1500
+        )
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_uses_the_guild_shard(self, chunker, mock_app):
+        chunker.request(1 << 22)
+        await asyncio.sleep(0)
+
+        mock_app.shards[0].request_guild_members.assert_not_called()
+        mock_app.shards[1].request_guild_members.assert_awaited_once_with(
+            1 << 22, include_presences=mock.ANY, nonce=mock.ANY
+        )
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_when_already_requested(self, chunker):
+        future = chunker.request(123)
+
+        assert chunker.request(123) is future
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_with_priority(self, chunker, mock_app):
+        chunker.request(2)
+        chunker.request(4)
+        chunker.request(6, priority=True)
+        await asyncio.sleep(0)
+
+        assert [c.args[0] for c in mock_app.shards[0].request_guild_members.call_args_list] == [6, 2, 4]
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_with_priority_moves_queued_request_up(self, chunker, mock_app):
+        chunker.request(2)
+        future = chunker.request(4)
+
+        assert chunker.request(4, priority=True) is future
+        await asyncio.sleep(0)
+
+        assert [c.args[0] for c in mock_app.shards[0].request_guild_members.call_args_list] == [4, 2]
+        mock_app.shards[0].request_guild_members.assert_has_awaits(
+            [mock.call(4, include_presences=mock.ANY, nonce=mock.ANY)]
+        )
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_max_pending_per_shard(self, mock_app):
+        chunker = member_chunker.MemberChunker(mock_app, max_pending_per_shard=1)
+        shard = mock_app.shards[0]
+        first = chunker.request(2)
+        chunker.request(4)
+        await asyncio.sleep(0)
+
+        shard.request_guild_members.assert_awaited_once_with(2, include_presences=mock.ANY, nonce=mock.ANY)
+        assert chunker.metrics.queued == 1
+        assert chunker.metrics.pending == 1
+
+        await chunker._on_member_chunk(_make_chunk_event(self._sent_nonce(shard)))
+        await first
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert shard.request_guild_members.await_count == 2
+        assert shard.request_guild_members.call_args.args == (4,)
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_when_sending_fails(self, chunker, mock_app):
+        error = errors.ComponentStateConflictError("shard 0 is not connected")
+        mock_app.shards[0].request_guild_members.side_effect = error
+
+        future = chunker.request(123)
+
+        with pytest.raises(errors.ComponentStateConflictError):
+            await future
+
+        await asyncio.sleep(0)
+        assert chunker.metrics.failed == 1
+        assert chunker.metrics.pending == 0
+        mock_app.event_manager.unsubscribe.assert_called_once_with(
+            shard_events.MemberChunkEvent, chunker._on_member_chunk
+        )
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_when_timed_out(self, mock_app):
+        chunker = member_chunker.MemberChunker(mock_app, timeout=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await chunker.request(123)
+
+        assert chunker.metrics.failed == 1
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test_request_when_cancelled_while_queued(self, mock_app):
+        chunker = member_chunker.MemberChunker(mock_app, max_pending_per_shard=1)
+        chunker.request(2)
+        future = chunker.request(4)
+
+        future.cancel()
+        await asyncio.sleep(0)
+
+        assert chunker.metrics.queued == 0
+        assert chunker.request(4) is not future
+        await chunker.close()
+
+    @pytest.mark.asyncio
+    async def test__on_member_chunk_ignores_unknown_nonces(self, chunker):
+        await chunker._on_member_chunk(_make_chunk_event(None))
+        await chunker._on_member_chunk(_make_chunk_event("unknown"))
+
+        assert chunker.metrics.chunks_received == 0
+
+    @pytest.mark.asyncio
+    async def test_close(self, chunker, mock_app):
+        queued = chunker.request(2)
+        await asyncio.sleep(0)
+
+        await chunker.close()
+
+        assert queued.cancelled()
+        await asyncio.sleep(0)
+        assert chunker.metrics.pending == 0
+        mock_app.event_manager.unsubscribe.assert_called_once_with(
+            shard_events.MemberChunkEvent, chunker._on_member_chunk
+        )
@@ -1937,6 +1937,22 @@ def test__build_message_payload_with_components_v2_and_flags(self, rest_client):
             payload.get("flags") is message_models.MessageFlag.IS_COMPONENTS_V2 | message_models.MessageFlag.EPHEMERAL
         )
 
+    def test__build_message_payload_with_frozen_components(self, rest_client):
+        attachment = files.Bytes(b"meow", "cat.png")
+        row = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.MessageActionRowBuilder().add_link_button("https://example.com", label="Hi")
+        )
+        container = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.ContainerComponentBuilder().add_file(attachment)
+        )
+
+        payload, form = rest_client._build_message_payload(components=[row, container])
+
+        assert payload["components"] == data_binding.JSONFragment.from_array([row.fragment, container.fragment])
+        assert payload.get("flags") is message_models.MessageFlag.IS_COMPONENTS_V2
+        assert form is not None
+        assert payload["attachments"] == [{"id": 0, "filename": "cat.png"}]
+
     def test_interaction_deferred_builder(self, rest_client):
         result = rest_client.interaction_deferred_builder(5)
 
@@ -3842,6 +3858,179 @@ async def test_execute_webhook_voice_message(self, rest_client):
             expected_route, form_builder=mock_form, query={"wait": "true"}, auth=None
         )
 
+    async def test_execute_webhooks(self, rest_client):
+        webhook = mock.Mock(webhooks.ExecutableWebhook, webhook_id=432)
+        mock_body = data_binding.JSONObjectBuilder()
+        mock_body.put("testing", "ensure_in_test")
+        error = errors.NotFoundError("", {}, "", "")
+        rest_client._build_message_payload = mock.Mock(return_value=(mock_body, None))
+        rest_client._request = mock.AsyncMock(side_effect=[{"id": "1"}, error])
+        rest_client._entity_factory.deserialize_message.side_effect = lambda payload: payload["id"]
+
+        results = [
+            result
+            async for result in rest_client.execute_webhooks(
+                [(webhook, "token"), (123, "other token")], "new content", username="davfsa", tts=True
+            )
+        ]
+
+        assert sorted(results, key=lambda result: result[0] == 123) == [(webhook, "1"), (123, error)]
+        rest_client._build_message_payload.assert_called_once_with(
+            content="new content",
+            attachment=undefined.UNDEFINED,
+            attachments=undefined.UNDEFINED,
+            component=undefined.UNDEFINED,
+            components=undefined.UNDEFINED,
+            embed=undefined.UNDEFINED,
+            embeds=undefined.UNDEFINED,
+            poll=undefined.UNDEFINED,
+            tts=True,
+            flags=undefined.UNDEFINED,
+            mentions_everyone=undefined.UNDEFINED,
+            user_mentions=undefined.UNDEFINED,
+            role_mentions=undefined.UNDEFINED,
+        )
+        assert mock_body == {"testing": "ensure_in_test", "username": "davfsa"}
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(
+                    routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=432, token="token"),
+                    json=mock_body,
+                    query={"wait": "true", "with_components": "true"},
+                    auth=None,
+                ),
+                mock.call(
+                    routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=123, token="other token"),
+                    json=mock_body,
+                    query={"wait": "true", "with_components": "true"},
+                    auth=None,
+                ),
+            ],
+            any_order=True,
+        )
+
+    async def test_execute_webhooks_when_form(self, rest_client):
+        mock_form = mock.Mock(read_resources=mock.AsyncMock())
+        mock_body = data_binding.JSONObjectBuilder()
+        mock_body.put("testing", "ensure_in_test")
+        rest_client._build_message_payload = mock.Mock(return_value=(mock_body, mock_form))
+        rest_client._request = mock.AsyncMock(return_value={"id": "1"})
+
+        results = [
+            result async for result in rest_client.execute_webhooks([(1, "token"), (2, "token")], attachment=object())
+        ]
+
+        assert len(results) == 2
+        mock_form.read_resources.assert_awaited_once_with(executor=rest_client._executor)
+        mock_form.add_field.assert_called_once_with(
+            "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
+        )
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(
+                    routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=webhook_id, token="token"),
+                    form_builder=mock_form,
+                    query={"wait": "true", "with_components": "true"},
+                    auth=None,
+                )
+                for webhook_id in (1, 2)
+            ],
+            any_order=True,
+        )
+
+    async def test_execute_webhooks_limits_concurrency(self, rest_client):
+        running = 0
+        max_running = 0
+
+        async def request(*args, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"id": "1"}
+
+        rest_client._build_message_payload = mock.Mock(return_value=(data_binding.JSONObjectBuilder(), None))
+        rest_client._request = request
+
+        results = [
+            result
+            async for result in rest_client.execute_webhooks(
+                [(webhook_id, "token") for webhook_id in range(10)], "content", max_concurrency=3
+            )
+        ]
+
+        assert len(results) == 10
+        assert max_running == 3
+
+    async def test_execute_webhooks_cancels_remaining_when_closed(self, rest_client):
+        blocked = asyncio.Event()
+        cancelled = []
+
+        async def request(route, **kwargs):
+            if route == routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=1, token="token"):
+                return {"id": "1"}
+
+            try:
+                await blocked.wait()
+            except asyncio.CancelledError:
+                cancelled.append(route)
+                raise
+
+        rest_client._build_message_payload = mock.Mock(return_value=(data_binding.JSONObjectBuilder(), None))
+        rest_client._request = request
+        iterator = rest_client.execute_webhooks([(1, "token"), (2, "token")], "content")
+
+        assert (await iterator.__anext__())[0] == 1
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        assert cancelled == [routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=2, token="token")]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            errors.RateLimitTooLongError(
+                route="some route", is_global=False, retry_after=120, max_retry_after=60, reset_at=0, limit=0, period=0
+            ),
+            errors.HTTPError("Connection refused"),
+        ],
+    )
+    async def test_execute_webhooks_when_http_error(self, rest_client, error):
+        rest_client._build_message_payload = mock.Mock(return_value=(data_binding.JSONObjectBuilder(), None))
+        rest_client._request = mock.AsyncMock(side_effect=[error, {"id": "2"}])
+        rest_client._entity_factory.deserialize_message.side_effect = lambda payload: payload["id"]
+
+        results = [result async for result in rest_client.execute_webhooks([(1, "token"), (2, "token")], "content")]
+
+        assert sorted(results, key=lambda result: result[0]) == [(1, error), (2, "2")]
+
+    async def test_execute_webhooks_when_aiohttp_error(self, rest_client):
+        error = aiohttp.ClientPayloadError("Response payload is not completed")
+        rest_client._build_message_payload = mock.Mock(return_value=(data_binding.JSONObjectBuilder(), None))
+        rest_client._request = mock.AsyncMock(side_effect=[error, {"id": "2"}])
+        rest_client._entity_factory.deserialize_message.side_effect = lambda payload: payload["id"]
+
+        results = [result async for result in rest_client.execute_webhooks([(1, "token"), (2, "token")], "content")]
+
+        (webhook, result), other_result = sorted(results, key=lambda result: result[0])
+        assert webhook == 1
+        assert isinstance(result, errors.HTTPError)
+        assert result.message == "Response payload is not completed"
+        assert result.__cause__ is error
+        assert other_result == (2, "2")
+
+    async def test_execute_webhooks_when_other_error(self, rest_client):
+        rest_client._build_message_payload = mock.Mock(return_value=(data_binding.JSONObjectBuilder(), None))
+        rest_client._request = mock.AsyncMock(side_effect=errors.ComponentStateConflictError("closed"))
+
+        with pytest.raises(errors.ComponentStateConflictError, match="closed"):
+            await rest_client.execute_webhooks([(1, "token")], "content").__anext__()
+
+    async def test_execute_webhooks_when_max_concurrency_invalid(self, rest_client):
+        with pytest.raises(ValueError, match="max_concurrency must be greater than 0"):
+            await rest_client.execute_webhooks([(1, "token")], "content", max_concurrency=0).__anext__()
+
     @pytest.mark.parametrize("webhook", [mock.Mock(webhooks.ExecutableWebhook, webhook_id=432), 432])
     async def test_fetch_webhook_message(self, rest_client, webhook):
         message_obj = object()
@@ -6790,6 +6979,174 @@ async def test_set_application_commands_without_guild_handles_unknown_command_ty
         rest_client._request.assert_awaited_once_with(expected_route, json=[mock_command_builder.build.return_value])
         mock_command_builder.build.assert_called_once_with(rest_client._entity_factory)
 
+    async def test_sync_application_commands(self, rest_client):
+        unchanged_payload = {
+            "id": "1",
+            "application_id": "4321231",
+            "version": "5",
+            "type": 1,
+            "name": "unchanged",
+            "description": "Unchanged",
+            "name_localizations": None,
+            "description_localizations": {"de": "Unverändert"},
+            "default_member_permissions": "8",
+            "integration_types": [0],
+            "contexts": None,
+            "nsfw": False,
+        }
+        responses = {
+            routes.GET_APPLICATION_GUILD_COMMANDS.compile(application=4321231, guild=6543234): [
+                {"id": "2", "type": 1, "name": "changed", "description": "Old", "nsfw": True},
+                unchanged_payload,
+                {"id": "3", "type": 2, "name": "removed", "description": ""},
+            ],
+            routes.PATCH_APPLICATION_GUILD_COMMAND.compile(application=4321231, guild=6543234, command=2): {"id": "2"},
+            routes.POST_APPLICATION_GUILD_COMMAND.compile(application=4321231, guild=6543234): {"id": "4"},
+            routes.DELETE_APPLICATION_GUILD_COMMAND.compile(application=4321231, guild=6543234, command=3): None,
+        }
+        rest_client._request = mock.AsyncMock(side_effect=lambda route, **_: responses[route])
+        rest_client._entity_factory.deserialize_command.side_effect = lambda payload, **_: payload["id"]
+        hashes = {}
+
+        result = await rest_client.sync_application_commands(
+            StubModel(4321231),
+            [
+                special_endpoints.ContextMenuCommandBuilder(commands.CommandType.MESSAGE, "new"),
+                special_endpoints.SlashCommandBuilder(
+                    "unchanged",
+                    "Unchanged",
+                    description_localizations={locales.Locale.DE: "Unverändert"},
+                    default_member_permissions=permissions.Permissions.ADMINISTRATOR,
+                    is_nsfw=False,
+                ),
+                special_endpoints.SlashCommandBuilder("changed", "New"),
+            ],
+            StubModel(6543234),
+            hashes=hashes,
+        )
+
+        assert result == ["4", "1", "2"]
+        assert hashes.keys() == {"4321231:6543234"}
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(
+                    routes.GET_APPLICATION_GUILD_COMMANDS.compile(application=4321231, guild=6543234),
+                    query={"with_localizations": "true"},
+                ),
+                mock.call(
+                    routes.PATCH_APPLICATION_GUILD_COMMAND.compile(application=4321231, guild=6543234, command=2),
+                    json={
+                        "type": commands.CommandType.SLASH,
+                        "name": "changed",
+                        "description": "New",
+                        "nsfw": False,
+                        "name_localizations": {},
+                        "options": [],
+                        "description_localizations": {},
+                    },
+                ),
+                mock.call(
+                    routes.POST_APPLICATION_GUILD_COMMAND.compile(application=4321231, guild=6543234),
+                    json={"type": commands.CommandType.MESSAGE, "name": "new", "name_localizations": {}},
+                ),
+                mock.call(
+                    routes.DELETE_APPLICATION_GUILD_COMMAND.compile(application=4321231, guild=6543234, command=3)
+                ),
+            ]
+        )
+        assert rest_client._request.await_count == 4
+
+    async def test_sync_application_commands_without_guild(self, rest_client):
+        rest_client._request = mock.AsyncMock(side_effect=[[{"id": "1", "type": 1, "name": "old"}], {"id": "2"}, None])
+
+        result = await rest_client.sync_application_commands(
+            StubModel(4321231), [special_endpoints.SlashCommandBuilder("new", "New")]
+        )
+
+        assert result == [rest_client._entity_factory.deserialize_command.return_value]
+        rest_client._entity_factory.deserialize_command.assert_called_once_with({"id": "2"}, guild_id=None)
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(
+                    routes.GET_APPLICATION_COMMANDS.compile(application=4321231), query={"with_localizations": "true"}
+                ),
+                mock.call(
+                    routes.POST_APPLICATION_COMMAND.compile(application=4321231),
+                    json={
+                        "type": commands.CommandType.SLASH,
+                        "name": "new",
+                        "description": "New",
+                        "name_localizations": {},
+                        "options": [],
+                        "description_localizations": {},
+                    },
+                ),
+                mock.call(routes.DELETE_APPLICATION_COMMAND.compile(application=4321231, command=1)),
+            ]
+        )
+
+    async def test_sync_application_commands_when_unchanged_since_last_sync(self, rest_client):
+        rest_client._request = mock.AsyncMock(side_effect=[[], {"id": "1"}])
+        hashes = {}
+        builders = [special_endpoints.SlashCommandBuilder("command", "Description")]
+        await rest_client.sync_application_commands(StubModel(4321231), builders, StubModel(6543234), hashes=hashes)
+        rest_client._request.reset_mock()
+
+        result = await rest_client.sync_application_commands(
+            StubModel(4321231), builders, StubModel(6543234), hashes=hashes
+        )
+
+        assert result is None
+        rest_client._request.assert_not_called()
+
+    async def test_sync_application_commands_when_changed_since_last_sync(self, rest_client):
+        rest_client._request = mock.AsyncMock(return_value=[])
+        hashes = {"4321231:global": "abc"}
+
+        await rest_client.sync_application_commands(StubModel(4321231), [], hashes=hashes)
+
+        rest_client._request.assert_awaited_once_with(
+            routes.GET_APPLICATION_COMMANDS.compile(application=4321231), query={"with_localizations": "true"}
+        )
+        assert hashes["4321231:global"] != "abc"
+
+    async def test_sync_application_commands_when_request_fails(self, rest_client):
+        rest_client._request = mock.AsyncMock(side_effect=[[], errors.BadRequestError("", {}, "", "")])
+        hashes = {}
+
+        with pytest.raises(errors.BadRequestError):
+            await rest_client.sync_application_commands(
+                StubModel(4321231), [special_endpoints.SlashCommandBuilder("command", "Description")], hashes=hashes
+            )
+
+        assert hashes == {}
+
+    async def test_sync_application_commands_when_request_fails_cancels_other_requests(self, rest_client):
+        cancelled = asyncio.Event()
+
+        async def request(route, **kwargs):
+            if route.method == "GET":
+                return [{"id": "1", "type": 1, "name": "old"}]
+
+            if route.method == "DELETE":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            await asyncio.sleep(0)
+            raise errors.BadRequestError("", {}, "", "")
+
+        rest_client._request = mock.Mock(side_effect=request)
+
+        with pytest.raises(errors.BadRequestError):
+            await rest_client.sync_application_commands(
+                StubModel(4321231), [special_endpoints.SlashCommandBuilder("command", "Description")]
+            )
+
+        assert cancelled.is_set()
+
     async def test_edit_application_command_with_optionals(self, rest_client):
         expected_route = routes.PATCH_APPLICATION_GUILD_COMMAND.compile(
             application=1235432, guild=54123, command=3451231
@@ -29,6 +29,7 @@
 import pytest
 
 from hikari import errors
+from hikari import messages
 from hikari.impl import config
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import interaction_server as interaction_server_impl
@@ -37,6 +38,7 @@
 from hikari.internal import aio
 from hikari.internal import signals
 from hikari.internal import ux
+from hikari.internal import workers
 from tests.hikari import hikari_test_helpers
 
 
@@ -100,6 +102,7 @@ def test___init__(
         self, mock_http_settings, mock_proxy_settings, mock_entity_factory, mock_rest_client, mock_interaction_server
     ):
         mock_executor = mock.Mock()
+        mock_verification_executor = mock.Mock()
 
         stack = contextlib.ExitStack()
         patched_init_logging = stack.enter_context(mock.patch.object(ux, "init_logging"))
@@ -121,6 +124,8 @@ def test___init__(
                 "token_type",
                 b"2123123123123132",
                 allow_color=False,
+                auto_defer_after=2.5,
+                auto_defer_flags=messages.MessageFlag.EPHEMERAL,
                 banner="a banner",
                 suppress_optimization_warning=True,
                 executor=mock_executor,
@@ -131,6 +136,7 @@ def test___init__(
                 max_retries=0,
                 proxy_settings=mock_proxy_settings,
                 rest_url="hresresres",
+                verification_executor=mock_verification_executor,
             )
 
         patched_init_logging.assert_called_once_with("ERROR", allow_color=False, force_color=True)
@@ -150,7 +156,12 @@ def test___init__(
             token_type="token_type",
         )
         patched_interaction_server.assert_called_once_with(
-            entity_factory=mock_entity_factory, public_key=b"2123123123123132", rest_client=mock_rest_client
+            auto_defer_after=2.5,
+            auto_defer_flags=messages.MessageFlag.EPHEMERAL,
+            entity_factory=mock_entity_factory,
+            public_key=b"2123123123123132",
+            rest_client=mock_rest_client,
+            verification_executor=mock_verification_executor,
         )
         assert result.interaction_server is mock_interaction_server
         assert result.rest is mock_rest_client
@@ -172,7 +183,12 @@ def test___init___parses_string_public_key(self):
             result = cls(object(), "token_type", "6f66646f646f646f6f")
 
             interaction_server_impl.InteractionServer.assert_called_once_with(
-                entity_factory=result.entity_factory, public_key=b"ofdododoo", rest_client=result.rest
+                auto_defer_after=None,
+                auto_defer_flags=messages.MessageFlag.NONE,
+                entity_factory=result.entity_factory,
+                public_key=b"ofdododoo",
+                rest_client=result.rest,
+                verification_executor=None,
             )
 
     def test___init___strips_token(self):
@@ -234,6 +250,15 @@ def test___init___generates_default_settings(self):
             assert result.http_settings is config.HTTPSettings.return_value
             assert result.proxy_settings is config.ProxySettings.return_value
 
+    def test_watchdog_property(self, mock_rest_bot):
+        assert mock_rest_bot.watchdog is None
+
+    def test_router_property(self, mock_rest_bot, mock_interaction_server):
+        assert mock_rest_bot.router is mock_interaction_server.router
+
+    def test_worker_id_property(self, mock_rest_bot):
+        assert mock_rest_bot.worker_id is None
+
     @pytest.mark.parametrize(("close_event", "expected"), [(object(), True), (None, False)])
     def test_is_alive_property(self, mock_rest_bot, close_event, expected):
         mock_rest_bot._close_event = close_event
@@ -310,6 +335,19 @@ async def test_close(
         mock_shutdown_1.assert_awaited_once_with(mock_rest_bot)
         mock_shutdown_2.assert_awaited_once_with(mock_rest_bot)
 
+    @pytest.mark.asyncio
+    async def test_close_when_watchdog_alive(
+        self, mock_rest_bot: rest_bot_impl.RESTBot, mock_interaction_server: mock.Mock, mock_rest_client: mock.Mock
+    ):
+        mock_rest_bot._close_event = mock.Mock()
+        mock_rest_bot._watchdog = mock.Mock(is_alive=True, close=mock.AsyncMock())
+        mock_interaction_server.close = mock.AsyncMock()
+        mock_rest_bot._is_closing = False
+
+        await mock_rest_bot.close()
+
+        mock_rest_bot._watchdog.close.assert_awaited_once_with()
+
     @pytest.mark.asyncio
     async def test_close_when_shutdown_callback_raises(
         self, mock_rest_bot: rest_bot_impl.RESTBot, mock_interaction_server: mock.Mock, mock_rest_client: mock.Mock
@@ -533,6 +571,141 @@ def test_run_ignores_close_executor_when_not_present(self, mock_rest_bot):
 
         assert mock_rest_bot.executor is None
 
+    def test_run_calls_on_started_once_started(self, mock_rest_bot):
+        mock_rest_bot.start = mock.Mock()
+        mock_rest_bot.join = mock.Mock()
+        with mock.patch.object(aio, "get_or_make_loop") as get_or_make_loop:
+            # The server must have started, but not been joined, once the worker reports that it has started
+            on_started = mock.Mock(
+                side_effect=lambda: get_or_make_loop.return_value.run_until_complete.assert_called_once_with(
+                    mock_rest_bot.start.return_value
+                )
+            )
+
+            mock_rest_bot._run(
+                asyncio_debug=False,
+                backlog=128,
+                check_for_updates=False,
+                close_loop=False,
+                close_passed_executor=False,
+                coroutine_tracking_depth=None,
+                enable_signal_handlers=False,
+                host=None,
+                path=None,
+                port=None,
+                propagate_interrupts=False,
+                reuse_address=None,
+                reuse_port=None,
+                shutdown_timeout=60.0,
+                socket=None,
+                ssl_context=None,
+                on_started=on_started,
+            )
+
+        on_started.assert_called_once_with()
+
+    def test_run_with_workers(self, mock_rest_bot):
+        mock_sockets = [mock.Mock(), mock.Mock(), mock.Mock()]
+        mock_context = object()
+        notify_started = object()
+        mock_rest_bot._run = mock.Mock()
+
+        with (
+            mock.patch.object(workers, "bind_sockets", return_value=mock_sockets) as bind_sockets,
+            mock.patch.object(workers, "run_workers") as run_workers,
+        ):
+            mock_rest_bot.run(
+                asyncio_debug=True,
+                backlog=321,
+                check_for_updates=False,
+                close_loop=False,
+                close_passed_executor=True,
+                coroutine_tracking_depth=32123,
+                enable_signal_handlers=True,
+                host=["192.168.1.102"],
+                port=4554,
+                propagate_interrupts=True,
+                reuse_address=True,
+                reuse_port=False,
+                shutdown_timeout=534.534,
+                ssl_context=mock_context,
+                workers=3,
+            )
+
+        bind_sockets.assert_called_once_with("192.168.1.102", 4554, 3, reuse_address=True)
+        run_workers.assert_called_once_with(3, mock.ANY)
+        mock_rest_bot._run.assert_not_called()
+        for mock_socket in mock_sockets:
+            mock_socket.close.assert_called_once_with()
+            mock_socket.close.reset_mock()
+
+        with (
+            mock.patch.object(asyncio, "new_event_loop") as new_event_loop,
+            mock.patch.object(asyncio, "set_event_loop") as set_event_loop,
+        ):
+            run_workers.call_args.args[1](1, notify_started)
+
+        set_event_loop.assert_called_once_with(new_event_loop.return_value)
+        assert mock_rest_bot.worker_id == 1
+        mock_sockets[0].close.assert_called_once_with()
+        mock_sockets[1].close.assert_not_called()
+        mock_sockets[2].close.assert_called_once_with()
+        mock_rest_bot._run.assert_called_once_with(
+            asyncio_debug=True,
+            backlog=321,
+            check_for_updates=False,
+            close_loop=False,
+            close_passed_executor=True,
+            coroutine_tracking_depth=32123,
+            enable_signal_handlers=True,
+            host=None,
+            path=None,
+            port=None,
+            propagate_interrupts=False,
+            reuse_address=True,
+            reuse_port=False,
+            shutdown_timeout=534.534,
+            socket=mock_sockets[1],
+            ssl_context=mock_context,
+            on_started=notify_started,
+        )
+
+    @pytest.mark.parametrize(("ssl_context", "expected_port"), [(None, 8080), (object(), 8443)])
+    def test_run_with_workers_uses_default_address(self, mock_rest_bot, ssl_context, expected_port):
+        with (
+            mock.patch.object(workers, "bind_sockets", return_value=[mock.Mock()]) as bind_sockets,
+            mock.patch.object(workers, "run_workers"),
+        ):
+            mock_rest_bot.run(ssl_context=ssl_context, workers=2)
+
+        bind_sockets.assert_called_once_with("0.0.0.0", expected_port, 2, reuse_address=None)
+
+    def test_run_with_workers_shares_passed_socket(self, mock_rest_bot):
+        mock_socket = mock.Mock()
+        mock_rest_bot._run = mock.Mock()
+
+        with (
+            mock.patch.object(workers, "bind_sockets") as bind_sockets,
+            mock.patch.object(workers, "run_workers") as run_workers,
+        ):
+            mock_rest_bot.run(socket=mock_socket, workers=2)
+
+        bind_sockets.assert_not_called()
+
+        with mock.patch.object(asyncio, "new_event_loop"), mock.patch.object(asyncio, "set_event_loop"):
+            run_workers.call_args.args[1](1, object())
+
+        mock_socket.close.assert_not_called()
+        assert mock_rest_bot._run.call_args.kwargs["socket"] is mock_socket
+
+    def test_run_with_workers_when_path(self, mock_rest_bot):
+        with pytest.raises(ValueError, match="Multiple workers cannot be run on a unix domain socket"):
+            mock_rest_bot.run(path="pathathath", workers=2)
+
+    def test_run_with_workers_when_multiple_hosts(self, mock_rest_bot):
+        with pytest.raises(ValueError, match="Multiple workers can only be bound to a single host"):
+            mock_rest_bot.run(host=["127.0.0.1", "::1"], workers=2)
+
     @pytest.mark.asyncio
     async def test_start(
         self, mock_rest_bot: rest_bot_impl.RESTBot, mock_interaction_server: mock.Mock, mock_rest_client: mock.Mock
@@ -38,6 +38,7 @@
 from hikari import presences
 from hikari import urls
 from hikari.impl import config
+from hikari.impl import instrumentation
 from hikari.impl import shard
 from hikari.api import shard as shard_api
 from hikari.internal import aio
@@ -124,6 +125,26 @@ def __init__(self, *, type=None, data=None, extra=None):
         self.extra = extra
 
 
+class TestGatewayTransportStatistics:
+    def test_compression_ratio(self):
+        statistics = shard.GatewayTransportStatistics(compressed_bytes=10, decompressed_bytes=45)
+
+        assert statistics.compression_ratio == 4.5
+
+    def test_compression_ratio_when_nothing_received(self):
+        assert shard.GatewayTransportStatistics().compression_ratio == 1.0
+
+    def test_record(self):
+        statistics = shard.GatewayTransportStatistics()
+
+        statistics.record(10, 40, 0.5)
+        statistics.record(5, 20, 0.25)
+
+        assert statistics == shard.GatewayTransportStatistics(
+            messages=2, compressed_bytes=15, decompressed_bytes=60, decompression_time=0.75
+        )
+
+
 class TestGatewayTransport:
     @pytest.fixture
     def transport_impl(self):
@@ -181,6 +202,56 @@ async def test_receive_json(self, transport_impl, trace):
         transport_impl._receive_and_check.assert_awaited_once_with()
         transport_impl._loads.assert_called_once_with(transport_impl._receive_and_check.return_value)
 
+    @pytest.mark.asyncio
+    async def test_receive_json_when_instrumented(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(side_effect=lambda: transport_impl._finish_receive(b"{}"))
+        transport_impl._logger = mock.Mock(enabled_for=mock.Mock(return_value=False))
+        transport_impl._loads = mock.Mock(return_value={"op": 0, "t": "MESSAGE_CREATE"})
+        transport_impl._instrumentation = instrumentation.PipelineInstrumentation(
+            clock=mock.Mock(side_effect=[1.0, 5.0, 5.5, 6.0, 8.5])
+        )
+
+        assert await transport_impl.receive_json() == {"op": 0, "t": "MESSAGE_CREATE"}
+
+        statistics = transport_impl._instrumentation.get_statistics()
+        assert statistics[instrumentation.WAIT_STAGE]["MESSAGE_CREATE"].total == 4.0
+        assert statistics[instrumentation.RECEIVE_STAGE]["MESSAGE_CREATE"].total == 0.5
+        assert statistics[instrumentation.LOADS_STAGE]["MESSAGE_CREATE"].total == 2.5
+        transport_impl._loads.assert_called_once_with(b"{}")
+
+    @pytest.mark.asyncio
+    async def test_receive_json_when_instrumented_and_not_dispatch(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock()
+        transport_impl._logger = mock.Mock(enabled_for=mock.Mock(return_value=False))
+        transport_impl._loads = mock.Mock(return_value={"op": 11})
+        transport_impl._instrumentation = instrumentation.PipelineInstrumentation(
+            clock=mock.Mock(side_effect=[1.0, 3.0, 3.5, 6.0])
+        )
+
+        assert await transport_impl.receive_json() == {"op": 11}
+
+        assert transport_impl._instrumentation.get_statistics() == {}
+
+    def test__finish_receive(self, transport_impl):
+        decompress = mock.Mock(return_value=b"decompressed data")
+
+        with mock.patch.object(shard.time, "perf_counter", side_effect=[1.0, 1.25]):
+            assert transport_impl._finish_receive(b"data", decompress) == b"decompressed data"
+
+        decompress.assert_called_once_with(b"data")
+        assert transport_impl._statistics == shard.GatewayTransportStatistics(
+            messages=1, compressed_bytes=4, decompressed_bytes=17, decompression_time=0.25
+        )
+
+    def test__finish_receive_when_not_compressed(self, transport_impl):
+        with mock.patch.object(shard.time, "perf_counter") as perf_counter:
+            assert transport_impl._finish_receive(b"data") == b"data"
+
+        perf_counter.assert_not_called()
+        assert transport_impl._statistics == shard.GatewayTransportStatistics(
+            messages=1, compressed_bytes=4, decompressed_bytes=4
+        )
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("trace", [True, False])
     async def test_send_json(self, transport_impl, trace):
@@ -429,6 +500,9 @@ async def test__receive_and_check(self, transport_impl):
         assert await transport_impl._receive_and_check() == b"some text"
 
         transport_impl._ws.receive.assert_awaited_once_with()
+        assert transport_impl._statistics == shard.GatewayTransportStatistics(
+            messages=1, compressed_bytes=9, decompressed_bytes=9
+        )
 
     @pytest.mark.asyncio
     async def test__receive_and_check_when_message_type_is_unknown(self, transport_impl):
@@ -465,6 +539,9 @@ async def test__receive_and_check_when_payload_split_across_frames(self, transpo
         assert await transport_impl._receive_and_check() == b"Hello world!"
 
         assert transport_impl._ws.receive.call_count == 3
+        assert transport_impl._statistics.messages == 1
+        assert transport_impl._statistics.compressed_bytes == 20
+        assert transport_impl._statistics.decompressed_bytes == 12
 
     @pytest.mark.asyncio
     async def test__receive_and_check_when_full_payload_in_one_frame(self, transport_impl):
@@ -474,6 +551,10 @@ async def test__receive_and_check_when_full_payload_in_one_frame(self, transport
         assert await transport_impl._receive_and_check() == b"aaaaaaaaaaaaaaaaaa"
 
         transport_impl._ws.receive.assert_awaited_once_with()
+        assert transport_impl._statistics.messages == 1
+        assert transport_impl._statistics.compressed_bytes == 12
+        assert transport_impl._statistics.decompressed_bytes == 18
+        assert transport_impl._statistics.decompression_time >= 0
 
     @pytest.mark.asyncio
     async def test__receive_and_check_when_message_type_is_unknown(self, transport_impl):
@@ -574,6 +655,20 @@ def test_shard_count_property(self, client):
         client._shard_count = 69
         assert client.shard_count == 69
 
+    def test_compression_property(self, client):
+        client._compression = shard_api.GatewayCompression.PAYLOAD_ZLIB_STREAM
+        assert client.compression is shard_api.GatewayCompression.PAYLOAD_ZLIB_STREAM
+
+    def test_transport_statistics_property(self, client):
+        client._transport_statistics.record(10, 20, 0.5)
+
+        statistics = client.transport_statistics
+        client._transport_statistics.record(10, 20, 0.5)
+
+        assert statistics == shard.GatewayTransportStatistics(
+            messages=1, compressed_bytes=10, decompressed_bytes=20, decompression_time=0.5
+        )
+
     def test_shard__check_if_connected_when_not_alive(self, client):
         with mock.patch.object(shard.GatewayShardImpl, "is_connected", new=False):
             with pytest.raises(errors.ComponentStateConflictError):
@@ -1007,6 +1102,8 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
             loads=client._loads,
             dumps=client._dumps,
             url="wss://somewhere.com?somewhere=true&v=400&encoding=json",
+            instrumentation=client._instrumentation,
+            statistics=client._transport_statistics,
         )
 
         assert create_task.call_count == 2
@@ -1093,6 +1190,8 @@ async def test__connect_when_reconnecting(self, client, http_settings, proxy_set
             dumps=client._dumps,
             compression=shard_api.GatewayCompression.PAYLOAD_ZLIB_STREAM,
             url="wss://notsomewhere.com?somewhere=true&v=400&encoding=json",
+            instrumentation=client._instrumentation,
+            statistics=client._transport_statistics,
         )
 
         assert create_task.call_count == 2
@@ -0,0 +1,390 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+
+import mock
+import pytest
+
+from hikari import emojis
+from hikari import guilds
+from hikari import snowflakes
+from hikari.api import cache as cache_api
+from hikari.api import config as config_api
+from hikari.impl import config
+from hikari.impl import entity_factory
+from hikari.impl import shared_cache
+from hikari.internal import cache as cache_utilities
+from tests.hikari import hikari_test_helpers
+
+
+def _role_payload(role_id: int) -> dict[str, object]:
+    return {
+        "id": str(role_id),
+        "name": "role",
+        "color": 0,
+        "hoist": False,
+        "position": 0,
+        "permissions": "0",
+        "managed": False,
+        "mentionable": False,
+        "flags": 0,
+    }
+
+
+class TestCacheBackend:
+    def test_write(self):
+        backend = hikari_test_helpers.mock_class_namespace(
+            cache_api.CacheBackend, set=mock.Mock(), delete=mock.Mock()
+        )()
+
+        backend.write({"foo": b"bar", "baz": None, "qux": b"quux"})
+
+        assert backend.set.call_args_list == [mock.call("foo", b"bar"), mock.call("qux", b"quux")]
+        backend.delete.assert_called_once_with(["baz"])
+
+
+class TestSQLiteCacheBackend:
+    @pytest.fixture
+    def backend(self, tmp_path):
+        backend = shared_cache.SQLiteCacheBackend(tmp_path / "cache.db")
+        yield backend
+        backend.close()
+
+    def test_get_when_not_found(self, backend):
+        assert backend.get("foo") is None
+
+    def test_set(self, backend):
+        backend.set("foo", b"bar")
+        backend.set("foo", b"baz")
+
+        assert backend.get("foo") == b"baz"
+
+    def test_delete(self, backend):
+        backend.set("foo", b"bar")
+        backend.set("bar", b"baz")
+
+        backend.delete(["foo", "unknown"])
+
+        assert backend.get("foo") is None
+        assert backend.get("bar") == b"baz"
+
+    def test_write(self, backend):
+        backend.set("foo", b"bar")
+
+        backend.write({"foo": None, "bar": b"baz", "unknown": None})
+
+        assert backend.get("foo") is None
+        assert backend.get("bar") == b"baz"
+
+    def test_write_when_failed(self, backend):
+        backend.set("foo", b"bar")
+
+        with pytest.raises(sqlite3.Error):
+            backend.write({"foo": None, "bar": object()})
+
+        assert backend.get("foo") == b"bar"
+        assert backend.get("bar") is None
+
+    def test_get_while_writing(self, backend):
+        backend.set("foo", b"bar")
+        backend._connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            backend._connection.execute("INSERT OR REPLACE INTO entries (key, value) VALUES ('foo', x'00')")
+
+            backend._lock = mock.MagicMock()
+
+            assert backend.get("foo") == b"bar"
+
+            backend._lock.__enter__.assert_not_called()
+
+        finally:
+            backend._connection.execute("ROLLBACK")
+
+    def test_read_connection_is_read_only(self, backend):
+        with pytest.raises(sqlite3.OperationalError):
+            backend._read_connection.execute("DELETE FROM entries")
+
+    def test_shared_between_connections(self, backend, tmp_path):
+        other_backend = shared_cache.SQLiteCacheBackend(tmp_path / "cache.db")
+
+        try:
+            backend.set("foo", b"bar")
+
+            assert other_backend.get("foo") == b"bar"
+
+        finally:
+            other_backend.close()
+
+
+class TestSharedCacheImpl:
+    @pytest.fixture
+    def app_impl(self):
+        return mock.Mock()
+
+    @pytest.fixture
+    def backend(self):
+        return mock.Mock(cache_api.CacheBackend)
+
+    @pytest.fixture
+    def cache_impl(self, app_impl, backend):
+        return shared_cache.SharedCacheImpl(app_impl, config.CacheSettings(), backend)
+
+    @pytest.fixture
+    def role(self, app_impl):
+        return entity_factory.EntityFactoryImpl(app_impl).deserialize_role(
+            _role_payload(123), guild_id=snowflakes.Snowflake(54123)
+        )
+
+    def test_backend_property(self, cache_impl, backend):
+        assert cache_impl.backend is backend
+
+    def test_set_role(self, cache_impl, backend, role, app_impl):
+        cache_impl.set_role(role)
+
+        backend.write.assert_called_once_with({"role:123": mock.ANY})
+        assert cache_utilities.load_snapshot(backend.write.call_args.args[0]["role:123"], app=app_impl) == role
+        assert cache_impl.get_role(123) == role
+
+    def test_set_role_when_not_enabled(self, app_impl, backend, role):
+        cache_impl = shared_cache.SharedCacheImpl(
+            app_impl, config.CacheSettings(components=config_api.CacheComponents.NONE), backend
+        )
+
+        cache_impl.set_role(role)
+
+        backend.write.assert_not_called()
+
+    def test_get_role_when_cached(self, cache_impl, backend, role):
+        cache_impl._role_entries[role.id] = role
+
+        assert cache_impl.get_role(123) == role
+
+        backend.get.assert_not_called()
+
+    def test_get_role_from_backend(self, cache_impl, backend, role, app_impl):
+        backend.get.return_value = cache_utilities.dump_snapshot(role, app=app_impl)
+
+        result = cache_impl.get_role(123)
+
+        assert result == role
+        assert result.app is app_impl
+        backend.get.assert_called_once_with("role:123")
+
+    def test_get_role_when_not_in_backend(self, cache_impl, backend):
+        backend.get.return_value = None
+
+        assert cache_impl.get_role(123) is None
+
+    def test_get_role_when_backend_has_other_type(self, cache_impl, backend, app_impl):
+        backend.get.return_value = cache_utilities.dump_snapshot("not a role", app=app_impl)
+
+        assert cache_impl.get_role(123) is None
+
+    def test_get_role_when_not_enabled(self, app_impl, backend):
+        cache_impl = shared_cache.SharedCacheImpl(
+            app_impl, config.CacheSettings(components=config_api.CacheComponents.NONE), backend
+        )
+
+        assert cache_impl.get_role(123) is None
+
+        backend.get.assert_not_called()
+
+    def test_delete_role(self, cache_impl, backend, role):
+        cache_impl.set_role(role)
+
+        assert cache_impl.delete_role(123) == role
+
+        backend.write.assert_called_with({"role:123": None})
+
+    def test_clear_roles_for_guild(self, cache_impl, backend, role):
+        cache_impl.set_role(role)
+
+        cache_impl.clear_roles_for_guild(54123)
+
+        backend.write.assert_called_with({"role:123": None})
+
+    def test_delete_emoji(self, cache_impl, backend):
+        cache_impl.delete_emoji(123)
+
+        backend.write.assert_called_once_with({"emoji:123": None})
+
+    def test_get_emoji_from_backend(self, cache_impl, backend):
+        with mock.patch.object(shared_cache.SharedCacheImpl, "_lookup") as lookup:
+            assert cache_impl.get_emoji(123) is lookup.return_value
+
+        lookup.assert_called_once_with("emoji:123", emojis.KnownCustomEmoji)
+
+    def test_delete_guild(self, cache_impl, backend):
+        cache_impl.delete_guild(123)
+
+        backend.write.assert_called_once_with({"guild:123": None})
+
+    def test_get_guild_from_backend(self, cache_impl, backend):
+        with mock.patch.object(shared_cache.SharedCacheImpl, "_lookup") as lookup:
+            assert cache_impl.get_guild(123) is lookup.return_value
+
+        lookup.assert_called_once_with("guild:123", guilds.GatewayGuild)
+
+    def test_delete_guild_channel(self, cache_impl, backend):
+        cache_impl.delete_guild_channel(123)
+
+        backend.write.assert_called_once_with({"channel:123": None})
+
+    def test_delete_member(self, cache_impl, backend):
+        cache_impl.delete_member(123, 456)
+
+        backend.write.assert_called_once_with({"member:123:456": None})
+
+    def test_get_member_from_backend(self, cache_impl, backend):
+        with mock.patch.object(shared_cache.SharedCacheImpl, "_lookup") as lookup:
+            assert cache_impl.get_member(123, 456) is lookup.return_value
+
+        lookup.assert_called_once_with("member:123:456", guilds.Member)
+
+    def test_set_members_from_payloads(self, cache_impl, backend, app_impl):
+        app_impl.entity_factory = entity_factory.EntityFactoryImpl(app_impl)
+        payload = {
+            "user": {"id": "456", "username": "nyaa", "discriminator": "0", "avatar": None},
+            "roles": [],
+            "joined_at": None,
+        }
+
+        cache_impl.set_members_from_payloads(snowflakes.Snowflake(123), iter([payload]))
+
+        backend.write.assert_called_once_with({"member:123:456": mock.ANY})
+        member = cache_utilities.load_snapshot(backend.write.call_args.args[0]["member:123:456"], app=app_impl)
+        assert member == app_impl.entity_factory.deserialize_member(payload, guild_id=snowflakes.Snowflake(123))
+
+    def test_clear(self, cache_impl, backend, role):
+        cache_impl.set_role(role)
+
+        cache_impl.clear()
+
+        backend.write.assert_called_with({"role:123": None})
+        assert cache_impl._role_entries == {}
+
+    def test_load_snapshot(self, cache_impl, app_impl, role):
+        cache_impl.set_role(role)
+        snapshot = cache_impl.dump_snapshot()
+        backend = mock.Mock(cache_api.CacheBackend)
+        other_cache = shared_cache.SharedCacheImpl(app_impl, config.CacheSettings(), backend)
+
+        other_cache.load_snapshot(snapshot)
+
+        backend.write.assert_called_once_with({"role:123": mock.ANY})
+        assert other_cache.get_role(123) == role
+
+    @pytest.mark.asyncio
+    async def test_changes_are_written_together_after_the_event(self, cache_impl, backend, role, app_impl):
+        other_role = entity_factory.EntityFactoryImpl(app_impl).deserialize_role(
+            _role_payload(456), guild_id=snowflakes.Snowflake(54123)
+        )
+        threads = []
+        backend.write.side_effect = lambda _: threads.append(threading.current_thread())
+
+        cache_impl.set_role(role)
+        cache_impl.set_role(other_role)
+        cache_impl.delete_role(456)
+
+        backend.write.assert_not_called()
+        assert cache_impl._lookup("role:456", guilds.Role) is None
+
+        await asyncio.sleep(0)
+        # The writer thread runs one batch at a time, so this waits for the previous one to be written
+        await asyncio.wrap_future(cache_impl._writer.submit(lambda: None))
+
+        backend.write.assert_called_once_with({"role:123": mock.ANY, "role:456": None})
+        assert threads != [threading.current_thread()]
+        assert cache_impl._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_lookup_when_change_not_written(self, cache_impl, backend, role):
+        cache_impl._publish("role:123", role)
+
+        assert cache_impl._lookup("role:123", guilds.Role) == role
+
+        backend.get.assert_not_called()
+        cache_impl.flush()
+
+    @pytest.mark.asyncio
+    async def test_flush(self, cache_impl, backend, role):
+        cache_impl._publish("role:123", role)
+
+        cache_impl.flush()
+
+        backend.write.assert_called_once_with({"role:123": mock.ANY})
+        assert cache_impl._flush_handle is None
+
+    def test_close(self, cache_impl, backend, role):
+        cache_impl._publish("role:123", role)
+
+        cache_impl.close()
+
+        backend.write.assert_called_once_with({"role:123": mock.ANY})
+        backend.close.assert_called_once_with()
+        with pytest.raises(RuntimeError):
+            cache_impl._writer.submit(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_publish_copies_entity(self, cache_impl, backend, role):
+        cache_impl._publish("role:123", role)
+        role.name = "changed"
+
+        assert cache_impl._lookup("role:123", guilds.Role).name == "role"
+        cache_impl.flush()
+
+    def test_write_when_backend_fails(self, cache_impl, backend, role):
+        backend.write.side_effect = RuntimeError("disk full")
+
+        with mock.patch.object(shared_cache, "_LOGGER") as logger:
+            cache_impl.set_role(role)
+
+        logger.exception.assert_called_once_with("failed to write %s changes to the shared cache backend", 1)
+
+    def test_shared_between_caches(self, app_impl, tmp_path):
+        factory = entity_factory.EntityFactoryImpl(app_impl)
+        backend = shared_cache.SQLiteCacheBackend(tmp_path / "cache.db")
+        other_app = mock.Mock()
+        other_backend = shared_cache.SQLiteCacheBackend(tmp_path / "cache.db")
+        cache_impl = shared_cache.SharedCacheImpl(app_impl, config.CacheSettings(), backend)
+        other_cache = shared_cache.SharedCacheImpl(other_app, config.CacheSettings(), other_backend)
+        role = factory.deserialize_role(_role_payload(123), guild_id=snowflakes.Snowflake(54123))
+
+        try:
+            cache_impl.set_role(role)
+            result = other_cache.get_role(123)
+
+            assert result == role
+            assert result.app is other_app
+            assert other_cache.get_roles_view() == {}
+
+            cache_impl.delete_role(123)
+
+            assert other_cache.get_role(123) is None
+
+        finally:
+            backend.close()
+            other_backend.close()
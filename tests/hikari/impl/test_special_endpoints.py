@@ -42,6 +42,7 @@
 from hikari.api import special_endpoints as special_endpoints_api
 from hikari.impl import special_endpoints
 from hikari.interactions import base_interactions
+from hikari.internal import data_binding
 from hikari.internal import routes
 from tests.hikari import hikari_test_helpers
 
@@ -1337,6 +1338,71 @@ def test_build(self):
         }
         assert attachments == []
 
+    def test_build_with_frozen_components(self):
+        row = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.MessageActionRowBuilder().add_interactive_button(components.ButtonStyle.PRIMARY, "yes")
+        )
+        container = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.ContainerComponentBuilder().add_text_display("Hi")
+        )
+        builder = special_endpoints.InteractionMessageBuilder(
+            base_interactions.ResponseType.MESSAGE_UPDATE, components=[row, container]
+        )
+
+        result, attachments = builder.build(mock.Mock())
+
+        assert result == {
+            "type": base_interactions.ResponseType.MESSAGE_UPDATE,
+            "data": {
+                "components": [row.build()[0], container.build()[0]],
+                "flags": messages.MessageFlag.IS_COMPONENTS_V2,
+            },
+        }
+        assert attachments == []
+
+    def test__build_fragments_with_frozen_components(self):
+        row = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.MessageActionRowBuilder().add_interactive_button(components.ButtonStyle.PRIMARY, "yes")
+        )
+        container = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.ContainerComponentBuilder().add_text_display("Hi")
+        )
+        builder = special_endpoints.InteractionMessageBuilder(
+            base_interactions.ResponseType.MESSAGE_UPDATE, "hi", components=[row, container]
+        )
+
+        result, attachments = builder._build_fragments(mock.Mock())
+
+        assert result == {
+            "type": base_interactions.ResponseType.MESSAGE_UPDATE,
+            "data": {
+                "content": "hi",
+                "components": data_binding.JSONFragment.from_array([row.fragment, container.fragment]),
+                "flags": messages.MessageFlag.IS_COMPONENTS_V2,
+            },
+        }
+        assert attachments == []
+
+    def test__build_fragments_when_not_all_components_frozen(self):
+        row = special_endpoints.FrozenComponentBuilder(
+            special_endpoints.MessageActionRowBuilder().add_interactive_button(components.ButtonStyle.PRIMARY, "yes")
+        )
+        container = special_endpoints.ContainerComponentBuilder().add_text_display("Hi")
+        builder = special_endpoints.InteractionMessageBuilder(
+            base_interactions.ResponseType.MESSAGE_UPDATE, components=[row, container]
+        )
+
+        result, attachments = builder._build_fragments(mock.Mock())
+
+        assert result == {
+            "type": base_interactions.ResponseType.MESSAGE_UPDATE,
+            "data": {
+                "components": [row.build()[0], container.build()[0]],
+                "flags": messages.MessageFlag.IS_COMPONENTS_V2,
+            },
+        }
+        assert attachments == []
+
     def test_build_for_partial_when_message_create(self):
         mock_entity_factory = mock.Mock()
         builder = special_endpoints.InteractionMessageBuilder(base_interactions.ResponseType.MESSAGE_CREATE)
@@ -2820,6 +2886,68 @@ def test_build_without_undefined_fields(self):
         assert attachments == []
 
 
+class TestFrozenComponentBuilder:
+    @pytest.fixture
+    def container(self):
+        return (
+            special_endpoints.ContainerComponentBuilder(id=5, accent_color=colors.Color(0xFF0000))
+            .add_text_display("Pick one")
+            .add_file("attachment://cat.png")
+        )
+
+    def test_properties(self, container):
+        frozen = special_endpoints.FrozenComponentBuilder(container)
+
+        assert frozen.type is components.ComponentType.CONTAINER
+        assert frozen.id == 5
+        assert frozen.fragment == data_binding.JSONFragment(data_binding.default_json_dumps(container.build()[0]))
+        assert frozen.attachments == tuple(container.build()[1])
+
+    def test_with_dumps(self, container):
+        dumps = mock.Mock(return_value=b'{"type":17}')
+
+        frozen = special_endpoints.FrozenComponentBuilder(container, dumps=dumps)
+
+        assert frozen.fragment == data_binding.JSONFragment(b'{"type":17}')
+        dumps.assert_called_once_with(container.build()[0])
+
+    def test_build(self, container):
+        frozen = special_endpoints.FrozenComponentBuilder(container)
+
+        payload, attachments = frozen.build()
+
+        assert payload == data_binding.default_json_loads(data_binding.default_json_dumps(container.build()[0]))
+        assert attachments == tuple(container.build()[1])
+
+    def test_build_returns_a_copy(self, container):
+        frozen = special_endpoints.FrozenComponentBuilder(container)
+
+        frozen.build()[0]["components"].clear()
+
+        assert len(frozen.build()[0]["components"]) == 2
+
+    def test_changes_after_freezing_are_not_reflected(self, container):
+        frozen = special_endpoints.FrozenComponentBuilder(container)
+
+        container.add_separator()
+
+        assert len(frozen.build()[0]["components"]) == 2
+
+    def test_join(self, container):
+        first = special_endpoints.FrozenComponentBuilder(container)
+        second = special_endpoints.FrozenComponentBuilder(special_endpoints.TextDisplayComponentBuilder(content="Hi"))
+
+        fragment, attachments = special_endpoints.FrozenComponentBuilder.join([first, second])
+
+        assert fragment == data_binding.JSONFragment.from_array([first.fragment, second.fragment])
+        assert attachments == [*first.attachments]
+
+    def test_join_when_not_all_frozen(self, container):
+        frozen = special_endpoints.FrozenComponentBuilder(container)
+
+        assert special_endpoints.FrozenComponentBuilder.join([frozen, container]) is None
+
+
 class TestModalActionRow:
     def test_type_property(self):
         row = special_endpoints.ModalActionRowBuilder()
@@ -0,0 +1,133 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+import re
+
+import mock
+import pytest
+
+from hikari.impl import typed_decoding
+
+try:
+    import msgspec
+
+    from hikari.internal import gateway_records
+
+    msgspec_present = True
+except ModuleNotFoundError:
+    msgspec_present = False
+
+
+@pytest.mark.skipif(msgspec_present, reason="msgspec is present")
+def test_typed_gateway_decoder_init_when_no_msgspec():
+    with pytest.raises(
+        RuntimeError,
+        match=re.escape(
+            "You must install the optional `hikari[msgspec]` dependencies to use the typed gateway decoder."
+        ),
+    ):
+        typed_decoding.TypedGatewayDecoder()
+
+
+def test_typed_gateway_decoder_init_when_msgspec_import_fails():
+    with (
+        mock.patch.dict("sys.modules", {"msgspec": None}),
+        pytest.raises(
+            RuntimeError,
+            match=re.escape(
+                "You must install the optional `hikari[msgspec]` dependencies to use the typed gateway decoder."
+            ),
+        ),
+    ):
+        typed_decoding.TypedGatewayDecoder()
+
+
+@pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+class TestTypedGatewayDecoder:
+    @pytest.fixture
+    def decoder(self):
+        return typed_decoding.TypedGatewayDecoder()
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b'[{"id": "123"}]', [{"id": "123"}]),
+            (b'{"id": "123", "name": "ok"}', {"id": "123", "name": "ok"}),
+            (b"null", None),
+            (
+                b'{"t":null,"s":null,"op":10,"d":{"heartbeat_interval":41250}}',
+                {"t": None, "s": None, "op": 10, "d": {"heartbeat_interval": 41250}},
+            ),
+            (
+                b'{"t":"CHANNEL_DELETE","s":3,"op":0,"d":{"id":"123"}}',
+                {"t": "CHANNEL_DELETE", "s": 3, "op": 0, "d": {"id": "123"}},
+            ),
+            (b'{"t":"MESSAGE_CREATE"}', {"t": "MESSAGE_CREATE"}),
+        ],
+    )
+    def test_decodes_other_payloads_generically(self, decoder, data, expected):
+        assert decoder(data) == expected
+
+    @pytest.mark.parametrize("data", [b'{"op": 0', b'{"t":"MESSAGE_CREATE'])
+    def test_raises_on_invalid_json(self, decoder, data):
+        with pytest.raises(ValueError):  # noqa: PT011 - The error depends on the default decoder
+            decoder(data)
+
+    @pytest.mark.parametrize(
+        ("event", "d", "record"),
+        [
+            (
+                "MESSAGE_CREATE",
+                b'{"id":"1","channel_id":"2","author":{"id":"3","username":"a","discriminator":"0","avatar":null},'
+                b'"content":"hi","timestamp":"2020-03-21T21:20:16.510000+00:00","edited_timestamp":null,"tts":false,'
+                b'"attachments":[],"embeds":[],"pinned":false,"type":0,"flags":0}',
+                "MessageRecord",
+            ),
+            ("GUILD_MEMBER_UPDATE", b'{"guild_id":"1","roles":[],"joined_at":null}', "MemberRecord"),
+        ],
+    )
+    def test_decodes_hot_dispatches_into_records(self, decoder, event, d, record):
+        data = b'{"t":"' + event.encode() + b'","s":5,"op":0,"d":' + d + b"}"
+
+        payload = decoder(data)
+
+        assert payload["op"] == 0
+        assert payload["s"] == 5
+        assert payload["t"] == event
+        assert type(payload["d"]) is getattr(gateway_records, record)
+        assert msgspec.to_builtins(payload["d"]) == msgspec.json.decode(d)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            # Doesn't match the record
+            b'{"t":"GUILD_MEMBER_UPDATE","s":5,"op":0,"d":{"guild_id":"1"}}',
+            # Not sent in the usual order
+            b'{"s":5,"t":"GUILD_MEMBER_UPDATE","op":0,"d":{"guild_id":"1","roles":[],"joined_at":null}}',
+            # Not sent as bytes
+            '{"t":"GUILD_MEMBER_UPDATE","s":5,"op":0,"d":{"guild_id":"1","roles":[],"joined_at":null}}',
+        ],
+    )
+    def test_decodes_hot_dispatches_generically_when_they_cant_be_decoded_into_records(self, decoder, data):
+        payload = decoder(data)
+
+        assert payload == msgspec.json.decode(data)
+        assert type(payload["d"]) is dict
@@ -0,0 +1,108 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+
+import asyncio
+import time
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import watchdog
+
+
+class TestLoopWatchdog:
+    @pytest.mark.parametrize(("threshold", "interval"), [(0, None), (-1, 0.1), (1, 0), (0.1, 0.5)])
+    def test___init___when_invalid(self, threshold, interval):
+        with pytest.raises(ValueError, match=r"'interval'"):
+            watchdog.LoopWatchdog(threshold=threshold, interval=interval)
+
+    def test___init___defaults_interval(self):
+        assert watchdog.LoopWatchdog(threshold=0.1)._interval == 0.05
+        assert watchdog.LoopWatchdog(threshold=2)._interval == 0.1
+
+    def test_unsubscribe(self):
+        callback = mock.Mock()
+        loop_watchdog = watchdog.LoopWatchdog()
+        loop_watchdog.subscribe(callback)
+
+        loop_watchdog.unsubscribe(callback)
+
+        assert loop_watchdog._callbacks == []
+
+    @pytest.mark.asyncio
+    async def test_start_when_already_running(self):
+        loop_watchdog = watchdog.LoopWatchdog()
+        loop_watchdog.start()
+
+        try:
+            with pytest.raises(errors.ComponentStateConflictError):
+                loop_watchdog.start()
+
+        finally:
+            await loop_watchdog.close()
+
+    @pytest.mark.asyncio
+    async def test_close_when_not_running(self):
+        with pytest.raises(errors.ComponentStateConflictError):
+            await watchdog.LoopWatchdog().close()
+
+    @pytest.mark.asyncio
+    async def test_reports_blocking_task(self):
+        async def blocking():
+            time.sleep(0.3)
+
+        callback = mock.Mock()
+        loop_watchdog = watchdog.LoopWatchdog(threshold=0.1, interval=0.02)
+        loop_watchdog.subscribe(callback)
+        loop_watchdog.start()
+        assert loop_watchdog.is_alive
+
+        try:
+            await asyncio.sleep(0.05)
+            await asyncio.create_task(blocking(), name="handler 'blocking' for 'MessageCreateEvent'")
+            await asyncio.sleep(0.05)
+
+        finally:
+            await loop_watchdog.close()
+
+        assert not loop_watchdog.is_alive
+        callback.assert_called_once()
+        report = callback.call_args.args[0]
+        assert report.duration >= 0.1
+        assert report.task_name == "handler 'blocking' for 'MessageCreateEvent'"
+        assert "time.sleep(0.3)" in report.stack[-1]
+
+    def test__report_when_callback_raises(self):
+        callbacks = [mock.Mock(side_effect=RuntimeError), mock.Mock()]
+        loop_watchdog = watchdog.LoopWatchdog()
+        loop_watchdog._callbacks = callbacks
+        report = watchdog.BlockedLoopReport(duration=1.0, task_name=None, stack=())
+
+        with mock.patch.object(watchdog, "_LOGGER") as logger:
+            loop_watchdog._report(report)
+
+        logger.warning.assert_called_once()
+        logger.exception.assert_called_once()
+        callbacks[0].assert_called_once_with(report)
+        callbacks[1].assert_called_once_with(report)
@@ -22,9 +22,11 @@
 
 import contextlib
 import copy as stdlib_copy
+import functools
 
 import attrs
 import mock
+import pytest
 
 from hikari.internal import attrs_extensions
 
@@ -417,3 +419,129 @@ class Foo(ParentClass): ...
 
         assert Foo.__copy__ == attrs_extensions.copy_attrs
         assert Foo.__deepcopy__ == attrs_extensions.deep_copy_attrs
+
+
+class TestLazyFields:
+    @attrs_extensions.with_lazy_fields(str, int, "foo", "bar")
+    @attrs_extensions.with_copy
+    @attrs.define(kw_only=True)
+    class StubModel:
+        foo: int | None = attrs.field()
+        bar: int = attrs.field()
+        baz: str = attrs.field()
+
+    def test_converts_raw_value_on_first_access(self):
+        convert = mock.Mock(return_value=123)
+
+        @attrs_extensions.with_lazy_fields(str, convert, "foo")
+        @attrs.define()
+        class StubClass:
+            foo: int = attrs.field()
+
+        model = StubClass(foo="123")
+
+        assert model.foo == 123
+        assert model.foo == 123
+        convert.assert_called_once_with("123")
+
+    def test_leaves_other_values(self):
+        model = self.StubModel(foo=None, bar=42, baz="ok")
+
+        assert model.foo is None
+        assert model.bar == 42
+        assert model.baz == "ok"
+
+    def test_set_and_delete(self):
+        model = self.StubModel(foo=None, bar=42, baz="ok")
+
+        model.foo = "64"
+        assert model.foo == 64
+
+        del model.bar
+        assert not hasattr(model, "bar")
+
+    def test_class_access(self):
+        assert isinstance(self.StubModel.foo, attrs_extensions.LazyField)
+
+    def test_get_raw_field(self):
+        model = self.StubModel(foo="1", bar="2", baz="3")
+
+        assert attrs_extensions.get_raw_field(model, "foo") == "1"
+        assert model.foo == 1
+        assert attrs_extensions.get_raw_field(model, "foo") == 1
+        assert attrs_extensions.get_raw_field(model, "baz") == "3"
+
+    def test_copy_keeps_raw_values(self):
+        model = self.StubModel(foo="1", bar="2", baz="3")
+
+        result = stdlib_copy.copy(model)
+
+        assert attrs_extensions.get_raw_field(result, "foo") == "1"
+        assert attrs_extensions.get_raw_field(model, "foo") == "1"
+        assert result == self.StubModel(foo=1, bar=2, baz="3")
+
+    def test_redefined_field(self):
+        @attrs.define(kw_only=True)
+        class ParentClass:
+            foo: int | str = attrs.field()
+
+        @attrs_extensions.with_lazy_fields(str, int, "foo")
+        @attrs.define(kw_only=True)
+        class ChildClass(ParentClass):
+            foo: int = attrs.field()
+
+        assert ChildClass(foo="5").foo == 5
+        assert ParentClass(foo="5").foo == "5"
+
+    def test_inherited(self):
+        @attrs.define(kw_only=True)
+        class ChildClass(self.StubModel):
+            qux: str = attrs.field()
+
+        model = ChildClass(foo="5", bar=2, baz="3", qux="4")
+
+        assert model.foo == 5
+        assert model.qux == "4"
+
+
+class TestDeferredFields:
+    @attrs_extensions.with_deferred_fields("foo")
+    @attrs.define(unsafe_hash=True, kw_only=True)
+    class StubModel:
+        id: int = attrs.field()
+        foo: int = attrs.field(eq=False)
+
+    def test_makes_call_on_first_access(self):
+        function = mock.Mock(return_value=123)
+        model = self.StubModel(id=1, foo=attrs_extensions.DeferredCall(function, "a", b="c"))
+
+        function.assert_not_called()
+        assert model.foo == 123
+        assert model.foo == 123
+        function.assert_called_once_with("a", b="c")
+
+    def test_leaves_other_callables(self):
+        partial = functools.partial(int, "5")
+        model = self.StubModel(id=1, foo=partial)
+
+        assert model.foo is partial
+
+    def test_eq_and_hash_dont_make_calls(self):
+        function = mock.Mock()
+        model = self.StubModel(id=1, foo=attrs_extensions.DeferredCall(function))
+        other = self.StubModel(id=1, foo=attrs_extensions.DeferredCall(function))
+
+        assert model == other
+        assert hash(model) == hash(other)
+        function.assert_not_called()
+
+    @pytest.mark.parametrize("field_kwargs", [{}, {"eq": False, "hash": True}])
+    def test_when_field_compared_or_hashed(self, field_kwargs):
+        @attrs.define(unsafe_hash=True)
+        class StubModel:
+            foo: int = attrs.field(**field_kwargs)
+
+        with pytest.raises(
+            TypeError, match=r"Deferred field 'foo' of StubModel must be excluded from equality and hashing"
+        ):
+            attrs_extensions.with_deferred_fields("foo")(StubModel)
@@ -21,14 +21,62 @@
 from __future__ import annotations
 
 import copy
+import datetime
+import importlib
+import pickle
+import zlib
 
 import mock
+import pytest
 
+from hikari import channels
+from hikari import guilds
 from hikari import snowflakes
 from hikari import stickers
+from hikari.impl import entity_factory
+from hikari.internal import attrs_extensions
 from hikari.internal import cache
 
 
+class TestInternPools:
+    def test_intern_string(self) -> None:
+        pools = cache.InternPools()
+        value = "".join(("foo", "bar"))
+
+        assert pools.intern_string(value) is value
+        assert pools.intern_string("".join(("foo", "bar"))) is value
+        assert pools.intern_string(None) is None
+
+    def test_intern_strings(self) -> None:
+        pools = cache.InternPools()
+        value = "".join(("foo", "bar"))
+
+        assert pools.intern_strings([value, "baz"]) == (value, "baz")
+        assert pools.intern_strings(["".join(("foo", "bar"))])[0] is value
+
+    def test_intern_snowflake(self) -> None:
+        pools = cache.InternPools()
+        value = snowflakes.Snowflake(123)
+
+        assert pools.intern_snowflake(value) is value
+        assert pools.intern_snowflake(snowflakes.Snowflake(123)) is value
+        assert pools.intern_snowflake(None) is None
+
+    def test_intern_snowflakes(self) -> None:
+        pools = cache.InternPools()
+        value = snowflakes.Snowflake(123)
+
+        assert pools.intern_snowflakes([value, snowflakes.Snowflake(456)]) == (123, 456)
+        assert pools.intern_snowflakes([snowflakes.Snowflake(123)])[0] is value
+
+    def test_when_disabled(self) -> None:
+        pools = cache.InternPools(generation_size=0)
+        value = snowflakes.Snowflake(123)
+        pools.intern_snowflake(value)
+
+        assert pools.intern_snowflake(snowflakes.Snowflake(123)) is not value
+
+
 class TestStickerData:
     def test_from_entity(self) -> None:
         mock_user = object()
@@ -46,12 +94,12 @@ def test_from_entity(self) -> None:
         data = cache.GuildStickerData.build_from_entity(mock_sticker, user=mock_user)
 
         assert data.id is mock_sticker.id
-        assert data.name is mock_sticker.name
+        assert data.name == mock_sticker.name
         assert data.format_type is mock_sticker.format_type
         assert data.description is mock_sticker.description
-        assert data.guild_id is mock_sticker.guild_id
+        assert data.guild_id == mock_sticker.guild_id
         assert data.is_available is mock_sticker.is_available
-        assert data.tag is mock_sticker.tag
+        assert data.tag == mock_sticker.tag
         assert data.user is mock_user
 
     def test_from_entity_when_user_not_passed(self) -> None:
@@ -74,3 +122,219 @@ def test_from_entity_when_user_not_passed(self) -> None:
         assert data.user is refcell.return_value
         mock_copy.assert_called_once_with(mock_user)
         refcell.assert_called_once_with(mock_copy.return_value)
+
+
+class TestMemberData:
+    def test_build_from_entity_shares_equal_values(self) -> None:
+        def make_member() -> guilds.Member:
+            return mock.Mock(
+                guilds.Member,
+                guild_id=snowflakes.Snowflake(int("54123")),
+                nickname="".join(("nick", "name")),
+                guild_avatar_hash=None,
+                guild_banner_hash=None,
+                role_ids=[snowflakes.Snowflake(int("123")), snowflakes.Snowflake(int("456"))],
+            )
+
+        pools = cache.InternPools()
+
+        data = cache.MemberData.build_from_entity(make_member(), user=mock.Mock(), pools=pools)
+        other_data = cache.MemberData.build_from_entity(make_member(), user=mock.Mock(), pools=pools)
+        unshared_data = cache.MemberData.build_from_entity(make_member(), user=mock.Mock())
+
+        assert data.guild_id is other_data.guild_id
+        assert data.nickname is other_data.nickname
+        assert data.role_ids == (123, 456)
+        assert all(a is b for a, b in zip(data.role_ids, other_data.role_ids))
+        assert data.guild_avatar_hash is None
+        assert unshared_data.nickname == data.nickname
+        assert unshared_data.nickname is not data.nickname
+
+    def test_build_from_entity_keeps_timestamps_raw(self) -> None:
+        factory = entity_factory.EntityFactoryImpl(mock.Mock())
+        payload = {"roles": [], "joined_at": "2015-04-26T06:26:56.936000+00:00"}
+        member = factory.deserialize_member(payload, user=mock.Mock(), guild_id=snowflakes.Snowflake(54123))
+
+        data = cache.MemberData.build_from_entity(member, user=mock.Mock())
+
+        assert attrs_extensions.get_raw_field(data, "joined_at") == "2015-04-26T06:26:56.936000+00:00"
+        assert data.build_entity(mock.Mock()).joined_at == datetime.datetime(
+            2015, 4, 26, 6, 26, 56, 936000, tzinfo=datetime.timezone.utc
+        )
+
+
+class TestComputeGuildVersion:
+    def test_when_unchanged(self) -> None:
+        payload = {"id": "123", "channels": [{"id": "1"}], "emojis": [], "roles": [{"id": "123"}], "members": []}
+
+        assert cache.compute_guild_version(payload) == cache.compute_guild_version(copy.deepcopy(payload))
+
+    def test_ignores_key_order(self) -> None:
+        payload = {"channels": [{"id": "1", "name": "general", "type": 0}], "emojis": [], "roles": []}
+        other_payload = {"roles": [], "emojis": [], "channels": [{"type": 0, "name": "general", "id": "1"}]}
+
+        assert cache.compute_guild_version(payload) == cache.compute_guild_version(other_payload)
+
+    def test_ignores_other_fields(self) -> None:
+        payload = {"id": "123", "channels": [{"id": "1"}], "emojis": [], "roles": [{"id": "123"}]}
+        other_payload = {**payload, "members": [{"user": {"id": "5"}}], "member_count": 5}
+
+        assert cache.compute_guild_version(payload) == cache.compute_guild_version(other_payload)
+
+    @pytest.mark.parametrize("field", ["channels", "emojis", "roles"])
+    def test_when_changed(self, field: str) -> None:
+        payload = {"id": "123", "channels": [{"id": "1"}], "emojis": [], "roles": [{"id": "123"}]}
+        other_payload = {**payload, field: [{"id": "999"}]}
+
+        assert cache.compute_guild_version(payload) != cache.compute_guild_version(other_payload)
+
+
+class TestSnapshot:
+    def test_round_trip(self) -> None:
+        app = object()
+        other_app = object()
+        data = {snowflakes.Snowflake(123): [app, "foo", {1, 2}], "app": app}
+
+        result = cache.load_snapshot(cache.dump_snapshot(data, app=app), app=other_app)
+
+        assert result == {snowflakes.Snowflake(123): [other_app, "foo", {1, 2}], "app": other_app}
+
+    def test_load_snapshot_when_malformed(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cache snapshot"):
+            cache.load_snapshot(b"not a snapshot", app=object())
+
+    def test_load_snapshot_when_disallowed_type(self) -> None:
+        snapshot = zlib.compress(pickle.dumps(mock.Mock))
+
+        with pytest.raises(ValueError, match="Invalid cache snapshot"):
+            cache.load_snapshot(snapshot, app=object())
+
+    @pytest.mark.parametrize(
+        ("module", "name"), [("hikari.internal.ux", "os.getcwd"), ("hikari.guilds", "Role.__init__.__globals__")]
+    )
+    def test_load_snapshot_when_dotted_name(self, module: str, name: str) -> None:
+        # STACK_GLOBAL for module.name, called with no arguments.
+        data = b"\x80\x04"
+        for value in (module, name):
+            data += b"\x8c" + bytes((len(value),)) + value.encode()
+        snapshot = zlib.compress(data + b"\x93)R.")
+
+        with mock.patch("os.getcwd") as getcwd, pytest.raises(ValueError, match="Invalid cache snapshot"):
+            cache.load_snapshot(snapshot, app=object())
+
+        getcwd.assert_not_called()
+
+    def test_load_snapshot_when_other_hikari_global(self) -> None:
+        snapshot = zlib.compress(pickle.dumps(attrs_extensions.copy_attrs))
+
+        with pytest.raises(ValueError, match="Invalid cache snapshot"):
+            cache.load_snapshot(snapshot, app=object())
+
+    @pytest.mark.parametrize(("module", "name"), sorted(cache._SNAPSHOT_GLOBALS))
+    def test_snapshot_globals_exist(self, module: str, name: str) -> None:
+        assert hasattr(importlib.import_module(module), name)
+
+    def test_load_snapshot_when_unknown_persistent_id(self) -> None:
+        snapshot = zlib.compress(b"\x80\x05\x95\x07\x00\x00\x00\x00\x00\x00\x00\x8c\x03foo\x94Q.")
+
+        with pytest.raises(ValueError, match="Invalid cache snapshot"):
+            cache.load_snapshot(snapshot, app=object())
+
+
+def _make_channel(
+    channel_type: type[channels.PermissibleGuildChannel], channel_id: int, position: int, parent_id: int | None = None
+) -> channels.PermissibleGuildChannel:
+    return mock.Mock(
+        channel_type,
+        id=snowflakes.Snowflake(channel_id),
+        position=position,
+        parent_id=None if parent_id is None else snowflakes.Snowflake(parent_id),
+    )
+
+
+class TestGuildChannelOrder:
+    def test_order(self) -> None:
+        order = cache.GuildChannelOrder()
+
+        order.add(_make_channel(channels.GuildVoiceChannel, 1, 0, 11))
+        order.add(_make_channel(channels.GuildTextChannel, 2, 1, 11))
+        order.add(_make_channel(channels.GuildCategory, 10, 1))
+        order.add(_make_channel(channels.GuildCategory, 11, 0))
+        order.add(_make_channel(channels.GuildTextChannel, 3, 0, 10))
+        order.add(_make_channel(channels.GuildTextChannel, 4, 0))
+        order.add(_make_channel(channels.GuildTextChannel, 5, 0))
+
+        assert list(order) == [4, 5, 11, 2, 1, 10, 3]
+        assert len(order) == 7
+
+    def test_add_when_moving_category(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.add(_make_channel(channels.GuildCategory, 10, 0))
+        order.add(_make_channel(channels.GuildCategory, 11, 1))
+        order.add(_make_channel(channels.GuildTextChannel, 1, 0, 10))
+        order.add(_make_channel(channels.GuildTextChannel, 2, 0, 11))
+
+        order.add(_make_channel(channels.GuildCategory, 10, 2))
+
+        assert list(order) == [11, 2, 10, 1]
+
+    def test_add_when_moving_channel_between_categories(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.add(_make_channel(channels.GuildCategory, 10, 0))
+        order.add(_make_channel(channels.GuildCategory, 11, 1))
+        order.add(_make_channel(channels.GuildTextChannel, 1, 0, 10))
+
+        order.add(_make_channel(channels.GuildTextChannel, 1, 0, 11))
+        order.add(_make_channel(channels.GuildCategory, 10, 2))
+
+        assert list(order) == [11, 1, 10]
+
+    def test_add_resets_sorted_channels(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.sorted_channels = {}
+
+        order.add(_make_channel(channels.GuildTextChannel, 1, 0))
+
+        assert order.sorted_channels is None
+
+    def test_remove(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.add(_make_channel(channels.GuildTextChannel, 1, 0))
+        order.add(_make_channel(channels.GuildTextChannel, 2, 1))
+        order.sorted_channels = {}
+
+        order.remove(snowflakes.Snowflake(1))
+
+        assert list(order) == [2]
+        assert order.sorted_channels is None
+
+    def test_remove_category(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.add(_make_channel(channels.GuildTextChannel, 1, 5))
+        order.add(_make_channel(channels.GuildCategory, 10, 0))
+        order.add(_make_channel(channels.GuildTextChannel, 2, 0, 10))
+
+        order.remove(snowflakes.Snowflake(10))
+
+        assert list(order) == [2, 1]
+
+    def test_remove_when_unknown(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.sorted_channels = {}
+
+        order.remove(snowflakes.Snowflake(1))
+
+        assert order.sorted_channels == {}
+
+    def test_pickle(self) -> None:
+        order = cache.GuildChannelOrder()
+        order.add(_make_channel(channels.GuildCategory, 10, 0))
+        order.add(_make_channel(channels.GuildTextChannel, 1, 0, 10))
+        order.sorted_channels = {}
+
+        result = pickle.loads(pickle.dumps(order))
+        result.add(_make_channel(channels.GuildCategory, 10, 1))
+        result.add(_make_channel(channels.GuildTextChannel, 2, 0))
+
+        assert list(result) == [2, 10, 1]
+        assert list(order) == [10, 1]
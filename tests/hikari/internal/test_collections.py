@@ -27,6 +27,7 @@
 import mock
 import pytest
 
+from hikari import snowflakes
 from hikari.internal import collections
 
 
@@ -162,6 +163,62 @@ def test___setitem___when_limit_reached_and_expire_callback_set(self):
         expire_callback.assert_has_calls((mock.call("no"), mock.call("lslsl")))
 
 
+class TestInternPool:
+    def test_intern(self):
+        pool = collections.InternPool(generation_size=10)
+        value = snowflakes.Snowflake(123)
+
+        assert pool.intern(value) is value
+        assert pool.intern(snowflakes.Snowflake(123)) is value
+        assert len(pool) == 1
+
+    def test_intern_when_generation_full(self):
+        pool = collections.InternPool(generation_size=2)
+        value = "".join(("foo", "bar"))
+        pool.intern(value)
+        pool.intern("baz")
+
+        pool.intern("bork")
+
+        assert len(pool) == 3
+        assert pool.intern("".join(("foo", "bar"))) is value
+
+    def test_intern_drops_values_unused_for_a_generation(self):
+        pool = collections.InternPool(generation_size=2)
+        value = "".join(("foo", "bar"))
+        used_value = "".join(("ba", "z"))
+        pool.intern(value)
+        pool.intern(used_value)
+        pool.intern("bork")
+        # Moves the value back to the young generation
+        pool.intern("".join(("ba", "z")))
+
+        pool.intern("qux")
+
+        assert len(pool) == 3
+        assert pool.intern("".join(("ba", "z"))) is used_value
+        assert pool.intern("".join(("foo", "bar"))) is not value
+
+    def test_intern_when_disabled(self):
+        pool = collections.InternPool(generation_size=0)
+        value = snowflakes.Snowflake(123)
+
+        assert pool.intern(value) is value
+        assert pool.intern(snowflakes.Snowflake(123)) is not value
+        assert len(pool) == 0
+
+    def test_clear(self):
+        pool = collections.InternPool(generation_size=1)
+        value = "".join(("foo", "bar"))
+        pool.intern(value)
+        pool.intern("baz")
+
+        pool.clear()
+
+        assert len(pool) == 0
+        assert pool.intern("".join(("foo", "bar"))) is not value
+
+
 class TestSnowflakeSet:
     def test_init_creates_empty_array(self):
         # given
@@ -274,6 +331,48 @@ def test_discard(self, start_with, discard, expect):
         # then
         assert sfs._ids.tolist() == expect
 
+    @pytest.mark.parametrize(
+        ("kwargs", "expect"),
+        [
+            ({}, [9, 18, 27, 36, 45, 54, 63]),
+            ({"after": 27}, [36, 45, 54, 63]),
+            ({"after": 28}, [36, 45, 54, 63]),
+            ({"before": 27}, [9, 18]),
+            ({"before": 26}, [9, 18]),
+            ({"after": 9, "before": 63}, [18, 27, 36, 45, 54]),
+            ({"limit": 3}, [45, 54, 63]),
+            ({"after": 9, "before": 45, "limit": 2}, [27, 36]),
+            ({"limit": 20}, [9, 18, 27, 36, 45, 54, 63]),
+            ({"after": 63}, []),
+            ({"before": 9}, []),
+            ({"limit": 0}, []),
+        ],
+    )
+    def test_get_range(self, kwargs, expect):
+        # given
+        sfs = collections.SnowflakeSet()
+        sfs._ids.extend([9, 18, 27, 36, 45, 54, 63])
+        # when
+        result = sfs.get_range(**kwargs)
+        # then
+        assert result == expect
+        assert all(isinstance(sf, snowflakes.Snowflake) for sf in result)
+
+    def test_pop_oldest(self):
+        # given
+        sfs = collections.SnowflakeSet()
+        sfs._ids.extend([9, 18, 27])
+        # when
+        result = sfs.pop_oldest()
+        # then
+        assert result == 9
+        assert isinstance(result, snowflakes.Snowflake)
+        assert sfs._ids.tolist() == [18, 27]
+
+    def test_pop_oldest_when_empty(self):
+        with pytest.raises(KeyError):
+            collections.SnowflakeSet().pop_oldest()
+
     @pytest.mark.parametrize(
         ("start_with", "look_for", "expect"),
         [
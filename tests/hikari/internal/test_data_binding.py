@@ -20,6 +20,8 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import contextlib
+import json
 import typing
 
 import aiohttp
@@ -28,6 +30,7 @@
 import multidict
 import pytest
 
+from hikari import files
 from hikari import snowflakes
 from hikari import undefined
 from hikari.internal import data_binding
@@ -104,6 +107,39 @@ async def test_build(self, form_builder):
             ]
         )
 
+    @pytest.mark.asyncio
+    async def test_read_resources(self, form_builder):
+        form_builder.add_resource("aye", files.Bytes(b"meow", "cat.txt"))
+        form_builder.add_resource("lmao", files.Bytes(b"\x00\x01", "data.bin", mimetype=None))
+
+        await form_builder.read_resources()
+
+        (name1, resource1), (name2, resource2) = form_builder._resources
+        assert (name1, name2) == ("aye", "lmao")
+        assert await resource1.read() == b"meow"
+        assert resource1.filename == "cat.txt"
+        assert resource1.mimetype == "text/plain"
+        assert await resource2.read() == b"\x00\x01"
+        assert resource2.filename == "data.bin"
+        assert resource2.mimetype == "application/octet-stream"
+
+    @pytest.mark.asyncio
+    async def test_read_resources_only_reads_once(self, form_builder):
+        stream = mock.Mock(filename="testing", mimetype="text/plain", read=mock.AsyncMock(return_value=b"data"))
+        resource = mock.Mock(
+            stream=mock.Mock(return_value=mock.AsyncMock(__aenter__=mock.AsyncMock(return_value=stream)))
+        )
+        executor = object()
+        form_builder.add_resource("aye", resource)
+
+        await form_builder.read_resources(executor)
+        for _ in range(2):
+            async with contextlib.AsyncExitStack() as stack:
+                await form_builder.build(stack, executor)
+
+        resource.stream.assert_called_once_with(executor=executor)
+        stream.read.assert_awaited_once_with()
+
 
 class TestStringMapBuilder:
     def test_is_mapping(self):
@@ -180,6 +216,69 @@ def convert(_):
         assert dict(mapping) == {"im hungry": "true"}
 
 
+class TestJSONFragment:
+    def test_from_array(self):
+        fragments = [data_binding.JSONFragment(b'{"a":1}'), data_binding.JSONFragment(b"[2]")]
+
+        assert data_binding.JSONFragment.from_array(fragments) == data_binding.JSONFragment(b'[{"a":1},[2]]')
+
+    def test_from_array_when_empty(self):
+        assert data_binding.JSONFragment.from_array([]).data == b"[]"
+
+    def test___eq__(self):
+        assert data_binding.JSONFragment(b"[1]") == data_binding.JSONFragment(b"[1]")
+        assert data_binding.JSONFragment(b"[1]") != data_binding.JSONFragment(b"[2]")
+        assert data_binding.JSONFragment(b"[1]") != b"[1]"
+
+    def test___hash__(self):
+        assert hash(data_binding.JSONFragment(b"[1]")) == hash(b"[1]")
+
+
+class TestDumpJSON:
+    def test_without_fragments(self):
+        dumps = mock.Mock()
+
+        assert data_binding.dump_json({"a": 1}, dumps) is dumps.return_value
+
+        dumps.assert_called_once_with({"a": 1})
+
+    def test_with_fragments(self):
+        payload = {"a": 1, "b": data_binding.JSONFragment(b'[{"c":2}]'), "d": {"e": data_binding.JSONFragment(b"3")}}
+
+        result = data_binding.dump_json(payload)
+
+        assert json.loads(result) == {"a": 1, "b": [{"c": 2}], "d": {"e": 3}}
+
+    def test_with_only_fragments(self):
+        payload = {"a": data_binding.JSONFragment(b"[1]"), "b": {"c": data_binding.JSONFragment(b"2")}}
+
+        assert json.loads(data_binding.dump_json(payload)) == {"a": [1], "b": {"c": 2}}
+
+    def test_with_fragments_and_other_encoder(self):
+        def dumps(value):
+            return (json.dumps(value, indent=4) + "\n").encode()
+
+        payload = {"a": "\u00e9", "b\u00e9": data_binding.JSONFragment(b"[1]")}
+
+        assert json.loads(data_binding.dump_json(payload, dumps)) == {"a": "\u00e9", "b\u00e9": [1]}
+
+    def test_with_fragments_and_encoder_accepting_any_type(self):
+        def dumps(value):
+            return json.dumps(value, default=str).encode()
+
+        payload = {"a": 1, "b": {"c": data_binding.JSONFragment(b"[2]")}}
+
+        assert json.loads(data_binding.dump_json(payload, dumps)) == {"a": 1, "b": {"c": [2]}}
+
+    def test_with_fragments_in_array(self):
+        with pytest.raises(TypeError):
+            data_binding.dump_json({"a": [data_binding.JSONFragment(b"1")]})
+
+    def test_when_not_encodable(self):
+        with pytest.raises(TypeError):
+            data_binding.dump_json({"a": object()})
+
+
 class TestJSONObjectBuilder:
     def test_is_mapping(self):
         assert isinstance(data_binding.JSONObjectBuilder(), typing.Mapping)
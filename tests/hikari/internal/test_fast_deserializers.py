@@ -0,0 +1,112 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+import linecache
+import typing
+
+import attrs
+import pytest
+
+from hikari.internal import fast_deserializers
+
+
+@attrs.define(weakref_slot=False)
+class _Entity:
+    id: int = attrs.field()
+    _name: str = attrs.field(alias="name")
+    tags: list[str] = attrs.field(factory=list)
+    flags: int = attrs.field(default=0)
+
+
+class TestGenerateDeserializer:
+    def test_for_attrs_class(self):
+        deserialize = fast_deserializers.generate_deserializer(
+            "deserialize_entity",
+            _Entity,
+            args=("payload",),
+            prelude=("entity_id = to_int(payload['id'])",),
+            fields={"id": "entity_id", "name": "payload['name']"},
+            namespace={"to_int": int},
+        )
+
+        entity = deserialize({"id": "123", "name": "foo"})
+
+        assert entity == _Entity(id=123, name="foo", tags=[], flags=0)
+        assert entity.tags is not deserialize({"id": "123", "name": "foo"}).tags
+
+    def test_for_callable(self):
+        def target(*, a: int, b: int) -> tuple[int, int]:
+            return a, b
+
+        deserialize = fast_deserializers.generate_deserializer(
+            "deserialize_pair", target, args=("x",), fields={"a": "x", "b": "x * 2"}, namespace={}
+        )
+
+        assert deserialize(2) == (2, 4)
+
+    def test_registers_source(self):
+        deserialize = fast_deserializers.generate_deserializer(
+            "deserialize_entity", _Entity, args=("payload",), fields={"id": "1", "name": "'foo'"}, namespace={}
+        )
+
+        source = "".join(linecache.getlines(deserialize.__code__.co_filename))
+        assert source.startswith("def deserialize_entity(payload):\n")
+        assert "self._name = 'foo'\n" in source
+
+    def test_when_missing_field(self):
+        with pytest.raises(TypeError, match=r"Missing expression for field 'name' of _Entity"):
+            fast_deserializers.generate_deserializer(
+                "deserialize_entity", _Entity, args=(), fields={"id": "1"}, namespace={}
+            )
+
+    def test_when_unknown_field(self):
+        with pytest.raises(TypeError, match=r"Unknown fields for _Entity: foo"):
+            fast_deserializers.generate_deserializer(
+                "deserialize_entity", _Entity, args=(), fields={"id": "1", "name": "''", "foo": "1"}, namespace={}
+            )
+
+    def test_when_field_has_converter(self):
+        @attrs.define(weakref_slot=False, on_setattr=attrs.setters.NO_OP)
+        class Entity:
+            id: int = attrs.field(converter=int)
+
+        with pytest.raises(TypeError, match=r"Field 'id' of Entity has a converter or validator"):
+            fast_deserializers.generate_deserializer("deserialize", Entity, args=(), fields={"id": "1"}, namespace={})
+
+    def test_when_frozen(self):
+        @attrs.frozen(weakref_slot=False)
+        class Entity:
+            id: int = attrs.field()
+
+        with pytest.raises(TypeError, match=r"Entity can't be built by assigning its fields"):
+            fast_deserializers.generate_deserializer("deserialize", Entity, args=(), fields={"id": "1"}, namespace={})
+
+
+class TestGetFastDeserializers:
+    def test_is_cached(self):
+        assert fast_deserializers.get_fast_deserializers() is fast_deserializers.get_fast_deserializers()
+
+    @pytest.mark.parametrize("name", ["user", "member", "embed", "message"])
+    def test_generates(self, name: str):
+        deserializer: typing.Callable[..., typing.Any] = getattr(fast_deserializers.get_fast_deserializers(), name)
+
+        assert deserializer.__name__ == f"deserialize_{name}"
@@ -0,0 +1,160 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+import collections.abc
+import importlib
+import re
+import sys
+
+import mock
+import pytest
+
+try:
+    import msgspec
+
+    from hikari.internal import gateway_records
+
+    msgspec_present = True
+except ModuleNotFoundError:
+    msgspec_present = False
+
+pytestmark = pytest.mark.skipif(not msgspec_present, reason="msgspec not present")
+
+
+class TestGatewayRecord:
+    @pytest.fixture
+    def record(self):
+        return msgspec.json.decode(
+            b'{"id": "123", "username": "nyaa", "discriminator": "0", "avatar": null, "global_name": null, "clan": {}}',
+            type=gateway_records.UserRecord,
+        )
+
+    def test_is_mapping(self, record):
+        assert isinstance(record, collections.abc.Mapping)
+
+    def test___getitem__(self, record):
+        assert record["id"] == "123"
+        assert record["avatar"] is None
+
+    @pytest.mark.parametrize("key", ["banner", "clan", "get", "__struct_fields__"])
+    def test___getitem___when_missing(self, record, key):
+        with pytest.raises(KeyError, match=key):
+            record[key]
+
+    def test___contains__(self, record):
+        assert "global_name" in record
+        assert "banner" not in record
+        assert "keys" not in record
+        assert 123 not in record
+
+    def test___iter__(self, record):
+        assert list(record) == ["id", "username", "discriminator", "avatar", "global_name"]
+
+    def test___len__(self, record):
+        assert len(record) == 5
+
+    def test_get(self, record):
+        assert record.get("username") == "nyaa"
+        assert record.get("banner") is None
+        assert record.get("banner", "default") == "default"
+        assert record.get("items", "default") == "default"
+
+    def test_views(self, record):
+        assert list(record.keys()) == ["id", "username", "discriminator", "avatar", "global_name"]
+        assert list(record.values()) == ["123", "nyaa", "0", None, None]
+        assert dict(record.items()) == dict(record)
+        assert dict(record) == {
+            "id": "123",
+            "username": "nyaa",
+            "discriminator": "0",
+            "avatar": None,
+            "global_name": None,
+        }
+
+    def test_nested_records(self):
+        record = msgspec.json.decode(
+            b'{"guild_id": "1", "roles": [], "joined_at": null, "user": {"id": "2", "username": "a", '
+            b'"discriminator": "0", "avatar": null}, "premium_since": "2020-03-21T21:20:16.510000+00:00"}',
+            type=gateway_records.MemberRecord,
+        )
+
+        assert isinstance(record["user"], gateway_records.UserRecord)
+        assert record["user"]["id"] == "2"
+        assert record["premium_since"] == "2020-03-21T21:20:16.510000+00:00"
+
+    def test_missing_required_field_fails_validation(self):
+        with pytest.raises(msgspec.ValidationError, match="joined_at"):
+            msgspec.json.decode(b'{"roles": []}', type=gateway_records.MemberRecord)
+
+
+def test_dispatch_frames():
+    assert gateway_records.DISPATCH_FRAMES == {
+        "MESSAGE_CREATE": gateway_records.DispatchFrame[gateway_records.MessageRecord],
+        "GUILD_MEMBER_UPDATE": gateway_records.DispatchFrame[gateway_records.MemberRecord],
+    }
+
+
+class TestRewriteForRecord:
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("payload['id']", "payload.id"),
+            ("payload['banner']", "payload['banner']"),
+            ("payload.get('id')", "payload.id"),
+            ("payload.get('banner')", "(None if payload.banner is UNSET else payload.banner)"),
+            ("payload.get('bot', False)", "(False if payload.bot is UNSET else payload.bot)"),
+            ("payload.get('bot', UserFlag.NONE)", "(UserFlag.NONE if payload.bot is UNSET else payload.bot)"),
+            ("len(payload.get('banner', ()))", "len((() if payload.banner is UNSET else payload.banner))"),
+            ("'id' in payload", "True"),
+            ("'banner' in payload", "payload.banner is not UNSET"),
+            ("[a for a in payload['username']]", "[a for a in payload.username]"),
+            ("v.get('url') if 'url' in v else None", "v.get('url') if 'url' in v else None"),
+        ],
+    )
+    def test_rewrite(self, source, expected):
+        assert gateway_records._rewrite_for_record(source, gateway_records.UserRecord) == expected
+
+    @pytest.mark.parametrize("source", ["payload['clan']", "payload.get('clan')", "'clan' in payload"])
+    def test_rewrite_when_unknown_field(self, source):
+        with pytest.raises(TypeError, match=r"UserRecord has no field 'clan'"):
+            gateway_records._rewrite_for_record(source, gateway_records.UserRecord)
+
+    @pytest.mark.parametrize("source", ["payload.get(key)", "payload.get('id', {})", "key in payload"])
+    def test_rewrite_when_unhandled(self, source):
+        with pytest.raises(TypeError, match=r"Can't rewrite .* to read a UserRecord"):
+            gateway_records._rewrite_for_record(source, gateway_records.UserRecord)
+
+
+def test_get_record_deserializers_is_cached():
+    assert gateway_records.get_record_deserializers() is gateway_records.get_record_deserializers()
+
+
+def test_import_when_msgspec_not_installed():
+    with mock.patch.dict(sys.modules, {"msgspec": None}):
+        del sys.modules["hikari.internal.gateway_records"]
+
+        with pytest.raises(
+            ModuleNotFoundError,
+            match=re.escape(
+                "You must install the optional `hikari[msgspec]` dependencies to use the typed gateway records."
+            ),
+        ):
+            importlib.import_module("hikari.internal.gateway_records")
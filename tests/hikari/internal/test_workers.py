@@ -0,0 +1,144 @@
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+
+import os
+import signal
+import socket
+import sys
+import time
+
+import mock
+import pytest
+
+from hikari.internal import workers
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="Forking is not supported on this platform")
+
+
+class TestBindSockets:
+    @pytest.mark.skipif(sys.platform != "linux", reason="SO_REUSEPORT is only used on Linux")
+    def test_binds_socket_for_each_worker(self):
+        sockets = workers.bind_sockets("127.0.0.1", 0, 3)
+
+        try:
+            assert len(sockets) == 3
+            assert len({sock.getsockname() for sock in sockets}) == 1
+            for sock in sockets:
+                assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT)
+                assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR)
+
+        finally:
+            for sock in sockets:
+                sock.close()
+
+    def test_binds_shared_socket_when_not_linux(self):
+        with mock.patch.object(sys, "platform", "darwin"):
+            sockets = workers.bind_sockets("127.0.0.1", 0, 3, reuse_address=False)
+
+        try:
+            assert len(sockets) == 1
+            assert sockets[0].getsockname()[1] != 0
+            assert not sockets[0].getsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR)
+
+        finally:
+            sockets[0].close()
+
+    def test_closes_sockets_when_binding_fails(self):
+        mock_socket = mock.Mock(bind=mock.Mock(side_effect=OSError))
+
+        with mock.patch.object(socket, "socket", return_value=mock_socket), pytest.raises(OSError):
+            workers.bind_sockets("127.0.0.1", 0, 3)
+
+        mock_socket.close.assert_called_once_with()
+
+
+class TestRunWorkers:
+    def test_when_fork_not_supported(self):
+        with (
+            mock.patch.object(workers, "os", mock.Mock(spec=[])),
+            pytest.raises(NotImplementedError, match="Running multiple workers requires a platform"),
+        ):
+            workers.run_workers(2, mock.Mock())
+
+    def test_runs_each_worker(self, tmp_path):
+        def worker(worker_id, notify_started):
+            notify_started()
+            (tmp_path / str(worker_id)).touch()
+            # The other workers are stopped once one exits, so wait for all of them to have run
+            while len(list(tmp_path.iterdir())) < 3:
+                time.sleep(0.01)
+
+        workers.run_workers(3, worker)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["0", "1", "2"]
+
+    def test_stops_other_workers_when_one_exits(self):
+        def worker(worker_id, notify_started):
+            notify_started()
+            if worker_id != 0:
+                time.sleep(60)
+
+        start = time.monotonic()
+        workers.run_workers(3, worker)
+
+        assert time.monotonic() - start < 30
+
+    def test_when_worker_fails(self):
+        def worker(worker_id, notify_started):
+            if worker_id == 1:
+                raise RuntimeError("oh no")
+
+            time.sleep(60)
+
+        with pytest.raises(RuntimeError, match="Workers 1 exited with an error"):
+            workers.run_workers(3, worker)
+
+    def test_leaves_other_children(self):
+        pid = os.fork()
+        if pid == 0:
+            os._exit(3)
+
+        def worker(worker_id, notify_started):
+            notify_started()
+            # Let the other child exit while the workers are being supervised
+            time.sleep(0.2)
+
+        workers.run_workers(2, worker)
+
+        assert os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 3
+
+    def test_forwards_interrupts_to_workers(self):
+        previous_handler = signal.getsignal(signal.SIGTERM)
+
+        def worker(worker_id, notify_started):
+            notify_started()
+            if worker_id == 0:
+                os.kill(os.getppid(), signal.SIGTERM)
+
+            time.sleep(60)
+
+        start = time.monotonic()
+        workers.run_workers(2, worker)
+
+        assert time.monotonic() - start < 30
+        assert signal.getsignal(signal.SIGTERM) is previous_handler